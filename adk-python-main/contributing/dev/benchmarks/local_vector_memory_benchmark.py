@@ -0,0 +1,167 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for LocalVectorMemoryService ingest and query.
+
+Ingests sessions of synthetic events with random clustered embeddings (no
+model calls) and reports the ingest throughput and the median query latency
+of exact search and, optionally, IVF search with its recall@k.
+
+Usage:
+  python contributing/dev/benchmarks/local_vector_memory_benchmark.py \
+      --sizes 10000 100000 1000000 --dim 256 --ivf-partitions 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Optional
+
+from google.adk.events.event import Event
+from google.adk.memory.local_vector_memory_service import LocalVectorMemoryService
+from google.adk.sessions.session import Session
+from google.genai import types
+import numpy as np
+
+_EVENTS_PER_SESSION = 1000
+
+
+class _SyntheticEmbedder:
+  """Maps 'memory <i>' to a fixed random vector around one of 256 clusters."""
+
+  def __init__(self, dim: int):
+    self._rng = np.random.default_rng(0)
+    self._clusters = self._rng.normal(size=(256, dim)).astype(np.float32)
+    self._dim = dim
+
+  def __call__(self, texts: list[str]) -> np.ndarray:
+    ids = np.array([int(text.rsplit(' ', 1)[1]) for text in texts])
+    noise = np.random.default_rng(ids[0]).normal(size=(len(ids), self._dim))
+    return self._clusters[ids % 256] + 0.3 * noise.astype(np.float32)
+
+
+def _session(first_id: int, count: int) -> Session:
+  return Session(
+      app_name='bench',
+      user_id='user',
+      id=f'session-{first_id}',
+      last_update_time=0,
+      events=[
+          Event(
+              id=f'event-{i}',
+              invocation_id='inv',
+              author='user',
+              timestamp=0,
+              content=types.Content(parts=[types.Part(text=f'memory {i}')]),
+          )
+          for i in range(first_id, first_id + count)
+      ],
+  )
+
+
+async def _run(
+    size: int,
+    dim: int,
+    queries: int,
+    ivf_partitions: Optional[int],
+    ivf_probes: int,
+    persist_dir: Optional[str],
+) -> None:
+  embedder = _SyntheticEmbedder(dim)
+  service = LocalVectorMemoryService(
+      embedder,
+      persist_dir=persist_dir,
+      embedding_batch_size=_EVENTS_PER_SESSION,
+      ivf_partitions=ivf_partitions,
+      ivf_probes=ivf_probes,
+  )
+  start = time.perf_counter()
+  for first_id in range(0, size, _EVENTS_PER_SESSION):
+    await service.add_session_to_memory(
+        _session(first_id, min(_EVENTS_PER_SESSION, size - first_id))
+    )
+  ingest = time.perf_counter() - start
+
+  latencies = []
+  hits = 0
+  exact = LocalVectorMemoryService(embedder) if ivf_partitions else None
+  if exact:
+    exact._stores = service._stores  # pylint: disable=protected-access
+  for i in range(queries):
+    query = f'memory {size + i}'
+    start = time.perf_counter()
+    response = await service.search_memory(
+        app_name='bench', user_id='user', query=query
+    )
+    latencies.append(time.perf_counter() - start)
+    if exact:
+      store = service._stores[('bench', 'user')]  # pylint: disable=protected-access
+      ivf, store.ivf = store.ivf, None
+      expected = await exact.search_memory(
+          app_name='bench', user_id='user', query=query
+      )
+      store.ivf = ivf
+      hits += len(
+          {m.id for m in response.memories}
+          & {m.id for m in expected.memories}
+      )
+
+  line = (
+      f'{size:>9} entries: ingest {size / ingest:10.0f} entries/s | query'
+      f' p50 {statistics.median(latencies) * 1e3:8.2f} ms'
+  )
+  if exact:
+    line += f' | recall@10 {hits / (10 * queries):.3f}'
+  print(line)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument(
+      '--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000]
+  )
+  parser.add_argument('--dim', type=int, default=256)
+  parser.add_argument('--queries', type=int, default=50)
+  parser.add_argument('--ivf-partitions', type=int, default=None)
+  parser.add_argument('--ivf-probes', type=int, default=16)
+  parser.add_argument(
+      '--persist', action='store_true', help='Store vectors in a memmap file.'
+  )
+  args = parser.parse_args()
+
+  print(
+      f'dim {args.dim}, {args.queries} queries,'
+      f' {"IVF " + str(args.ivf_partitions) if args.ivf_partitions else "exact"}'
+      f' search, {"memmap" if args.persist else "in-memory"} storage'
+  )
+  for size in args.sizes:
+    with tempfile.TemporaryDirectory() as persist_dir:
+      asyncio.run(
+          _run(
+              size,
+              args.dim,
+              args.queries,
+              args.ivf_partitions,
+              args.ivf_probes,
+              persist_dir if args.persist else None,
+          )
+      )
+
+
+if __name__ == '__main__':
+  main()
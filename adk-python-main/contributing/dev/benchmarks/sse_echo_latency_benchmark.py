@@ -0,0 +1,191 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latency benchmark of /run_sse for an echo agent.
+
+Serves an agent whose model echoes the user message back, in `--chunks`
+streamed partial responses, from the API server on a local port. Sends
+`--requests` requests to /run_sse, `--concurrency` at a time, and reports the
+latency percentiles of the first and of the last SSE event. The services are
+in memory and the client shares the server's event loop, so the numbers
+measure the server and runner overhead only.
+
+Usage:
+  python contributing/dev/benchmarks/sse_echo_latency_benchmark.py \
+      --requests 500 --concurrency 8 --chunks 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import tempfile
+import time
+from typing import AsyncGenerator
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.adk.auth.credential_service.in_memory_credential_service import InMemoryCredentialService
+from google.adk.cli.adk_web_server import AdkWebServer
+from google.adk.cli.utils.base_agent_loader import BaseAgentLoader
+from google.adk.evaluation.in_memory_eval_sets_manager import InMemoryEvalSetsManager
+from google.adk.evaluation.local_eval_set_results_manager import LocalEvalSetResultsManager
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.genai import types
+import httpx
+import uvicorn
+
+_APP_NAME = 'echo_app'
+
+
+class _EchoLlm(BaseLlm):
+  """Echoes the last user message, split into `chunks` partial responses."""
+
+  chunks: int = 1
+
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    text = llm_request.contents[-1].parts[0].text
+    if stream:
+      size = max(1, len(text) // self.chunks)
+      for start in range(0, len(text), size):
+        chunk = text[start : start + size]
+        yield LlmResponse(
+            content=types.Content(role='model', parts=[types.Part(text=chunk)]),
+            partial=True,
+        )
+    yield LlmResponse(
+        content=types.Content(role='model', parts=[types.Part(text=text)])
+    )
+
+
+class _EchoAgentLoader(BaseAgentLoader):
+
+  def __init__(self, chunks: int):
+    self._agent = Agent(
+        name='echo_agent', model=_EchoLlm(model='echo', chunks=chunks)
+    )
+
+  def load_agent(self, agent_name: str) -> Agent:
+    return self._agent
+
+  def list_agents(self) -> list[str]:
+    return [_APP_NAME]
+
+
+def _percentile(latencies: list[float], percentile: int) -> float:
+  return statistics.quantiles(latencies, n=100)[percentile - 1]
+
+
+async def _run(args: argparse.Namespace, agents_dir: str) -> None:
+  session_service = InMemorySessionService()
+  server = AdkWebServer(
+      agent_loader=_EchoAgentLoader(args.chunks),
+      session_service=session_service,
+      memory_service=InMemoryMemoryService(),
+      artifact_service=InMemoryArtifactService(),
+      credential_service=InMemoryCredentialService(),
+      eval_sets_manager=InMemoryEvalSetsManager(),
+      eval_set_results_manager=LocalEvalSetResultsManager(agents_dir),
+      agents_dir=agents_dir,
+  )
+  sock = socket.socket()
+  sock.bind(('127.0.0.1', 0))
+  uvicorn_server = uvicorn.Server(
+      uvicorn.Config(server.get_fast_api_app(), log_level='warning')
+  )
+  serving = asyncio.create_task(uvicorn_server.serve(sockets=[sock]))
+  while not uvicorn_server.started:
+    await asyncio.sleep(0.01)
+  message = 'echo ' * args.message_words
+
+  async with httpx.AsyncClient(
+      base_url=f'http://127.0.0.1:{sock.getsockname()[1]}',
+      limits=httpx.Limits(max_connections=args.concurrency),
+      timeout=None,
+  ) as client:
+
+    async def request(user_id: str) -> tuple[float, float]:
+      session = await session_service.create_session(
+          app_name=_APP_NAME, user_id=user_id
+      )
+      payload = {
+          'app_name': _APP_NAME,
+          'user_id': user_id,
+          'session_id': session.id,
+          'new_message': {'role': 'user', 'parts': [{'text': message}]},
+          'streaming': True,
+      }
+      first_event = None
+      start = time.perf_counter()
+      async with client.stream('POST', '/run_sse', json=payload) as response:
+        async for line in response.aiter_lines():
+          if first_event is None and line.startswith('data: '):
+            first_event = time.perf_counter() - start
+      return first_event, time.perf_counter() - start
+
+    for i in range(args.warmup):
+      await request(f'warmup_{i}')
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited(i: int) -> tuple[float, float]:
+      async with semaphore:
+        return await request(f'user_{i}')
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(limited(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+  uvicorn_server.should_exit = True
+  await serving
+
+  print(
+      f'{args.requests} requests, {args.concurrency} concurrent,'
+      f' {args.chunks} chunks of a {args.message_words}-word message:'
+      f' {args.requests / elapsed:.1f} requests/s'
+  )
+  for name, latencies in (
+      ('first event', [first for first, _ in results]),
+      ('last event', [last for _, last in results]),
+  ):
+    print(
+        f'{name:>12}: p50 {_percentile(latencies, 50) * 1e3:7.2f} ms |'
+        f' p95 {_percentile(latencies, 95) * 1e3:7.2f} ms |'
+        f' p99 {_percentile(latencies, 99) * 1e3:7.2f} ms'
+    )
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--requests', type=int, default=500)
+  parser.add_argument('--concurrency', type=int, default=8)
+  parser.add_argument('--chunks', type=int, default=10)
+  parser.add_argument('--message-words', type=int, default=50)
+  parser.add_argument('--warmup', type=int, default=20)
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as agents_dir:
+    asyncio.run(_run(args, agents_dir))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,158 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for StreamingResponseAggregator.
+
+Streams synthetic text chunks and streamed function call arguments through
+the aggregator and reports the time per stream for `process_response` (with
+and without progressive SSE streaming) and for `process_delta`.
+
+Usage:
+  python contributing/dev/benchmarks/streaming_aggregator_benchmark.py \
+      --chunks 2000 --chunk-size 16 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from google.adk.features import FeatureName
+from google.adk.features._feature_registry import temporary_feature_override
+from google.adk.utils.streaming_utils import StreamingResponseAggregator
+from google.genai import types
+
+
+def _text_stream(
+    chunks: int, chunk_size: int
+) -> list[types.GenerateContentResponse]:
+  responses = []
+  for i in range(chunks):
+    responses.append(
+        types.GenerateContentResponse(
+            candidates=[
+                types.Candidate(
+                    content=types.Content(
+                        role='model', parts=[types.Part(text='x' * chunk_size)]
+                    ),
+                    finish_reason=types.FinishReason.STOP
+                    if i == chunks - 1
+                    else None,
+                )
+            ]
+        )
+    )
+  return responses
+
+
+def _function_call_stream(
+    chunks: int, chunk_size: int
+) -> list[types.GenerateContentResponse]:
+  responses = []
+  for i in range(chunks):
+    responses.append(
+        types.GenerateContentResponse(
+            candidates=[
+                types.Candidate(
+                    content=types.Content(
+                        role='model',
+                        parts=[
+                            types.Part(
+                                function_call=types.FunctionCall(
+                                    name='write_file' if i == 0 else None,
+                                    partial_args=[
+                                        types.PartialArg(
+                                            json_path='$.content',
+                                            string_value='y' * chunk_size,
+                                        )
+                                    ],
+                                    will_continue=i < chunks - 1,
+                                )
+                            )
+                        ],
+                    ),
+                    finish_reason=types.FinishReason.STOP
+                    if i == chunks - 1
+                    else None,
+                )
+            ]
+        )
+    )
+  return responses
+
+
+async def _run_process_response(
+    responses: list[types.GenerateContentResponse],
+) -> None:
+  aggregator = StreamingResponseAggregator()
+  for response in responses:
+    async for _ in aggregator.process_response(response):
+      pass
+  aggregator.close()
+
+
+async def _run_process_delta(
+    responses: list[types.GenerateContentResponse],
+) -> None:
+  aggregator = StreamingResponseAggregator()
+  for response in responses:
+    aggregator.process_delta(response)
+  aggregator.close()
+
+
+def _time(run, responses, repeat: int) -> float:
+  best = float('inf')
+  for _ in range(repeat):
+    start = time.perf_counter()
+    asyncio.run(run(responses))
+    best = min(best, time.perf_counter() - start)
+  return best
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--chunks', type=int, default=2000)
+  parser.add_argument('--chunk-size', type=int, default=16)
+  parser.add_argument('--repeat', type=int, default=5)
+  args = parser.parse_args()
+
+  streams = {
+      'text': _text_stream(args.chunks, args.chunk_size),
+      'function_call_args': _function_call_stream(
+          args.chunks, args.chunk_size
+      ),
+  }
+  print(
+      f'{args.chunks} chunks of {args.chunk_size} chars, best of'
+      f' {args.repeat}'
+  )
+  for name, responses in streams.items():
+    with temporary_feature_override(
+        FeatureName.PROGRESSIVE_SSE_STREAMING, False
+    ):
+      legacy = _time(_run_process_response, responses, args.repeat)
+    with temporary_feature_override(
+        FeatureName.PROGRESSIVE_SSE_STREAMING, True
+    ):
+      progressive = _time(_run_process_response, responses, args.repeat)
+    deltas = _time(_run_process_delta, responses, args.repeat)
+    print(
+        f'{name:>20}: process_response {legacy * 1e3:8.2f} ms | progressive'
+        f' {progressive * 1e3:8.2f} ms | process_delta {deltas * 1e3:8.2f} ms'
+    )
+
+
+if __name__ == '__main__':
+  main()
@@ -14,13 +14,17 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
+from contextlib import asynccontextmanager
 from datetime import datetime
 from datetime import timezone
 import inspect
 import logging
+from typing import AsyncIterator
 from typing import Awaitable
 from typing import Callable
 from typing import Optional
+from typing import Union
 import uuid
 
 from a2a.server.agent_execution import AgentExecutor
@@ -54,6 +58,10 @@ from .task_result_aggregator import TaskResultAggregator
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+_RunnerOrContext = Union[
+    Runner, Awaitable[Runner], AbstractAsyncContextManager[Runner]
+]
+
 
 @a2a_experimental
 class A2aAgentExecutorConfig(BaseModel):
@@ -81,9 +89,19 @@ class A2aAgentExecutor(AgentExecutor):
   def __init__(
       self,
       *,
-      runner: Runner | Callable[..., Runner | Awaitable[Runner]],
+      runner: Runner | Callable[..., _RunnerOrContext],
       config: Optional[A2aAgentExecutorConfig] = None,
   ):
+    """Initializes the executor.
+
+    Args:
+      runner: The runner of the agent, or a callable returning it. The runner
+        returned by a callable is kept for later requests, unless the callable
+        returns an async context manager: it is then called for each request,
+        and the runner is only used within the context, so that its provider,
+        such as a cache, does not close it while a request runs.
+      config: The configuration of the executor.
+    """
     super().__init__()
     self._runner = runner
     self._config = config or A2aAgentExecutorConfig()
@@ -112,6 +130,23 @@ class A2aAgentExecutor(AgentExecutor):
         f' Runner, got {type(self._runner)}'
     )
 
+  @asynccontextmanager
+  async def _use_runner(self) -> AsyncIterator[Runner]:
+    """Yields the runner of a request."""
+    if isinstance(self._runner, Runner) or not callable(self._runner):
+      yield await self._resolve_runner()
+      return
+    result = self._runner()
+    if isinstance(result, AbstractAsyncContextManager):
+      async with result as runner:
+        yield runner
+      return
+    if inspect.iscoroutine(result):
+      result = await result
+    # Cache the resolved runner for future calls
+    self._runner = result
+    yield result
+
   @override
   async def cancel(self, context: RequestContext, event_queue: EventQueue):
     """Cancel the execution."""
@@ -183,9 +218,15 @@ class A2aAgentExecutor(AgentExecutor):
       context: RequestContext,
       event_queue: EventQueue,
   ):
-    # Resolve the runner instance
-    runner = await self._resolve_runner()
+    async with self._use_runner() as runner:
+      await self._handle_request_with_runner(context, event_queue, runner)
 
+  async def _handle_request_with_runner(
+      self,
+      context: RequestContext,
+      event_queue: EventQueue,
+      runner: Runner,
+  ):
     # Convert the a2a request to AgentRunRequest
     run_request = self._config.request_converter(
         context,
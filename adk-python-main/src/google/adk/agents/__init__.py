@@ -14,6 +14,7 @@
 
 from .base_agent import BaseAgent
 from .invocation_context import InvocationContext
+from .live_request_queue import LiveQueueOverflowPolicy
 from .live_request_queue import LiveRequest
 from .live_request_queue import LiveRequestQueue
 from .llm_agent import Agent
@@ -33,6 +34,7 @@ __all__ = [
     'ParallelAgent',
     'SequentialAgent',
     'InvocationContext',
+    'LiveQueueOverflowPolicy',
     'LiveRequest',
     'LiveRequestQueue',
     'RunConfig',
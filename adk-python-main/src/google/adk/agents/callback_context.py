@@ -113,6 +113,7 @@ class CallbackContext(ReadonlyContext):
         custom_metadata=custom_metadata,
     )
     self._event_actions.artifact_delta[filename] = version
+    self._invocation_context.artifact_load_cache.invalidate([filename])
     return version
 
   async def get_artifact_version(
@@ -200,3 +201,6 @@ class CallbackContext(ReadonlyContext):
     await self._invocation_context.memory_service.add_session_to_memory(
         self._invocation_context.session
     )
+    self._invocation_context.memory_search_cache.invalidate(
+        self._invocation_context.app_name, self._invocation_context.user_id
+    )
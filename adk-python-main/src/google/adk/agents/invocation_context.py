@@ -25,10 +25,12 @@ from pydantic import Field
 from pydantic import PrivateAttr
 
 from ..apps.app import ResumabilityConfig
+from ..artifacts.artifact_load_cache import ArtifactLoadCache
 from ..artifacts.base_artifact_service import BaseArtifactService
 from ..auth.credential_service.base_credential_service import BaseCredentialService
 from ..events.event import Event
 from ..memory.base_memory_service import BaseMemoryService
+from ..memory.memory_search_cache import MemorySearchCache
 from ..plugins.plugin_manager import PluginManager
 from ..sessions.base_session_service import BaseSessionService
 from ..sessions.session import Session
@@ -213,6 +215,26 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _memory_search_cache: MemorySearchCache = PrivateAttr(
+      default_factory=MemorySearchCache
+  )
+  """The memory searches made in this invocation."""
+
+  _artifact_load_cache: ArtifactLoadCache = PrivateAttr(
+      default_factory=ArtifactLoadCache
+  )
+  """The artifacts loaded for instructions in this invocation."""
+
+  @property
+  def memory_search_cache(self) -> MemorySearchCache:
+    """The cache of memory searches, shared by all tools of this invocation."""
+    return self._memory_search_cache
+
+  @property
+  def artifact_load_cache(self) -> ArtifactLoadCache:
+    """The cache of artifacts referenced by instruction templates."""
+    return self._artifact_load_cache
+
   @property
   def is_resumable(self) -> bool:
     """Returns whether the current invocation is resumable."""
@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 import asyncio
+from enum import Enum
+import logging
 from typing import Optional
 
 from google.genai import types
@@ -22,6 +24,8 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import field_validator
 
+logger = logging.getLogger('google_adk.' + __name__)
+
 
 class LiveRequest(BaseModel):
   """Request send to live agents."""
@@ -57,11 +61,129 @@ class LiveRequest(BaseModel):
   """If set, close the queue. queue.shutdown() is only supported in Python 3.13+."""
 
 
+class LiveQueueOverflowPolicy(Enum):
+  """What a bounded `LiveRequestQueue` does with realtime blobs when full.
+
+  Only realtime blobs are dropped or coalesced. Content, activity signals and
+  the close request are always queued, even beyond the bound.
+  """
+
+  DROP_OLDEST = 'drop_oldest'
+  """Drops the oldest queued blob to make room for the new one."""
+
+  DROP_NEWEST = 'drop_newest'
+  """Drops the new blob."""
+
+  COALESCE = 'coalesce'
+  """Merges the new blob into the newest queued blob of the same MIME type.
+
+  Audio data is appended, so that no audio is lost while the number of queued
+  requests stays bounded. Other blobs, e.g. video frames, replace the queued
+  one. Drops the oldest queued blob when there is none of the same MIME type.
+  """
+
+
+class _BoundedQueue(asyncio.Queue):
+  """An `asyncio.Queue` that applies an overflow policy to realtime blobs."""
+
+  def __init__(self, max_size: int, overflow_policy: LiveQueueOverflowPolicy):
+    # Unbounded for `asyncio.Queue`: `_put` applies the bound.
+    super().__init__()
+    self._max_size = max_size
+    self._overflow_policy = overflow_policy
+    self.dropped_count = 0
+
+  def _put(self, item: LiveRequest) -> None:
+    if (
+        len(self._queue) < self._max_size
+        or _priority_field(item) != 'blob'
+    ):
+      self._queue.append(item)
+      return
+    if self._overflow_policy == LiveQueueOverflowPolicy.DROP_NEWEST:
+      self._drop(item)
+      return
+    if self._overflow_policy == LiveQueueOverflowPolicy.COALESCE:
+      for i in range(len(self._queue) - 1, -1, -1):
+        queued = self._queue[i]
+        if (
+            _priority_field(queued) == 'blob'
+            and queued.blob.mime_type == item.blob.mime_type
+        ):
+          self._queue[i] = _coalesce(queued, item)
+          return
+    for queued in self._queue:
+      if _priority_field(queued) == 'blob':
+        self._queue.remove(queued)
+        self._drop(queued)
+        break
+    self._queue.append(item)
+
+  def _drop(self, item: LiveRequest) -> None:
+    self.dropped_count += 1
+    logger.debug(
+        'Live request queue is full, dropped a %s blob.', item.blob.mime_type
+    )
+
+
+def _priority_field(request: LiveRequest) -> Optional[str]:
+  """Returns the field of a request that is processed, by priority."""
+  if request.close:
+    return 'close'
+  for field in ('activity_start', 'activity_end', 'blob', 'content'):
+    if getattr(request, field) is not None:
+      return field
+  return None
+
+
+def _coalesce(queued: LiveRequest, new: LiveRequest) -> LiveRequest:
+  mime_type = new.blob.mime_type or ''
+  if not mime_type.startswith('audio/'):
+    return new
+  return LiveRequest(
+      blob=types.Blob(
+          mime_type=mime_type,
+          data=(queued.blob.data or b'') + (new.blob.data or b''),
+      )
+  )
+
+
 class LiveRequestQueue:
-  """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
+  """Queue used to send LiveRequest in a live(bidirectional streaming) way.
+
+  The queue is unbounded by default. With `max_size`, realtime blobs sent
+  while `max_size` requests are queued are dropped or coalesced according to
+  `overflow_policy`, so that a slow model connection does not grow memory
+  without bound.
+  """
 
-  def __init__(self):
-    self._queue = asyncio.Queue()
+  def __init__(
+      self,
+      *,
+      max_size: Optional[int] = None,
+      overflow_policy: LiveQueueOverflowPolicy = (
+          LiveQueueOverflowPolicy.DROP_OLDEST
+      ),
+  ):
+    """Initializes the queue.
+
+    Args:
+      max_size: The number of queued requests beyond which realtime blobs are
+        dropped or coalesced. Unbounded if `None`.
+      overflow_policy: What to do with realtime blobs beyond `max_size`.
+    """
+    if max_size is not None and max_size < 1:
+      raise ValueError('max_size must be at least 1.')
+    self._queue = (
+        asyncio.Queue()
+        if max_size is None
+        else _BoundedQueue(max_size, overflow_policy)
+    )
+
+  @property
+  def dropped_count(self) -> int:
+    """The number of realtime blobs dropped because the queue was full."""
+    return getattr(self._queue, 'dropped_count', 0)
 
   def close(self):
     self._queue.put_nowait(LiveRequest(close=True))
@@ -49,6 +49,35 @@ class ToolThreadPoolConfig(BaseModel):
   )
 
 
+class BatchConfig(BaseModel):
+  """Configuration for coalescing concurrent model calls into batches.
+
+  Attributes:
+    max_batch_size: Maximum number of requests submitted in one batch.
+    max_wait_seconds: Maximum time a request waits for other requests to join
+      its batch before the batch is submitted.
+  """
+
+  model_config = ConfigDict(
+      extra='forbid',
+      frozen=True,
+  )
+
+  max_batch_size: int = Field(
+      default=32,
+      description='Maximum number of requests submitted in one batch.',
+      ge=1,
+  )
+
+  max_wait_seconds: float = Field(
+      default=0.05,
+      description=(
+          'Maximum time a request waits for other requests to join its batch.'
+      ),
+      ge=0,
+  )
+
+
 class StreamingMode(Enum):
   """Streaming modes for agent execution.
 
@@ -297,6 +326,30 @@ class RunConfig(BaseModel):
     ```
   """
 
+  batch_config: Optional[BatchConfig] = None
+  """Coalesces concurrent model calls into batch submissions.
+
+  When set, non-streaming model calls to models that implement
+  `BaseLlm.generate_content_batch` are queued and submitted together with the
+  concurrent calls of other invocations to the same model, once
+  `max_batch_size` requests are queued or the oldest one has waited
+  `max_wait_seconds`. Other calls are unaffected. This trades per-call latency
+  for throughput and is intended for large offline workloads such as evals.
+  When None (default), every model call is submitted on its own.
+
+  No model shipped with ADK implements `generate_content_batch` yet, so this
+  setting has no effect until the model in use opts in by overriding it.
+
+  Example:
+    ```python
+    from google.adk.agents.run_config import BatchConfig, RunConfig
+
+    run_config = RunConfig(
+        batch_config=BatchConfig(max_batch_size=64, max_wait_seconds=0.2),
+    )
+    ```
+  """
+
   save_live_audio: bool = Field(
       default=False,
       deprecated=True,
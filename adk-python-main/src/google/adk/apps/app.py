@@ -80,6 +80,12 @@ class EventsCompactionConfig(BaseModel):
   end of the last compacted range. This creates an overlap between consecutive
   compacted summaries, maintaining context."""
 
+  token_threshold: Optional[int] = Field(default=None, gt=0)
+  """The estimated number of tokens in events after the last compaction that
+  triggers a compaction even before `compaction_interval` new invocations
+  have completed. Token counts are estimated locally. None disables the
+  token-based trigger."""
+
 
 class App(BaseModel):
   """Represents an LLM-backed agentic application.
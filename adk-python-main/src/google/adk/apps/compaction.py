@@ -20,10 +20,31 @@ from google.adk.apps.app import App
 from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
 from google.adk.sessions.base_session_service import BaseSessionService
 from google.adk.sessions.session import Session
+from google.adk.utils.token_estimation import estimate_content_tokens
 
 logger = logging.getLogger('google_adk.' + __name__)
 
 
+def _exceeds_token_threshold(
+    app: App, events: list, last_compacted_end_timestamp: float
+) -> bool:
+  """Returns whether events since the last compaction reach the threshold."""
+  token_threshold = app.events_compaction_config.token_threshold
+  if token_threshold is None:
+    return False
+  new_tokens = 0
+  for event in reversed(events):
+    if event.timestamp <= last_compacted_end_timestamp:
+      break
+    if event.actions and event.actions.compaction:
+      continue
+    if event.content:
+      new_tokens += estimate_content_tokens(event.content)
+      if new_tokens >= token_threshold:
+        return True
+  return False
+
+
 async def _run_compaction_for_sliding_window(
     app: App, session: Session, session_service: BaseSessionService
 ):
@@ -139,8 +160,14 @@ async def _run_compaction_for_sliding_window(
       if invocation_latest_timestamps[inv_id] > last_compacted_end_timestamp
   ]
 
-  if len(new_invocation_ids) < app.events_compaction_config.compaction_interval:
-    return None  # Not enough new invocations to trigger compaction.
+  if not new_invocation_ids:
+    return None
+  if len(
+      new_invocation_ids
+  ) < app.events_compaction_config.compaction_interval and (
+      not _exceeds_token_threshold(app, events, last_compacted_end_timestamp)
+  ):
+    return None  # Not enough new invocations or tokens to trigger compaction.
 
   # Determine the range of invocations to compact.
   # The end of the compaction range is the last of the new invocations.
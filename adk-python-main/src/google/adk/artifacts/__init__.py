@@ -13,12 +13,14 @@
 # limitations under the License.
 
 from .base_artifact_service import BaseArtifactService
+from .caching_artifact_service import CachingArtifactService
 from .file_artifact_service import FileArtifactService
 from .gcs_artifact_service import GcsArtifactService
 from .in_memory_artifact_service import InMemoryArtifactService
 
 __all__ = [
     'BaseArtifactService',
+    'CachingArtifactService',
     'FileArtifactService',
     'GcsArtifactService',
     'InMemoryArtifactService',
@@ -0,0 +1,96 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caches of the artifacts loaded during an invocation."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from google.genai import types
+
+from .base_artifact_service import BaseArtifactService
+
+if TYPE_CHECKING:
+  from ..sessions.session import Session
+
+
+class ArtifactLoadCache:
+  """Caches the latest versions of artifacts for the duration of an invocation.
+
+  Instruction templates reference the same artifacts on every model call of
+  an invocation; this loads each of them once. Concurrent loads of the same
+  artifact share a single call to the artifact service, and failed loads are
+  not cached.
+
+  An artifact is reloaded once an event of the session records a new version
+  of it in its `artifact_delta`, or after `invalidate`.
+  """
+
+  def __init__(self):
+    self._loads: dict[str, asyncio.Future[Optional[types.Part]]] = {}
+    # The number of session events whose artifact deltas were applied.
+    self._events_seen = 0
+    self.hits = 0
+    """The number of loads answered from the cache."""
+    self.misses = 0
+    """The number of loads sent to the artifact service."""
+
+  async def load_artifact(
+      self,
+      artifact_service: BaseArtifactService,
+      session: Session,
+      filename: str,
+  ) -> Optional[types.Part]:
+    """Returns the latest version of a session's artifact, loading it once."""
+    self._apply_artifact_deltas(session)
+    load = self._loads.get(filename)
+    if load is None:
+      self.misses += 1
+      load = asyncio.ensure_future(
+          artifact_service.load_artifact(
+              app_name=session.app_name,
+              user_id=session.user_id,
+              session_id=session.id,
+              filename=filename,
+          )
+      )
+      self._loads[filename] = load
+    else:
+      self.hits += 1
+    try:
+      return await asyncio.shield(load)
+    except Exception:
+      if self._loads.get(filename) is load:
+        del self._loads[filename]
+      raise
+
+  def invalidate(self, filenames: Iterable[str]) -> None:
+    """Drops the cached artifacts with the given filenames."""
+    for filename in filenames:
+      self._loads.pop(filename, None)
+
+  def _apply_artifact_deltas(self, session: Session) -> None:
+    events = session.events
+    if len(events) < self._events_seen:
+      # The session was rewound or replaced.
+      self._loads.clear()
+      self._events_seen = 0
+    for event in events[self._events_seen :]:
+      if event.actions.artifact_delta:
+        self.invalidate(event.actions.artifact_delta)
+    self._events_seen = len(events)
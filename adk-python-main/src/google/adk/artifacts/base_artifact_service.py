@@ -17,6 +17,8 @@ from abc import ABC
 from abc import abstractmethod
 from datetime import datetime
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
 from typing import Optional
 
 from google.genai import types
@@ -60,6 +62,90 @@ class ArtifactVersion(BaseModel):
   )
 
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""The default size of the chunks yielded by `ArtifactReader.iter_chunks`."""
+
+
+class ArtifactReader(ABC):
+  """Reads the payload of one artifact version in byte ranges.
+
+  Readers are returned by `BaseArtifactService.open_artifact` and should be
+  closed when done, preferably by using them as async context managers.
+  """
+
+  def __init__(self, *, size: int, mime_type: Optional[str]):
+    self.size = size
+    """The size of the payload in bytes."""
+    self.mime_type = mime_type
+    """The MIME type of binary payloads, or `None` for text artifacts."""
+
+  @abstractmethod
+  async def _read_range(self, offset: int, length: int) -> bytes:
+    """Reads `length` bytes at `offset`, both within the payload."""
+
+  async def read(self, offset: int = 0, length: Optional[int] = None) -> bytes:
+    """Reads a byte range of the payload.
+
+    Args:
+      offset: The position of the first byte to read.
+      length: The maximum number of bytes to read. If `None`, reads to the end
+        of the payload.
+
+    Returns:
+      The bytes read, which are fewer than `length` at the end of the payload.
+    """
+    offset, length = self._clamp(offset, length)
+    if not length:
+      return b""
+    return await self._read_range(offset, length)
+
+  async def iter_chunks(
+      self,
+      offset: int = 0,
+      length: Optional[int] = None,
+      chunk_size: int = DEFAULT_CHUNK_SIZE,
+  ) -> AsyncIterator[bytes]:
+    """Yields a byte range of the payload in chunks of up to `chunk_size`."""
+    offset, length = self._clamp(offset, length)
+    end = offset + length
+    while offset < end:
+      chunk = await self._read_range(offset, min(chunk_size, end - offset))
+      if not chunk:
+        return
+      yield chunk
+      offset += len(chunk)
+
+  async def close(self) -> None:
+    """Releases the resources held by the reader."""
+
+  async def __aenter__(self) -> ArtifactReader:
+    return self
+
+  async def __aexit__(self, *exc_info) -> None:
+    await self.close()
+
+  def _clamp(self, offset: int, length: Optional[int]) -> tuple[int, int]:
+    if offset < 0 or (length is not None and length < 0):
+      raise ValueError("offset and length must not be negative.")
+    offset = min(offset, self.size)
+    available = self.size - offset
+    return offset, available if length is None else min(length, available)
+
+
+class BytesArtifactReader(ArtifactReader):
+  """Reads a payload that is already in memory.
+
+  Services that keep payloads in memory can return it from `open_artifact`.
+  """
+
+  def __init__(self, data: bytes, mime_type: Optional[str]):
+    super().__init__(size=len(data), mime_type=mime_type)
+    self._data = memoryview(data)
+
+  async def _read_range(self, offset: int, length: int) -> bytes:
+    return bytes(self._data[offset : offset + length])
+
+
 class BaseArtifactService(ABC):
   """Abstract base class for artifact services."""
 
@@ -232,3 +318,85 @@ class BaseArtifactService(ABC):
       An ArtifactVersion object containing the metadata of the specified
       artifact version, or `None` if the artifact version is not found.
     """
+
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: AsyncIterable[bytes],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Saves a binary artifact whose payload is given as chunks of bytes.
+
+    Services that support it store the chunks as they arrive, so that large
+    payloads are never held in memory whole. By default, the chunks are joined
+    and saved with `save_artifact`.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filename: The filename of the artifact.
+      chunks: The payload, in order.
+      mime_type: The MIME type of the payload.
+      session_id: The session ID. If `None`, the artifact is user-scoped.
+      custom_metadata: custom metadata to associate with the artifact.
+
+    Returns:
+      The revision ID, as returned by `save_artifact`.
+    """
+    data = b"".join([chunk async for chunk in chunks])
+    return await self.save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        artifact=types.Part.from_bytes(data=data, mime_type=mime_type),
+        session_id=session_id,
+        custom_metadata=custom_metadata,
+    )
+
+  async def open_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens an artifact for reading its payload in byte ranges.
+
+    Services that support it read only the requested ranges from storage. By
+    default, the artifact is loaded whole with `load_artifact`. Text artifacts
+    are read as UTF-8.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      filename: The filename of the artifact.
+      session_id: The session ID. If `None`, open the user-scoped artifact.
+      version: The version of the artifact. If None, the latest version will be
+        opened.
+
+    Returns:
+      A reader of the artifact payload, or None if not found.
+    """
+    artifact = await self.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+    if artifact is None:
+      return None
+    if artifact.inline_data:
+      return BytesArtifactReader(
+          artifact.inline_data.data or b"", artifact.inline_data.mime_type
+      )
+    if artifact.text is not None:
+      return BytesArtifactReader(artifact.text.encode("utf-8"), None)
+    return None
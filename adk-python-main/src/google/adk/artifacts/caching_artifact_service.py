@@ -0,0 +1,463 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service that caches the artifacts loaded from another one."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import AsyncIterable
+from typing import Optional
+
+from google.genai import types
+from pydantic import ValidationError
+from typing_extensions import override
+
+from ..utils.feature_decorator import experimental
+from .base_artifact_service import ArtifactReader
+from .base_artifact_service import ArtifactVersion
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# App name, user ID, session ID (None for user-scoped artifacts) and filename.
+_ArtifactKey = tuple[str, str, Optional[str], str]
+
+
+def _artifact_key(
+    app_name: str, user_id: str, session_id: Optional[str], filename: str
+) -> _ArtifactKey:
+  if filename.startswith("user:"):
+    session_id = None
+  return (app_name, user_id, session_id, filename)
+
+
+def _part_size(part: types.Part) -> int:
+  """Estimates the memory held by a cached artifact."""
+  size = 0
+  if part.inline_data and part.inline_data.data:
+    size += len(part.inline_data.data)
+  if part.text:
+    size += len(part.text)
+  return max(size, 1)
+
+
+def _copy_part(part: types.Part) -> types.Part:
+  """Returns an artifact that can be modified without affecting the cache."""
+  return part.model_copy(deep=True)
+
+
+@dataclasses.dataclass
+class _Entry:
+  part: types.Part
+  size: int
+  expires_at: Optional[float]
+  """When a cached latest version must be reloaded; None for versions."""
+
+
+class _DiskCache:
+  """An LRU cache of specific artifact versions in a local directory.
+
+  Each version is stored as the JSON of its `types.Part` in
+  `{root}/{artifact digest}/{version}.json`. Entries are evicted, least
+  recently used first, when the files exceed `max_bytes`. The methods block
+  and are run in worker threads.
+  """
+
+  def __init__(self, root: Path, max_bytes: int):
+    self._root = root
+    self._max_bytes = max_bytes
+    self._lock = threading.Lock()
+    self._sizes: OrderedDict[Path, int] = OrderedDict()
+    self._total_bytes = 0
+    self._root.mkdir(parents=True, exist_ok=True)
+    # Entries written by earlier processes, oldest access first.
+    existing = []
+    for path in self._root.glob("*/*.json"):
+      with contextlib.suppress(FileNotFoundError):
+        stat = path.stat()
+        existing.append((stat.st_mtime_ns, path, stat.st_size))
+    for _, path, size in sorted(existing):
+      self._sizes[path] = size
+      self._total_bytes += size
+    self._evict()
+
+  def _artifact_dir(self, key: _ArtifactKey) -> Path:
+    digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+    return self._root / digest
+
+  def get(self, key: _ArtifactKey, version: int) -> Optional[types.Part]:
+    path = self._artifact_dir(key) / f"{version}.json"
+    try:
+      part = types.Part.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+      return None
+    except ValidationError as exc:
+      logger.warning(
+          "Dropping unreadable artifact cache entry %s: %s", path, exc
+      )
+      self._remove(path)
+      return None
+    with self._lock:
+      if path in self._sizes:
+        self._sizes.move_to_end(path)
+    with contextlib.suppress(FileNotFoundError):
+      os.utime(path)
+    return part
+
+  def put(self, key: _ArtifactKey, version: int, part: types.Part) -> None:
+    data = part.model_dump_json(exclude_none=True).encode("utf-8")
+    if len(data) > self._max_bytes:
+      return
+    artifact_dir = self._artifact_dir(key)
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    path = artifact_dir / f"{version}.json"
+    fd, tmp_name = tempfile.mkstemp(dir=artifact_dir, suffix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as tmp_file:
+        tmp_file.write(data)
+      os.replace(tmp_name, path)
+    except BaseException:
+      with contextlib.suppress(FileNotFoundError):
+        os.unlink(tmp_name)
+      raise
+    with self._lock:
+      self._total_bytes += len(data) - self._sizes.pop(path, 0)
+      self._sizes[path] = len(data)
+      self._evict()
+
+  def delete(self, key: _ArtifactKey) -> None:
+    artifact_dir = self._artifact_dir(key)
+    with self._lock:
+      for path in [p for p in self._sizes if p.parent == artifact_dir]:
+        self._total_bytes -= self._sizes.pop(path)
+    for path in artifact_dir.glob("*.json"):
+      with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+    with contextlib.suppress(OSError):
+      artifact_dir.rmdir()
+
+  def _remove(self, path: Path) -> None:
+    with self._lock:
+      self._total_bytes -= self._sizes.pop(path, 0)
+    with contextlib.suppress(FileNotFoundError):
+      path.unlink()
+
+  def _evict(self) -> None:
+    while self._total_bytes > self._max_bytes and self._sizes:
+      path, size = self._sizes.popitem(last=False)
+      self._total_bytes -= size
+      with contextlib.suppress(FileNotFoundError):
+        path.unlink()
+
+
+@experimental
+class CachingArtifactService(BaseArtifactService):
+  """An artifact service that caches the artifacts loaded from another one.
+
+  Loading an artifact that was loaded before, e.g. by an instruction
+  placeholder on every model call, is answered locally instead of downloading
+  it again. Specific versions never change and are kept until they are
+  evicted. The latest version of an artifact is kept for
+  `latest_ttl_seconds`, since other processes may save newer versions.
+  Saving or deleting an artifact through this service drops its cached latest
+  version right away, and deleting it also drops its cached versions.
+
+  Cached artifacts are evicted least recently used first once their size
+  exceeds `max_bytes`. With `disk_cache_dir`, specific versions are also kept
+  in a local directory, bounded by `max_disk_bytes`, which outlives the
+  process. Artifacts deleted and re-created by other processes may be served
+  stale from the disk cache; clear it after doing so.
+  """
+
+  def __init__(
+      self,
+      artifact_service: BaseArtifactService,
+      *,
+      max_bytes: int = 64 * 1024 * 1024,
+      latest_ttl_seconds: float = 5.0,
+      disk_cache_dir: Optional[Path | str] = None,
+      max_disk_bytes: int = 1024 * 1024 * 1024,
+  ):
+    """Initializes the caching artifact service.
+
+    Args:
+      artifact_service: The artifact service to cache the artifacts of.
+      max_bytes: The maximum total size of the artifacts cached in memory.
+      latest_ttl_seconds: How long a loaded latest version is reused.
+      disk_cache_dir: A local directory to also cache specific versions in. If
+        `None`, artifacts are only cached in memory.
+      max_disk_bytes: The maximum total size of the files in
+        `disk_cache_dir`.
+    """
+    self._artifact_service = artifact_service
+    self._max_bytes = max_bytes
+    self._latest_ttl_seconds = latest_ttl_seconds
+    self._entries: OrderedDict[
+        tuple[_ArtifactKey, Optional[int]], _Entry
+    ] = OrderedDict()
+    self._total_bytes = 0
+    self._disk_cache = (
+        _DiskCache(Path(disk_cache_dir).expanduser(), max_disk_bytes)
+        if disk_cache_dir is not None
+        else None
+    )
+    # Bumped on every save and delete, so that loads which started before
+    # the write completed do not cache what the write replaced.
+    self._generations: dict[_ArtifactKey, int] = {}
+    self.hits = 0
+    """The number of loads answered from the cache."""
+    self.misses = 0
+    """The number of loads sent to the wrapped artifact service."""
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      artifact: types.Part,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    key = _artifact_key(app_name, user_id, session_id, filename)
+    try:
+      return await self._artifact_service.save_artifact(
+          app_name=app_name,
+          user_id=user_id,
+          filename=filename,
+          artifact=artifact,
+          session_id=session_id,
+          custom_metadata=custom_metadata,
+      )
+    finally:
+      self._invalidate(key)
+
+  @override
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: AsyncIterable[bytes],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    key = _artifact_key(app_name, user_id, session_id, filename)
+    try:
+      return await self._artifact_service.save_artifact_stream(
+          app_name=app_name,
+          user_id=user_id,
+          filename=filename,
+          chunks=chunks,
+          mime_type=mime_type,
+          session_id=session_id,
+          custom_metadata=custom_metadata,
+      )
+    finally:
+      self._invalidate(key)
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    key = _artifact_key(app_name, user_id, session_id, filename)
+    entry = self._entries.get((key, version))
+    if entry is not None:
+      if entry.expires_at is None or entry.expires_at > time.monotonic():
+        self.hits += 1
+        self._entries.move_to_end((key, version))
+        return _copy_part(entry.part)
+      self._remove((key, version))
+
+    generation = self._generations.get(key, 0)
+    if version is not None and self._disk_cache is not None:
+      artifact = await asyncio.to_thread(self._disk_cache.get, key, version)
+      if artifact is not None:
+        self.hits += 1
+        if generation == self._generations.get(key, 0):
+          self._put(key, version, artifact)
+        return _copy_part(artifact)
+
+    self.misses += 1
+    artifact = await self._artifact_service.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+    if artifact is None or generation != self._generations.get(key, 0):
+      return artifact
+    self._put(key, version, artifact)
+    if version is not None and self._disk_cache is not None:
+      try:
+        await asyncio.to_thread(self._disk_cache.put, key, version, artifact)
+      except OSError as exc:
+        logger.warning("Failed to cache artifact %s on disk: %s", filename, exc)
+    return _copy_part(artifact)
+
+  @override
+  async def open_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    # Ranged reads of large payloads go to the wrapped service uncached.
+    return await self._artifact_service.open_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: Optional[str] = None
+  ) -> list[str]:
+    return await self._artifact_service.list_artifact_keys(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+
+  @override
+  async def delete_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> None:
+    key = _artifact_key(app_name, user_id, session_id, filename)
+    try:
+      await self._artifact_service.delete_artifact(
+          app_name=app_name,
+          user_id=user_id,
+          filename=filename,
+          session_id=session_id,
+      )
+    finally:
+      self._invalidate(key, all_versions=True)
+      if self._disk_cache is not None:
+        await asyncio.to_thread(self._disk_cache.delete, key)
+
+  @override
+  async def list_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[int]:
+    return await self._artifact_service.list_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+
+  @override
+  async def list_artifact_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[ArtifactVersion]:
+    return await self._artifact_service.list_artifact_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+
+  @override
+  async def get_artifact_version(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactVersion]:
+    return await self._artifact_service.get_artifact_version(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+        version=version,
+    )
+
+  def _put(
+      self, key: _ArtifactKey, version: Optional[int], artifact: types.Part
+  ) -> None:
+    size = _part_size(artifact)
+    if size > self._max_bytes:
+      return
+    self._remove((key, version))
+    self._entries[(key, version)] = _Entry(
+        part=artifact,
+        size=size,
+        expires_at=(
+            time.monotonic() + self._latest_ttl_seconds
+            if version is None
+            else None
+        ),
+    )
+    self._total_bytes += size
+    while self._total_bytes > self._max_bytes:
+      _, evicted = self._entries.popitem(last=False)
+      self._total_bytes -= evicted.size
+
+  def _remove(self, entry_key: tuple[_ArtifactKey, Optional[int]]) -> None:
+    entry = self._entries.pop(entry_key, None)
+    if entry is not None:
+      self._total_bytes -= entry.size
+
+  def _invalidate(self, key: _ArtifactKey, all_versions: bool = False) -> None:
+    self._generations[key] = self._generations.get(key, 0) + 1
+    if all_versions:
+      for entry_key in [k for k in self._entries if k[0] == key]:
+        self._remove(entry_key)
+    else:
+      self._remove((key, None))
@@ -14,14 +14,27 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import errno
+import hashlib
+import json
 import logging
+import mmap
 import os
 from pathlib import Path
 from pathlib import PurePosixPath
 from pathlib import PureWindowsPath
+import secrets
 import shutil
+import threading
+import time
 from typing import Any
+from typing import AsyncIterable
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterator
 from typing import Optional
+from typing import TypeVar
 from urllib.parse import unquote
 from urllib.parse import urlparse
 
@@ -33,6 +46,7 @@ from pydantic import ValidationError
 from typing_extensions import override
 
 from ..errors.input_validation_error import InputValidationError
+from .base_artifact_service import ArtifactReader
 from .base_artifact_service import ArtifactVersion
 from .base_artifact_service import BaseArtifactService
 
@@ -171,6 +185,178 @@ def _list_versions_on_disk(artifact_dir: Path) -> list[int]:
   return sorted(versions)
 
 
+# Flags of the temporary files, created with the mode `open()` would give new
+# files, as the kernel applies the current umask to it. `mkstemp` always uses
+# 0o600 instead.
+_TEMP_FILE_FLAGS = (
+    os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+)
+_TEMP_FILE_MODE = 0o666
+
+# Errors of `os.link` that mean hard links are unavailable at the target.
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        errno.EPERM,
+        errno.EXDEV,
+        errno.EMLINK,
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "EOPNOTSUPP", None),
+    )
+    if code is not None
+)
+
+
+def _mkstemp(directory: Path) -> tuple[int, str]:
+  """Creates a temporary file with the default permissions of new files."""
+  while True:
+    temp_path = os.path.join(directory, f".tmp-{secrets.token_hex(8)}")
+    try:
+      return os.open(temp_path, _TEMP_FILE_FLAGS, _TEMP_FILE_MODE), temp_path
+    except FileExistsError:
+      continue
+
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+  """Writes a file via a temporary sibling so readers never see partial data."""
+  fd, temp_path = _mkstemp(path.parent)
+  try:
+    with os.fdopen(fd, "wb") as f:
+      f.write(data)
+    os.replace(temp_path, path)
+  except BaseException:
+    with contextlib.suppress(OSError):
+      os.unlink(temp_path)
+    raise
+
+
+def _link_or_move(source: str, path: Path) -> None:
+  """Places the content of `source` at `path` without copying it."""
+  try:
+    os.link(source, path)
+  except FileExistsError:
+    # Blobs are named by content, so the existing one has the same bytes.
+    pass
+  except OSError as exc:
+    if exc.errno not in _LINK_UNSUPPORTED_ERRNOS:
+      raise
+    os.replace(source, path)
+
+
+def _write_chunk(file: BinaryIO, hasher: Any, chunk: bytes) -> None:
+  hasher.update(chunk)
+  file.write(chunk)
+
+
+class _BlobStore:
+  """Stores payloads once per distinct content, named by their SHA-256.
+
+  Each artifact version holds a hard link to its blob, so the number of links
+  of a blob is its reference count, maintained by the filesystem. A blob that
+  is only linked from the store itself is unreferenced and can be removed.
+  """
+
+  def __init__(self, root: Path):
+    self._root = root
+    # Serializes linking against garbage collection within this process.
+    self._lock = threading.Lock()
+
+  def path(self, digest: str) -> Path:
+    return self._root / digest[:2] / digest
+
+  def create_temp_file(self) -> tuple[int, str]:
+    """Creates a file to stage content in, on the same filesystem as blobs."""
+    self._root.mkdir(parents=True, exist_ok=True)
+    return _mkstemp(self._root)
+
+  def link(self, data: bytes, target: Path) -> str:
+    """Creates `target` with the content and returns the content digest.
+
+    The payload is written only if no blob with the same content exists.
+    Falls back to moving the blob to `target` where hard links are not
+    supported.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    self._link(digest, target, lambda path: _write_file_atomic(path, data))
+    return digest
+
+  def link_file(self, source: str, digest: str, target: Path) -> str:
+    """Like `link`, for content staged in a file from `create_temp_file`.
+
+    The caller removes `source` afterwards.
+    """
+    self._link(digest, target, lambda path: _link_or_move(source, path))
+    return digest
+
+  def _link(
+      self, digest: str, target: Path, write_blob: Callable[[Path], None]
+  ) -> None:
+    blob_path = self.path(digest)
+    with self._lock:
+      for _ in range(2):
+        if not blob_path.exists():
+          blob_path.parent.mkdir(parents=True, exist_ok=True)
+          write_blob(blob_path)
+        try:
+          os.link(blob_path, target)
+          return
+        except FileNotFoundError:
+          # Collected by another process in between; write it again.
+          continue
+        except OSError as exc:
+          # Anything else, such as an existing target, is a real failure and
+          # must not move the shared blob away.
+          if exc.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+          logger.debug("Hard links unavailable at %s: %s", target, exc)
+          break
+      # Without links the blob cannot be shared, so it becomes the payload.
+      try:
+        os.replace(blob_path, target)
+      except FileNotFoundError:
+        write_blob(target)
+
+  def release(self, digests: set[str]) -> None:
+    """Removes the blobs that are no longer linked from any version."""
+    with self._lock:
+      for digest in digests:
+        blob_path = self.path(digest)
+        try:
+          if blob_path.stat().st_nlink <= 1:
+            blob_path.unlink()
+            logger.debug("Removed unreferenced blob %s", digest)
+        except FileNotFoundError:
+          pass
+
+
+class _FileArtifactReader(ArtifactReader):
+  """Reads byte ranges of a payload file through a read-only memory map."""
+
+  def __init__(self, path: Path, mime_type: Optional[str]):
+    self._file = open(path, "rb")
+    size = os.fstat(self._file.fileno()).st_size
+    # Empty files cannot be mapped, and have no ranges to read.
+    self._mmap = (
+        mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if size
+        else None
+    )
+    super().__init__(size=size, mime_type=mime_type)
+
+  @override
+  async def _read_range(self, offset: int, length: int) -> bytes:
+    # Slicing may fault pages in from disk, so it runs off the event loop.
+    return await asyncio.to_thread(
+        self._mmap.__getitem__, slice(offset, offset + length)
+    )
+
+  @override
+  async def close(self) -> None:
+    if self._mmap is not None:
+      self._mmap.close()
+    self._file.close()
+
+
 class FileArtifactVersion(ArtifactVersion):
   """Represents persisted metadata for a file-backed artifact."""
 
@@ -182,6 +368,212 @@ class FileArtifactVersion(ArtifactVersion):
   file_name: str = Field(
       description="Original filename supplied by the caller."
   )
+  content_hash: Optional[str] = Field(
+      default=None,
+      description="SHA-256 hex digest of the payload, naming its blob.",
+  )
+
+
+_T = TypeVar("_T")
+
+_Manifest = dict[str, dict[int, Optional[FileArtifactVersion]]]
+"""Scope-relative artifact path to the metadata of its versions, ascending."""
+
+_MANIFEST_SUFFIX = ".manifest.json"
+_MANIFEST_FORMAT_VERSION = 1
+# A lock held longer than this is assumed to be left by a crashed process.
+_MANIFEST_LOCK_STALE_SECONDS = 30.0
+
+
+def _manifest_path(scope_root: Path) -> Path:
+  """Returns the manifest of a scope.
+
+  It is stored next to the scope root rather than in it, so that no artifact
+  name can collide with it.
+  """
+  return scope_root.with_name(scope_root.name + _MANIFEST_SUFFIX)
+
+
+@contextlib.contextmanager
+def _manifest_lock(manifest_path: Path) -> Iterator[None]:
+  """Serializes the updates of a manifest across processes.
+
+  The lock is an exclusively created file, which works on any filesystem,
+  including network filesystems without reliable advisory locks.
+  """
+  lock_path = manifest_path.with_name(manifest_path.name + ".lock")
+  while True:
+    try:
+      os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+      break
+    except FileExistsError:
+      try:
+        age = time.time() - lock_path.stat().st_mtime
+      except FileNotFoundError:
+        continue
+      if age > _MANIFEST_LOCK_STALE_SECONDS:
+        logger.warning("Breaking stale artifact manifest lock %s", lock_path)
+        with contextlib.suppress(FileNotFoundError):
+          lock_path.unlink()
+        continue
+      time.sleep(0.005)
+  try:
+    yield
+  finally:
+    with contextlib.suppress(FileNotFoundError):
+      lock_path.unlink()
+
+
+def _scan_scope(scope_root: Path) -> _Manifest:
+  """Builds the manifest of a scope from the artifact directories on disk."""
+  manifest: _Manifest = {}
+  for artifact_dir in _iter_artifact_dirs(scope_root):
+    key = artifact_dir.relative_to(scope_root).as_posix()
+    manifest[key] = {
+        version: _read_metadata(_metadata_path(artifact_dir, version))
+        for version in _list_versions_on_disk(artifact_dir)
+    }
+  return manifest
+
+
+def _load_manifest(path: Path) -> Optional[_Manifest]:
+  """Reads a manifest, or returns None if it is missing or unreadable."""
+  try:
+    raw = json.loads(path.read_bytes())
+    if raw.get("formatVersion") != _MANIFEST_FORMAT_VERSION:
+      raise ValueError(f"unsupported format {raw.get('formatVersion')!r}")
+    manifest: _Manifest = {}
+    for key, versions in raw["artifacts"].items():
+      manifest[key] = {
+          int(version): (
+              None
+              if metadata is None
+              else FileArtifactVersion.model_validate(metadata)
+          )
+          for version, metadata in sorted(
+              versions.items(), key=lambda item: int(item[0])
+          )
+      }
+    return manifest
+  except FileNotFoundError:
+    return None
+  except (ValidationError, ValueError, KeyError, AttributeError) as exc:
+    logger.warning("Ignoring invalid artifact manifest %s: %s", path, exc)
+    return None
+
+
+def _dump_manifest(manifest: _Manifest) -> bytes:
+  return json.dumps(
+      {
+          "formatVersion": _MANIFEST_FORMAT_VERSION,
+          "artifacts": {
+              key: {
+                  str(version): (
+                      None
+                      if metadata is None
+                      else metadata.model_dump(
+                          mode="json", by_alias=True, exclude_none=True
+                      )
+                  )
+                  for version, metadata in versions.items()
+              }
+              for key, versions in manifest.items()
+          },
+      },
+      separators=(",", ":"),
+  ).encode("utf-8")
+
+
+def _latest_version(versions: dict[int, Any]) -> int:
+  return next(reversed(versions))
+
+
+class _ManifestStore:
+  """Keeps a manifest of the artifact versions and metadata of each scope.
+
+  Lookups read one small file instead of walking the artifact directories
+  and parsing every `metadata.json`, and the parsed manifest is reused for
+  as long as the file is unchanged. Updates rewrite the manifest atomically
+  under a lock file, so that concurrent writers, including other processes,
+  do not lose each other's versions.
+
+  The version directories stay the source of truth: a missing or unreadable
+  manifest is rebuilt from them, and `FileArtifactService.rebuild_index`
+  rebuilds every manifest after the tree was modified by other means.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    # Manifest path -> (file signature, parsed manifest). Cached manifests
+    # are shared and must not be modified.
+    self._cache: dict[Path, tuple[tuple[int, int, int], _Manifest]] = {}
+
+  def read(self, scope_root: Path) -> _Manifest:
+    """Returns the manifest of a scope, building it if it is missing."""
+    path = _manifest_path(scope_root)
+    try:
+      stat = path.stat()
+    except FileNotFoundError:
+      if not scope_root.exists():
+        return {}
+      # Scopes written before manifests existed are indexed on first use.
+      return self.rebuild(scope_root)
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    with self._lock:
+      cached = self._cache.get(path)
+    if cached is not None and cached[0] == signature:
+      return cached[1]
+    manifest = _load_manifest(path)
+    if manifest is None:
+      return self.rebuild(scope_root)
+    with self._lock:
+      self._cache[path] = (signature, manifest)
+    return manifest
+
+  def update(
+      self, scope_root: Path, mutate: Callable[[_Manifest], _T]
+  ) -> _T:
+    """Applies `mutate` to a fresh copy of the manifest and saves it."""
+    return self._update(scope_root, mutate, rescan=False)
+
+  def rebuild(self, scope_root: Path) -> _Manifest:
+    """Rebuilds the manifest of a scope from disk."""
+    return self._update(scope_root, lambda manifest: manifest, rescan=True)
+
+  def _update(
+      self,
+      scope_root: Path,
+      mutate: Callable[[_Manifest], _T],
+      *,
+      rescan: bool,
+  ) -> _T:
+    path = _manifest_path(scope_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with self._lock, _manifest_lock(path):
+      manifest = None if rescan else _load_manifest(path)
+      if manifest is None:
+        manifest = _scan_scope(scope_root)
+      result = mutate(manifest)
+      _write_file_atomic(path, _dump_manifest(manifest))
+      stat = path.stat()
+      self._cache[path] = (
+          (stat.st_ino, stat.st_mtime_ns, stat.st_size),
+          manifest,
+      )
+    return result
+
+
+def _record_version(
+    manifest: _Manifest,
+    key: str,
+    version: int,
+    metadata: Optional[FileArtifactVersion],
+) -> None:
+  versions = manifest.setdefault(key, {})
+  versions[version] = metadata
+  if version != _latest_version(versions):
+    # Recorded after a later version of a concurrent writer.
+    manifest[key] = dict(sorted(versions.items()))
 
 
 class FileArtifactService(BaseArtifactService):
@@ -206,6 +598,17 @@ class FileArtifactService(BaseArtifactService):
   # nested directories, and path traversal is rejected to keep the layout
   # portable across filesystems. `{artifact_path}` therefore mirrors the
   # sanitized, scope-relative path derived from each filename.
+  #
+  # Payloads are deduplicated: each distinct content is stored once under
+  # root/blobs/sha256/{digest[:2]}/{digest}, and every version payload is a
+  # hard link to its blob. Deleting an artifact removes the blobs no other
+  # version links to.
+  #
+  # Each scope directory has a manifest next to it, e.g.
+  # users/{user_id}/artifacts.manifest.json, indexing the versions and
+  # metadata of its artifacts so that lookups and listings do not walk the
+  # tree. Run `adk artifacts rebuild_index` after modifying the tree by other
+  # means.
 
   def __init__(self, root_dir: Path | str):
     """Initializes the file-based artifact service.
@@ -215,6 +618,8 @@ class FileArtifactService(BaseArtifactService):
     """
     self.root_dir = Path(root_dir).expanduser().resolve()
     self.root_dir.mkdir(parents=True, exist_ok=True)
+    self._blob_store = _BlobStore(self.root_dir / "blobs" / "sha256")
+    self._manifests = _ManifestStore()
 
   def _base_root(self, user_id: str, /) -> Path:
     """Returns the artifacts root directory for a user."""
@@ -251,6 +656,72 @@ class FileArtifactService(BaseArtifactService):
     artifact_dir, _ = _resolve_scoped_artifact_path(scope_root, filename)
     return artifact_dir
 
+  def _artifact_location(
+      self,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> tuple[Path, Path, str]:
+    """Returns the scope root, the artifact directory and its manifest key."""
+    scope_root = self._scope_root(
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+    artifact_dir, relative = _resolve_scoped_artifact_path(
+        scope_root, filename
+    )
+    return scope_root, artifact_dir, relative.as_posix()
+
+  def _manifest_versions(
+      self,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> dict[int, Optional[FileArtifactVersion]]:
+    """Returns the metadata of an artifact's versions, ascending."""
+    scope_root, _, key = self._artifact_location(
+        user_id, session_id, filename
+    )
+    return self._manifests.read(scope_root).get(key, {})
+
+  async def rebuild_index(self) -> int:
+    """Rebuilds the manifests of every scope from the files on disk.
+
+    Use this after artifacts were written, restored or removed without this
+    service, e.g. by copying directories or by another tool.
+
+    Returns:
+      The number of scopes indexed.
+    """
+    return await asyncio.to_thread(self._rebuild_index_sync)
+
+  def _rebuild_index_sync(self) -> int:
+    users_root = self.root_dir / "users"
+    if not users_root.exists():
+      return 0
+    scope_roots: list[Path] = []
+    for user_root in users_root.iterdir():
+      if not user_root.is_dir():
+        continue
+      scope_roots.append(_user_artifacts_dir(user_root))
+      sessions_root = user_root / "sessions"
+      if sessions_root.is_dir():
+        scope_roots.extend(
+            session_root / "artifacts"
+            for session_root in sessions_root.iterdir()
+            if session_root.is_dir()
+        )
+    rebuilt = 0
+    for scope_root in scope_roots:
+      if scope_root.exists() or _manifest_path(scope_root).exists():
+        self._manifests.rebuild(scope_root)
+        rebuilt += 1
+    logger.info(
+        "Rebuilt %d artifact manifests under %s", rebuilt, self.root_dir
+    )
+    return rebuilt
+
   def _build_artifact_version(
       self,
       *,
@@ -298,15 +769,6 @@ class FileArtifactService(BaseArtifactService):
     payload_path = _versions_dir(artifact_dir) / str(version) / stored_filename
     return payload_path.resolve().as_uri()
 
-  def _latest_metadata(
-      self, artifact_dir: Path
-  ) -> Optional[FileArtifactVersion]:
-    """Loads metadata for the most recent version."""
-    versions = _list_versions_on_disk(artifact_dir)
-    if not versions:
-      return None
-    return _read_metadata(_metadata_path(artifact_dir, versions[-1]))
-
   @override
   async def save_artifact(
       self,
@@ -344,37 +806,107 @@ class FileArtifactService(BaseArtifactService):
       custom_metadata: Optional[dict[str, Any]],
   ) -> int:
     """Saves an artifact to disk and returns its version."""
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    artifact_dir.mkdir(parents=True, exist_ok=True)
-
-    versions = _list_versions_on_disk(artifact_dir)
-    next_version = 0 if not versions else versions[-1] + 1
-    versions_dir = _versions_dir(artifact_dir)
-    versions_dir.mkdir(parents=True, exist_ok=True)
-    version_dir = versions_dir / str(next_version)
-    version_dir.mkdir()
-
-    stored_filename = artifact_dir.name
-    content_path = version_dir / stored_filename
-
     if artifact.inline_data:
-      content_path.write_bytes(artifact.inline_data.data)
+      data = artifact.inline_data.data
       mime_type = (
           artifact.inline_data.mime_type
           if artifact.inline_data.mime_type
           else "application/octet-stream"
       )
     elif artifact.text is not None:
-      content_path.write_text(artifact.text, encoding="utf-8")
+      data = artifact.text.encode("utf-8")
       mime_type = None
     else:
       raise InputValidationError(
           "Artifact must have either inline_data or text content."
       )
+    return self._save_version_sync(
+        user_id,
+        filename,
+        session_id,
+        custom_metadata,
+        mime_type,
+        lambda content_path: self._blob_store.link(data, content_path),
+    )
+
+  @override
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: AsyncIterable[bytes],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Persists a binary artifact to disk as its chunks arrive.
+
+    The chunks are staged in a temporary file next to the blob store, and the
+    version is created once all of them are written.
+    """
+    # Rejects invalid filenames before consuming the chunks.
+    self._artifact_dir(
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+    fd, temp_path = await asyncio.to_thread(self._blob_store.create_temp_file)
+    try:
+      hasher = hashlib.sha256()
+      with os.fdopen(fd, "wb") as temp_file:
+        async for chunk in chunks:
+          await asyncio.to_thread(_write_chunk, temp_file, hasher, chunk)
+      digest = hasher.hexdigest()
+      return await asyncio.to_thread(
+          self._save_version_sync,
+          user_id,
+          filename,
+          session_id,
+          custom_metadata,
+          mime_type or "application/octet-stream",
+          lambda content_path: self._blob_store.link_file(
+              temp_path, digest, content_path
+          ),
+      )
+    finally:
+      with contextlib.suppress(OSError):
+        os.unlink(temp_path)
+
+  def _save_version_sync(
+      self,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      custom_metadata: Optional[dict[str, Any]],
+      mime_type: Optional[str],
+      store_payload: Callable[[Path], str],
+  ) -> int:
+    """Creates the next version, storing its payload with `store_payload`.
+
+    `store_payload` creates the payload file at the given path and returns the
+    content hash.
+    """
+    scope_root, artifact_dir, key = self._artifact_location(
+        user_id, session_id, filename
+    )
+    versions = self._manifests.read(scope_root).get(key)
+    next_version = _latest_version(versions) + 1 if versions else 0
+    versions_dir = _versions_dir(artifact_dir)
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    while True:
+      version_dir = versions_dir / str(next_version)
+      try:
+        version_dir.mkdir()
+        break
+      except FileExistsError:
+        # Taken by a concurrent writer, or left unrecorded by a crash.
+        next_version = _list_versions_on_disk(artifact_dir)[-1] + 1
+
+    stored_filename = artifact_dir.name
+    content_path = version_dir / stored_filename
+    content_hash = store_payload(content_path)
 
     canonical_uri = self._canonical_uri(
         user_id=user_id,
@@ -382,13 +914,20 @@ class FileArtifactService(BaseArtifactService):
         filename=filename,
         version=next_version,
     )
-    _write_metadata(
+    metadata = _write_metadata(
         version_dir / "metadata.json",
         filename=filename,
         mime_type=mime_type,
         version=next_version,
         canonical_uri=canonical_uri,
         custom_metadata=custom_metadata,
+        content_hash=content_hash,
+    )
+    self._manifests.update(
+        scope_root,
+        lambda manifest: _record_version(
+            manifest, key, next_version, metadata
+        ),
     )
 
     logger.debug(
@@ -425,27 +964,73 @@ class FileArtifactService(BaseArtifactService):
       version: Optional[int],
   ) -> Optional[types.Part]:
     """Loads an artifact from disk."""
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
+    payload = self._payload_sync(user_id, filename, session_id, version)
+    if payload is None:
+      return None
+    content_path, mime_type = payload
+    if mime_type:
+      data = content_path.read_bytes()
+      return types.Part(inline_data=types.Blob(mime_type=mime_type, data=data))
+
+    text = content_path.read_text(encoding="utf-8")
+    return types.Part(text=text)
+
+  @override
+  async def open_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens an artifact payload for reading through a memory map."""
+    return await asyncio.to_thread(
+        self._open_artifact_sync,
+        user_id,
+        filename,
+        session_id,
+        version,
     )
-    if not artifact_dir.exists():
+
+  def _open_artifact_sync(
+      self,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      version: Optional[int],
+  ) -> Optional[ArtifactReader]:
+    payload = self._payload_sync(user_id, filename, session_id, version)
+    if payload is None:
       return None
+    content_path, mime_type = payload
+    return _FileArtifactReader(content_path, mime_type)
 
-    versions = _list_versions_on_disk(artifact_dir)
+  def _payload_sync(
+      self,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+      version: Optional[int],
+  ) -> Optional[tuple[Path, Optional[str]]]:
+    """Returns the payload path and MIME type of an artifact version."""
+    scope_root, artifact_dir, key = self._artifact_location(
+        user_id, session_id, filename
+    )
+    versions = self._manifests.read(scope_root).get(key)
     if not versions:
       return None
 
     if version is None:
-      version_to_load = versions[-1]
+      version_to_load = _latest_version(versions)
     else:
       if version not in versions:
         return None
       version_to_load = version
 
     version_dir = _versions_dir(artifact_dir) / str(version_to_load)
-    metadata = _read_metadata(_metadata_path(artifact_dir, version_to_load))
+    metadata = versions[version_to_load]
     mime_type = metadata.mime_type if metadata else None
     stored_filename = artifact_dir.name
     content_path = version_dir / stored_filename
@@ -454,21 +1039,15 @@ class FileArtifactService(BaseArtifactService):
       if uri_path and uri_path.exists():
         content_path = uri_path
 
-    if mime_type:
-      if not content_path.exists():
-        logger.warning(
-            "Binary artifact %s missing at %s", filename, content_path
-        )
-        return None
-      data = content_path.read_bytes()
-      return types.Part(inline_data=types.Blob(mime_type=mime_type, data=data))
-
     if not content_path.exists():
-      logger.warning("Text artifact %s missing at %s", filename, content_path)
+      logger.warning(
+          "%s artifact %s missing at %s",
+          "Binary" if mime_type else "Text",
+          filename,
+          content_path,
+      )
       return None
-
-    text = content_path.read_text(encoding="utf-8")
-    return types.Part(text=text)
+    return content_path, mime_type
 
   @override
   async def list_artifact_keys(
@@ -494,24 +1073,16 @@ class FileArtifactService(BaseArtifactService):
 
     base_root = self._base_root(user_id)
 
+    scopes = [(_user_artifacts_dir(base_root), "user:")]
     if session_id:
-      session_root = _session_artifacts_dir(base_root, session_id)
-      for artifact_dir in _iter_artifact_dirs(session_root):
-        metadata = self._latest_metadata(artifact_dir)
+      scopes.insert(0, (_session_artifacts_dir(base_root, session_id), ""))
+    for scope_root, prefix in scopes:
+      for key, versions in self._manifests.read(scope_root).items():
+        metadata = versions[_latest_version(versions)] if versions else None
         if metadata and metadata.file_name:
           filenames.add(str(metadata.file_name))
         else:
-          rel = artifact_dir.relative_to(session_root)
-          filenames.add(rel.as_posix())
-
-    user_root = _user_artifacts_dir(base_root)
-    for artifact_dir in _iter_artifact_dirs(user_root):
-      metadata = self._latest_metadata(artifact_dir)
-      if metadata and metadata.file_name:
-        filenames.add(str(metadata.file_name))
-      else:
-        rel = artifact_dir.relative_to(user_root)
-        filenames.add(f"user:{rel.as_posix()}")
+          filenames.add(f"{prefix}{key}")
 
     return sorted(filenames)
 
@@ -546,13 +1117,20 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> None:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
+    scope_root, artifact_dir, key = self._artifact_location(
+        user_id, session_id, filename
+    )
+    versions = self._manifests.update(
+        scope_root, lambda manifest: manifest.pop(key, None)
     )
     if artifact_dir.exists():
+      digests = {
+          metadata.content_hash
+          for metadata in (versions or {}).values()
+          if metadata and metadata.content_hash
+      }
       shutil.rmtree(artifact_dir)
+      self._blob_store.release(digests)
       logger.debug("Deleted artifact %s at %s", filename, artifact_dir)
 
   @override
@@ -578,12 +1156,7 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> list[int]:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    return _list_versions_on_disk(artifact_dir)
+    return list(self._manifest_versions(user_id, session_id, filename))
 
   @override
   async def list_artifact_versions(
@@ -608,16 +1181,9 @@ class FileArtifactService(BaseArtifactService):
       filename: str,
       session_id: Optional[str],
   ) -> list[ArtifactVersion]:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    versions = _list_versions_on_disk(artifact_dir)
+    versions = self._manifest_versions(user_id, session_id, filename)
     artifact_versions: list[ArtifactVersion] = []
-    for version in versions:
-      metadata_path = _metadata_path(artifact_dir, version)
-      metadata = _read_metadata(metadata_path)
+    for version, metadata in versions.items():
       artifact_versions.append(
           self._build_artifact_version(
               user_id=user_id,
@@ -655,23 +1221,17 @@ class FileArtifactService(BaseArtifactService):
       session_id: Optional[str],
       version: Optional[int],
   ) -> Optional[ArtifactVersion]:
-    artifact_dir = self._artifact_dir(
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    versions = _list_versions_on_disk(artifact_dir)
+    versions = self._manifest_versions(user_id, session_id, filename)
     if not versions:
       return None
     if version is None:
-      version_to_read = versions[-1]
+      version_to_read = _latest_version(versions)
     else:
       if version not in versions:
         return None
       version_to_read = version
 
-    metadata_path = _metadata_path(artifact_dir, version_to_read)
-    metadata = _read_metadata(metadata_path)
+    metadata = versions[version_to_read]
     return self._build_artifact_version(
         user_id=user_id,
         session_id=session_id,
@@ -689,7 +1249,8 @@ def _write_metadata(
     version: int,
     canonical_uri: str,
     custom_metadata: Optional[dict[str, Any]],
-) -> None:
+    content_hash: Optional[str] = None,
+) -> FileArtifactVersion:
   """Persists metadata describing an artifact version."""
   metadata = FileArtifactVersion(
       file_name=filename,
@@ -699,11 +1260,15 @@ def _write_metadata(
       # Persist caller supplied metadata for feature parity with other
       # artifact services (e.g. GCS).
       custom_metadata=dict(custom_metadata or {}),
+      content_hash=content_hash,
   )
-  path.write_text(
-      metadata.model_dump_json(by_alias=True, exclude_none=True),
-      encoding="utf-8",
+  _write_file_atomic(
+      path,
+      metadata.model_dump_json(by_alias=True, exclude_none=True).encode(
+          "utf-8"
+      ),
   )
+  return metadata
 
 
 def _read_metadata(path: Path) -> Optional[FileArtifactVersion]:
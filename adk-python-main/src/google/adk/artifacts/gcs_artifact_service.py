@@ -24,18 +24,41 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import tempfile
 from typing import Any
+from typing import AsyncIterable
+from typing import BinaryIO
 from typing import Optional
 
 from google.genai import types
 from typing_extensions import override
 
 from ..errors.input_validation_error import InputValidationError
+from .base_artifact_service import ArtifactReader
 from .base_artifact_service import ArtifactVersion
 from .base_artifact_service import BaseArtifactService
 
 logger = logging.getLogger("google_adk." + __name__)
 
+# Streamed payloads are buffered in memory up to this size, then on disk.
+_STREAM_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+class _GcsArtifactReader(ArtifactReader):
+  """Reads byte ranges of a blob with ranged downloads."""
+
+  def __init__(self, blob: Any):
+    super().__init__(size=blob.size or 0, mime_type=blob.content_type)
+    self._blob = blob
+
+  @override
+  async def _read_range(self, offset: int, length: int) -> bytes:
+    return await asyncio.to_thread(
+        self._blob.download_as_bytes,
+        start=offset,
+        end=offset + length - 1,
+    )
+
 
 class GcsArtifactService(BaseArtifactService):
   """An artifact service implementation using Google Cloud Storage (GCS)."""
@@ -93,6 +116,58 @@ class GcsArtifactService(BaseArtifactService):
         version,
     )
 
+  @override
+  async def save_artifact_stream(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      chunks: AsyncIterable[bytes],
+      mime_type: str,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    """Saves a binary artifact, spooling large payloads to a temporary file."""
+    with tempfile.SpooledTemporaryFile(
+        max_size=_STREAM_SPOOL_MAX_SIZE
+    ) as spool:
+      async for chunk in chunks:
+        await asyncio.to_thread(spool.write, chunk)
+      return await asyncio.to_thread(
+          self._save_artifact_file,
+          app_name,
+          user_id,
+          session_id,
+          filename,
+          spool,
+          mime_type,
+          custom_metadata,
+      )
+
+  @override
+  async def open_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens an artifact whose byte ranges are read with ranged GETs."""
+    blob = await asyncio.to_thread(
+        self._get_stored_blob,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        version,
+    )
+    if blob is None:
+      return None
+    return _GcsArtifactReader(blob)
+
   @override
   async def list_artifact_keys(
       self, *, app_name: str, user_id: str, session_id: Optional[str] = None
@@ -200,6 +275,56 @@ class GcsArtifactService(BaseArtifactService):
       artifact: types.Part,
       custom_metadata: Optional[dict[str, Any]] = None,
   ) -> int:
+    if not artifact.inline_data and not artifact.text:
+      if artifact.file_data:
+        raise NotImplementedError(
+            "Saving artifact with file_data is not supported yet in"
+            " GcsArtifactService."
+        )
+      raise InputValidationError(
+          "Artifact must have either inline_data or text."
+      )
+
+    version, blob = self._next_version_blob(
+        app_name, user_id, session_id, filename, custom_metadata
+    )
+    if artifact.inline_data:
+      blob.upload_from_string(
+          data=artifact.inline_data.data,
+          content_type=artifact.inline_data.mime_type,
+      )
+    else:
+      blob.upload_from_string(
+          data=artifact.text,
+          content_type="text/plain",
+      )
+    return version
+
+  def _save_artifact_file(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      file: BinaryIO,
+      mime_type: str,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    version, blob = self._next_version_blob(
+        app_name, user_id, session_id, filename, custom_metadata
+    )
+    blob.upload_from_file(file, rewind=True, content_type=mime_type)
+    return version
+
+  def _next_version_blob(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      custom_metadata: Optional[dict[str, Any]],
+  ) -> tuple[int, Any]:
+    """Returns the next version and the blob to upload its payload to."""
     versions = self._list_versions(
         app_name=app_name,
         user_id=user_id,
@@ -214,28 +339,30 @@ class GcsArtifactService(BaseArtifactService):
     blob = self.bucket.blob(blob_name)
     if custom_metadata:
       blob.metadata = {k: str(v) for k, v in custom_metadata.items()}
+    return version, blob
 
-    if artifact.inline_data:
-      blob.upload_from_string(
-          data=artifact.inline_data.data,
-          content_type=artifact.inline_data.mime_type,
-      )
-    elif artifact.text:
-      blob.upload_from_string(
-          data=artifact.text,
-          content_type="text/plain",
-      )
-    elif artifact.file_data:
-      raise NotImplementedError(
-          "Saving artifact with file_data is not supported yet in"
-          " GcsArtifactService."
-      )
-    else:
-      raise InputValidationError(
-          "Artifact must have either inline_data or text."
+  def _get_stored_blob(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[Any]:
+    """Fetches the blob of an artifact version, with its size and type."""
+    if version is None:
+      versions = self._list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
       )
-
-    return version
+      if not versions:
+        return None
+      version = max(versions)
+    return self.bucket.get_blob(
+        self._get_blob_name(app_name, user_id, filename, version, session_id)
+    )
 
   def _load_artifact(
       self,
@@ -24,16 +24,20 @@ import time
 import traceback
 import typing
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import List
 from typing import Literal
 from typing import Optional
+from urllib.parse import quote
 
 from fastapi import FastAPI
+from fastapi import Header
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.responses import RedirectResponse
 from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
@@ -41,14 +45,19 @@ from fastapi.websockets import WebSocket
 from fastapi.websockets import WebSocketDisconnect
 from google.genai import types
 import graphviz
+from opentelemetry import metrics
 from opentelemetry import trace
 import opentelemetry.sdk.environment_variables as otel_env
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.export import MetricReader
 from opentelemetry.sdk.trace import export as export_lib
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace import TracerProvider
 from pydantic import Field
 from pydantic import ValidationError
+from starlette.background import BackgroundTask
 from starlette.types import Lifespan
 from typing_extensions import deprecated
 from typing_extensions import override
@@ -56,7 +65,7 @@ from watchdog.observers import Observer
 
 from . import agent_graph
 from ..agents.base_agent import BaseAgent
-from ..agents.live_request_queue import LiveRequest
+from ..agents.live_request_queue import LiveQueueOverflowPolicy
 from ..agents.live_request_queue import LiveRequestQueue
 from ..agents.run_config import RunConfig
 from ..agents.run_config import StreamingMode
@@ -87,14 +96,24 @@ from ..plugins.base_plugin import BasePlugin
 from ..runners import Runner
 from ..sessions.base_session_service import BaseSessionService
 from ..sessions.session import Session
+from ..telemetry import metrics as adk_metrics
+from ..telemetry.event_loop_monitor import EventLoopMonitor
 from ..utils.context_utils import Aclosing
 from .cli_eval import EVAL_SESSION_ID_PREFIX
 from .utils import cleanup
 from .utils import common
 from .utils import envs
 from .utils import evals
+from .utils import session_view
+from .utils.admission import AdmissionController
+from .utils.admission import AdmissionRejectedError
+from .utils.admission import InvocationSlot
 from .utils.base_agent_loader import BaseAgentLoader
+from .utils.live_websocket import LiveEventSender
+from .utils.live_websocket import receive_live_requests
+from .utils.runner_cache import RunnerCache
 from .utils.shared_value import SharedValue
+from .utils.span_store import SpanStore
 from .utils.state import create_empty_state
 
 logger = logging.getLogger("google_adk." + __name__)
@@ -105,6 +124,8 @@ TAG_DEBUG = "Debug"
 TAG_EVALUATION = "Evaluation"
 
 _REGEX_PREFIX = "regex:"
+# Session responses this large or larger are compressed in a thread.
+_COMPRESS_IN_THREAD_BYTES = 256 * 1024
 
 
 def _parse_cors_origins(
@@ -135,67 +156,104 @@ def _parse_cors_origins(
   return literal_origins, combined_regex
 
 
-class ApiServerSpanExporter(export_lib.SpanExporter):
+def _parse_byte_range(
+    range_header: Optional[str], size: int
+) -> Optional[tuple[int, int]]:
+  """Parses a single-range `Range` header into inclusive byte offsets.
 
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
+  Returns None when the whole payload should be sent: without a header, or
+  with one that is malformed or requests several ranges.
 
-  def export(
-      self, spans: typing.Sequence[ReadableSpan]
-  ) -> export_lib.SpanExportResult:
-    for span in spans:
-      if (
-          span.name == "call_llm"
-          or span.name == "send_data"
-          or span.name.startswith("execute_tool")
-      ):
-        attributes = dict(span.attributes)
-        attributes["trace_id"] = span.get_span_context().trace_id
-        attributes["span_id"] = span.get_span_context().span_id
-        if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
-    return export_lib.SpanExportResult.SUCCESS
+  Raises:
+    HTTPException: If the range lies outside of the payload.
+  """
+  if not range_header or not range_header.startswith("bytes="):
+    return None
+  spec = range_header[len("bytes=") :].strip()
+  if "," in spec or "-" not in spec:
+    return None
+  start_text, end_text = (part.strip() for part in spec.split("-", 1))
+  if any(text and not text.isdigit() for text in (start_text, end_text)):
+    return None
+  if not start_text:
+    # A suffix range: the last `end_text` bytes.
+    if not end_text or not int(end_text):
+      return None
+    start, end = max(size - int(end_text), 0), size - 1
+  else:
+    start = int(start_text)
+    if end_text and int(end_text) < start:
+      return None
+    end = min(int(end_text), size - 1) if end_text else size - 1
+  if start >= size:
+    raise HTTPException(
+        status_code=416,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+  return start, end
 
-  def force_flush(self, timeout_millis: int = 30000) -> bool:
-    return True
+
+# Reused for every streamed event, instead of going through `model_dump_json`.
+_EVENT_SERIALIZER = Event.__pydantic_serializer__
+
+
+def _to_sse_frames(event: Event) -> list[bytes]:
+  """Encodes an event as the Server-Sent Events frames streamed by /run_sse.
+
+  ADK Web renders artifacts from `actions.artifactDelta` during part
+  processing *and* during action processing, so an event with both content
+  and an artifact delta is streamed as two events:
+  1) the original event with `artifactDelta` cleared (content)
+  2) a content-less "action-only" event carrying `artifactDelta`
+
+  Both are shallow copies: the event is only read while it is encoded.
+  """
+  events_to_stream = [event]
+  if event.actions.artifact_delta and event.content and event.content.parts:
+    events_to_stream = [
+        event.model_copy(
+            update={
+                "actions": event.actions.model_copy(
+                    update={"artifact_delta": {}}
+                )
+            }
+        ),
+        event.model_copy(update={"content": None}),
+    ]
+  return [
+      b"data: "
+      + _EVENT_SERIALIZER.to_json(
+          event_to_stream, by_alias=True, exclude_none=True
+      )
+      + b"\n\n"
+      for event_to_stream in events_to_stream
+  ]
 
 
 class InMemoryExporter(export_lib.SpanExporter):
+  """Exports spans to the span store of the debug trace endpoints."""
 
-  def __init__(self, trace_dict):
+  def __init__(self, span_store: SpanStore):
     super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
+    self.span_store = span_store
 
   @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export_lib.SpanExportResult:
-    for span in spans:
-      trace_id = span.context.trace_id
-      if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
-        if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+    self.span_store.add(list(spans))
     return export_lib.SpanExportResult.SUCCESS
 
   @override
   def force_flush(self, timeout_millis: int = 30000) -> bool:
     return True
 
-  def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+  def get_finished_spans(self, session_id: str) -> list[dict[str, Any]]:
+    return self.span_store.get_session_spans(session_id)
 
   def clear(self):
-    self._spans.clear()
+    self.span_store.clear()
 
 
 class RunAgentRequest(common.BaseModel):
@@ -340,13 +398,20 @@ class ListAppsResponse(common.BaseModel):
 def _setup_telemetry(
     otel_to_cloud: bool = False,
     internal_exporters: Optional[list[SpanProcessor]] = None,
+    internal_metric_readers: Optional[list[MetricReader]] = None,
 ):
   # TODO - remove the else branch here once maybe_set_otel_providers is no
   # longer experimental.
   if otel_to_cloud:
-    _setup_gcp_telemetry(internal_exporters=internal_exporters)
+    _setup_gcp_telemetry(
+        internal_exporters=internal_exporters,
+        internal_metric_readers=internal_metric_readers,
+    )
   elif _otel_env_vars_enabled():
-    _setup_telemetry_from_env(internal_exporters=internal_exporters)
+    _setup_telemetry_from_env(
+        internal_exporters=internal_exporters,
+        internal_metric_readers=internal_metric_readers,
+    )
   else:
     # Old logic - to be removed when above leaves experimental.
     tracer_provider = TracerProvider()
@@ -354,6 +419,10 @@ def _setup_telemetry(
       for exporter in internal_exporters:
         tracer_provider.add_span_processor(exporter)
     trace.set_tracer_provider(tracer_provider=tracer_provider)
+    if internal_metric_readers:
+      metrics.set_meter_provider(
+          MeterProvider(metric_readers=internal_metric_readers)
+      )
 
 
 def _otel_env_vars_enabled() -> bool:
@@ -370,17 +439,23 @@ def _otel_env_vars_enabled() -> bool:
 
 def _setup_gcp_telemetry(
     internal_exporters: list[SpanProcessor] = None,
+    internal_metric_readers: list[MetricReader] = None,
 ):
   if typing.TYPE_CHECKING:
     from ..telemetry.setup import OTelHooks
 
   otel_hooks_to_add: list[OTelHooks] = []
 
-  if internal_exporters:
+  if internal_exporters or internal_metric_readers:
     from ..telemetry.setup import OTelHooks
 
-    # Register ADK-specific exporters in trace provider.
-    otel_hooks_to_add.append(OTelHooks(span_processors=internal_exporters))
+    # Register ADK-specific exporters in trace and meter providers.
+    otel_hooks_to_add.append(
+        OTelHooks(
+            span_processors=internal_exporters or [],
+            metric_readers=internal_metric_readers or [],
+        )
+    )
 
   import google.auth
 
@@ -412,16 +487,22 @@ def _setup_gcp_telemetry(
 
 def _setup_telemetry_from_env(
     internal_exporters: list[SpanProcessor] = None,
+    internal_metric_readers: list[MetricReader] = None,
 ):
   from ..telemetry.setup import maybe_set_otel_providers
 
   otel_hooks_to_add = []
 
-  if internal_exporters:
+  if internal_exporters or internal_metric_readers:
     from ..telemetry.setup import OTelHooks
 
-    # Register ADK-specific exporters in trace provider.
-    otel_hooks_to_add.append(OTelHooks(span_processors=internal_exporters))
+    # Register ADK-specific exporters in trace and meter providers.
+    otel_hooks_to_add.append(
+        OTelHooks(
+            span_processors=internal_exporters or [],
+            metric_readers=internal_metric_readers or [],
+        )
+    )
 
   maybe_set_otel_providers(otel_hooks_to_setup=otel_hooks_to_add)
   _setup_instrumentation_lib_if_installed()
@@ -474,7 +555,23 @@ class AdkWebServer:
       logo_image_url: URL of an image to display as logo of the UI.
       runners_to_clean: Set of runner names marked for cleanup.
       current_app_name_ref: A shared reference to the latest ran app name.
-      runner_dict: A dict of instantiated runners for each app.
+      runner_dict: The `RunnerCache` of the runners of the apps.
+      prewarm_apps: The apps whose runners are created at startup.
+      live_queue_size: The number of live requests queued per `/run_live`
+        session beyond which realtime blobs are dropped or coalesced.
+        Unbounded if `None`.
+      live_overflow_policy: What to do with realtime blobs beyond
+        `live_queue_size`.
+      span_store: The bounded store of the spans shown by the debug trace
+        endpoints.
+      metric_reader: The reader of the metrics served at `/metrics`.
+      serve_metrics: Whether `/metrics` is served. The workers of a
+        multi-process server do not serve it, as each one only sees its own
+        metrics.
+      event_loop_monitor: The monitor of the event loop, if any, started and
+        stopped with the app.
+      admission_controller: Limits the invocations started by `/run`,
+        `/run_sse` and `/run_live`, if set.
   """
 
   def __init__(
@@ -492,6 +589,16 @@ class AdkWebServer:
       logo_text: Optional[str] = None,
       logo_image_url: Optional[str] = None,
       url_prefix: Optional[str] = None,
+      span_store: Optional[SpanStore] = None,
+      event_loop_monitor: Optional[EventLoopMonitor] = None,
+      admission_controller: Optional[AdmissionController] = None,
+      runner_cache: Optional[RunnerCache] = None,
+      prewarm_apps: Optional[list[str]] = None,
+      live_queue_size: Optional[int] = None,
+      live_overflow_policy: LiveQueueOverflowPolicy = (
+          LiveQueueOverflowPolicy.DROP_OLDEST
+      ),
+      serve_metrics: bool = True,
   ):
     self.agent_loader = agent_loader
     self.session_service = session_service
@@ -507,22 +614,92 @@ class AdkWebServer:
     # Internal properties we want to allow being modified from callbacks.
     self.runners_to_clean: set[str] = set()
     self.current_app_name_ref: SharedValue[str] = SharedValue(value="")
-    self.runner_dict = {}
+    self.runner_dict = runner_cache or RunnerCache()
+    self.prewarm_apps = prewarm_apps or []
+    self.live_queue_size = live_queue_size
+    self.live_overflow_policy = live_overflow_policy
     self.url_prefix = url_prefix
+    self.span_store = span_store or SpanStore()
+    self.metric_reader = InMemoryMetricReader()
+    self.serve_metrics = serve_metrics
+    self.event_loop_monitor = event_loop_monitor
+    self.admission_controller = admission_controller
+
+  async def _acquire_invocation_slot(
+      self, app_name: str, user_id: str
+  ) -> Optional[InvocationSlot]:
+    """Waits for the admission controller, if any, to admit an invocation.
+
+    Raises:
+      HTTPException: 429 or 503, with a `Retry-After` header, if the
+        invocation is not admitted.
+    """
+    if self.admission_controller is None:
+      return None
+    try:
+      return await self.admission_controller.acquire(app_name, user_id)
+    except AdmissionRejectedError as e:
+      raise HTTPException(
+          status_code=e.status_code,
+          detail=str(e),
+          headers={"Retry-After": str(e.retry_after)},
+      ) from e
+
+  async def _get_session_to_run(self, req: RunAgentRequest) -> Session:
+    """Loads the session of a run, which the runner then uses as is.
+
+    Called once the invocation is admitted, so that the session does not go
+    stale while the request waits for a slot.
+
+    Raises:
+      HTTPException: 404 if the session does not exist.
+    """
+    session = await self.session_service.get_session(
+        app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
+    )
+    if not session:
+      raise HTTPException(status_code=404, detail="Session not found")
+    return session
 
   async def get_runner_async(self, app_name: str) -> Runner:
     """Returns the cached runner for the given app."""
-    # Handle cleanup
+    await self._close_reloaded_runner(app_name)
+    return await self.runner_dict.get_or_create(
+        app_name, lambda: self._create_app_runner(app_name)
+    )
+
+  @asynccontextmanager
+  async def _use_runner(self, app_name: str) -> AsyncIterator[Runner]:
+    """Returns the cached runner for the given app, not evicted until exit."""
+    await self._close_reloaded_runner(app_name)
+    async with self.runner_dict.use(
+        app_name, lambda: self._create_app_runner(app_name)
+    ) as runner:
+      yield runner
+
+  async def _close_reloaded_runner(self, app_name: str) -> None:
     if app_name in self.runners_to_clean:
       self.runners_to_clean.remove(app_name)
       runner = self.runner_dict.pop(app_name, None)
-      await cleanup.close_runners(list([runner]))
+      if runner:
+        await cleanup.close_runners([runner])
 
-    # Return cached runner if exists
-    if app_name in self.runner_dict:
-      return self.runner_dict[app_name]
+  async def _prewarm_runners(self) -> None:
+    """Creates the runners of `prewarm_apps`, one at a time."""
+    max_size = self.runner_dict.max_size
+    if max_size is not None and len(self.prewarm_apps) > max_size:
+      logger.warning(
+          "Prewarming %s apps, more than the %s runners cached.",
+          len(self.prewarm_apps),
+          max_size,
+      )
+    for app_name in self.prewarm_apps:
+      try:
+        await self.get_runner_async(app_name)
+      except Exception:
+        logger.exception("Failed to prewarm the runner of app %s.", app_name)
 
-    # Create new runner
+  async def _create_app_runner(self, app_name: str) -> Runner:
     envs.load_dotenv_for_agent(os.path.basename(app_name), self.agents_dir)
     agent_or_app = self.agent_loader.load_agent(app_name)
 
@@ -540,9 +717,7 @@ class AdkWebServer:
       agent_or_app.plugins = agent_or_app.plugins + extra_plugins_instances
       agentic_app = agent_or_app
 
-    runner = self._create_runner(agentic_app)
-    self.runner_dict[app_name] = runner
-    return runner
+    return self._create_runner(agentic_app)
 
   def _get_root_agent(self, agent_or_app: BaseAgent | App) -> BaseAgent:
     """Extract root agent from either a BaseAgent or App object."""
@@ -706,15 +881,18 @@ class AdkWebServer:
     Returns:
       A FastAPI app instance.
     """
-    # Properties we don't need to modify from callbacks
-    trace_dict = {}
-    session_trace_dict = {}
     # Set up a file system watcher to detect changes in the agents directory.
     observer = Observer()
     setup_observer(observer, self)
 
     @asynccontextmanager
     async def internal_lifespan(app: FastAPI):
+      if self.event_loop_monitor:
+        self.event_loop_monitor.start()
+      await self._prewarm_runners()
+      runner_expiry = asyncio.create_task(
+          self.runner_dict.expire_idle_runners()
+      )
       try:
         if lifespan:
           async with lifespan(app) as lifespan_context:
@@ -723,17 +901,19 @@ class AdkWebServer:
           yield
       finally:
         tear_down_observer(observer, self)
-        # Create tasks for all runner closures to run concurrently
-        await cleanup.close_runners(list(self.runner_dict.values()))
-
-    memory_exporter = InMemoryExporter(session_trace_dict)
+        runner_expiry.cancel()
+        # Closes all runners concurrently.
+        await self.runner_dict.close()
+        self.span_store.close()
+        if self.event_loop_monitor:
+          await self.event_loop_monitor.stop()
 
     _setup_telemetry(
         otel_to_cloud=otel_to_cloud,
         internal_exporters=[
-            export_lib.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict)),
-            export_lib.SimpleSpanProcessor(memory_exporter),
+            export_lib.SimpleSpanProcessor(InMemoryExporter(self.span_store)),
         ],
+        internal_metric_readers=[self.metric_reader],
     )
     if web_assets_dir:
       self._setup_runtime_config(web_assets_dir)
@@ -768,45 +948,142 @@ class AdkWebServer:
         return ListAppsResponse(apps=[AppInfo(**app) for app in apps_info])
       return self.agent_loader.list_agents()
 
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def get_metrics() -> PlainTextResponse:
+      if not self.serve_metrics:
+        raise HTTPException(
+            status_code=501,
+            detail=(
+                "Metrics are not served by the workers of a multi-process"
+                " server. Export them through OpenTelemetry instead."
+            ),
+        )
+      # The reader only sees the metrics if ADK set the meter provider.
+      return PlainTextResponse(
+          adk_metrics.to_prometheus_text(
+              self.metric_reader.get_metrics_data()
+          ),
+          media_type="text/plain; version=0.0.4",
+      )
+
     @app.get("/debug/trace/{event_id}", tags=[TAG_DEBUG])
     async def get_trace_dict(event_id: str) -> Any:
-      event_dict = trace_dict.get(event_id, None)
+      event_dict = self.span_store.get_event_trace(event_id)
       if event_dict is None:
         raise HTTPException(status_code=404, detail="Trace not found")
       return event_dict
 
     @app.get("/debug/trace/session/{session_id}", tags=[TAG_DEBUG])
     async def get_session_trace(session_id: str) -> Any:
-      spans = memory_exporter.get_finished_spans(session_id)
-      if not spans:
-        return []
-      return [
-          {
-              "name": s.name,
-              "span_id": s.context.span_id,
-              "trace_id": s.context.trace_id,
-              "start_time": s.start_time,
-              "end_time": s.end_time,
-              "attributes": dict(s.attributes),
-              "parent_span_id": s.parent.span_id if s.parent else None,
-          }
-          for s in spans
-      ]
+      return self.span_store.get_session_spans(session_id)
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}",
-        response_model_exclude_none=True,
+        response_model=None,
+        responses=session_view.SESSION_VIEW_RESPONSES,
     )
     async def get_session(
-        app_name: str, user_id: str, session_id: str
-    ) -> Session:
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        fields: Optional[str] = None,
+        event_offset: int = Query(default=0, ge=0),
+        event_limit: Optional[int] = Query(default=None, ge=0),
+        exclude_blobs: bool = False,
+        accept_encoding: Optional[str] = Header(default=None),
+    ) -> Response:
+      """Gets a session, optionally with a subset of its events.
+
+      Args:
+        fields: Comma-separated list of the event fields to return, e.g.
+          `id,author,timestamp,content`. All fields by default.
+        event_offset: The index of the first event to return.
+        event_limit: The number of events to return. All the remaining ones by
+          default. The total number of events is in the `X-Total-Events`
+          header.
+        exclude_blobs: Whether to replace the inline data of the events by
+          `fileData` parts linking to the `.../blob` endpoint below.
+        accept_encoding: Large responses are compressed with gzip, or with
+          brotli if the `brotli` package is installed.
+      """
+      try:
+        event_fields = (
+            session_view.parse_event_fields(fields)
+            if fields is not None
+            else None
+        )
+      except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
       session = await self.session_service.get_session(
           app_name=app_name, user_id=user_id, session_id=session_id
       )
       if not session:
         raise HTTPException(status_code=404, detail="Session not found")
       self.current_app_name_ref.value = app_name
-      return session
+
+      # The ids were decoded from the path, and are escaped again.
+      blob_url_prefix = (
+          f"{self.url_prefix or ''}/apps/{quote(app_name, safe='')}"
+          f"/users/{quote(user_id, safe='')}"
+          f"/sessions/{quote(session_id, safe='')}/events"
+      )
+      body = session_view.session_to_json(
+          session,
+          event_fields=event_fields,
+          event_offset=event_offset,
+          event_limit=event_limit,
+          blob_url=(
+              lambda event_id, part_index: (
+                  f"{blob_url_prefix}/{quote(event_id, safe='')}"
+                  f"/parts/{part_index}/blob"
+              )
+          )
+          if exclude_blobs
+          else None,
+      )
+      if len(body) >= _COMPRESS_IN_THREAD_BYTES:
+        body, encoding = await asyncio.to_thread(
+            session_view.compress, body, accept_encoding
+        )
+      else:
+        body, encoding = session_view.compress(body, accept_encoding)
+      headers = {
+          "X-Total-Events": str(len(session.events)),
+          "Vary": "Accept-Encoding",
+      }
+      if encoding:
+        headers["Content-Encoding"] = encoding
+      return Response(
+          content=body, media_type="application/json", headers=headers
+      )
+
+    @app.get(
+        "/apps/{app_name}/users/{user_id}/sessions/{session_id}/events/{event_id}/parts/{part_index}/blob"
+    )
+    async def get_event_blob(
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        event_id: str,
+        part_index: int,
+    ) -> Response:
+      """Gets the inline data of a part of an event, as raw bytes."""
+      session = await self.session_service.get_session(
+          app_name=app_name, user_id=user_id, session_id=session_id
+      )
+      if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+      event = next((e for e in session.events if e.id == event_id), None)
+      parts = event.content.parts if event and event.content else None
+      if not parts or not 0 <= part_index < len(parts):
+        raise HTTPException(status_code=404, detail="Part not found")
+      blob = parts[part_index].inline_data
+      if not blob or blob.data is None:
+        raise HTTPException(status_code=404, detail="Part has no inline data")
+      return Response(
+          content=blob.data,
+          media_type=blob.mime_type or "application/octet-stream",
+      )
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions",
@@ -1279,6 +1556,61 @@ class AdkWebServer:
         raise HTTPException(status_code=404, detail="Artifact not found")
       return artifact
 
+    @app.get(
+        "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}/content",
+        response_class=StreamingResponse,
+    )
+    async def download_artifact(
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        artifact_name: str,
+        version: Optional[int] = Query(None),
+        range_header: Optional[str] = Header(None, alias="Range"),
+    ) -> StreamingResponse:
+      """Streams the raw artifact payload, supporting single byte ranges."""
+      try:
+        reader = await self.artifact_service.open_artifact(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=artifact_name,
+            version=version,
+        )
+      except InputValidationError as ive:
+        raise HTTPException(status_code=400, detail=str(ive)) from ive
+      if reader is None:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+      try:
+        byte_range = _parse_byte_range(range_header, reader.size)
+      except HTTPException:
+        await reader.close()
+        raise
+      headers = {"Accept-Ranges": "bytes"}
+      status_code = 200
+      offset, length = 0, reader.size
+      if byte_range is not None:
+        offset, end = byte_range
+        length = end - offset + 1
+        status_code = 206
+        headers["Content-Range"] = f"bytes {offset}-{end}/{reader.size}"
+      headers["Content-Length"] = str(length)
+
+      async def _stream_payload():
+        try:
+          async for chunk in reader.iter_chunks(offset, length):
+            yield chunk
+        finally:
+          await reader.close()
+
+      return StreamingResponse(
+          _stream_payload(),
+          status_code=status_code,
+          media_type=reader.mime_type or "text/plain; charset=utf-8",
+          headers=headers,
+      )
+
     @app.post(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts",
         response_model=ArtifactVersion,
@@ -1401,21 +1733,23 @@ class AdkWebServer:
 
     @app.post("/run", response_model_exclude_none=True)
     async def run_agent(req: RunAgentRequest) -> list[Event]:
-      session = await self.session_service.get_session(
-          app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
-      )
-      if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-      runner = await self.get_runner_async(req.app_name)
-      async with Aclosing(
-          runner.run_async(
-              user_id=req.user_id,
-              session_id=req.session_id,
-              new_message=req.new_message,
-              state_delta=req.state_delta,
-          )
-      ) as agen:
-        events = [event async for event in agen]
+      slot = await self._acquire_invocation_slot(req.app_name, req.user_id)
+      try:
+        session = await self._get_session_to_run(req)
+        async with self._use_runner(req.app_name) as runner:
+          async with Aclosing(
+              runner.run_async(
+                  user_id=req.user_id,
+                  session_id=req.session_id,
+                  new_message=req.new_message,
+                  state_delta=req.state_delta,
+                  session=session,
+              )
+          ) as agen:
+            events = [event async for event in agen]
+      finally:
+        if slot:
+          slot.release()
       logger.info("Generated %s events in agent run", len(events))
       logger.debug("Events generated: %s", events)
       return events
@@ -1423,11 +1757,13 @@ class AdkWebServer:
     @app.post("/run_sse")
     async def run_agent_sse(req: RunAgentRequest) -> StreamingResponse:
       # SSE endpoint
-      session = await self.session_service.get_session(
-          app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
-      )
-      if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+      slot = await self._acquire_invocation_slot(req.app_name, req.user_id)
+      try:
+        session = await self._get_session_to_run(req)
+      except BaseException:
+        if slot:
+          slot.release()
+        raise
 
       # Convert the events to properly formatted SSE
       async def event_generator():
@@ -1435,43 +1771,24 @@ class AdkWebServer:
           stream_mode = (
               StreamingMode.SSE if req.streaming else StreamingMode.NONE
           )
-          runner = await self.get_runner_async(req.app_name)
-          async with Aclosing(
-              runner.run_async(
-                  user_id=req.user_id,
-                  session_id=req.session_id,
-                  new_message=req.new_message,
-                  state_delta=req.state_delta,
-                  run_config=RunConfig(streaming_mode=stream_mode),
-                  invocation_id=req.invocation_id,
-              )
-          ) as agen:
-            async for event in agen:
-              # ADK Web renders artifacts from `actions.artifactDelta`
-              # during part processing *and* during action processing
-              # 1) the original event with `artifactDelta` cleared (content)
-              # 2) a content-less "action-only" event carrying `artifactDelta`
-              events_to_stream = [event]
-              if (
-                  event.actions.artifact_delta
-                  and event.content
-                  and event.content.parts
-              ):
-                content_event = event.model_copy(deep=True)
-                content_event.actions.artifact_delta = {}
-                artifact_event = event.model_copy(deep=True)
-                artifact_event.content = None
-                events_to_stream = [content_event, artifact_event]
-
-              for event_to_stream in events_to_stream:
-                sse_event = event_to_stream.model_dump_json(
-                    exclude_none=True,
-                    by_alias=True,
+          async with self._use_runner(req.app_name) as runner:
+            async with Aclosing(
+                runner.run_async(
+                    user_id=req.user_id,
+                    session_id=req.session_id,
+                    new_message=req.new_message,
+                    state_delta=req.state_delta,
+                    run_config=RunConfig(streaming_mode=stream_mode),
+                    invocation_id=req.invocation_id,
+                    session=session,
                 )
-                logger.debug(
-                    "Generated event in agent run streaming: %s", sse_event
-                )
-                yield f"data: {sse_event}\n\n"
+            ) as agen:
+              async for event in agen:
+                for sse_frame in _to_sse_frames(event):
+                  logger.debug(
+                      "Generated event in agent run streaming: %s", sse_frame
+                  )
+                  yield sse_frame
         except Exception as e:
           logger.exception("Error in event_generator: %s", e)
           # Yield a proper Event object for the error
@@ -1485,11 +1802,16 @@ class AdkWebServer:
               "data:"
               f" {error_event.model_dump_json(by_alias=True, exclude_none=True)}\n\n"
           )
+        finally:
+          if slot:
+            slot.release()
 
       # Returns a streaming response with the proper media type for SSE
       return StreamingResponse(
           event_generator(),
           media_type="text/event-stream",
+          # Releases the slot if the stream never starts.
+          background=BackgroundTask(slot.release) if slot else None,
       )
 
     @app.get(
@@ -1551,7 +1873,17 @@ class AdkWebServer:
         modalities: List[Literal["TEXT", "AUDIO"]] = Query(
             default=["AUDIO"]
         ),  # Only allows "TEXT" or "AUDIO"
+        audio_mime_type: str = "audio/pcm;rate=16000",
+        binary_audio: bool = False,
+        batch_ms: Optional[float] = Query(default=None, gt=0),
     ) -> None:
+      """Runs a live session over a websocket.
+
+      Clients send `LiveRequest` JSON text frames, or binary frames of raw
+      audio of `audio_mime_type`. With `binary_audio`, the audio of the events
+      is sent as binary frames. With `batch_ms`, small events are sent
+      together as JSON arrays, at most `batch_ms` milliseconds late.
+      """
       await websocket.accept()
 
       session = await self.session_service.get_session(
@@ -1562,30 +1894,49 @@ class AdkWebServer:
         # then close with a specific code.
         await websocket.close(code=1002, reason="Session not found")
         return
+      try:
+        slot = await self._acquire_invocation_slot(app_name, user_id)
+      except HTTPException as e:
+        WEBSOCKET_TRY_AGAIN_LATER_CODE = 1013
+        await websocket.close(
+            code=WEBSOCKET_TRY_AGAIN_LATER_CODE,
+            reason=f"{e.detail} Retry after {e.headers['Retry-After']}s.",
+        )
+        return
 
-      live_request_queue = LiveRequestQueue()
+      live_request_queue = LiveRequestQueue(
+          max_size=self.live_queue_size,
+          overflow_policy=self.live_overflow_policy,
+      )
+      event_sender = LiveEventSender(
+          websocket,
+          binary_audio=binary_audio,
+          batch_window_seconds=batch_ms / 1000 if batch_ms else None,
+      )
 
       async def forward_events():
-        runner = await self.get_runner_async(app_name)
         run_config = RunConfig(response_modalities=modalities)
-        async with Aclosing(
-            runner.run_live(
-                session=session,
-                live_request_queue=live_request_queue,
-                run_config=run_config,
-            )
-        ) as agen:
-          async for event in agen:
-            await websocket.send_text(
-                event.model_dump_json(exclude_none=True, by_alias=True)
-            )
+        try:
+          async with self._use_runner(app_name) as runner:
+            async with Aclosing(
+                runner.run_live(
+                    session=session,
+                    live_request_queue=live_request_queue,
+                    run_config=run_config,
+                )
+            ) as agen:
+              async for event in agen:
+                await event_sender.send(event)
+          await event_sender.flush()
+        finally:
+          event_sender.close()
 
       async def process_messages():
         try:
-          while True:
-            data = await websocket.receive_text()
-            # Validate and send the received message to the live queue.
-            live_request_queue.send(LiveRequest.model_validate_json(data))
+          # Validates and sends the received messages to the live queue.
+          await receive_live_requests(
+              websocket, live_request_queue, audio_mime_type=audio_mime_type
+          )
         except ValidationError as ve:
           logger.error("Validation error in process_messages: %s", ve)
 
@@ -1616,6 +1967,8 @@ class AdkWebServer:
       finally:
         for task in pending:
           task.cancel()
+        if slot:
+          slot.release()
 
     if web_assets_dir:
       import mimetypes
@@ -43,6 +43,7 @@ from .fast_api import get_fast_api_app
 from .utils import envs
 from .utils import evals
 from .utils import logs
+from .utils.workers import run_workers
 
 LOG_LEVELS = click.Choice(
     ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -1223,6 +1224,131 @@ def fast_api_common_options():
         ),
         default=None,
     )
+    @click.option(
+        "--trace_spill_path",
+        type=click.Path(dir_okay=False, resolve_path=True),
+        help=(
+            "Optional. A SQLite file to move the spans of the debug trace"
+            " endpoints to once they no longer fit in memory, instead of"
+            " dropping them."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--max_concurrent_invocations",
+        type=click.IntRange(min=1),
+        help=(
+            "Optional. The maximum number of invocations started by /run,"
+            " /run_sse and /run_live that run at once. Unlimited by default."
+            " With --workers, the limit is split between the workers."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--max_concurrent_invocations_per_app",
+        type=click.IntRange(min=1),
+        help=(
+            "Optional. The maximum number of invocations of each app that"
+            " run at once. Unlimited by default. With --workers, the limit is"
+            " split between the workers."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--max_queued_invocations",
+        type=click.IntRange(min=0),
+        help=(
+            "Optional. The number of requests that wait for an invocation"
+            " slot once the concurrency limits are reached. Further requests"
+            " are rejected with 429 and a Retry-After header. With --workers,"
+            " the limit is split between the workers."
+        ),
+        default=0,
+        show_default=True,
+    )
+    @click.option(
+        "--max_queue_wait_seconds",
+        type=click.FloatRange(min=0, min_open=True),
+        help=(
+            "Optional. How long a request waits for an invocation slot before"
+            " it is rejected with 503 and a Retry-After header. Unlimited by"
+            " default."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--event_loop_stall_threshold_ms",
+        type=click.FloatRange(min=0, min_open=True),
+        help=(
+            "Optional. Watch the event loop and log a warning, with the tool,"
+            " callback or plugin that was running, whenever it is blocked for"
+            " this many milliseconds or longer."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--max_cached_runners",
+        type=click.IntRange(min=1),
+        help=(
+            "Optional. The maximum number of app runners kept in memory. The"
+            " least recently used runners are closed beyond it. Unlimited by"
+            " default."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--runner_idle_ttl_seconds",
+        type=click.FloatRange(min=0, min_open=True),
+        help=(
+            "Optional. Close the runner of an app once it has not been used"
+            " for this many seconds. Runners are kept by default."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--live_queue_size",
+        type=click.IntRange(min=1),
+        help=(
+            "Optional. The number of requests queued per live session beyond"
+            " which realtime audio and video are dropped or coalesced, as set"
+            " by --live_overflow_policy. Unbounded by default."
+        ),
+        default=None,
+    )
+    @click.option(
+        "--live_overflow_policy",
+        type=click.Choice(["drop_oldest", "drop_newest", "coalesce"]),
+        help=(
+            "Optional. What to do with realtime audio and video sent to a full"
+            " live session queue: drop the oldest queued chunk, drop the new"
+            " one, or merge it into the queued chunk of the same type."
+        ),
+        default="drop_oldest",
+        show_default=True,
+    )
+    @click.option(
+        "--prewarm",
+        help=(
+            "Optional. Comma-separated list of apps whose runners are created"
+            " at startup, so that their first requests do not pay for loading"
+            " the agent."
+        ),
+        multiple=True,
+    )
+    @click.option(
+        "--workers",
+        type=click.IntRange(min=1),
+        help=(
+            "Optional. The number of server processes. With more than one,"
+            " sessions and artifacts must not be stored in memory, --reload is"
+            " ignored, each process reloads the changed agents itself with"
+            " --reload_agents, the invocation limits are split between the"
+            " processes, and /metrics is not served: export metrics through"
+            " OpenTelemetry instead."
+        ),
+        default=1,
+        show_default=True,
+    )
     @click.option(
         "--extra_plugins",
         help=(
@@ -1293,6 +1419,18 @@ def cli_web(
     artifact_storage_uri: Optional[str] = None,  # Deprecated
     a2a: bool = False,
     reload_agents: bool = False,
+    trace_spill_path: Optional[str] = None,
+    event_loop_stall_threshold_ms: Optional[float] = None,
+    max_concurrent_invocations: Optional[int] = None,
+    max_concurrent_invocations_per_app: Optional[int] = None,
+    max_queued_invocations: int = 0,
+    max_queue_wait_seconds: Optional[float] = None,
+    max_cached_runners: Optional[int] = None,
+    runner_idle_ttl_seconds: Optional[float] = None,
+    prewarm: Optional[list[str]] = None,
+    live_queue_size: Optional[int] = None,
+    live_overflow_policy: str = "drop_oldest",
+    workers: int = 1,
     extra_plugins: Optional[list[str]] = None,
     logo_text: Optional[str] = None,
     logo_image_url: Optional[str] = None,
@@ -1332,7 +1470,7 @@ def cli_web(
         fg="green",
     )
 
-  app = get_fast_api_app(
+  app_kwargs = dict(
       agents_dir=agents_dir,
       session_service_uri=session_service_uri,
       artifact_service_uri=artifact_service_uri,
@@ -1343,18 +1481,31 @@ def cli_web(
       web=True,
       trace_to_cloud=trace_to_cloud,
       otel_to_cloud=otel_to_cloud,
-      lifespan=_lifespan,
       a2a=a2a,
       host=host,
       port=port,
       url_prefix=url_prefix,
       reload_agents=reload_agents,
+      trace_spill_path=trace_spill_path,
+      event_loop_stall_threshold_ms=event_loop_stall_threshold_ms,
+      max_concurrent_invocations=max_concurrent_invocations,
+      max_concurrent_invocations_per_app=max_concurrent_invocations_per_app,
+      max_queued_invocations=max_queued_invocations,
+      max_queue_wait_seconds=max_queue_wait_seconds,
+      max_cached_runners=max_cached_runners,
+      runner_idle_ttl_seconds=runner_idle_ttl_seconds,
+      prewarm_apps=prewarm,
+      live_queue_size=live_queue_size,
+      live_overflow_policy=live_overflow_policy,
       extra_plugins=extra_plugins,
       logo_text=logo_text,
       logo_image_url=logo_image_url,
   )
+  if workers > 1:
+    run_workers(workers=workers, host=host, port=port, app_kwargs=app_kwargs)
+    return
   config = uvicorn.Config(
-      app,
+      get_fast_api_app(**app_kwargs, lifespan=_lifespan),
       host=host,
       port=port,
       reload=reload,
@@ -1397,6 +1548,18 @@ def cli_api_server(
     artifact_storage_uri: Optional[str] = None,  # Deprecated
     a2a: bool = False,
     reload_agents: bool = False,
+    trace_spill_path: Optional[str] = None,
+    event_loop_stall_threshold_ms: Optional[float] = None,
+    max_concurrent_invocations: Optional[int] = None,
+    max_concurrent_invocations_per_app: Optional[int] = None,
+    max_queued_invocations: int = 0,
+    max_queue_wait_seconds: Optional[float] = None,
+    max_cached_runners: Optional[int] = None,
+    runner_idle_ttl_seconds: Optional[float] = None,
+    prewarm: Optional[list[str]] = None,
+    live_queue_size: Optional[int] = None,
+    live_overflow_policy: str = "drop_oldest",
+    workers: int = 1,
     extra_plugins: Optional[list[str]] = None,
 ):
   """Starts a FastAPI server for agents.
@@ -1412,25 +1575,40 @@ def cli_api_server(
   artifact_service_uri = artifact_service_uri or artifact_storage_uri
   logs.setup_adk_logger(getattr(logging, log_level.upper()))
 
+  app_kwargs = dict(
+      agents_dir=agents_dir,
+      session_service_uri=session_service_uri,
+      artifact_service_uri=artifact_service_uri,
+      memory_service_uri=memory_service_uri,
+      use_local_storage=use_local_storage,
+      eval_storage_uri=eval_storage_uri,
+      allow_origins=allow_origins,
+      web=False,
+      trace_to_cloud=trace_to_cloud,
+      otel_to_cloud=otel_to_cloud,
+      a2a=a2a,
+      host=host,
+      port=port,
+      url_prefix=url_prefix,
+      reload_agents=reload_agents,
+      trace_spill_path=trace_spill_path,
+      event_loop_stall_threshold_ms=event_loop_stall_threshold_ms,
+      max_concurrent_invocations=max_concurrent_invocations,
+      max_concurrent_invocations_per_app=max_concurrent_invocations_per_app,
+      max_queued_invocations=max_queued_invocations,
+      max_queue_wait_seconds=max_queue_wait_seconds,
+      max_cached_runners=max_cached_runners,
+      runner_idle_ttl_seconds=runner_idle_ttl_seconds,
+      prewarm_apps=prewarm,
+      live_queue_size=live_queue_size,
+      live_overflow_policy=live_overflow_policy,
+      extra_plugins=extra_plugins,
+  )
+  if workers > 1:
+    run_workers(workers=workers, host=host, port=port, app_kwargs=app_kwargs)
+    return
   config = uvicorn.Config(
-      get_fast_api_app(
-          agents_dir=agents_dir,
-          session_service_uri=session_service_uri,
-          artifact_service_uri=artifact_service_uri,
-          memory_service_uri=memory_service_uri,
-          use_local_storage=use_local_storage,
-          eval_storage_uri=eval_storage_uri,
-          allow_origins=allow_origins,
-          web=False,
-          trace_to_cloud=trace_to_cloud,
-          otel_to_cloud=otel_to_cloud,
-          a2a=a2a,
-          host=host,
-          port=port,
-          url_prefix=url_prefix,
-          reload_agents=reload_agents,
-          extra_plugins=extra_plugins,
-      ),
+      get_fast_api_app(**app_kwargs),
       host=host,
       port=port,
       reload=reload,
@@ -1719,6 +1897,34 @@ def cli_migrate_session(
     click.secho(f"Migration failed: {e}", fg="red", err=True)
 
 
+@main.group()
+def artifacts():
+  """ADK artifact commands."""
+  pass
+
+
+@artifacts.command("rebuild_index", cls=HelpfulCommand)
+@click.argument(
+    "root_dir",
+    type=click.Path(
+        exists=True, dir_okay=True, file_okay=False, resolve_path=True
+    ),
+)
+def cli_artifacts_rebuild_index(root_dir: str):
+  """Rebuilds the manifests of a local artifact directory.
+
+  Run this after the files under ROOT_DIR were added, restored or removed
+  without the file artifact service, e.g. when restoring a backup.
+
+  ROOT_DIR: The root directory of the file artifact service, e.g.
+  .adk/artifacts in an agent directory.
+  """
+  from ..artifacts.file_artifact_service import FileArtifactService
+
+  rebuilt = asyncio.run(FileArtifactService(root_dir).rebuild_index())
+  click.secho(f"Rebuilt {rebuilt} artifact manifests.", fg="green")
+
+
 @deploy.command("agent_engine")
 @click.option(
     "--api_key",
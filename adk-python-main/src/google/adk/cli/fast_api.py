@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 import importlib
 import json
 import logging
@@ -35,19 +36,24 @@ from opentelemetry.sdk.trace import TracerProvider
 from starlette.types import Lifespan
 from watchdog.observers import Observer
 
+from ..agents.live_request_queue import LiveQueueOverflowPolicy
 from ..auth.credential_service.in_memory_credential_service import InMemoryCredentialService
 from ..evaluation.local_eval_set_results_manager import LocalEvalSetResultsManager
 from ..evaluation.local_eval_sets_manager import LocalEvalSetsManager
 from ..runners import Runner
+from ..telemetry.event_loop_monitor import EventLoopMonitor
 from .adk_web_server import AdkWebServer
 from .service_registry import load_services_module
 from .utils import envs
 from .utils import evals
+from .utils.admission import AdmissionController
 from .utils.agent_change_handler import AgentChangeEventHandler
 from .utils.agent_loader import AgentLoader
+from .utils.runner_cache import RunnerCache
 from .utils.service_factory import create_artifact_service_from_options
 from .utils.service_factory import create_memory_service_from_options
 from .utils.service_factory import create_session_service_from_options
+from .utils.span_store import SpanStore
 
 logger = logging.getLogger("google_adk." + __name__)
 
@@ -87,6 +93,18 @@ def get_fast_api_app(
     trace_to_cloud: bool = False,
     otel_to_cloud: bool = False,
     reload_agents: bool = False,
+    trace_spill_path: Optional[str] = None,
+    event_loop_stall_threshold_ms: Optional[float] = None,
+    max_concurrent_invocations: Optional[int] = None,
+    max_concurrent_invocations_per_app: Optional[int] = None,
+    max_queued_invocations: int = 0,
+    max_queue_wait_seconds: Optional[float] = None,
+    max_cached_runners: Optional[int] = None,
+    runner_idle_ttl_seconds: Optional[float] = None,
+    prewarm_apps: Optional[list[str]] = None,
+    live_queue_size: Optional[int] = None,
+    live_overflow_policy: str = "drop_oldest",
+    workers: int = 1,
     lifespan: Optional[Lifespan[FastAPI]] = None,
     extra_plugins: Optional[list[str]] = None,
     logo_text: Optional[str] = None,
@@ -153,6 +171,33 @@ def get_fast_api_app(
       logo_text=logo_text,
       logo_image_url=logo_image_url,
       url_prefix=url_prefix,
+      # The workers of a multi-process server share their spans.
+      span_store=SpanStore(spill_path=trace_spill_path, shared=workers > 1),
+      event_loop_monitor=EventLoopMonitor(
+          threshold_seconds=event_loop_stall_threshold_ms / 1000
+      )
+      if event_loop_stall_threshold_ms
+      else None,
+      admission_controller=AdmissionController(
+          max_concurrent_invocations=max_concurrent_invocations,
+          max_concurrent_invocations_per_app=max_concurrent_invocations_per_app,
+          max_queue_size=max_queued_invocations,
+          max_queue_wait_seconds=max_queue_wait_seconds,
+      )
+      if max_concurrent_invocations or max_concurrent_invocations_per_app
+      else None,
+      runner_cache=RunnerCache(
+          max_size=max_cached_runners, idle_ttl_seconds=runner_idle_ttl_seconds
+      ),
+      prewarm_apps=[
+          app_name.strip()
+          for apps in prewarm_apps or []
+          for app_name in apps.split(",")
+          if app_name.strip()
+      ],
+      live_queue_size=live_queue_size,
+      live_overflow_policy=LiveQueueOverflowPolicy(live_overflow_policy),
+      serve_metrics=workers == 1,
   )
 
   # Callbacks & other optional args for when constructing the FastAPI instance
@@ -488,10 +533,11 @@ def get_fast_api_app(
       def create_a2a_runner_loader(captured_app_name: str):
         """Factory function to create A2A runner with proper closure."""
 
-        async def _get_a2a_runner_async() -> Runner:
-          return await adk_web_server.get_runner_async(captured_app_name)
+        def _use_a2a_runner() -> AbstractAsyncContextManager[Runner]:
+          # Keeps the cached runner from being evicted while a request runs.
+          return adk_web_server._use_runner(captured_app_name)
 
-        return _get_a2a_runner_async
+        return _use_a2a_runner
 
       for p in base_path.iterdir():
         # only folders with an agent.json file representing agent card are valid
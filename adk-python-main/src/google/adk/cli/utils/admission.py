@@ -0,0 +1,245 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Admission control of the invocations started by the API server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections import deque
+from collections import OrderedDict
+import dataclasses
+import math
+import time
+from typing import Optional
+
+from ...telemetry import metrics as adk_metrics
+
+# The weight of the latest invocation in the average invocation duration.
+_DURATION_SMOOTHING = 0.2
+_MAX_RETRY_AFTER_SECONDS = 60
+
+
+class AdmissionRejectedError(Exception):
+  """Raised when a request is not admitted to start an invocation."""
+
+  def __init__(self, message: str, *, status_code: int, retry_after: int):
+    super().__init__(message)
+    self.status_code = status_code
+    """429 when the wait queue is full, 503 when the wait timed out."""
+    self.retry_after = retry_after
+    """The suggested number of seconds to wait before retrying."""
+
+
+@dataclasses.dataclass
+class _Waiter:
+  app_name: str
+  future: asyncio.Future[None]
+
+
+class InvocationSlot:
+  """The right to run one invocation, returned by `AdmissionController`."""
+
+  def __init__(self, controller: AdmissionController, app_name: str):
+    self._controller = controller
+    self._app_name = app_name
+    self._started_at = time.monotonic()
+    self._released = False
+
+  def release(self) -> None:
+    """Frees the slot for the next request. Later calls do nothing."""
+    if self._released:
+      return
+    self._released = True
+    self._controller._release(
+        self._app_name, time.monotonic() - self._started_at
+    )
+
+
+class AdmissionController:
+  """Limits the invocations running at once, globally and per app.
+
+  A request that finds no free slot waits in a bounded queue for at most
+  `max_queue_wait_seconds`. Waiting requests are admitted round-robin across
+  users, so that one user sending many requests does not starve the others.
+  Requests that find the queue full, or that wait too long, are rejected with
+  an `AdmissionRejectedError`.
+
+  Must be used from a single event loop.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_concurrent_invocations: Optional[int] = None,
+      max_concurrent_invocations_per_app: Optional[int] = None,
+      max_queue_size: int = 0,
+      max_queue_wait_seconds: Optional[float] = None,
+  ):
+    """Initializes the admission controller.
+
+    Args:
+      max_concurrent_invocations: The maximum number of invocations running at
+        once on the server. Unlimited if `None`.
+      max_concurrent_invocations_per_app: The maximum number of invocations
+        running at once for each app. Unlimited if `None`.
+      max_queue_size: The maximum number of requests waiting for a slot.
+        Requests are rejected as soon as there is no free slot if 0.
+      max_queue_wait_seconds: How long a request waits for a slot before it is
+        rejected. Unlimited if `None`.
+    """
+    self._max_concurrent = max_concurrent_invocations
+    self._max_concurrent_per_app = max_concurrent_invocations_per_app
+    self._max_queue_size = max_queue_size
+    self._max_queue_wait_seconds = max_queue_wait_seconds
+    self._running = 0
+    self._running_by_app: Counter[str] = Counter()
+    # The waiting requests of each user, in the order users are served.
+    self._queues: OrderedDict[str, deque[_Waiter]] = OrderedDict()
+    self._queued = 0
+    self._average_duration = 1.0
+
+  @property
+  def running(self) -> int:
+    """The number of invocations running."""
+    return self._running
+
+  @property
+  def queued(self) -> int:
+    """The number of requests waiting for a slot."""
+    return self._queued
+
+  async def acquire(self, app_name: str, user_id: str) -> InvocationSlot:
+    """Waits for a slot to run an invocation of an app for a user.
+
+    Args:
+      app_name: The app to run.
+      user_id: The user the invocation runs for.
+
+    Returns:
+      The slot, to release once the invocation is done.
+
+    Raises:
+      AdmissionRejectedError: If the wait queue is full, or if no slot became
+        free within `max_queue_wait_seconds`.
+    """
+    if self._has_capacity(app_name):
+      self._take(app_name)
+      return InvocationSlot(self, app_name)
+    attributes = {'adk.app': app_name}
+    if self._queued >= self._max_queue_size:
+      self._reject(app_name, 'queue_full')
+      raise AdmissionRejectedError(
+          'Too many invocations are running or waiting to run.',
+          status_code=429,
+          retry_after=self._retry_after(),
+      )
+
+    waiter = _Waiter(app_name, asyncio.get_running_loop().create_future())
+    self._queues.setdefault(user_id, deque()).append(waiter)
+    self._queued += 1
+    adk_metrics.add_to_counter(adk_metrics.ADMISSION_QUEUE_DEPTH, 1, attributes)
+    enqueued_at = time.monotonic()
+    try:
+      await asyncio.wait({waiter.future}, timeout=self._max_queue_wait_seconds)
+    except asyncio.CancelledError:
+      if waiter.future.done():
+        # The slot was handed over as the request was cancelled.
+        InvocationSlot(self, app_name).release()
+      else:
+        self._dequeue(user_id, waiter)
+      raise
+    finally:
+      adk_metrics.record_duration(
+          adk_metrics.ADMISSION_QUEUE_DURATION,
+          time.monotonic() - enqueued_at,
+          attributes,
+      )
+    if not waiter.future.done():
+      self._dequeue(user_id, waiter)
+      self._reject(app_name, 'queue_timeout')
+      raise AdmissionRejectedError(
+          'Timed out waiting for an invocation slot.',
+          status_code=503,
+          retry_after=self._retry_after(),
+      )
+    return InvocationSlot(self, app_name)
+
+  def _has_capacity(self, app_name: str) -> bool:
+    if self._max_concurrent is not None and (
+        self._running >= self._max_concurrent
+    ):
+      return False
+    return self._max_concurrent_per_app is None or (
+        self._running_by_app[app_name] < self._max_concurrent_per_app
+    )
+
+  def _take(self, app_name: str) -> None:
+    self._running += 1
+    self._running_by_app[app_name] += 1
+
+  def _release(self, app_name: str, duration: float) -> None:
+    self._running -= 1
+    self._running_by_app[app_name] -= 1
+    if not self._running_by_app[app_name]:
+      del self._running_by_app[app_name]
+    self._average_duration += _DURATION_SMOOTHING * (
+        duration - self._average_duration
+    )
+    self._admit_waiters()
+
+  def _admit_waiters(self) -> None:
+    """Hands the free slots to waiting requests, one user at a time."""
+    admitted = True
+    while admitted and self._queues:
+      admitted = False
+      for user_id in list(self._queues):
+        queue = self._queues[user_id]
+        waiter = next(
+            (w for w in queue if self._has_capacity(w.app_name)), None
+        )
+        if waiter is None:
+          continue
+        self._dequeue(user_id, waiter)
+        self._take(waiter.app_name)
+        waiter.future.set_result(None)
+        if user_id in self._queues:
+          # Serves the other users before this one's next request.
+          self._queues.move_to_end(user_id)
+        admitted = True
+        break
+
+  def _dequeue(self, user_id: str, waiter: _Waiter) -> None:
+    queue = self._queues[user_id]
+    queue.remove(waiter)
+    if not queue:
+      del self._queues[user_id]
+    self._queued -= 1
+    adk_metrics.add_to_counter(
+        adk_metrics.ADMISSION_QUEUE_DEPTH, -1, {'adk.app': waiter.app_name}
+    )
+
+  def _reject(self, app_name: str, reason: str) -> None:
+    adk_metrics.add_to_counter(
+        adk_metrics.ADMISSION_REJECTIONS,
+        1,
+        {'adk.app': app_name, 'adk.reason': reason},
+    )
+
+  def _retry_after(self) -> int:
+    """Estimates when a slot will be free for a new request."""
+    capacity = self._max_concurrent or self._max_concurrent_per_app or 1
+    wait = self._average_duration * (self._queued + 1) / capacity
+    return max(1, min(_MAX_RETRY_AFTER_SECONDS, math.ceil(wait)))
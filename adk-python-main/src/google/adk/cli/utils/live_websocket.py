@@ -0,0 +1,200 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The frames exchanged with clients of the /run_live websocket.
+
+Clients send text frames holding a JSON `LiveRequest`, or binary frames
+holding raw audio. The server sends each event as a JSON text frame. Clients
+can opt in to:
+
+- binary audio: the audio parts of the events are sent as binary frames of
+  raw audio, instead of base64 inside the JSON of the events.
+- batching: small events sent within a short window are sent together, as a
+  JSON array in one text frame.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from fastapi.websockets import WebSocket
+from fastapi.websockets import WebSocketDisconnect
+from google.genai import types
+
+from ...agents.live_request_queue import LiveRequest
+from ...agents.live_request_queue import LiveRequestQueue
+from ...events.event import Event
+
+_EVENT_SERIALIZER = Event.__pydantic_serializer__
+
+# Events this large or larger are not batched.
+_MAX_BATCHED_EVENT_BYTES = 1024
+# A batch is sent once it holds this many bytes.
+_MAX_BATCH_BYTES = 16 * 1024
+
+
+def _is_audio(part: types.Part) -> bool:
+  return bool(
+      part.inline_data
+      and part.inline_data.data
+      and (part.inline_data.mime_type or "").startswith("audio/")
+  )
+
+
+def _split_audio(event: Event) -> tuple[Optional[Event], list[bytes]]:
+  """Splits the audio parts out of an event.
+
+  Returns:
+    The event without its audio parts, or None if nothing but audio is left
+    to send, and the audio data of the parts.
+  """
+  if not event.content or not event.content.parts:
+    return event, []
+  audio = [
+      part.inline_data.data for part in event.content.parts if _is_audio(part)
+  ]
+  if not audio:
+    return event, []
+  parts = [part for part in event.content.parts if not _is_audio(part)]
+  if not parts and not (
+      event.interrupted or event.turn_complete or event.error_code
+  ):
+    return None, audio
+  return (
+      event.model_copy(
+          update={"content": event.content.model_copy(update={"parts": parts})}
+      ),
+      audio,
+  )
+
+
+async def receive_live_requests(
+    websocket: WebSocket,
+    live_request_queue: LiveRequestQueue,
+    *,
+    audio_mime_type: str,
+) -> None:
+  """Sends the frames received from the client to the live request queue.
+
+  Args:
+    websocket: The websocket of the client.
+    live_request_queue: The queue of the live session.
+    audio_mime_type: The MIME type of the audio in binary frames.
+
+  Raises:
+    WebSocketDisconnect: When the client disconnects.
+    ValidationError: When a text frame is not a valid `LiveRequest`.
+  """
+  while True:
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+      raise WebSocketDisconnect(message.get("code", 1000))
+    if message.get("bytes") is not None:
+      live_request_queue.send_realtime(
+          types.Blob(data=message["bytes"], mime_type=audio_mime_type)
+      )
+    else:
+      live_request_queue.send(LiveRequest.model_validate_json(message["text"]))
+
+
+class LiveEventSender:
+  """Sends the events of a live session to the client of the websocket.
+
+  Must be flushed once the session is done, to send the pending batch, and
+  closed.
+  """
+
+  def __init__(
+      self,
+      websocket: WebSocket,
+      *,
+      binary_audio: bool = False,
+      batch_window_seconds: Optional[float] = None,
+  ):
+    """Initializes the sender.
+
+    Args:
+      websocket: The websocket of the client.
+      binary_audio: Whether to send audio as binary frames.
+      batch_window_seconds: How long a small event waits for others to be sent
+        with it. Events are sent one by one if `None`.
+    """
+    self._websocket = websocket
+    self._binary_audio = binary_audio
+    self._batch_window_seconds = batch_window_seconds
+    self._batch: list[bytes] = []
+    self._batch_bytes = 0
+    self._flush_task: Optional[asyncio.Task[None]] = None
+    # Keeps the frames in order while a delayed flush sends the batch.
+    self._lock = asyncio.Lock()
+
+  async def send(self, event: Event) -> None:
+    """Sends an event, or adds it to the pending batch."""
+    audio = []
+    if self._binary_audio:
+      event, audio = _split_audio(event)
+    async with self._lock:
+      if event is not None:
+        text = _EVENT_SERIALIZER.to_json(
+            event, by_alias=True, exclude_none=True
+        )
+        if self._batch_window_seconds and len(text) < _MAX_BATCHED_EVENT_BYTES:
+          self._add_to_batch(text)
+          if self._batch_bytes >= _MAX_BATCH_BYTES:
+            await self._send_batch()
+        else:
+          await self._send_batch()
+          await self._websocket.send_text(text.decode())
+      if audio:
+        await self._send_batch()
+        for data in audio:
+          await self._websocket.send_bytes(data)
+
+  async def flush(self) -> None:
+    """Sends the pending batch."""
+    async with self._lock:
+      await self._send_batch()
+
+  def close(self) -> None:
+    """Stops sending batches. The pending batch, if any, is not sent."""
+    if self._flush_task:
+      self._flush_task.cancel()
+      self._flush_task = None
+    self._batch = []
+    self._batch_bytes = 0
+
+  def _add_to_batch(self, text: bytes) -> None:
+    self._batch.append(text)
+    self._batch_bytes += len(text)
+    if self._flush_task is None:
+      self._flush_task = asyncio.create_task(self._flush_later())
+
+  async def _flush_later(self) -> None:
+    await asyncio.sleep(self._batch_window_seconds)
+    self._flush_task = None
+    async with self._lock:
+      await self._send_batch()
+
+  async def _send_batch(self) -> None:
+    if not self._batch:
+      return
+    batch = b"[" + b",".join(self._batch) + b"]"
+    self._batch = []
+    self._batch_bytes = 0
+    if self._flush_task and self._flush_task is not asyncio.current_task():
+      self._flush_task.cancel()
+    self._flush_task = None
+    await self._websocket.send_text(batch.decode())
+
@@ -0,0 +1,221 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The cache of the runners of the apps served by the API server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import dataclasses
+import logging
+import time
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+from ...runners import Runner
+from . import cleanup
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+@dataclasses.dataclass
+class _Entry:
+  runner: Runner
+  last_used: float
+  active: int = 0
+  """The number of invocations running on the runner."""
+
+
+class RunnerCache:
+  """Caches a runner per app, bounded in size and in idle time.
+
+  When the cache holds more than `max_size` runners, the least recently used
+  ones are closed and dropped. Runners unused for `idle_ttl_seconds` are
+  closed and dropped as well. A runner is never evicted while an invocation
+  runs on it through `use`, so the cache may briefly exceed `max_size`.
+
+  Concurrent requests for an app that is not cached create its runner once.
+
+  Must be used from a single event loop.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_size: Optional[int] = None,
+      idle_ttl_seconds: Optional[float] = None,
+  ):
+    """Initializes the cache.
+
+    Args:
+      max_size: The maximum number of cached runners. Unlimited if `None`.
+      idle_ttl_seconds: How long a runner stays cached without being used.
+        Unlimited if `None`.
+    """
+    if max_size is not None and max_size < 1:
+      raise ValueError("max_size must be at least 1.")
+    if idle_ttl_seconds is not None and idle_ttl_seconds <= 0:
+      raise ValueError("idle_ttl_seconds must be positive.")
+    self.max_size = max_size
+    self.idle_ttl_seconds = idle_ttl_seconds
+    # From the least to the most recently used.
+    self._entries: OrderedDict[str, _Entry] = OrderedDict()
+    self._creating: dict[str, asyncio.Task[Runner]] = {}
+
+  def __contains__(self, app_name: object) -> bool:
+    return app_name in self._entries
+
+  def __getitem__(self, app_name: str) -> Runner:
+    return self._entries[app_name].runner
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def __iter__(self) -> Iterator[str]:
+    return iter(list(self._entries))
+
+  def values(self) -> list[Runner]:
+    """Returns the cached runners."""
+    return [entry.runner for entry in self._entries.values()]
+
+  def pop(
+      self, app_name: str, default: Optional[Runner] = None
+  ) -> Optional[Runner]:
+    """Drops the runner of an app from the cache, without closing it."""
+    entry = self._entries.pop(app_name, None)
+    return entry.runner if entry else default
+
+  async def get_or_create(
+      self,
+      app_name: str,
+      create_runner: Callable[[], Awaitable[Runner]],
+  ) -> Runner:
+    """Returns the runner of an app, creating it if it is not cached.
+
+    Args:
+      app_name: The app of the runner.
+      create_runner: Creates the runner. Called once however many requests
+        wait for the runner.
+
+    Returns:
+      The runner of the app.
+    """
+    return (await self._get_entry(app_name, create_runner)).runner
+
+  @asynccontextmanager
+  async def use(
+      self,
+      app_name: str,
+      create_runner: Callable[[], Awaitable[Runner]],
+  ) -> AsyncIterator[Runner]:
+    """Returns the runner of an app, kept cached until the block exits.
+
+    Example:
+      async with runner_cache.use(app_name, create_runner) as runner:
+        async for event in runner.run_async(...):
+          ...
+    """
+    entry = await self._get_entry(app_name, create_runner)
+    entry.active += 1
+    try:
+      yield entry.runner
+    finally:
+      entry.active -= 1
+      entry.last_used = time.monotonic()
+      if self._entries.get(app_name) is entry:
+        await self._evict_over_size()
+
+  async def evict_expired(self) -> None:
+    """Closes and drops the runners unused for `idle_ttl_seconds`."""
+    if self.idle_ttl_seconds is None:
+      return
+    deadline = time.monotonic() - self.idle_ttl_seconds
+    expired = [
+        app_name
+        for app_name, entry in self._entries.items()
+        if not entry.active and entry.last_used <= deadline
+    ]
+    for app_name in expired:
+      logger.info("Closing the runner of app %s, idle for too long.", app_name)
+    await self._close(expired)
+
+  async def expire_idle_runners(self) -> None:
+    """Evicts expired runners until cancelled. Returns at once without a TTL."""
+    if self.idle_ttl_seconds is None:
+      return
+    while True:
+      await asyncio.sleep(self.idle_ttl_seconds / 2)
+      await self.evict_expired()
+
+  async def close(self) -> None:
+    """Closes and drops all the runners."""
+    await self._close(list(self._entries))
+
+  async def _get_entry(
+      self,
+      app_name: str,
+      create_runner: Callable[[], Awaitable[Runner]],
+  ) -> _Entry:
+    await self.evict_expired()
+    while True:
+      entry = self._entries.get(app_name)
+      if entry:
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(app_name)
+        return entry
+      task = self._creating.get(app_name)
+      if task is None:
+        task = asyncio.ensure_future(self._create(app_name, create_runner))
+        self._creating[app_name] = task
+      # Cancelling one of the requests does not cancel the creation the
+      # others wait for. Loops in case the runner was evicted right away.
+      await asyncio.shield(task)
+
+  async def _create(
+      self,
+      app_name: str,
+      create_runner: Callable[[], Awaitable[Runner]],
+  ) -> None:
+    try:
+      self._entries[app_name] = _Entry(await create_runner(), time.monotonic())
+    finally:
+      del self._creating[app_name]
+    await self._evict_over_size(keep=app_name)
+
+  async def _evict_over_size(self, keep: Optional[str] = None) -> None:
+    """Evicts the least recently used idle runners, except the one of `keep`."""
+    if self.max_size is None:
+      return
+    excess = len(self._entries) - self.max_size
+    if excess <= 0:
+      return
+    evicted = [
+        app_name
+        for app_name, entry in self._entries.items()
+        if not entry.active and app_name != keep
+    ][:excess]
+    for app_name in evicted:
+      logger.info(
+          "Closing the runner of app %s, the least recently used.", app_name
+      )
+    await self._close(evicted)
+
+  async def _close(self, app_names: list[str]) -> None:
+    runners = [self._entries.pop(app_name).runner for app_name in app_names]
+    await cleanup.close_runners(runners)
@@ -0,0 +1,189 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Partial, compressed views of a session returned by the API server."""
+
+from __future__ import annotations
+
+import gzip
+from typing import Callable
+from typing import Optional
+
+from google.genai import types
+
+from ...events.event import Event
+from ...sessions.session import Session
+
+_SESSION_SERIALIZER = Session.__pydantic_serializer__
+
+# Responses smaller than this are not worth compressing.
+_MIN_COMPRESSED_BYTES = 1024
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+
+# The OpenAPI description of the responses of the session endpoint. The
+# events of a projected session only have the requested fields, so the schema
+# does not require any of them.
+SESSION_VIEW_RESPONSES = {
+    200: {
+        "description": (
+            "The session, with the events selected by `event_offset` and"
+            " `event_limit`. With `fields`, its events only have the listed"
+            " fields."
+        ),
+        "headers": {
+            "X-Total-Events": {
+                "description": "The number of events of the session.",
+                "schema": {"type": "integer"},
+            },
+        },
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "appName": {"type": "string"},
+                        "userId": {"type": "string"},
+                        "state": {"type": "object"},
+                        "events": {
+                            "type": "array",
+                            "items": {"type": "object"},
+                        },
+                        "lastUpdateTime": {"type": "number"},
+                    },
+                    "required": ["id", "appName", "userId"],
+                },
+            },
+        },
+    },
+}
+
+_EVENT_FIELDS = {
+    **{name: name for name in Event.model_fields},
+    **{field.alias: name for name, field in Event.model_fields.items()},
+}
+
+
+def parse_event_fields(fields: str) -> set[str]:
+  """Parses a comma-separated list of event fields, by name or by alias.
+
+  Raises:
+    ValueError: If a field is not a field of `Event`.
+  """
+  names = set()
+  for field in fields.split(","):
+    field = field.strip()
+    if not field:
+      continue
+    if field not in _EVENT_FIELDS:
+      raise ValueError(f"Unknown event field: {field}")
+    names.add(_EVENT_FIELDS[field])
+  return names
+
+
+def _replace_blobs(event: Event, blob_url: Callable[[str, int], str]) -> Event:
+  """Returns the event with its inline data replaced by `file_data` links."""
+  if not event.content or not event.content.parts:
+    return event
+  if not any(part.inline_data for part in event.content.parts):
+    return event
+  parts = [
+      types.Part(
+          file_data=types.FileData(
+              file_uri=blob_url(event.id, i),
+              mime_type=part.inline_data.mime_type,
+              display_name=part.inline_data.display_name,
+          )
+      )
+      if part.inline_data
+      else part
+      for i, part in enumerate(event.content.parts)
+  ]
+  return event.model_copy(
+      update={"content": event.content.model_copy(update={"parts": parts})}
+  )
+
+
+def session_to_json(
+    session: Session,
+    *,
+    event_fields: Optional[set[str]] = None,
+    event_offset: int = 0,
+    event_limit: Optional[int] = None,
+    blob_url: Optional[Callable[[str, int], str]] = None,
+) -> bytes:
+  """Encodes a session as JSON, with a subset of its events.
+
+  Args:
+    session: The session to encode.
+    event_fields: The fields of the events to keep. All if `None`.
+    event_offset: The index of the first event to keep.
+    event_limit: The number of events to keep. All the remaining ones if
+      `None`.
+    blob_url: If set, the inline data of the events is replaced by `file_data`
+      parts linking to `blob_url(event_id, part_index)`.
+
+  Returns:
+    The JSON of the session, as returned by the API server.
+  """
+  end = None if event_limit is None else event_offset + event_limit
+  events = session.events[event_offset:end]
+  if blob_url:
+    events = [_replace_blobs(event, blob_url) for event in events]
+  include = None
+  if event_fields is not None:
+    include = {name: True for name in Session.model_fields}
+    include["events"] = {"__all__": event_fields}
+  return _SESSION_SERIALIZER.to_json(
+      session.model_copy(update={"events": events}),
+      by_alias=True,
+      exclude_none=True,
+      include=include,
+  )
+
+
+def _accepted_encodings(accept_encoding: Optional[str]) -> set[str]:
+  encodings = set()
+  for item in (accept_encoding or "").split(","):
+    encoding, _, params = item.partition(";")
+    if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00"):
+      continue
+    encodings.add(encoding.strip().lower())
+  return encodings
+
+
+def compress(
+    body: bytes, accept_encoding: Optional[str]
+) -> tuple[bytes, Optional[str]]:
+  """Compresses a response body with the best encoding the client accepts.
+
+  Brotli is used when the `brotli` package is installed.
+
+  Returns:
+    The body, and its `Content-Encoding`, or None if it is not compressed.
+  """
+  if len(body) < _MIN_COMPRESSED_BYTES:
+    return body, None
+  encodings = _accepted_encodings(accept_encoding)
+  if "br" in encodings:
+    try:
+      import brotli
+    except ImportError:
+      pass
+    else:
+      return brotli.compress(body, quality=_BROTLI_QUALITY), "br"
+  if "gzip" in encodings:
+    return gzip.compress(body, compresslevel=_GZIP_LEVEL), "gzip"
+  return body, None
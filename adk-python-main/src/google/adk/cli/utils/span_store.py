@@ -0,0 +1,342 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A bounded store of the spans shown by the debug trace endpoints."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import dataclasses
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Spans whose attributes are returned by `/debug/trace/{event_id}`.
+_EVENT_SPAN_NAMES = ("call_llm", "send_data")
+_EVENT_SPAN_PREFIXES = ("execute_tool",)
+
+_SPILL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spans (
+  seq INTEGER PRIMARY KEY,
+  trace_id TEXT NOT NULL,
+  event_id TEXT,
+  exported_at REAL NOT NULL,
+  span TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS spans_trace_id ON spans (trace_id);
+CREATE INDEX IF NOT EXISTS spans_event_id ON spans (event_id);
+CREATE INDEX IF NOT EXISTS spans_exported_at ON spans (exported_at);
+CREATE TABLE IF NOT EXISTS session_traces (
+  session_id TEXT NOT NULL,
+  trace_id TEXT NOT NULL,
+  exported_at REAL NOT NULL,
+  PRIMARY KEY (session_id, trace_id)
+);
+"""
+# How often expired spans are deleted from the spill database.
+_SPILL_PRUNE_INTERVAL_SECONDS = 60.0
+
+
+@dataclasses.dataclass
+class _SpanRecord:
+  seq: int
+  span: dict[str, Any]
+  """The span, as returned by `/debug/trace/session/{session_id}`."""
+  event_id: Optional[str]
+  """The event whose trace the span is, if any."""
+  size: int
+  exported_at: float
+
+
+def _span_to_dict(span: ReadableSpan) -> dict[str, Any]:
+  return {
+      "name": span.name,
+      "span_id": span.context.span_id,
+      "trace_id": span.context.trace_id,
+      "start_time": span.start_time,
+      "end_time": span.end_time,
+      "attributes": dict(span.attributes),
+      "parent_span_id": span.parent.span_id if span.parent else None,
+  }
+
+
+def _estimate_size(span: dict[str, Any]) -> int:
+  size = 256
+  for key, value in span["attributes"].items():
+    size += len(key) + (len(value) if isinstance(value, str) else 16)
+  return size
+
+
+def _is_event_span(name: str) -> bool:
+  return name in _EVENT_SPAN_NAMES or name.startswith(_EVENT_SPAN_PREFIXES)
+
+
+class SpanStore:
+  """Keeps the recent spans of the API server, indexed by session and event.
+
+  Spans are kept in export order and evicted oldest first once there are more
+  than `max_spans` of them, once their attributes exceed about `max_bytes`, or
+  once they are older than `ttl_seconds`. Looking up the spans of a session
+  or the trace of an event only reads the matching spans.
+
+  With `spill_path`, spans evicted for space are moved to a SQLite database
+  instead of being dropped, and are still returned by lookups until they
+  expire. With `shared`, several processes use the same spill database: the
+  spans are written to it as they are added, so that the lookups of each
+  process return the spans of all of them. The methods are thread-safe.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_spans: int = 10000,
+      max_bytes: int = 64 * 1024 * 1024,
+      ttl_seconds: Optional[float] = 24 * 60 * 60,
+      spill_path: Optional[str] = None,
+      shared: bool = False,
+  ):
+    """Initializes the span store.
+
+    Args:
+      max_spans: The maximum number of spans kept in memory.
+      max_bytes: The approximate maximum size of the spans kept in memory.
+      ttl_seconds: How long spans are kept. If `None`, spans are only evicted
+        for space.
+      spill_path: A SQLite database to move the spans evicted from memory to.
+      shared: Whether other processes use the same spill database. Spans are
+        then not kept in memory. Requires `spill_path`.
+
+    Raises:
+      ValueError: If `shared` is set without `spill_path`.
+    """
+    if shared and not spill_path:
+      raise ValueError("A shared span store requires a spill path.")
+    self._shared = shared
+    self._max_spans = 0 if shared else max_spans
+    self._max_bytes = max_bytes
+    self._ttl_seconds = ttl_seconds
+    self._lock = threading.Lock()
+    self._next_seq = 0
+    self._total_bytes = 0
+    self._spans: OrderedDict[int, _SpanRecord] = OrderedDict()
+    self._trace_spans: dict[int, list[int]] = {}
+    self._session_traces: dict[str, dict[int, None]] = {}
+    self._trace_sessions: dict[int, set[str]] = {}
+    self._event_spans: dict[str, int] = {}
+    self._spill: Optional[sqlite3.Connection] = None
+    self._spill_pruned_at = 0.0
+    if spill_path:
+      self._spill = sqlite3.connect(spill_path, check_same_thread=False)
+      if shared:
+        # Lets the processes read while another one writes.
+        self._spill.execute("PRAGMA journal_mode=WAL")
+      self._spill.executescript(_SPILL_SCHEMA)
+      self._spill.commit()
+      # Continues the sequence of the spans spilled by earlier processes.
+      (max_seq,) = self._spill.execute("SELECT MAX(seq) FROM spans").fetchone()
+      self._next_seq = 0 if max_seq is None else max_seq + 1
+
+  def add(self, spans: list[ReadableSpan]) -> None:
+    """Adds finished spans to the store."""
+    now = time.time()
+    with self._lock:
+      for span in spans:
+        span_dict = _span_to_dict(span)
+        attributes = span_dict["attributes"]
+        trace_id = span_dict["trace_id"]
+        event_id = None
+        if _is_event_span(span.name):
+          event_id = attributes.get("gcp.vertex.agent.event_id") or None
+        record = _SpanRecord(
+            seq=self._next_seq,
+            span=span_dict,
+            event_id=event_id,
+            size=_estimate_size(span_dict),
+            exported_at=now,
+        )
+        self._next_seq += 1
+        self._spans[record.seq] = record
+        self._total_bytes += record.size
+        self._trace_spans.setdefault(trace_id, []).append(record.seq)
+        if event_id:
+          self._event_spans[event_id] = record.seq
+        if span.name == "call_llm":
+          session_id = attributes.get("gcp.vertex.agent.session_id")
+          if session_id:
+            self._session_traces.setdefault(session_id, {})[trace_id] = None
+            self._trace_sessions.setdefault(trace_id, set()).add(session_id)
+            if self._spill is not None:
+              self._spill.execute(
+                  "INSERT OR REPLACE INTO session_traces VALUES (?, ?, ?)",
+                  (session_id, str(trace_id), now),
+              )
+      self._evict(now)
+
+  def get_session_spans(self, session_id: str) -> list[dict[str, Any]]:
+    """Returns the spans of the traces of a session, in export order."""
+    with self._lock:
+      self._evict(time.time())
+      trace_ids = list(self._session_traces.get(session_id, {}))
+      records = [
+          self._spans[seq]
+          for trace_id in trace_ids
+          for seq in self._trace_spans.get(trace_id, [])
+      ]
+      spans = [(record.seq, record.span) for record in records]
+      if self._spill is not None:
+        spans.extend(self._spilled_session_spans(session_id))
+    return [span for _, span in sorted(spans, key=lambda item: item[0])]
+
+  def get_event_trace(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the attributes of the latest span of an event's trace."""
+    with self._lock:
+      self._evict(time.time())
+      seq = self._event_spans.get(event_id)
+      if seq is not None:
+        span = self._spans[seq].span
+      elif self._spill is not None:
+        row = self._spill.execute(
+            "SELECT span FROM spans WHERE event_id = ? ORDER BY seq DESC"
+            " LIMIT 1",
+            (event_id,),
+        ).fetchone()
+        if row is None:
+          return None
+        span = json.loads(row[0])
+      else:
+        return None
+    return {
+        **span["attributes"],
+        "trace_id": span["trace_id"],
+        "span_id": span["span_id"],
+    }
+
+  def clear(self) -> None:
+    """Drops all spans."""
+    with self._lock:
+      self._spans.clear()
+      self._trace_spans.clear()
+      self._session_traces.clear()
+      self._trace_sessions.clear()
+      self._event_spans.clear()
+      self._total_bytes = 0
+      if self._spill is not None:
+        self._spill.execute("DELETE FROM spans")
+        self._spill.execute("DELETE FROM session_traces")
+        self._spill.commit()
+
+  def close(self) -> None:
+    """Moves the spans to the spill database, if any, and closes it."""
+    with self._lock:
+      if self._spill is not None:
+        self._write_spill(list(self._spans.values()))
+        self._spill.commit()
+        self._spill.close()
+        self._spill = None
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._spans)
+
+  def _spilled_session_spans(
+      self, session_id: str
+  ) -> list[tuple[int, dict[str, Any]]]:
+    rows = self._spill.execute(
+        "SELECT spans.seq, spans.span FROM session_traces JOIN spans"
+        " ON spans.trace_id = session_traces.trace_id"
+        " WHERE session_traces.session_id = ?",
+        (session_id,),
+    ).fetchall()
+    return [(seq, json.loads(span)) for seq, span in rows]
+
+  def _evict(self, now: float) -> None:
+    expired_before = (
+        now - self._ttl_seconds if self._ttl_seconds is not None else None
+    )
+    spilled = []
+    while self._spans:
+      record = next(iter(self._spans.values()))
+      expired = (
+          expired_before is not None and record.exported_at < expired_before
+      )
+      if (
+          not expired
+          and len(self._spans) <= self._max_spans
+          and self._total_bytes <= self._max_bytes
+      ):
+        break
+      self._remove(record)
+      if not expired and self._spill is not None:
+        spilled.append(record)
+    if self._spill is None:
+      return
+    prune = (
+        expired_before is not None
+        and now - self._spill_pruned_at >= _SPILL_PRUNE_INTERVAL_SECONDS
+    )
+    if not spilled and not prune:
+      return
+    if spilled:
+      self._write_spill(spilled)
+    if prune:
+      self._spill_pruned_at = now
+      self._spill.execute(
+          "DELETE FROM spans WHERE exported_at < ?", (expired_before,)
+      )
+      self._spill.execute(
+          "DELETE FROM session_traces WHERE exported_at < ?", (expired_before,)
+      )
+    self._spill.commit()
+
+  def _write_spill(self, records: list[_SpanRecord]) -> None:
+    self._spill.executemany(
+        "INSERT OR REPLACE INTO spans VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                # The database numbers the spans of all the processes.
+                None if self._shared else record.seq,
+                str(record.span["trace_id"]),
+                record.event_id,
+                record.exported_at,
+                json.dumps(record.span, default=str),
+            )
+            for record in records
+        ],
+    )
+
+  def _remove(self, record: _SpanRecord) -> None:
+    del self._spans[record.seq]
+    self._total_bytes -= record.size
+    trace_id = record.span["trace_id"]
+    trace_spans = self._trace_spans[trace_id]
+    trace_spans.remove(record.seq)
+    if not trace_spans:
+      del self._trace_spans[trace_id]
+      # Spilled traces are found through the session_traces table.
+      for session_id in self._trace_sessions.pop(trace_id, ()):
+        session_traces = self._session_traces[session_id]
+        session_traces.pop(trace_id, None)
+        if not session_traces:
+          del self._session_traces[session_id]
+    event_id = record.event_id
+    if event_id and self._event_spans.get(event_id) == record.seq:
+      del self._event_spans[event_id]
@@ -0,0 +1,209 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs the API server in several worker processes.
+
+Each worker builds its own app from the options of the command, with its own
+runners, admission controller and agent file watcher. The server-wide
+invocation limits are split between the workers, and `/metrics` is not served,
+as each worker only sees its own metrics: they are exported through the
+OpenTelemetry pipeline instead, e.g. with `--otel_to_cloud`. What workers must
+share is kept out of their memory:
+
+- sessions and artifacts are stored by services that several processes can
+  use, which is checked before the workers start.
+- the spans of the debug trace endpoints are written to a shared SQLite
+  database, so that any worker can serve the trace of a session run by
+  another one.
+
+With `reload_agents`, each worker watches the agents directory and reloads
+the changed agents itself, so no reload state is exchanged between workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import tempfile
+from typing import Any
+from typing import Optional
+
+import click
+from fastapi import FastAPI
+import uvicorn
+
+from ...artifacts.in_memory_artifact_service import InMemoryArtifactService
+from ...memory.in_memory_memory_service import InMemoryMemoryService
+from ...sessions.in_memory_session_service import InMemorySessionService
+from ..service_registry import load_services_module
+from .service_factory import create_artifact_service_from_options
+from .service_factory import create_memory_service_from_options
+from .service_factory import create_session_service_from_options
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# Passes the options of `get_fast_api_app` from the command to the workers.
+_APP_KWARGS_ENV = "ADK_WORKER_APP_KWARGS"
+
+# The server-wide invocation limits, split between the workers.
+_SPLIT_LIMITS = (
+    "max_concurrent_invocations",
+    "max_concurrent_invocations_per_app",
+    "max_queued_invocations",
+)
+
+
+async def _close_services(services: list[Any]) -> None:
+  for service in services:
+    close = getattr(service, "close", None)
+    if close is not None:
+      await close()
+
+
+def check_services_for_workers(
+    *,
+    agents_dir: str,
+    session_service_uri: Optional[str] = None,
+    artifact_service_uri: Optional[str] = None,
+    memory_service_uri: Optional[str] = None,
+    use_local_storage: bool = True,
+) -> None:
+  """Checks that the services of the server can be shared by processes.
+
+  Builds the services the way the workers will, checks them, and closes
+  them. In-memory session and artifact services are refused, as their data
+  would be split between workers. The memory and credential services are only
+  warned about.
+
+  Raises:
+    click.UsageError: If the session or artifact service is in memory.
+  """
+  load_services_module(agents_dir)
+  services = []
+  try:
+    session_service = create_session_service_from_options(
+        base_dir=agents_dir,
+        session_service_uri=session_service_uri,
+        use_local_storage=use_local_storage,
+    )
+    services.append(session_service)
+    artifact_service = create_artifact_service_from_options(
+        base_dir=agents_dir,
+        artifact_service_uri=artifact_service_uri,
+        strict_uri=True,
+        use_local_storage=use_local_storage,
+    )
+    services.append(artifact_service)
+    memory_service = create_memory_service_from_options(
+        base_dir=agents_dir,
+        memory_service_uri=memory_service_uri,
+    )
+    services.append(memory_service)
+  except ValueError as exc:
+    raise click.ClickException(str(exc)) from exc
+  finally:
+    asyncio.run(_close_services(services))
+  if isinstance(session_service, InMemorySessionService) or (
+      session_service_uri and ":memory:" in session_service_uri
+  ):
+    raise click.UsageError(
+        "--workers requires a session service that several processes can"
+        " use: set --session_service_uri, or enable local storage."
+    )
+  if isinstance(artifact_service, InMemoryArtifactService):
+    raise click.UsageError(
+        "--workers requires an artifact service that several processes can"
+        " use: set --artifact_service_uri, or enable local storage."
+    )
+  if isinstance(memory_service, InMemoryMemoryService):
+    logger.warning(
+        "The memory service is in memory: each worker only searches the"
+        " sessions it added to memory. Set --memory_service_uri to share it."
+    )
+  logger.warning(
+      "Credentials obtained through OAuth flows are kept by the worker that"
+      " ran the flow."
+  )
+
+
+def run_workers(
+    *,
+    workers: int,
+    host: str,
+    port: int,
+    app_kwargs: dict[str, Any],
+) -> None:
+  """Serves the app in `workers` processes until the server is stopped.
+
+  Args:
+    workers: The number of worker processes.
+    host: The binding host of the server.
+    port: The port of the server.
+    app_kwargs: The JSON-serializable arguments of `get_fast_api_app`. The
+      invocation limits are split between the workers, rounded up. A
+      temporary trace spill database is used when `trace_spill_path` is not
+      set.
+  """
+  check_services_for_workers(
+      agents_dir=app_kwargs["agents_dir"],
+      session_service_uri=app_kwargs.get("session_service_uri"),
+      artifact_service_uri=app_kwargs.get("artifact_service_uri"),
+      memory_service_uri=app_kwargs.get("memory_service_uri"),
+      use_local_storage=app_kwargs.get("use_local_storage", True),
+  )
+  app_kwargs = dict(app_kwargs, workers=workers)
+  for name in _SPLIT_LIMITS:
+    if app_kwargs.get(name):
+      app_kwargs[name] = math.ceil(app_kwargs[name] / workers)
+      logger.info("Each worker uses --%s=%s.", name, app_kwargs[name])
+  logger.warning(
+      "/metrics is not served with --workers, as each worker only sees its"
+      " own metrics. Export them through OpenTelemetry instead, e.g. with"
+      " --otel_to_cloud."
+  )
+  temporary_spill_path = None
+  if not app_kwargs.get("trace_spill_path"):
+    fd, temporary_spill_path = tempfile.mkstemp(
+        prefix="adk_traces_", suffix=".db"
+    )
+    os.close(fd)
+    app_kwargs["trace_spill_path"] = temporary_spill_path
+  # The workers are spawned, and inherit the environment.
+  os.environ[_APP_KWARGS_ENV] = json.dumps(app_kwargs)
+  try:
+    uvicorn.run(
+        f"{__name__}:create_worker_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+    )
+  finally:
+    os.environ.pop(_APP_KWARGS_ENV, None)
+    if temporary_spill_path:
+      for suffix in ("", "-wal", "-shm"):
+        try:
+          os.remove(temporary_spill_path + suffix)
+        except FileNotFoundError:
+          pass
+
+
+def create_worker_app() -> FastAPI:
+  """Builds the app of a worker, from the options passed by `run_workers`."""
+  from ..fast_api import get_fast_api_app
+
+  return get_fast_api_app(**json.loads(os.environ[_APP_KWARGS_ENV]))
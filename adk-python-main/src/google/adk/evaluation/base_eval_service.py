@@ -25,6 +25,7 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
+from ..agents.run_config import BatchConfig
 from .eval_case import Invocation
 from .eval_metrics import EvalMetric
 from .eval_result import EvalCaseResult
@@ -81,6 +82,16 @@ the quota.
 could also overwhelm those tools.""",
   )
 
+  batch_config: Optional[BatchConfig] = Field(
+      default=None,
+      description="""If set, concurrent model calls from the parallel
+inferences are coalesced into batch submissions for models that implement
+`BaseLlm.generate_content_batch`. Batches only fill up to the number of
+concurrent inferences, so pair this with a larger `parallelism`. No model
+shipped with ADK implements it yet, so this has no effect until the model in
+use opts in.""",
+  )
+
 
 class InferenceRequest(BaseModel):
   """Represent a request to perform inferences for the eval cases in an eval set."""
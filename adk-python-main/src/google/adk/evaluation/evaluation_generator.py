@@ -25,6 +25,7 @@ from google.genai.types import Content
 from pydantic import BaseModel
 
 from ..agents.llm_agent import Agent
+from ..agents.run_config import RunConfig
 from ..artifacts.base_artifact_service import BaseArtifactService
 from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
 from ..events.event import Event
@@ -162,6 +163,7 @@ class EvaluationGenerator:
       user_id: str,
       session_id: str,
       user_content: Content,
+      run_config: Optional[RunConfig] = None,
   ) -> AsyncGenerator[Event, None]:
     invocation_id = None
 
@@ -170,6 +172,7 @@ class EvaluationGenerator:
             user_id=user_id,
             session_id=session_id,
             new_message=user_content,
+            run_config=run_config,
         )
     ) as agen:
 
@@ -194,6 +197,7 @@ class EvaluationGenerator:
       session_service: Optional[BaseSessionService] = None,
       artifact_service: Optional[BaseArtifactService] = None,
       memory_service: Optional[BaseMemoryService] = None,
+      run_config: Optional[RunConfig] = None,
   ) -> list[Invocation]:
     """Scrapes the root agent in coordination with the user simulator."""
 
@@ -249,7 +253,11 @@ class EvaluationGenerator:
           async for (
               event
           ) in EvaluationGenerator._generate_inferences_for_single_user_invocation(
-              runner, user_id, session_id, next_user_message.user_message
+              runner,
+              user_id,
+              session_id,
+              next_user_message.user_message,
+              run_config=run_config,
           ):
             events.append(event)
         else:  # no message generated
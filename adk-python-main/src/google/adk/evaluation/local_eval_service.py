@@ -25,6 +25,7 @@ import uuid
 from typing_extensions import override
 
 from ..agents.base_agent import BaseAgent
+from ..agents.run_config import RunConfig
 from ..artifacts.base_artifact_service import BaseArtifactService
 from ..artifacts.in_memory_artifact_service import InMemoryArtifactService
 from ..errors.not_found_error import NotFoundError
@@ -175,6 +176,12 @@ class LocalEvalService(BaseEvalService):
         value=inference_request.inference_config.parallelism
     )
 
+    run_config = None
+    if inference_request.inference_config.batch_config:
+      run_config = RunConfig(
+          batch_config=inference_request.inference_config.batch_config
+      )
+
     async def run_inference(eval_case):
       async with semaphore:
         return await self._perform_inference_single_eval_item(
@@ -182,6 +189,7 @@ class LocalEvalService(BaseEvalService):
             eval_set_id=inference_request.eval_set_id,
             eval_case=eval_case,
             root_agent=self._root_agent,
+            run_config=run_config,
         )
 
     inference_results = [run_inference(eval_case) for eval_case in eval_cases]
@@ -470,6 +478,7 @@ class LocalEvalService(BaseEvalService):
       eval_set_id: str,
       eval_case: EvalCase,
       root_agent: BaseAgent,
+      run_config: Optional[RunConfig] = None,
   ) -> InferenceResult:
     initial_session = eval_case.session_input
     session_id = self._session_id_supplier()
@@ -491,6 +500,7 @@ class LocalEvalService(BaseEvalService):
                 session_service=self._session_service,
                 artifact_service=self._artifact_service,
                 memory_service=self._memory_service,
+                run_config=run_config,
             )
         )
 
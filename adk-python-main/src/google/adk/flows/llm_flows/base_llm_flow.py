@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
+import contextlib
 import datetime
 import inspect
 import logging
@@ -25,6 +26,7 @@ from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import types
+from opentelemetry import trace
 from websockets.exceptions import ConnectionClosed
 from websockets.exceptions import ConnectionClosedOK
 
@@ -41,7 +43,10 @@ from ...events.event import Event
 from ...models.base_llm_connection import BaseLlmConnection
 from ...models.llm_request import LlmRequest
 from ...models.llm_response import LlmResponse
+from ...models.rate_limiter import ModelRateLimiter
+from ...telemetry import metrics as adk_metrics
 from ...telemetry import tracing
+from ...telemetry.event_loop_monitor import track_callback
 from ...telemetry.tracing import trace_call_llm
 from ...telemetry.tracing import trace_send_data
 from ...telemetry.tracing import tracer
@@ -49,7 +54,9 @@ from ...tools.base_toolset import BaseToolset
 from ...tools.google_search_tool import google_search
 from ...tools.tool_context import ToolContext
 from ...utils.context_utils import Aclosing
+from ...utils.token_estimation import estimate_request_tokens
 from .audio_cache_manager import AudioCacheManager
+from .batch_scheduler import generate_batched
 
 if TYPE_CHECKING:
   from ...agents.llm_agent import LlmAgent
@@ -68,6 +75,76 @@ DEFAULT_TASK_COMPLETION_DELAY = 1.0
 # Statistics configuration
 DEFAULT_ENABLE_CACHE_STATISTICS = False
 
+_RATE_LIMIT_QUEUE_WAIT_ATTRIBUTE = (
+    'gcp.vertex.agent.rate_limit_queue_wait_seconds'
+)
+_RESOURCE_EXHAUSTED_ERROR_CODES = frozenset({'429', 'RESOURCE_EXHAUSTED'})
+
+
+async def _generate_with_rate_limit(
+    rate_limiter: ModelRateLimiter,
+    responses_generator: AsyncGenerator[LlmResponse, None],
+    llm_request: LlmRequest,
+    invocation_context: InvocationContext,
+    span: trace.Span,
+) -> AsyncGenerator[LlmResponse, None]:
+  """Runs a model call once admitted by the model's shared rate limiter.
+
+  The model call runs in its own task, which holds the concurrency slot only
+  until the model finishes responding. Processing the last response, e.g.
+  running the requested tools, does not keep other calls waiting. The task
+  reads at most one response ahead of the consumer, so a slow consumer slows
+  down the model stream instead of buffering it.
+
+  Args:
+    rate_limiter: The rate limiter shared by all calls to the model.
+    responses_generator: The not yet started model response generator.
+    llm_request: The LLM request, used to estimate the tokens charged.
+    invocation_context: The invocation context. Waiters are queued fairly
+      across sessions.
+    span: The `call_llm` span, which records the time spent queued.
+
+  Yields:
+    The model responses.
+  """
+  responses: asyncio.Queue[Optional[LlmResponse]] = asyncio.Queue(maxsize=1)
+
+  async def _call_model() -> None:
+    cancelled = False
+    try:
+      async with rate_limiter.acquire(
+          estimated_tokens=estimate_request_tokens(llm_request),
+          fairness_key=invocation_context.session.id,
+      ) as lease:
+        span.set_attribute(
+            _RATE_LIMIT_QUEUE_WAIT_ATTRIBUTE, lease.queue_wait_seconds
+        )
+        async with Aclosing(responses_generator) as agen:
+          async for llm_response in agen:
+            # Some models report quota errors as responses instead of raising.
+            if llm_response.error_code in _RESOURCE_EXHAUSTED_ERROR_CODES:
+              lease.record_throttled()
+            await responses.put(llm_response)
+    except asyncio.CancelledError:
+      cancelled = True
+      raise
+    finally:
+      # Once cancelled, the consumer is gone and nothing reads the queue.
+      if not cancelled:
+        await responses.put(None)
+
+  model_call = asyncio.create_task(_call_model())
+  try:
+    while (llm_response := await responses.get()) is not None:
+      yield llm_response
+    # Raises the error of the model call, if any.
+    await model_call
+  finally:
+    if not model_call.done():
+      model_call.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await model_call
+
 
 def _finalize_model_response_event(
     llm_request: LlmRequest,
@@ -523,7 +600,11 @@ class BaseLlmFlow(ABC):
     # Runs processors.
     for processor in self.request_processors:
       async with Aclosing(
-          processor.run_async(invocation_context, llm_request)
+          adk_metrics.measure_stream(
+              processor.run_async(invocation_context, llm_request),
+              adk_metrics.REQUEST_PROCESSOR_DURATION,
+              {'adk.processor': type(processor).__name__},
+          )
       ) as agen:
         async for event in agen:
           yield event
@@ -538,28 +619,31 @@ class BaseLlmFlow(ABC):
 
     multiple_tools = len(agent.tools) > 1
     model = agent.canonical_model
-    for tool_union in agent.tools:
-      tool_context = ToolContext(invocation_context)
+    with adk_metrics.measure(
+        adk_metrics.REQUEST_PROCESSOR_DURATION, {'adk.processor': 'tools'}
+    ):
+      for tool_union in agent.tools:
+        tool_context = ToolContext(invocation_context)
 
-      # If it's a toolset, process it first
-      if isinstance(tool_union, BaseToolset):
-        await tool_union.process_llm_request(
-            tool_context=tool_context, llm_request=llm_request
-        )
+        # If it's a toolset, process it first
+        if isinstance(tool_union, BaseToolset):
+          await tool_union.process_llm_request(
+              tool_context=tool_context, llm_request=llm_request
+          )
 
-      from ...agents.llm_agent import _convert_tool_union_to_tools
+        from ...agents.llm_agent import _convert_tool_union_to_tools
 
-      # Then process all tools from this tool union
-      tools = await _convert_tool_union_to_tools(
-          tool_union,
-          ReadonlyContext(invocation_context),
-          model,
-          multiple_tools,
-      )
-      for tool in tools:
-        await tool.process_llm_request(
-            tool_context=tool_context, llm_request=llm_request
+        # Then process all tools from this tool union
+        tools = await _convert_tool_union_to_tools(
+            tool_union,
+            ReadonlyContext(invocation_context),
+            model,
+            multiple_tools,
         )
+        for tool in tools:
+          await tool.process_llm_request(
+              tool_context=tool_context, llm_request=llm_request
+          )
 
   async def _postprocess_async(
       self,
@@ -808,7 +892,7 @@ class BaseLlmFlow(ABC):
     llm = self.__get_llm(invocation_context)
 
     async def _call_llm_with_tracing() -> AsyncGenerator[LlmResponse, None]:
-      with tracer.start_as_current_span('call_llm') as span:
+      with tracing.start_call_llm_span() as span:
         if invocation_context.run_config.support_cfc:
           invocation_context.live_request_queue = LiveRequestQueue()
           responses_generator = self.run_live(invocation_context)
@@ -840,11 +924,30 @@ class BaseLlmFlow(ABC):
           # pushes the counter beyond the max set value, then the execution is
           # stopped right here, and exception is thrown.
           invocation_context.increment_llm_call_count()
-          responses_generator = llm.generate_content_async(
-              llm_request,
-              stream=invocation_context.run_config.streaming_mode
-              == StreamingMode.SSE,
+          run_config = invocation_context.run_config
+          stream = run_config.streaming_mode == StreamingMode.SSE
+          if run_config.batch_config and not stream and llm.supports_batch:
+            responses_generator = generate_batched(
+                llm, llm_request, run_config.batch_config
+            )
+          else:
+            responses_generator = llm.generate_content_async(
+                llm_request, stream=stream
+            )
+          responses_generator = adk_metrics.measure_stream(
+              responses_generator,
+              adk_metrics.LLM_CALL_DURATION,
+              {'gen_ai.request.model': llm_request.model or llm.model},
+              first_item_name=adk_metrics.LLM_TIME_TO_FIRST_TOKEN,
           )
+          if (rate_limiter := llm.rate_limiter) is not None:
+            responses_generator = _generate_with_rate_limit(
+                rate_limiter,
+                responses_generator,
+                llm_request,
+                invocation_context,
+                span,
+            )
           async with Aclosing(
               self._run_and_handle_error(
                   responses_generator,
@@ -902,11 +1005,12 @@ class BaseLlmFlow(ABC):
     if not agent.canonical_before_model_callbacks:
       return
     for callback in agent.canonical_before_model_callbacks:
-      callback_response = callback(
-          callback_context=callback_context, llm_request=llm_request
-      )
-      if inspect.isawaitable(callback_response):
-        callback_response = await callback_response
+      with track_callback(invocation_context, callback):
+        callback_response = callback(
+            callback_context=callback_context, llm_request=llm_request
+        )
+        if inspect.isawaitable(callback_response):
+          callback_response = await callback_response
       if callback_response:
         return callback_response
 
@@ -962,11 +1066,12 @@ class BaseLlmFlow(ABC):
     if not agent.canonical_after_model_callbacks:
       return await _maybe_add_grounding_metadata()
     for callback in agent.canonical_after_model_callbacks:
-      callback_response = callback(
-          callback_context=callback_context, llm_response=llm_response
-      )
-      if inspect.isawaitable(callback_response):
-        callback_response = await callback_response
+      with track_callback(invocation_context, callback):
+        callback_response = callback(
+            callback_context=callback_context, llm_response=llm_response
+        )
+        if inspect.isawaitable(callback_response):
+          callback_response = await callback_response
       if callback_response:
         return await _maybe_add_grounding_metadata(callback_response)
     return await _maybe_add_grounding_metadata()
@@ -0,0 +1,157 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coalesces concurrent model calls into batch submissions.
+
+A `BatchScheduler` queues the non-streaming calls that concurrent invocations
+make to one model and submits them together through
+`BaseLlm.generate_content_batch`, either as soon as `max_batch_size` calls are
+queued or once the oldest queued call has waited `max_wait_seconds`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import AsyncGenerator
+from typing import TYPE_CHECKING
+import weakref
+
+from ...agents.run_config import BatchConfig
+
+if TYPE_CHECKING:
+  from ...models.base_llm import BaseLlm
+  from ...models.llm_request import LlmRequest
+  from ...models.llm_response import LlmResponse
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+
+class BatchScheduler:
+  """Submits the queued calls to one model in batches.
+
+  A scheduler is bound to the event loop it is first used on.
+  """
+
+  def __init__(self, llm: BaseLlm, config: BatchConfig):
+    # Held weakly, so that the registry of schedulers does not keep models
+    # alive. Callers waiting on a batch hold their model themselves.
+    self._llm_ref = weakref.ref(llm)
+    self._model = llm.model
+    self._config = config
+    self._pending: list[tuple[LlmRequest, asyncio.Future[LlmResponse]]] = []
+    self._flush_handle: asyncio.TimerHandle | None = None
+    self._batch_tasks: set[asyncio.Task[None]] = set()
+    self.batches_submitted = 0
+    self.requests_submitted = 0
+
+  @property
+  def queue_depth(self) -> int:
+    """Number of calls waiting for their batch to be submitted."""
+    return len(self._pending)
+
+  async def submit(self, llm_request: LlmRequest) -> LlmResponse:
+    """Queues a request and returns its response once its batch completes.
+
+    Raises:
+      Exception: The error raised by `generate_content_batch` for the batch.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[LlmResponse] = loop.create_future()
+    entry = (llm_request, future)
+    self._pending.append(entry)
+    if len(self._pending) >= self._config.max_batch_size:
+      self._flush()
+    elif self._flush_handle is None:
+      self._flush_handle = loop.call_later(
+          self._config.max_wait_seconds, self._flush
+      )
+    try:
+      return await future
+    except asyncio.CancelledError:
+      # A cancelled call that has not been submitted yet leaves the batch.
+      if entry in self._pending:
+        self._pending.remove(entry)
+        if not self._pending:
+          self._cancel_flush_timer()
+      raise
+
+  def _cancel_flush_timer(self) -> None:
+    if self._flush_handle is not None:
+      self._flush_handle.cancel()
+      self._flush_handle = None
+
+  def _flush(self) -> None:
+    self._cancel_flush_timer()
+    while self._pending:
+      batch = self._pending[: self._config.max_batch_size]
+      del self._pending[: self._config.max_batch_size]
+      task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+      self._batch_tasks.add(task)
+      task.add_done_callback(self._batch_tasks.discard)
+
+  async def _run_batch(
+      self, batch: list[tuple[LlmRequest, asyncio.Future[LlmResponse]]]
+  ) -> None:
+    self.batches_submitted += 1
+    self.requests_submitted += len(batch)
+    try:
+      llm = self._llm_ref()
+      if llm is None:
+        raise RuntimeError(f'Model {self._model} was garbage collected.')
+      llm_responses = await llm.generate_content_batch(
+          [llm_request for llm_request, _ in batch]
+      )
+      if len(llm_responses) != len(batch):
+        raise ValueError(
+            f'generate_content_batch of {self._model} returned'
+            f' {len(llm_responses)} responses for {len(batch)} requests.'
+        )
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      logger.debug('Batch of %d requests failed: %s', len(batch), e)
+      for _, future in batch:
+        if not future.done():
+          future.set_exception(e)
+      return
+    for (_, future), llm_response in zip(batch, llm_responses):
+      if not future.done():
+        future.set_result(llm_response)
+
+
+# Schedulers per event loop, keyed by model instance and batch config. An
+# entry is dropped when its model is garbage collected, before its id can be
+# reused.
+_schedulers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[int, BatchConfig], BatchScheduler]
+] = weakref.WeakKeyDictionary()
+
+
+def get_batch_scheduler(llm: BaseLlm, config: BatchConfig) -> BatchScheduler:
+  """Returns the scheduler of the running loop for `llm` and `config`."""
+  loop = asyncio.get_running_loop()
+  schedulers = _schedulers.setdefault(loop, {})
+  key = (id(llm), config)
+  scheduler = schedulers.get(key)
+  if scheduler is None:
+    scheduler = BatchScheduler(llm, config)
+    schedulers[key] = scheduler
+    weakref.finalize(llm, schedulers.pop, key, None)
+  return scheduler
+
+
+async def generate_batched(
+    llm: BaseLlm, llm_request: LlmRequest, config: BatchConfig
+) -> AsyncGenerator[LlmResponse, None]:
+  """Yields the response to `llm_request`, submitted as part of a batch."""
+  yield await get_batch_scheduler(llm, config).submit(llm_request)
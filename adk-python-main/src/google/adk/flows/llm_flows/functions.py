@@ -23,6 +23,7 @@ import functools
 import inspect
 import logging
 import threading
+import time
 from typing import Any
 from typing import AsyncGenerator
 from typing import cast
@@ -37,6 +38,9 @@ from ...agents.invocation_context import InvocationContext
 from ...auth.auth_tool import AuthToolArguments
 from ...events.event import Event
 from ...events.event_actions import EventActions
+from ...telemetry import metrics as adk_metrics
+from ...telemetry.event_loop_monitor import track_activity
+from ...telemetry.event_loop_monitor import track_callback
 from ...telemetry.tracing import trace_merged_tool_calls
 from ...telemetry.tracing import trace_tool_call
 from ...telemetry.tracing import tracer
@@ -124,10 +128,19 @@ async def _call_tool_in_thread_pool(
 
   loop = asyncio.get_running_loop()
   executor = _get_tool_thread_pool(max_workers)
+  submitted_at = time.perf_counter()
+
+  def record_queue_duration():
+    adk_metrics.record_duration(
+        adk_metrics.TOOL_QUEUE_DURATION,
+        time.perf_counter() - submitted_at,
+        {'gen_ai.tool.name': tool.name, 'adk.queue': 'thread_pool'},
+    )
 
   if _is_sync_tool(tool):
     # For sync FunctionTool, call the underlying function directly
     def run_sync_tool():
+      record_queue_duration()
       if isinstance(tool, FunctionTool):
         args_to_call = tool._preprocess_args(args)
         signature = inspect.signature(tool.func)
@@ -150,6 +163,7 @@ async def _call_tool_in_thread_pool(
     # This helps when async functions contain blocking I/O (common user mistake)
     # that would otherwise block the main event loop.
     def run_async_tool_in_new_loop():
+      record_queue_duration()
       # Create a new event loop for this thread
       return asyncio.run(tool.run_async(args=args, tool_context=tool_context))
 
@@ -331,6 +345,7 @@ async def handle_function_call_list_async(
     return None
 
   # Create tasks for parallel execution
+  scheduled_at = time.perf_counter()
   tasks = [
       asyncio.create_task(
           _execute_single_function_call_async(
@@ -341,6 +356,7 @@ async def handle_function_call_list_async(
               tool_confirmation_dict[function_call.id]
               if tool_confirmation_dict
               else None,
+              scheduled_at=scheduled_at,
           )
       )
       for function_call in filtered_calls
@@ -379,8 +395,11 @@ async def _execute_single_function_call_async(
     tools_dict: dict[str, BaseTool],
     agent: LlmAgent,
     tool_confirmation: Optional[ToolConfirmation] = None,
+    *,
+    scheduled_at: Optional[float] = None,
 ) -> Optional[Event]:
   """Execute a single function call with thread safety for state modifications."""
+  _record_tool_queue_duration(function_call, scheduled_at)
 
   async def _run_on_tool_error_callbacks(
       *,
@@ -402,14 +421,15 @@ async def _execute_single_function_call_async(
       return error_response
 
     for callback in agent.canonical_on_tool_error_callbacks:
-      error_response = callback(
-          tool=tool,
-          args=tool_args,
-          tool_context=tool_context,
-          error=error,
-      )
-      if inspect.isawaitable(error_response):
-        error_response = await error_response
+      with track_callback(invocation_context, callback):
+        error_response = callback(
+            tool=tool,
+            args=tool_args,
+            tool_context=tool_context,
+            error=error,
+        )
+        if inspect.isawaitable(error_response):
+          error_response = await error_response
       if error_response is not None:
         return error_response
 
@@ -458,11 +478,12 @@ async def _execute_single_function_call_async(
     # canonical callback.
     if function_response is None:
       for callback in agent.canonical_before_tool_callbacks:
-        function_response = callback(
-            tool=tool, args=function_args, tool_context=tool_context
-        )
-        if inspect.isawaitable(function_response):
-          function_response = await function_response
+        with track_callback(invocation_context, callback):
+          function_response = callback(
+              tool=tool, args=function_args, tool_context=tool_context
+          )
+          if inspect.isawaitable(function_response):
+            function_response = await function_response
         if function_response:
           break
 
@@ -499,14 +520,15 @@ async def _execute_single_function_call_async(
     # canonical after_tool_callbacks.
     if altered_function_response is None:
       for callback in agent.canonical_after_tool_callbacks:
-        altered_function_response = callback(
-            tool=tool,
-            args=function_args,
-            tool_context=tool_context,
-            tool_response=function_response,
-        )
-        if inspect.isawaitable(altered_function_response):
-          altered_function_response = await altered_function_response
+        with track_callback(invocation_context, callback):
+          altered_function_response = callback(
+              tool=tool,
+              args=function_args,
+              tool_context=tool_context,
+              tool_response=function_response,
+          )
+          if inspect.isawaitable(altered_function_response):
+            altered_function_response = await altered_function_response
         if altered_function_response:
           break
 
@@ -565,6 +587,7 @@ async def handle_function_calls_live(
   streaming_lock = asyncio.Lock()
 
   # Create tasks for parallel execution
+  scheduled_at = time.perf_counter()
   tasks = [
       asyncio.create_task(
           _execute_single_function_call_live(
@@ -573,6 +596,7 @@ async def handle_function_calls_live(
               tools_dict,
               agent,
               streaming_lock,
+              scheduled_at=scheduled_at,
           )
       )
       for function_call in function_calls
@@ -610,8 +634,11 @@ async def _execute_single_function_call_live(
     tools_dict: dict[str, BaseTool],
     agent: LlmAgent,
     streaming_lock: asyncio.Lock,
+    *,
+    scheduled_at: Optional[float] = None,
 ) -> Optional[Event]:
   """Execute a single function call for live mode with thread safety."""
+  _record_tool_queue_duration(function_call, scheduled_at)
   tool, tool_context = _get_tool_and_context(
       invocation_context, function_call, tools_dict
   )
@@ -814,12 +841,15 @@ async def _process_function_live_helper(
     # Check if we should run tools in thread pool to avoid blocking event loop
     thread_pool_config = invocation_context.run_config.tool_thread_pool_config
     if thread_pool_config is not None:
-      function_response = await _call_tool_in_thread_pool(
-          tool,
-          args=function_args,
-          tool_context=tool_context,
-          max_workers=thread_pool_config.max_workers,
-      )
+      with adk_metrics.measure(
+          adk_metrics.TOOL_EXECUTION_DURATION, {'gen_ai.tool.name': tool.name}
+      ):
+        function_response = await _call_tool_in_thread_pool(
+            tool,
+            args=function_args,
+            tool_context=tool_context,
+            max_workers=thread_pool_config.max_workers,
+        )
     else:
       function_response = await __call_tool_async(
           tool, args=function_args, tool_context=tool_context
@@ -901,7 +931,23 @@ async def __call_tool_async(
     tool_context: ToolContext,
 ) -> Any:
   """Calls the tool."""
-  return await tool.run_async(args=args, tool_context=tool_context)
+  with adk_metrics.measure(
+      adk_metrics.TOOL_EXECUTION_DURATION, {'gen_ai.tool.name': tool.name}
+  ), track_activity(tool_context._invocation_context, 'tool', tool.name):
+    return await tool.run_async(args=args, tool_context=tool_context)
+
+
+def _record_tool_queue_duration(
+    function_call: types.FunctionCall, scheduled_at: Optional[float]
+) -> None:
+  """Records how long a function call's task waited to be started."""
+  if scheduled_at is None:
+    return
+  adk_metrics.record_duration(
+      adk_metrics.TOOL_QUEUE_DURATION,
+      time.perf_counter() - scheduled_at,
+      {'gen_ai.tool.name': function_call.name, 'adk.queue': 'task'},
+  )
 
 
 def __build_response_event(
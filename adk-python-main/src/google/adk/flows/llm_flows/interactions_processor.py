@@ -31,7 +31,9 @@ logger = logging.getLogger('google_adk.' + __name__)
 class InteractionsRequestProcessor(BaseLlmRequestProcessor):
   """Request processor for Interactions API stateful conversations.
   This processor extracts the previous_interaction_id from session events
-  to enable stateful conversation chaining via the Interactions API.
+  to enable stateful conversation chaining via the Interactions API. It also
+  serves GeminiEnterprise, which reports its Discovery Engine session as the
+  interaction id so that server-side history is scoped to the ADK session.
   The actual content filtering (retaining only latest user messages) is
   done in the Gemini class when using the Interactions API.
   """
@@ -47,16 +49,18 @@ class InteractionsRequestProcessor(BaseLlmRequestProcessor):
         Event: No events are yielded by this processor
     """
     from ...agents.llm_agent import LlmAgent
+    from ...models.gemini_enterprise_llm import GeminiEnterprise
     from ...models.google_llm import Gemini
 
     agent = invocation_context.agent
-    # Only process if using Gemini with interactions API
+    # Only process if using Gemini with interactions API or GeminiEnterprise
     if not isinstance(agent, LlmAgent):
       return
     model = agent.canonical_model
-    if not isinstance(model, Gemini):
-      return
-    if not model.use_interactions_api:
+    if isinstance(model, Gemini):
+      if not model.use_interactions_api:
+        return
+    elif not isinstance(model, GeminiEnterprise):
       return
     # Extract previous interaction ID from session events
     previous_interaction_id = self._find_previous_interaction_id(
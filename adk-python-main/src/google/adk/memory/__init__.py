@@ -15,12 +15,14 @@ import logging
 
 from .base_memory_service import BaseMemoryService
 from .in_memory_memory_service import InMemoryMemoryService
+from .memory_search_cache import CachingMemoryService
 from .vertex_ai_memory_bank_service import VertexAiMemoryBankService
 
 logger = logging.getLogger('google_adk.' + __name__)
 
 __all__ = [
     'BaseMemoryService',
+    'CachingMemoryService',
     'InMemoryMemoryService',
     'VertexAiMemoryBankService',
 ]
@@ -35,3 +37,14 @@ except ImportError:
       ' VertexAiRagMemoryService please install it. If not, you can ignore this'
       ' warning.'
   )
+
+try:
+  from .local_vector_memory_service import LocalVectorMemoryService
+
+  __all__.append('LocalVectorMemoryService')
+except ImportError:
+  logger.debug(
+      'NumPy is not installed. If you want to use the'
+      ' LocalVectorMemoryService please install it. If not, you can ignore'
+      ' this warning.'
+  )
@@ -15,9 +15,165 @@
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 from datetime import datetime
+import re
+import threading
+from typing import Iterator
+from typing import Sequence
+from typing import TYPE_CHECKING
+import unicodedata
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+
+# Scripts written without spaces between words (Han, Hiragana, Katakana) are
+# indexed one character per token.
+_UNSPACED_SCRIPTS = '\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+_TOKEN_PATTERN = re.compile(
+    rf'[{_UNSPACED_SCRIPTS}]|[^\W_{_UNSPACED_SCRIPTS}]+'
+)
 
 
 def format_timestamp(timestamp: float) -> str:
   """Formats the timestamp of the memory entry."""
   return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def tokenize(text: str) -> list[str]:
+  """Splits text into case-folded words of letters and digits in any script."""
+  return _TOKEN_PATTERN.findall(
+      unicodedata.normalize('NFKC', text).casefold()
+  )
+
+
+def event_text(event: Event) -> str:
+  """Joins the text parts of an event's content."""
+  if not event.content or not event.content.parts:
+    return ''
+  return ' '.join([part.text for part in event.content.parts if part.text])
+
+
+@dataclasses.dataclass
+class _Watermark:
+  timestamp: float
+  event_ids: set[str]
+  """Ids of the ingested events at `timestamp`."""
+
+
+class IngestionTracker:
+  """Tracks the high-water mark of the ingested events of each session.
+
+  An event is new if it is later than the session's last ingested event, or
+  as late but with an id not ingested yet. Events must be given in
+  chronological order, as in `Session.events`, so finding the new events only
+  visits the events past the high-water mark.
+
+  The marks are kept in process memory, so they only deduplicate the calls
+  made through one service instance.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._watermarks: dict[tuple[str, str, str], _Watermark] = {}
+    self._claimed: dict[tuple[str, str, str], set[str]] = {}
+    """Ids of the events being ingested by in-flight calls, per session."""
+    self._released: dict[tuple[str, str, str], set[str]] = {}
+    """Ids of the events of failed calls that a concurrent call moved the
+    high-water mark past, per session. They are new despite their timestamp.
+    """
+
+  @contextlib.contextmanager
+  def claim(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> Iterator[list[Event]]:
+    """Claims the session's new events for one ingestion.
+
+    Yields the events past the high-water mark that no concurrent call has
+    claimed, so that overlapping calls do not ingest the same events twice.
+    The events are marked ingested when the block completes, and released
+    for a later call if it raises.
+    """
+    key = (app_name, user_id, session_id)
+    with self._lock:
+      claimed = self._claimed.setdefault(key, set())
+      new_events = [
+          event
+          for event in self._new_events(key, events)
+          if event.id not in claimed
+      ]
+      event_ids = {event.id for event in new_events}
+      claimed.update(event_ids)
+    succeeded = False
+    try:
+      yield new_events
+      succeeded = True
+    finally:
+      with self._lock:
+        if succeeded:
+          self._advance(key, new_events)
+        else:
+          self._release(key, new_events)
+        claimed.difference_update(event_ids)
+        if not claimed and self._claimed.get(key) is claimed:
+          del self._claimed[key]
+
+  def _new_events(
+      self, key: tuple[str, str, str], events: Sequence[Event]
+  ) -> list[Event]:
+    watermark = self._watermarks.get(key)
+    if watermark is None:
+      return list(events)
+    released = self._released.get(key)
+    new_events = []
+    for event in reversed(events):
+      if event.timestamp < watermark.timestamp:
+        if not released:
+          break
+        if event.id in released:
+          new_events.append(event)
+        continue
+      if (
+          event.timestamp > watermark.timestamp
+          or event.id not in watermark.event_ids
+      ):
+        new_events.append(event)
+    new_events.reverse()
+    return new_events
+
+  def _advance(
+      self, key: tuple[str, str, str], events: Sequence[Event]
+  ) -> None:
+    watermark = self._watermarks.get(key)
+    for event in events:
+      if watermark is None or event.timestamp > watermark.timestamp:
+        watermark = _Watermark(event.timestamp, {event.id})
+      elif event.timestamp == watermark.timestamp:
+        watermark.event_ids.add(event.id)
+    if watermark is not None:
+      self._watermarks[key] = watermark
+    released = self._released.get(key)
+    if released:
+      released.difference_update(event.id for event in events)
+      if not released:
+        del self._released[key]
+
+  def _release(
+      self, key: tuple[str, str, str], events: Sequence[Event]
+  ) -> None:
+    watermark = self._watermarks.get(key)
+    if watermark is None:
+      return
+    behind = [
+        event.id
+        for event in events
+        if event.timestamp <= watermark.timestamp
+        and event.id not in watermark.event_ids
+    ]
+    if behind:
+      self._released.setdefault(key, set()).update(behind)
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -25,6 +26,7 @@ from pydantic import Field
 from .memory_entry import MemoryEntry
 
 if TYPE_CHECKING:
+  from ..events.event import Event
   from ..sessions.session import Session
 
 
@@ -52,12 +54,45 @@ class BaseMemoryService(ABC):
   ):
     """Adds a session to the memory service.
 
-    A session may be added multiple times during its lifetime.
+    A session may be added multiple times during its lifetime. Services that
+    support incremental ingestion only process the events added since the
+    session was last added.
 
     Args:
         session: The session to add.
     """
 
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    """Adds new events of a session to the memory service.
+
+    Unlike `add_session_to_memory`, only the given events are processed,
+    e.g. the events of the latest invocation. Events already added for the
+    session through this service instance are skipped, so the same or
+    overlapping events can be passed again. This is best effort: the record
+    of added events is kept in process memory, so another instance or
+    process adds them again unless the backend deduplicates them itself.
+
+    Args:
+        app_name: The name of the application.
+        user_id: The id of the user.
+        session_id: The id of the session the events belong to.
+        events: The events, in chronological order.
+
+    Raises:
+        NotImplementedError: If the service does not support incremental
+          ingestion.
+    """
+    raise NotImplementedError(
+        f'{type(self).__name__} does not support adding events incrementally.'
+    )
+
   @abstractmethod
   async def search_memory(
       self,
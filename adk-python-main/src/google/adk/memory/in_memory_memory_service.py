@@ -13,8 +13,13 @@
 # limitations under the License.
 from __future__ import annotations
 
-import re
+import collections
+import dataclasses
+import heapq
+import math
 import threading
+from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -28,74 +33,212 @@ if TYPE_CHECKING:
   from ..events.event import Event
   from ..sessions.session import Session
 
+# BM25 parameters: term frequency saturation and document length
+# normalization.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
 
 def _user_key(app_name: str, user_id: str):
   return f'{app_name}/{user_id}'
 
 
-def _extract_words_lower(text: str) -> set[str]:
-  """Extracts words from a string and converts them to lowercase."""
-  return set([word.lower() for word in re.findall(r'[A-Za-z]+', text)])
+@dataclasses.dataclass
+class _IndexedEvent:
+  event: Event
+  term_counts: collections.Counter[str]
+  length: int
+
+
+class _UserIndex:
+  """BM25 inverted index over the events of one user."""
+
+  def __init__(self):
+    self.docs: dict[int, _IndexedEvent] = {}
+    self.postings: dict[str, dict[int, int]] = {}
+    self.session_docs: dict[str, dict[str, int]] = {}
+    """Session id to event id to doc id."""
+    self.total_length = 0
+    self._next_doc_id = 0
+
+  def add_session(self, session_id: str, events: list[Event]) -> None:
+    """Indexes the events of a session, replacing its previous events.
+
+    Events that are already indexed are kept as is, so re-adding a grown
+    session only tokenizes its new events.
+    """
+    previous = self.session_docs.get(session_id, {})
+    current: dict[str, int] = {}
+    for event in events:
+      doc_id = previous.pop(event.id, None)
+      if doc_id is None:
+        doc_id = self._add_doc(event)
+      current[event.id] = doc_id
+    for doc_id in previous.values():
+      self._remove_doc(doc_id)
+    self.session_docs[session_id] = current
+
+  def add_events(self, session_id: str, events: list[Event]) -> None:
+    """Indexes the events of a session that are not indexed yet."""
+    session_docs = self.session_docs.setdefault(session_id, {})
+    for event in events:
+      if event.id not in session_docs:
+        session_docs[event.id] = self._add_doc(event)
+
+  def _add_doc(self, event: Event) -> int:
+    doc_id = self._next_doc_id
+    self._next_doc_id += 1
+    term_counts = collections.Counter(
+        _utils.tokenize(_utils.event_text(event))
+    )
+    length = sum(term_counts.values())
+    self.docs[doc_id] = _IndexedEvent(event, term_counts, length)
+    self.total_length += length
+    for term, count in term_counts.items():
+      self.postings.setdefault(term, {})[doc_id] = count
+    return doc_id
+
+  def _remove_doc(self, doc_id: int) -> None:
+    doc = self.docs.pop(doc_id)
+    self.total_length -= doc.length
+    for term in doc.term_counts:
+      posting = self.postings[term]
+      del posting[doc_id]
+      if not posting:
+        del self.postings[term]
+
+  def search(self, terms: set[str], top_k: Optional[int]) -> list[Event]:
+    """Returns the events matching any term, best BM25 score first."""
+    if not self.docs:
+      return []
+    doc_count = len(self.docs)
+    average_length = self.total_length / doc_count or 1.0
+    scores: dict[int, float] = collections.defaultdict(float)
+    for term in terms:
+      posting = self.postings.get(term)
+      if not posting:
+        continue
+      idf = math.log(
+          1.0 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5)
+      )
+      for doc_id, count in posting.items():
+        length_norm = 1.0 - _BM25_B + _BM25_B * (
+            self.docs[doc_id].length / average_length
+        )
+        scores[doc_id] += (
+            idf * count * (_BM25_K1 + 1.0) / (count + _BM25_K1 * length_norm)
+        )
+    # Ties keep the insertion order.
+    rank_key = lambda doc_id: (-scores[doc_id], doc_id)
+    if top_k is None:
+      doc_ids = sorted(scores, key=rank_key)
+    else:
+      doc_ids = heapq.nsmallest(top_k, scores, key=rank_key)
+    return [self.docs[doc_id].event for doc_id in doc_ids]
 
 
 class InMemoryMemoryService(BaseMemoryService):
   """An in-memory memory service for prototyping purpose only.
 
-  Uses keyword matching instead of semantic search.
+  Uses keyword matching, ranked with BM25 over an inverted index, instead of
+  semantic search. Adding a session again replaces its events, and only
+  tokenizes the new ones.
 
   This class is thread-safe, however, it should be used for testing and
   development only.
   """
 
-  def __init__(self):
-    self._lock = threading.Lock()
+  def __init__(self, top_k: Optional[int] = 10):
+    """Initializes the memory service.
 
-    self._session_events: dict[str, dict[str, list[Event]]] = {}
-    """Keys are "{app_name}/{user_id}". Values are dicts of session_id to
-    session event lists.
+    Args:
+      top_k: The maximum number of memories returned by a search, best match
+        first. None returns every matching memory.
     """
+    self._lock = threading.Lock()
+    self._top_k = top_k
+
+    self._indexes: dict[str, _UserIndex] = {}
+    """Keys are "{app_name}/{user_id}". Values are the users' search indexes."""
+    self._ingestion_tracker = _utils.IngestionTracker()
 
   @override
   async def add_session_to_memory(self, session: Session):
     user_key = _user_key(session.app_name, session.user_id)
+    events = [
+        event
+        for event in session.events
+        if event.content and event.content.parts
+    ]
 
     with self._lock:
-      self._session_events[user_key] = self._session_events.get(user_key, {})
-      self._session_events[user_key][session.id] = [
-          event
-          for event in session.events
-          if event.content and event.content.parts
-      ]
+      self._indexes.setdefault(user_key, _UserIndex()).add_session(
+          session.id, events
+      )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    user_key = _user_key(app_name, user_id)
+    # The high-water mark only saves visiting old events; the index skips
+    # events it already has either way.
+    with self._ingestion_tracker.claim(
+        app_name, user_id, session_id, events
+    ) as new_events:
+      with self._lock:
+        self._indexes.setdefault(user_key, _UserIndex()).add_events(
+            session_id,
+            [
+                event
+                for event in new_events
+                if event.content and event.content.parts
+            ],
+        )
 
   @override
   async def search_memory(
-      self, *, app_name: str, user_id: str, query: str
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      query: str,
+      top_k: Optional[int] = None,
   ) -> SearchMemoryResponse:
-    user_key = _user_key(app_name, user_id)
+    """Searches the user's memories for events sharing words with the query.
 
-    with self._lock:
-      session_event_lists = self._session_events.get(user_key, {})
+    Args:
+      app_name: The name of the application.
+      user_id: The id of the user.
+      query: The query to search for.
+      top_k: Overrides the service's maximum number of memories returned.
 
-    words_in_query = _extract_words_lower(query)
+    Returns:
+      A SearchMemoryResponse with the matching memories, best match first.
+    """
+    user_key = _user_key(app_name, user_id)
+    terms = set(_utils.tokenize(query))
     response = SearchMemoryResponse()
 
-    for session_events in session_event_lists.values():
-      for event in session_events:
-        if not event.content or not event.content.parts:
-          continue
-        words_in_event = _extract_words_lower(
-            ' '.join([part.text for part in event.content.parts if part.text])
-        )
-        if not words_in_event:
-          continue
-
-        if any(query_word in words_in_event for query_word in words_in_query):
-          response.memories.append(
-              MemoryEntry(
-                  content=event.content,
-                  author=event.author,
-                  timestamp=_utils.format_timestamp(event.timestamp),
-              )
+    with self._lock:
+      index = self._indexes.get(user_key)
+      if index is None or not terms:
+        return response
+      events = index.search(
+          terms, top_k if top_k is not None else self._top_k
+      )
+
+    for event in events:
+      response.memories.append(
+          MemoryEntry(
+              content=event.content,
+              author=event.author,
+              timestamp=_utils.format_timestamp(event.timestamp),
           )
-
+      )
     return response
@@ -0,0 +1,540 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A self-hosted semantic memory service backed by NumPy.
+
+Each user's memories are embedded with a pluggable embedding function and
+stored as unit-normalized rows of one contiguous float32 matrix, so a search
+is a single matrix-vector product followed by a partial sort. With
+`persist_dir` set, the matrix is a memory-mapped `.npy` file next to a JSON
+lines file holding the memory entries.
+
+For large corpora, an optional IVF (inverted file) index partitions the rows
+around k-means centroids and only scores the partitions closest to the query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import threading
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+import urllib.parse
+
+import numpy as np
+from typing_extensions import override
+
+from ..utils.feature_decorator import experimental
+from . import _utils
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+EmbeddingFunction = Callable[
+    [list[str]],
+    Union[Sequence[Sequence[float]], Awaitable[Sequence[Sequence[float]]]],
+]
+"""Embeds a batch of texts, synchronously or asynchronously."""
+
+_VECTORS_FILE = 'vectors.npy'
+_ENTRIES_FILE = 'entries.jsonl'
+_INITIAL_CAPACITY = 1024
+# K-means needs enough rows per centroid to produce useful partitions.
+_IVF_MIN_ROWS_PER_PARTITION = 39
+_IVF_TRAINING_ITERATIONS = 10
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+  norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+  norms[norms == 0] = 1.0
+  return vectors / norms
+
+
+def cosine_top_k(
+    matrix: np.ndarray, queries: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+  """Returns the top-k rows of `matrix` for each query by dot product.
+
+  Rows and queries are expected to be unit-normalized, so the dot product is
+  the cosine similarity.
+
+  Args:
+    matrix: A (rows, dim) matrix.
+    queries: A (queries, dim) matrix.
+    k: The number of rows returned per query.
+
+  Returns:
+    The (queries, k) row indices, best first, and their similarities.
+  """
+  k = min(k, matrix.shape[0])
+  if k <= 0:
+    empty = np.empty((queries.shape[0], 0))
+    return empty.astype(np.int64), empty.astype(np.float32)
+  scores = queries @ matrix.T
+  if k < matrix.shape[0]:
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+  else:
+    candidates = np.broadcast_to(
+        np.arange(matrix.shape[0]), (queries.shape[0], matrix.shape[0])
+    )
+  candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+  order = np.argsort(-candidate_scores, axis=1, kind='stable')
+  return (
+      np.take_along_axis(candidates, order, axis=1),
+      np.take_along_axis(candidate_scores, order, axis=1),
+  )
+
+
+class _IvfIndex:
+  """Partitions rows by their nearest k-means centroid."""
+
+  def __init__(self, centroids: np.ndarray, assignments: np.ndarray):
+    self.centroids = centroids
+    self._partitions: list[list[int]] = [[] for _ in range(len(centroids))]
+    for row, partition in enumerate(assignments.tolist()):
+      self._partitions[partition].append(row)
+    self._arrays: dict[int, np.ndarray] = {}
+    self.trained_rows = len(assignments)
+
+  @classmethod
+  def train(cls, vectors: np.ndarray, num_partitions: int) -> _IvfIndex:
+    """Runs spherical k-means over a sample of the rows."""
+    rng = np.random.default_rng(0)
+    sample_size = min(len(vectors), num_partitions * 256)
+    sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+    centroids = sample[
+        rng.choice(sample_size, num_partitions, replace=False)
+    ].copy()
+    for _ in range(_IVF_TRAINING_ITERATIONS):
+      assignments = np.argmax(sample @ centroids.T, axis=1)
+      for partition in range(num_partitions):
+        members = sample[assignments == partition]
+        if len(members):
+          centroids[partition] = members.sum(axis=0)
+      centroids = _normalize(centroids)
+    return cls(centroids, cls._assign(centroids, vectors))
+
+  @staticmethod
+  def _assign(centroids: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    # Assigns in blocks to bound the size of the score matrix.
+    for start in range(0, len(vectors), 65536):
+      block = vectors[start : start + 65536]
+      assignments[start : start + len(block)] = np.argmax(
+          block @ centroids.T, axis=1
+      )
+    return assignments
+
+  def add(self, first_row: int, vectors: np.ndarray) -> None:
+    for offset, partition in enumerate(
+        self._assign(self.centroids, vectors).tolist()
+    ):
+      self._partitions[partition].append(first_row + offset)
+      self._arrays.pop(partition, None)
+
+  def candidate_rows(self, query: np.ndarray, num_probes: int) -> np.ndarray:
+    """Returns the rows of the partitions closest to the query."""
+    num_probes = min(num_probes, len(self.centroids))
+    probes = np.argpartition(-(self.centroids @ query), num_probes - 1)[
+        :num_probes
+    ]
+    arrays = []
+    for partition in probes.tolist():
+      array = self._arrays.get(partition)
+      if array is None:
+        array = np.asarray(self._partitions[partition], dtype=np.int64)
+        self._arrays[partition] = array
+      arrays.append(array)
+    return np.concatenate(arrays)
+
+
+class _VectorStore:
+  """The embeddings and entries of one user.
+
+  Rows are appended to a matrix that grows by doubling. When persisted, the
+  vectors are written before the entries, so after a crash any row without
+  an entry is ignored and overwritten.
+  """
+
+  def __init__(self, directory: Optional[str]):
+    self._directory = directory
+    self._vectors: Optional[np.ndarray] = None
+    self.entries: list[str] = []
+    """Serialized entries, one per row."""
+    self.event_ids: set[tuple[str, str]] = set()
+    """(session id, event id) of the stored events."""
+    self.ivf: Optional[_IvfIndex] = None
+    self.ivf_training = False
+    """Whether a new IVF index is being trained for the store."""
+    if directory and os.path.exists(os.path.join(directory, _ENTRIES_FILE)):
+      self._load()
+
+  def _load(self) -> None:
+    self._vectors = np.load(
+        os.path.join(self._directory, _VECTORS_FILE), mmap_mode='r+'
+    )
+    with open(os.path.join(self._directory, _ENTRIES_FILE), 'rb+') as f:
+      valid_length = 0
+      for raw_line in f:
+        if not raw_line.endswith(b'\n'):
+          # Drops a partially written last line.
+          f.truncate(valid_length)
+          break
+        valid_length += len(raw_line)
+        line = raw_line.decode('utf-8')
+        record = json.loads(line)
+        self.entries.append(line)
+        self.event_ids.add((record['session_id'], record['event_id']))
+
+  @property
+  def count(self) -> int:
+    return len(self.entries)
+
+  @property
+  def vectors(self) -> np.ndarray:
+    """The stored rows."""
+    if self._vectors is None:
+      return np.empty((0, 0), dtype=np.float32)
+    return self._vectors[: self.count]
+
+  def _ensure_capacity(self, rows: int, dim: int) -> None:
+    if self._vectors is not None:
+      if self._vectors.shape[1] != dim:
+        raise ValueError(
+            f'Embedding dimension {dim} does not match the stored dimension'
+            f' {self._vectors.shape[1]}.'
+        )
+      if rows <= len(self._vectors):
+        return
+    capacity = max(_INITIAL_CAPACITY, rows)
+    if self._vectors is not None:
+      capacity = max(capacity, 2 * len(self._vectors))
+    if self._directory:
+      os.makedirs(self._directory, exist_ok=True)
+      path = os.path.join(self._directory, _VECTORS_FILE)
+      grown = np.lib.format.open_memmap(
+          path + '.tmp', mode='w+', dtype=np.float32, shape=(capacity, dim)
+      )
+      if self._vectors is not None:
+        grown[: self.count] = self.vectors
+      grown.flush()
+      del grown
+      os.replace(path + '.tmp', path)
+      self._vectors = np.load(path, mmap_mode='r+')
+    else:
+      grown = np.empty((capacity, dim), dtype=np.float32)
+      if self._vectors is not None:
+        grown[: self.count] = self.vectors
+      self._vectors = grown
+
+  def append(self, vectors: np.ndarray, entries: list[str]) -> None:
+    first_row = self.count
+    self._ensure_capacity(first_row + len(vectors), vectors.shape[1])
+    self._vectors[first_row : first_row + len(vectors)] = vectors
+    if self._directory:
+      self._vectors.flush()
+      with open(
+          os.path.join(self._directory, _ENTRIES_FILE), 'a', encoding='utf-8'
+      ) as f:
+        f.writelines(entries)
+    self.entries.extend(entries)
+    if self.ivf is not None:
+      self.ivf.add(first_row, vectors)
+
+
+@experimental
+class LocalVectorMemoryService(BaseMemoryService):
+  """A semantic memory service that runs in process on NumPy.
+
+  Events are embedded in batches when a session is added. Re-adding a session
+  only processes the events added since, and events that are already stored
+  are never embedded again.
+
+  Searches rank memories by cosine similarity to the embedded query. With
+  `ivf_partitions` set and enough memories stored, only the rows of the
+  `ivf_probes` partitions closest to the query are scored, trading a little
+  recall for sublinear search time. The index is retrained in a worker
+  thread whenever the number of memories doubles, and searches use the
+  previous index until the new one is ready.
+
+  Sample:
+  ```python
+  client = genai.Client()
+
+  async def embed(texts: list[str]) -> list[list[float]]:
+    response = await client.aio.models.embed_content(
+        model='gemini-embedding-001', contents=texts
+    )
+    return [embedding.values for embedding in response.embeddings]
+
+  memory_service = LocalVectorMemoryService(embed, persist_dir='memory')
+  ```
+  """
+
+  def __init__(
+      self,
+      embedding_function: EmbeddingFunction,
+      *,
+      persist_dir: Optional[str] = None,
+      top_k: int = 10,
+      min_similarity: Optional[float] = None,
+      embedding_batch_size: int = 100,
+      ivf_partitions: Optional[int] = None,
+      ivf_probes: int = 8,
+  ):
+    """Initializes the memory service.
+
+    Args:
+      embedding_function: Embeds a list of texts, returning one vector per
+        text. May be sync or async.
+      persist_dir: If set, memories are stored in this directory and loaded
+        from it. Otherwise they are kept in memory.
+      top_k: The maximum number of memories returned by a search.
+      min_similarity: If set, memories less similar to the query are not
+        returned.
+      embedding_batch_size: The maximum number of texts per embedding call.
+      ivf_partitions: If set, the number of partitions of the IVF index used
+        once at least 39 memories per partition are stored.
+      ivf_probes: The number of partitions scored per search.
+    """
+    if embedding_batch_size < 1:
+      raise ValueError('embedding_batch_size must be at least 1.')
+    self._embedding_function = embedding_function
+    self._persist_dir = persist_dir
+    self._top_k = top_k
+    self._min_similarity = min_similarity
+    self._embedding_batch_size = embedding_batch_size
+    self._ivf_partitions = ivf_partitions
+    self._ivf_probes = ivf_probes
+    self._lock = threading.Lock()
+    self._stores: dict[tuple[str, str], _VectorStore] = {}
+    self._ingestion_tracker = _utils.IngestionTracker()
+
+  def _store(self, app_name: str, user_id: str) -> _VectorStore:
+    key = (app_name, user_id)
+    store = self._stores.get(key)
+    if store is None:
+      directory = None
+      if self._persist_dir:
+        directory = os.path.join(
+            self._persist_dir,
+            urllib.parse.quote(app_name, safe=''),
+            urllib.parse.quote(user_id, safe=''),
+        )
+      store = _VectorStore(directory)
+      self._stores[key] = store
+    return store
+
+  # The lock is held for file I/O, memmap growth and scoring, so it is only
+  # acquired in worker threads, never on the event loop.
+
+  async def _open_store(self, app_name: str, user_id: str) -> _VectorStore:
+    def _open() -> _VectorStore:
+      with self._lock:
+        return self._store(app_name, user_id)
+
+    store = await asyncio.to_thread(_open)
+    # Stores loaded from disk may already be large enough for an index.
+    await self._maybe_train_ivf(store)
+    return store
+
+  async def _embed(self, texts: list[str]) -> np.ndarray:
+    batches = []
+    for start in range(0, len(texts), self._embedding_batch_size):
+      embeddings = self._embedding_function(
+          texts[start : start + self._embedding_batch_size]
+      )
+      if inspect.isawaitable(embeddings):
+        embeddings = await embeddings
+      batches.append(np.asarray(embeddings, dtype=np.float32))
+    return _normalize(np.concatenate(batches))
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    await self.add_events_to_memory(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+        events=session.events,
+    )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    with self._ingestion_tracker.claim(
+        app_name, user_id, session_id, events
+    ) as new_events:
+      await self._add_new_events(app_name, user_id, session_id, new_events)
+
+  async def _add_new_events(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      new_events: list[Event],
+  ) -> None:
+    store = await self._open_store(app_name, user_id)
+
+    def _unstored_events() -> list[Event]:
+      with self._lock:
+        return [
+            event
+            for event in new_events
+            if (session_id, event.id) not in store.event_ids
+        ]
+
+    new_events = await asyncio.to_thread(_unstored_events)
+
+    texts = []
+    entries = []
+    event_ids = []
+    for event in new_events:
+      text = _utils.event_text(event)
+      if not text:
+        continue
+      texts.append(text)
+      event_ids.append((session_id, event.id))
+      entries.append(
+          json.dumps({
+              'session_id': session_id,
+              'event_id': event.id,
+              'entry': MemoryEntry(
+                  id=event.id,
+                  content=event.content,
+                  author=event.author,
+                  timestamp=_utils.format_timestamp(event.timestamp),
+              ).model_dump(mode='json', exclude_none=True),
+          })
+          + '\n'
+      )
+    if not texts:
+      return
+
+    vectors = await self._embed(texts)
+    if len(vectors) != len(texts):
+      raise ValueError(
+          f'The embedding function returned {len(vectors)} embeddings for'
+          f' {len(texts)} texts.'
+      )
+
+    def _append() -> None:
+      with self._lock:
+        # Skips events stored by a concurrent call while embedding.
+        new_rows = [
+            i
+            for i, event_id in enumerate(event_ids)
+            if event_id not in store.event_ids
+        ]
+        if new_rows:
+          store.append(vectors[new_rows], [entries[i] for i in new_rows])
+          store.event_ids.update(event_ids[i] for i in new_rows)
+
+    await asyncio.to_thread(_append)
+    await self._maybe_train_ivf(store)
+
+  async def _maybe_train_ivf(self, store: _VectorStore) -> None:
+    """Trains a new IVF index for the store in a worker thread, if due.
+
+    Training runs without the lock on a snapshot of the rows, which are never
+    modified once written, so searches keep using the previous index until
+    the new one is swapped in. Rows appended meanwhile are assigned to the
+    new index when it is.
+    """
+    if not self._ivf_partitions:
+      return
+
+    def _train() -> None:
+      with self._lock:
+        if store.ivf_training:
+          return
+        if store.count < self._ivf_partitions * _IVF_MIN_ROWS_PER_PARTITION:
+          return
+        if store.ivf is not None and store.count < 2 * store.ivf.trained_rows:
+          return
+        store.ivf_training = True
+        vectors = store.vectors
+      try:
+        logger.debug(
+            'Training IVF index with %d partitions on %d memories.',
+            self._ivf_partitions,
+            len(vectors),
+        )
+        ivf = _IvfIndex.train(np.asarray(vectors), self._ivf_partitions)
+        with self._lock:
+          if store.count > ivf.trained_rows:
+            ivf.add(ivf.trained_rows, store.vectors[ivf.trained_rows :])
+          store.ivf = ivf
+      finally:
+        with self._lock:
+          store.ivf_training = False
+
+    await asyncio.to_thread(_train)
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    response = SearchMemoryResponse()
+    store = await self._open_store(app_name, user_id)
+    if not store.count:
+      return response
+    query_vector = (await self._embed([query]))[0]
+
+    def _score() -> list[tuple[str, float]]:
+      with self._lock:
+        if store.ivf is not None:
+          rows = store.ivf.candidate_rows(query_vector, self._ivf_probes)
+          indices, scores = cosine_top_k(
+              store.vectors[rows], query_vector[None, :], self._top_k
+          )
+          indices = rows[indices[0]]
+        else:
+          indices, scores = cosine_top_k(
+              store.vectors, query_vector[None, :], self._top_k
+          )
+          indices = indices[0]
+        return [
+            (store.entries[row], float(score))
+            for row, score in zip(indices.tolist(), scores[0].tolist())
+        ]
+
+    results = await asyncio.to_thread(_score)
+
+    for line, score in results:
+      if self._min_similarity is not None and score < self._min_similarity:
+        break
+      response.memories.append(
+          MemoryEntry.model_validate(json.loads(line)['entry'])
+      )
+    return response
@@ -0,0 +1,189 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caches of memory search results."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import dataclasses
+import time
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from ..utils.feature_decorator import experimental
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+_CacheKey = tuple[str, str, str]
+
+
+def _copy_response(response: SearchMemoryResponse) -> SearchMemoryResponse:
+  """Returns a response that can be modified without affecting the cache."""
+  return response.model_copy(deep=True)
+
+
+class MemorySearchCache:
+  """Caches memory searches for the duration of one invocation.
+
+  Searches are keyed by app name, user id and query. Concurrent searches for
+  the same key share a single call to the memory service, and failed searches
+  are not cached.
+  """
+
+  def __init__(self):
+    self._searches: dict[_CacheKey, asyncio.Future[SearchMemoryResponse]] = {}
+    self.hits = 0
+    """The number of searches answered from the cache."""
+    self.misses = 0
+    """The number of searches sent to the memory service."""
+
+  async def search_memory(
+      self,
+      memory_service: BaseMemoryService,
+      *,
+      app_name: str,
+      user_id: str,
+      query: str,
+  ) -> SearchMemoryResponse:
+    """Returns the cached search result, searching the memory service once."""
+    key = (app_name, user_id, query)
+    search = self._searches.get(key)
+    if search is None:
+      self.misses += 1
+      search = asyncio.ensure_future(
+          memory_service.search_memory(
+              app_name=app_name, user_id=user_id, query=query
+          )
+      )
+      self._searches[key] = search
+    else:
+      self.hits += 1
+    try:
+      response = await asyncio.shield(search)
+    except Exception:
+      if self._searches.get(key) is search:
+        del self._searches[key]
+      raise
+    return _copy_response(response)
+
+  def invalidate(self, app_name: str, user_id: str) -> None:
+    """Drops the cached searches of the user."""
+    for key in [k for k in self._searches if k[:2] == (app_name, user_id)]:
+      del self._searches[key]
+
+
+@dataclasses.dataclass
+class _TtlEntry:
+  expires_at: float
+  response: SearchMemoryResponse
+
+
+@experimental
+class CachingMemoryService(BaseMemoryService):
+  """A memory service that caches the search results of another one.
+
+  Results are kept for `ttl_seconds` across invocations, which saves repeated
+  remote calls for common queries. Adding memories for a user drops that
+  user's cached results.
+  """
+
+  def __init__(
+      self,
+      memory_service: BaseMemoryService,
+      *,
+      ttl_seconds: float = 60.0,
+      max_entries: int = 1024,
+  ):
+    """Initializes the caching memory service.
+
+    Args:
+      memory_service: The memory service to cache the searches of.
+      ttl_seconds: How long a search result is reused.
+      max_entries: The maximum number of cached results. The least recently
+        used results are dropped first.
+    """
+    self._memory_service = memory_service
+    self._ttl_seconds = ttl_seconds
+    self._max_entries = max_entries
+    self._entries: OrderedDict[_CacheKey, _TtlEntry] = OrderedDict()
+    # Bumped on every add, so that searches which started before the add
+    # completed do not cache results that miss the added memories.
+    self._generations: dict[tuple[str, str], int] = {}
+    self.hits = 0
+    """The number of searches answered from the cache."""
+    self.misses = 0
+    """The number of searches sent to the wrapped memory service."""
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    await self._memory_service.add_session_to_memory(session)
+    self._invalidate(session.app_name, session.user_id)
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    await self._memory_service.add_events_to_memory(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        events=events,
+    )
+    self._invalidate(app_name, user_id)
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    key = (app_name, user_id, query)
+    entry = self._entries.get(key)
+    if entry is not None:
+      if entry.expires_at > time.monotonic():
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return _copy_response(entry.response)
+      del self._entries[key]
+
+    self.misses += 1
+    generation = self._generations.get((app_name, user_id), 0)
+    response = await self._memory_service.search_memory(
+        app_name=app_name, user_id=user_id, query=query
+    )
+    if generation == self._generations.get((app_name, user_id), 0):
+      self._entries[key] = _TtlEntry(
+          expires_at=time.monotonic() + self._ttl_seconds, response=response
+      )
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+    return _copy_response(response)
+
+  def _invalidate(self, app_name: str, user_id: str) -> None:
+    scope = (app_name, user_id)
+    self._generations[scope] = self._generations.get(scope, 0) + 1
+    for key in [k for k in self._entries if k[:2] == scope]:
+      del self._entries[key]
@@ -0,0 +1,258 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+import hashlib
+import logging
+import re
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+import aiosqlite
+from google.genai import types
+from typing_extensions import override
+
+from ..sessions.sqlite_session_service import _parse_db_path
+from . import _utils
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+logger = logging.getLogger("google_adk." + __name__)
+
+MEMORY_ENTRIES_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_entries (
+    rowid INTEGER PRIMARY KEY,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    author TEXT,
+    timestamp REAL NOT NULL,
+    content TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    text TEXT NOT NULL,
+    UNIQUE (app_name, user_id, session_id, event_id)
+);
+"""
+
+# The external content FTS5 index over memory_entries. The `scope` column
+# holds one token per app and user, so a search only visits that user's
+# postings.
+MEMORY_FTS_TABLE_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+    scope,
+    text,
+    content='memory_entries',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+MEMORY_FTS_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS memory_entries_ai AFTER INSERT ON memory_entries
+BEGIN
+  INSERT INTO memory_fts(rowid, scope, text)
+  VALUES (new.rowid, new.scope, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS memory_entries_ad AFTER DELETE ON memory_entries
+BEGIN
+  INSERT INTO memory_fts(memory_fts, rowid, scope, text)
+  VALUES ('delete', old.rowid, old.scope, old.text);
+END;
+"""
+
+CREATE_MEMORY_SCHEMA_SQL = "\n".join([
+    MEMORY_ENTRIES_TABLE_SCHEMA,
+    MEMORY_FTS_TABLE_SCHEMA,
+    MEMORY_FTS_TRIGGERS,
+])
+
+# Ranks text matches only; the scope column always matches.
+_SEARCH_SQL = """
+SELECT e.author, e.timestamp, e.content, e.event_id,
+       snippet(memory_fts, 1, '', '', '...', ?) AS snippet,
+       bm25(memory_fts, 0.0, 1.0) AS rank
+FROM memory_fts JOIN memory_entries AS e ON e.rowid = memory_fts.rowid
+WHERE memory_fts MATCH ? AND e.app_name = ? AND e.user_id = ?
+ORDER BY rank
+LIMIT ?
+"""
+
+
+# Words as split by the unicode61 tokenizer. Quotes never match, so terms can
+# be quoted as is.
+_QUERY_TERM_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _scope_token(app_name: str, user_id: str) -> str:
+  digest = hashlib.sha256(f"{app_name}/{user_id}".encode("utf-8"))
+  return "s" + digest.hexdigest()[:32]
+
+
+def _query_terms(query: str) -> list[str]:
+  """Splits a query into words; FTS5 folds their case and diacritics."""
+  return sorted(set(_QUERY_TERM_PATTERN.findall(query)))
+
+
+def _match_expression(scope: str, terms: list[str]) -> str:
+  """Builds an FTS5 query matching any of the terms within the scope."""
+  quoted_terms = " OR ".join(f'"{term}"' for term in terms)
+  return f'scope:"{scope}" AND ({quoted_terms})'
+
+
+class SqliteMemoryService(BaseMemoryService):
+  """A memory service that uses an SQLite FTS5 index for storage and search.
+
+  Memories are ranked by BM25 keyword relevance. The tables can live in the
+  same database file as `SqliteSessionService`, and connections are opened
+  the same way, one per operation. Adding a session again only writes the
+  events added since; after a restart, already stored events are skipped by
+  the database.
+
+  Words are split by the FTS5 unicode61 tokenizer, which folds case and
+  diacritics. Scripts written without spaces, such as Chinese or Japanese,
+  are matched by whole runs of characters.
+  """
+
+  def __init__(self, db_path: str, top_k: int = 10, snippet_tokens: int = 32):
+    """Initializes the SQLite memory service.
+
+    Args:
+      db_path: The path or `sqlite:///` URL of the database file.
+      top_k: The maximum number of memories returned by a search.
+      snippet_tokens: The maximum number of tokens of the snippet returned in
+        each memory's `custom_metadata["snippet"]`.
+    """
+    self._db_path, self._db_connect_path, self._db_connect_uri = _parse_db_path(
+        db_path
+    )
+    self._top_k = top_k
+    self._snippet_tokens = snippet_tokens
+    self._ingestion_tracker = _utils.IngestionTracker()
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    await self.add_events_to_memory(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+        events=session.events,
+    )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    """Adds the events, skipping events that are already stored.
+
+    All events are written in one transaction.
+    """
+    with self._ingestion_tracker.claim(
+        app_name, user_id, session_id, events
+    ) as new_events:
+      scope = _scope_token(app_name, user_id)
+      rows = []
+      for event in new_events:
+        text = _utils.event_text(event)
+        if not text:
+          continue
+        rows.append((
+            app_name,
+            user_id,
+            session_id,
+            event.id,
+            event.author,
+            event.timestamp,
+            event.content.model_dump_json(exclude_none=True),
+            scope,
+            text,
+        ))
+      if not rows:
+        return
+
+      async with self._get_db_connection() as db:
+        await db.executemany(
+            """
+            INSERT INTO memory_entries (
+                app_name, user_id, session_id, event_id, author, timestamp,
+                content, scope, text
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (app_name, user_id, session_id, event_id) DO NOTHING
+            """,
+            rows,
+        )
+        await db.commit()
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    """Returns the user's memories matching any query word, best first.
+
+    Each memory's `custom_metadata` holds the matching `snippet` and its BM25
+    `score`, higher is better.
+    """
+    response = SearchMemoryResponse()
+    terms = _query_terms(query)
+    if not terms:
+      return response
+
+    async with self._get_db_connection() as db:
+      async with db.execute(
+          _SEARCH_SQL,
+          (
+              self._snippet_tokens,
+              _match_expression(_scope_token(app_name, user_id), terms),
+              app_name,
+              user_id,
+              self._top_k,
+          ),
+      ) as cursor:
+        rows = await cursor.fetchall()
+
+    for row in rows:
+      response.memories.append(
+          MemoryEntry(
+              id=row["event_id"],
+              content=types.Content.model_validate_json(row["content"]),
+              author=row["author"],
+              timestamp=_utils.format_timestamp(row["timestamp"]),
+              custom_metadata={
+                  "snippet": row["snippet"],
+                  "score": -row["rank"],
+              },
+          )
+      )
+    return response
+
+  @asynccontextmanager
+  async def _get_db_connection(self):
+    """Connects to the db and performs initial setup."""
+    async with aiosqlite.connect(
+        self._db_connect_path, uri=self._db_connect_uri
+    ) as db:
+      db.row_factory = aiosqlite.Row
+      await db.executescript(CREATE_MEMORY_SCHEMA_SQL)
+      yield db
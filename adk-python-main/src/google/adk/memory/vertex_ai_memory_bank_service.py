@@ -16,17 +16,20 @@ from __future__ import annotations
 
 import logging
 from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from google.genai import types
 from typing_extensions import override
 
 from ..utils.vertex_ai_utils import get_express_mode_api_key
+from . import _utils
 from .base_memory_service import BaseMemoryService
 from .base_memory_service import SearchMemoryResponse
 from .memory_entry import MemoryEntry
 
 if TYPE_CHECKING:
+  from ..events.event import Event
   from ..sessions.session import Session
 
 logger = logging.getLogger('google_adk.' + __name__)
@@ -62,6 +65,7 @@ class VertexAiMemoryBankService(BaseMemoryService):
     self._project = project
     self._location = location
     self._agent_engine_id = agent_engine_id
+    self._ingestion_tracker = _utils.IngestionTracker()
     self._express_mode_api_key = get_express_mode_api_key(
         project, location, express_mode_api_key
     )
@@ -76,32 +80,59 @@ class VertexAiMemoryBankService(BaseMemoryService):
 
   @override
   async def add_session_to_memory(self, session: Session):
+    await self.add_events_to_memory(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+        events=session.events,
+    )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    """Generates memories from the events not yet sent for the session.
+
+    Events sent by an earlier call on this instance are skipped, so that
+    adding a growing session repeatedly does not regenerate memories from the
+    whole conversation.
+    """
     if not self._agent_engine_id:
       raise ValueError('Agent Engine ID is required for Memory Bank.')
 
-    events = []
-    for event in session.events:
-      if _should_filter_out_event(event.content):
-        continue
-      if event.content:
-        events.append({
-            'content': event.content.model_dump(exclude_none=True, mode='json')
-        })
-    if events:
-      client = self._get_api_client()
-      operation = client.agent_engines.memories.generate(
-          name='reasoningEngines/' + self._agent_engine_id,
-          direct_contents_source={'events': events},
-          scope={
-              'app_name': session.app_name,
-              'user_id': session.user_id,
-          },
-          config={'wait_for_completion': False},
-      )
-      logger.info('Generate memory response received.')
-      logger.debug('Generate memory response: %s', operation)
-    else:
-      logger.info('No events to add to memory.')
+    with self._ingestion_tracker.claim(
+        app_name, user_id, session_id, events
+    ) as new_events:
+      contents = []
+      for event in new_events:
+        if _should_filter_out_event(event.content):
+          continue
+        if event.content:
+          contents.append({
+              'content': event.content.model_dump(
+                  exclude_none=True, mode='json'
+              )
+          })
+      if contents:
+        client = self._get_api_client()
+        operation = client.agent_engines.memories.generate(
+            name='reasoningEngines/' + self._agent_engine_id,
+            direct_contents_source={'events': contents},
+            scope={
+                'app_name': app_name,
+                'user_id': user_id,
+            },
+            config={'wait_for_completion': False},
+        )
+        logger.info('Generate memory response received.')
+        logger.debug('Generate memory response: %s', operation)
+      else:
+        logger.info('No events to add to memory.')
 
   @override
   async def search_memory(self, *, app_name: str, user_id: str, query: str):
@@ -20,6 +20,7 @@ import json
 import os
 import tempfile
 from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from google.genai import types
@@ -61,15 +62,39 @@ class VertexAiRagMemoryService(BaseMemoryService):
         similarity_top_k=similarity_top_k,
         vector_distance_threshold=vector_distance_threshold,
     )
+    self._ingestion_tracker = _utils.IngestionTracker()
 
   @override
   async def add_session_to_memory(self, session: Session):
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete=False, suffix=".txt"
-    ) as temp_file:
+    await self.add_events_to_memory(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+        events=session.events,
+    )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ) -> None:
+    """Uploads the events not yet uploaded for the session as one file.
+
+    Files of the same session share a display name, and their events are
+    merged back together on search.
+    """
+    if not self._vertex_rag_store.rag_resources:
+      raise ValueError("Rag resources must be set.")
 
+    with self._ingestion_tracker.claim(
+        app_name, user_id, session_id, events
+    ) as new_events:
       output_lines = []
-      for event in session.events:
+      for event in new_events:
         if not event.content or not event.content.parts:
           continue
         text_parts = [
@@ -85,25 +110,29 @@ class VertexAiRagMemoryService(BaseMemoryService):
                   "text": ".".join(text_parts),
               })
           )
-      output_string = "\n".join(output_lines)
-      temp_file.write(output_string)
-      temp_file_path = temp_file.name
-
-    if not self._vertex_rag_store.rag_resources:
-      raise ValueError("Rag resources must be set.")
-
-    from ..dependencies.vertexai import rag
-
-    for rag_resource in self._vertex_rag_store.rag_resources:
-      rag.upload_file(
-          corpus_name=rag_resource.rag_corpus,
-          path=temp_file_path,
-          # this is the temp workaround as upload file does not support
-          # adding metadata, thus use display_name to store the session info.
-          display_name=f"{session.app_name}.{session.user_id}.{session.id}",
-      )
-
-    os.remove(temp_file_path)
+      if not output_lines:
+        return
+
+      with tempfile.NamedTemporaryFile(
+          mode="w", delete=False, suffix=".txt"
+      ) as temp_file:
+        temp_file.write("\n".join(output_lines))
+        temp_file_path = temp_file.name
+
+      from ..dependencies.vertexai import rag
+
+      try:
+        for rag_resource in self._vertex_rag_store.rag_resources:
+          rag.upload_file(
+              corpus_name=rag_resource.rag_corpus,
+              path=temp_file_path,
+              # this is the temp workaround as upload file does not support
+              # adding metadata, thus use display_name to store the session
+              # info.
+              display_name=f"{app_name}.{user_id}.{session_id}",
+          )
+      finally:
+        os.remove(temp_file_path)
 
   @override
   async def search_memory(
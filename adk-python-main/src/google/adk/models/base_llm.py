@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from typing import AsyncGenerator
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import types
@@ -23,6 +24,9 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 
 from .base_llm_connection import BaseLlmConnection
+from .rate_limiter import get_rate_limiter
+from .rate_limiter import ModelRateLimiter
+from .rate_limiter import RateLimitConfig
 
 if TYPE_CHECKING:
   from .llm_request import LlmRequest
@@ -41,6 +45,34 @@ class BaseLlm(BaseModel):
   model: str
   """The name of the LLM, e.g. gemini-2.5-flash or gemini-2.5-pro."""
 
+  rate_limit_config: Optional[RateLimitConfig] = None
+  """Client-side rate limiting applied by the flow around each model call.
+
+  Model instances with the same `RateLimitConfig.key` (or, if unset, the same
+  model name) share one limiter across all invocations in the process. None
+  disables rate limiting.
+
+  Sample:
+  ```python
+  agent = Agent(
+    model=Gemini(
+      rate_limit_config=RateLimitConfig(
+          requests_per_minute=60, tokens_per_minute=250_000
+      ),
+    )
+  )
+  ```
+  """
+
+  @property
+  def rate_limiter(self) -> Optional[ModelRateLimiter]:
+    """The shared rate limiter for this model, or None if not configured."""
+    if self.rate_limit_config is None:
+      return None
+    return get_rate_limiter(
+        self.rate_limit_config.key or self.model, self.rate_limit_config
+    )
+
   @classmethod
   def supported_models(cls) -> list[str]:
     """Returns a list of supported models in regex for LlmRegistry."""
@@ -149,6 +181,35 @@ class BaseLlm(BaseModel):
     )
     yield  # AsyncGenerator requires a yield statement in function body.
 
+  @property
+  def supports_batch(self) -> bool:
+    """Whether this model implements `generate_content_batch`."""
+    return (
+        type(self).generate_content_batch
+        is not BaseLlm.generate_content_batch
+    )
+
+  async def generate_content_batch(
+      self, llm_requests: list[LlmRequest]
+  ) -> list[LlmResponse]:
+    """Generates content for several independent model turns in one call.
+
+    Optional. Models that can submit requests in bulk (e.g. through a batch
+    prediction API) override this, and the flow then coalesces concurrent
+    non-streaming calls into batches when `RunConfig.batch_config` is set.
+
+    Args:
+      llm_requests: The requests, each for a separate model turn.
+
+    Returns:
+      One complete (non-partial) LlmResponse per request, in request order. A
+      failed request may be reported as a response with `error_code` set;
+      raising fails every request of the batch.
+    """
+    raise NotImplementedError(
+        f'Batch generation is not supported for {self.model}.'
+    )
+
   def _maybe_append_user_content(self, llm_request: LlmRequest):
     """Appends a user content, so that model can continue to output.
 
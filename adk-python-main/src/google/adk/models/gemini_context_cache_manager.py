@@ -17,7 +17,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import time
 from typing import Optional
@@ -26,6 +25,7 @@ from typing import TYPE_CHECKING
 from google.genai import types
 
 from ..utils.feature_decorator import experimental
+from ..utils.token_estimation import estimate_request_tokens
 from .cache_metadata import CacheMetadata
 from .llm_request import LlmRequest
 from .llm_response import LlmResponse
@@ -285,21 +285,20 @@ class GeminiContextCacheManager:
     Returns:
         Cache metadata if successful, None otherwise
     """
-    # Check if we have token count from previous response for cache size validation
-    if llm_request.cacheable_contents_token_count is None:
-      logger.info(
-          "No previous token count available, skipping cache creation for"
-          " initial request"
+    # Prefer the token count reported for the previous response for cache
+    # size validation, and fall back to a local estimate of the cached prefix.
+    token_count = llm_request.cacheable_contents_token_count
+    if token_count is None:
+      token_count = estimate_request_tokens(llm_request, cache_contents_count)
+      logger.debug(
+          "No previous token count available, estimated %d tokens",
+          token_count,
       )
-      return None
 
-    if (
-        llm_request.cacheable_contents_token_count
-        < llm_request.cache_config.min_tokens
-    ):
+    if token_count < llm_request.cache_config.min_tokens:
       logger.info(
-          "Previous request too small for caching (%d < %d tokens)",
-          llm_request.cacheable_contents_token_count,
+          "Request too small for caching (%d < %d tokens)",
+          token_count,
           llm_request.cache_config.min_tokens,
       )
       return None
@@ -314,7 +313,7 @@ class GeminiContextCacheManager:
   def _estimate_request_tokens(self, llm_request: LlmRequest) -> int:
     """Estimate token count for the request.
 
-    This is a rough estimation based on content text length.
+    Uses the shared offline estimator, so no model call is made.
 
     Args:
         llm_request: Request to estimate tokens for
@@ -322,27 +321,7 @@ class GeminiContextCacheManager:
     Returns:
         Estimated token count
     """
-    total_chars = 0
-
-    # System instruction
-    if llm_request.config and llm_request.config.system_instruction:
-      total_chars += len(llm_request.config.system_instruction)
-
-    # Tools
-    if llm_request.config and llm_request.config.tools:
-      for tool in llm_request.config.tools:
-        if isinstance(tool, types.Tool):
-          tool_str = json.dumps(tool.model_dump())
-          total_chars += len(tool_str)
-
-    # Contents
-    for content in llm_request.contents:
-      for part in content.parts:
-        if part.text:
-          total_chars += len(part.text)
-
-    # Rough estimate: 4 characters per token
-    return total_chars // 4
+    return estimate_request_tokens(llm_request)
 
   async def _create_gemini_cache(
       self, llm_request: LlmRequest, cache_contents_count: int
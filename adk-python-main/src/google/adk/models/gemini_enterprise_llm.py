@@ -14,13 +14,21 @@
 
 from __future__ import annotations
 
-from functools import cached_property
+import asyncio
+import collections
+import inspect
+import json
 import logging
-from typing import AsyncGenerator, Optional, TYPE_CHECKING
+import os
+import re
+from typing import Any, AsyncGenerator, AsyncIterable, Hashable, Optional, TYPE_CHECKING
+import warnings
+import weakref
 
 from google.api_core.client_options import ClientOptions
 from google.cloud import discoveryengine_v1 as discoveryengine
 from google.genai import types
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from .base_llm import BaseLlm
@@ -31,15 +39,59 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# Maximum number of cached clients (one per distinct credentials) kept per
+# event loop.
+_MAX_CACHED_CLIENTS_PER_LOOP = 32
+
+
+class _IdentityKey:
+    """Hashes an object by identity, holding it so that its id is not reused."""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+
+def _credentials_key(credentials: Any) -> Hashable:
+    """Returns the key of the cached client for the request credentials.
+
+    Callbacks often build a new credentials object for every request, so
+    credentials carrying an access token are keyed by the token: objects with
+    the same token authorize the same principal and can share a client.
+    Credentials without a token yet are keyed by their identity.
+    """
+    token = getattr(credentials, 'token', None)
+    if isinstance(token, str) and token:
+        return (type(credentials).__qualname__, token)
+    return _IdentityKey(credentials)
+
+
 class GeminiEnterprise(BaseLlm):
     """Integration for Gemini Enterprise (StreamAssist) models.
 
+    The Discovery Engine session that holds the conversation history is
+    scoped to the ADK session: its name is returned as the `interaction_id`
+    of each response, persisted on the session events, and passed back as
+    `LlmRequest.previous_interaction_id` on the next turn. One model instance
+    can therefore serve any number of users and sessions concurrently.
+
     Attributes:
         project_id: The Google Cloud project ID.
         location: The location of the data store (e.g., 'global', 'us', 'eu').
         engine_id: The unique identifier for the Gemini Enterprise app.
         collection: The collection ID (default is 'default_collection').
         assistant: The assistant ID (default is 'default_assistant').
+        client_factory: Optional callable returning an async assistant client
+            given the request credentials. Defaults to creating a
+            `discoveryengine.AssistantServiceAsyncClient`. Used to plug in a
+            fake backend for tests and benchmarks.
     """
 
     model: str = 'gemini-enterprise'
@@ -48,9 +100,13 @@ class GeminiEnterprise(BaseLlm):
     engine_id: Optional[str] = None
     collection: str = 'default_collection'
     assistant: str = 'default_assistant'
+    client_factory: Optional[Any] = None
 
-    # Session state to maintain conversation context
-    _session_id: Optional[str] = None
+    # Async clients are bound to the event loop that created them, so they are
+    # cached per loop, then per credentials (see `_credentials_key`).
+    _clients: weakref.WeakKeyDictionary = PrivateAttr(
+        default_factory=weakref.WeakKeyDictionary
+    )
 
     def __init__(
         self,
@@ -62,7 +118,6 @@ class GeminiEnterprise(BaseLlm):
         **kwargs,
     ):
         super().__init__(**kwargs)
-        import os
         self.project_id = project_id or os.environ.get("GOOGLE_CLOUD_PROJECT")
         self.location = location or os.environ.get("GEMINI_ENTERPRISE_LOCATION", "global")
         self.engine_id = engine_id or os.environ.get("GEMINI_ENTERPRISE_ENGINE_ID")
@@ -76,27 +131,59 @@ class GeminiEnterprise(BaseLlm):
     def supported_models(cls) -> list[str]:
         return [r'gemini-enterprise']
 
-    @override
-    async def generate_content_async(
-        self, llm_request: LlmRequest, stream: bool = False
-    ) -> AsyncGenerator[LlmResponse, None]:
-        """Sends a request to the Gemini Enterprise StreamAssist API.
+    def _create_client(self, credentials: Any) -> Any:
+        if self.client_factory is not None:
+            return self.client_factory(credentials)
+        client_options = (
+            ClientOptions(api_endpoint=f"{self.location}-discoveryengine.googleapis.com")
+            if self.location != "global"
+            else None
+        )
+        return discoveryengine.AssistantServiceAsyncClient(
+            client_options=client_options,
+            credentials=credentials,
+        )
 
-        Args:
-            llm_request: LlmRequest, the request to send.
-            stream: bool = False, whether to do streaming call.
+    def _get_client(self, credentials: Any) -> Any:
+        """Returns a cached async client for the running loop and credentials."""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            clients = collections.OrderedDict()
+            self._clients[loop] = clients
+        key = _credentials_key(credentials)
+        client = clients.get(key)
+        if client is not None:
+            clients.move_to_end(key)
+            return client
+        client = self._create_client(credentials)
+        clients[key] = client
+        if len(clients) > _MAX_CACHED_CLIENTS_PER_LOOP:
+            _, evicted = clients.popitem(last=False)
+            transport = getattr(evicted, 'transport', None)
+            if transport is not None and hasattr(transport, 'close'):
+                close_result = transport.close()
+                if inspect.isawaitable(close_result):
+                    loop.create_task(close_result)
+        return client
 
-        Yields:
-            LlmResponse: The model response.
+    def reset_session(self):
+        """Deprecated: sessions are scoped to the ADK session, not the model.
+
+        Start a new ADK session to start a new conversation.
         """
-        if not self.project_id or not self.engine_id:
-            raise ValueError("project_id and engine_id must be provided for GeminiEnterprise.")
+        warnings.warn(
+            'GeminiEnterprise.reset_session() is deprecated and does nothing.'
+            ' The Gemini Enterprise session is now scoped to the ADK session'
+            ' through `LlmRequest.previous_interaction_id`; start a new ADK'
+            ' session to start a new conversation.',
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
-        # StreamAssist handles its own history via session_id.
-        # We take the latest message from llm_request as the query.
-        if not llm_request.contents:
-            raise ValueError("No content provided in LlmRequest.")
-        
+    def _build_query_text(self, llm_request: LlmRequest) -> str:
+        # StreamAssist handles its own history via the session, so the latest
+        # message from llm_request is the query.
         last_content = llm_request.contents[-1]
         query_text = ""
         for part in last_content.parts:
@@ -104,7 +191,6 @@ class GeminiEnterprise(BaseLlm):
                 query_text += part.text
 
         # --- Tool Emulation Layer: Instruction Injection ---
-        tool_instruction = ""
         if llm_request.config and llm_request.config.tools:
             tool_definitions = []
             for tool in llm_request.config.tools:
@@ -114,33 +200,44 @@ class GeminiEnterprise(BaseLlm):
                         params = func.parameters.properties if func.parameters else {}
                         param_str = ", ".join([f"{k}" for k in params.keys()])
                         tool_definitions.append(f"- `{func.name}({param_str})`: {func.description}")
-            
+
             if tool_definitions:
-                tool_instruction = (
+                query_text += (
                     "\n\nSYSTEM INSTRUCTION: You have access to the following tools:\n" +
                     "\n".join(tool_definitions) +
                     "\nTo use a tool, you MUST output a JSON object with this EXACT format:\n"
                     '```json\n{"tool": "function_name", "parameters": {"param_name": "value"}}\n```\n'
                     "If you use a tool, do not output any other text."
                 )
-                query_text += tool_instruction
+        return query_text
+
+    @override
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        """Sends a request to the Gemini Enterprise StreamAssist API.
+
+        Args:
+            llm_request: LlmRequest, the request to send.
+            stream: bool = False, whether to do streaming call.
+
+        Yields:
+            LlmResponse: The model response.
+        """
+        if not self.project_id or not self.engine_id:
+            raise ValueError("project_id and engine_id must be provided for GeminiEnterprise.")
+
+        if not llm_request.contents:
+            raise ValueError("No content provided in LlmRequest.")
+
+        query_text = self._build_query_text(llm_request)
 
         # Support native OAuth by passing credentials if available in LlmRequest
         # ADK's LlmAgent usually populates credentials in the llm_request.
-        credentials = getattr(llm_request, 'credentials', None)
-
-        client_options = (
-            ClientOptions(api_endpoint=f"{self.location}-discoveryengine.googleapis.com")
-            if self.location != "global"
-            else None
-        )
-        client = discoveryengine.AssistantServiceClient(
-            client_options=client_options,
-            credentials=credentials
-        )
+        client = self._get_client(llm_request.credentials)
 
         request = discoveryengine.StreamAssistRequest(
-            name=client.assistant_path(
+            name=discoveryengine.AssistantServiceClient.assistant_path(
                 project=self.project_id,
                 location=self.location,
                 collection=self.collection,
@@ -148,7 +245,7 @@ class GeminiEnterprise(BaseLlm):
                 assistant=self.assistant,
             ),
             query=discoveryengine.Query(text=query_text),
-            session=self._session_id,
+            session=llm_request.previous_interaction_id,
         )
 
         logger.info(
@@ -157,23 +254,18 @@ class GeminiEnterprise(BaseLlm):
             self.engine_id,
         )
 
-        # The discoveryengine Python SDK's stream_assist is a sync generator in v1.
-        # To make it async-friendly in ADK, we can wrap the iteration.
-        # Note: If there's an async version of AssistantServiceClient, we should use it.
-        # Let's check if AssistantServiceAsyncClient exists.
-        
-        # For now, let's implement using the sync stream but yield as chunks.
-        responses = client.stream_assist(request=request)
-
-        full_answer = ""
-        import json
-        import re
+        # The async client returns an awaitable resolving to the stream.
+        responses: Any = client.stream_assist(request=request)
+        if inspect.isawaitable(responses):
+            responses = await responses
 
-        for response in responses:
-            # Update session ID if provided in the response
+        session_name = llm_request.previous_interaction_id
+        answer_chunks = []
+        async for response in _aiter(responses):
+            # Track the session that holds this conversation's history.
             if response.session_info and response.session_info.session:
-                self._session_id = response.session_info.session
-            
+                session_name = response.session_info.session
+
             # Handle empty/skipped responses
             if not response.answer or not response.answer.replies:
                 continue
@@ -183,15 +275,15 @@ class GeminiEnterprise(BaseLlm):
                 # Check for grounded_content.content.text
                 # We need to access attributes safely as they might be optional
                 if hasattr(reply, 'grounded_content') and hasattr(reply.grounded_content, 'content'):
-                     content = reply.grounded_content.content
-                     if content and content.text:
-                         chunk_text += content.text
+                    content = reply.grounded_content.content
+                    if content and content.text:
+                        chunk_text += content.text
 
             if not chunk_text:
                 continue
 
-            full_answer += chunk_text
-            
+            answer_chunks.append(chunk_text)
+
             if stream:
                 # Yield partial response (text)
                 yield LlmResponse(
@@ -199,17 +291,20 @@ class GeminiEnterprise(BaseLlm):
                         role='model',
                         parts=[types.Part(text=chunk_text)]
                     ),
-                    partial=True
+                    partial=True,
+                    interaction_id=session_name,
                 )
 
+        full_answer = "".join(answer_chunks)
+
         # --- Tool Emulation Layer: Output Parsing ---
         # Check if the full response contains a JSON tool call
         # We look for the ```json ... ``` block or just a raw JSON object
         tool_call_part = None
-        json_match = re.search(r'```json\s*(\{.*?\})\s*```', full_answer, re.DOTALL)
+        json_match = _JSON_BLOCK_PATTERN.search(full_answer)
         if not json_match:
-             # Look for the first valid JSON object start/end (Greedy to capture nested braces)
-             json_match = re.search(r'(\{.*"tool".*\})', full_answer, re.DOTALL)
+            # Look for the first valid JSON object start/end (Greedy to capture nested braces)
+            json_match = _RAW_TOOL_JSON_PATTERN.search(full_answer)
 
         if json_match:
             try:
@@ -225,25 +320,37 @@ class GeminiEnterprise(BaseLlm):
             except json.JSONDecodeError:
                 pass
 
-        if tool_call_part:
-            # Yield final response as a FunctionCall
-            yield LlmResponse(
-                content=types.Content(
-                    role='model',
-                    parts=[tool_call_part]
-                ),
-                partial=False
-            )
-        else:
-            # Yield final consolidated response as Text
-            yield LlmResponse(
-                content=types.Content(
-                    role='model',
-                    parts=[types.Part(text=full_answer)]
-                ),
-                partial=False
-            )
+        # Yield final consolidated response as a FunctionCall or as Text
+        yield LlmResponse(
+            content=types.Content(
+                role='model',
+                parts=[tool_call_part or types.Part(text=full_answer)]
+            ),
+            partial=False,
+            interaction_id=session_name,
+        )
 
-    def reset_session(self):
-        """Resets the conversation session."""
-        self._session_id = None
+
+_JSON_BLOCK_PATTERN = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_RAW_TOOL_JSON_PATTERN = re.compile(r'(\{.*"tool".*\})', re.DOTALL)
+
+
+async def _aiter(responses: Any) -> AsyncIterable[Any]:
+    """Iterates a response stream without blocking the event loop.
+
+    Async streams are consumed directly. Synchronous iterables (e.g. from a
+    sync client returned by `client_factory`) are drained on a worker thread
+    and handed back chunk by chunk.
+    """
+    if hasattr(responses, '__aiter__'):
+        async for response in responses:
+            yield response
+        return
+
+    iterator = iter(responses)
+    sentinel = object()
+    while True:
+        response = await asyncio.to_thread(next, iterator, sentinel)
+        if response is sentinel:
+            return
+        yield response
@@ -0,0 +1,398 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side adaptive rate limiting for model calls.
+
+A `ModelRateLimiter` is shared by every model instance configured with the
+same key (by default the model name), so all concurrent invocations in the
+process draw from one budget. It combines:
+
+* Token buckets on requests per minute and estimated tokens per minute.
+* An AIMD (additive increase, multiplicative decrease) concurrency limit that
+  halves on 429 / RESOURCE_EXHAUSTED responses and grows back on success.
+* Round-robin queuing across fairness keys (typically session ids), so one
+  busy session cannot starve the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import logging
+import math
+import threading
+import time
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+from ..utils.feature_decorator import experimental
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+_RESOURCE_EXHAUSTED = 'RESOURCE_EXHAUSTED'
+
+
+@experimental
+class RateLimitConfig(BaseModel):
+  """Configuration of the client-side rate limiter for a model.
+
+  Attributes:
+    key: Governor key. Models sharing a key share one rate limiter. Defaults
+      to the model name. Use e.g. an API key alias to share a quota across
+      several models.
+    requests_per_minute: Maximum request rate. None means unlimited.
+    tokens_per_minute: Maximum estimated input token rate. None means
+      unlimited.
+    max_concurrency: Upper bound of the adaptive concurrency limit.
+    min_concurrency: Lower bound of the adaptive concurrency limit.
+    initial_concurrency: Starting concurrency limit. Defaults to
+      `max_concurrency`.
+    additive_increase: Amount the concurrency limit grows per full window of
+      successful calls.
+    multiplicative_decrease: Factor applied to the concurrency limit when the
+      model reports that the quota is exhausted.
+  """
+
+  model_config = ConfigDict(
+      extra='forbid',
+  )
+
+  key: Optional[str] = None
+
+  requests_per_minute: Optional[int] = Field(default=None, gt=0)
+
+  tokens_per_minute: Optional[int] = Field(default=None, gt=0)
+
+  max_concurrency: int = Field(default=16, ge=1)
+
+  min_concurrency: int = Field(default=1, ge=1)
+
+  initial_concurrency: Optional[int] = Field(default=None, ge=1)
+
+  additive_increase: float = Field(default=1.0, gt=0)
+
+  multiplicative_decrease: float = Field(default=0.5, gt=0, lt=1)
+
+
+def is_resource_exhausted_error(error: BaseException) -> bool:
+  """Returns whether an exception signals an exhausted model quota."""
+  if getattr(error, 'code', None) == 429:
+    return True
+  if getattr(error, 'status_code', None) == 429:
+    return True
+  return _RESOURCE_EXHAUSTED in str(error)
+
+
+class _TokenBucket:
+  """A token bucket refilled continuously at `per_minute / 60` per second."""
+
+  def __init__(self, per_minute: int, now: float):
+    self.capacity = float(per_minute)
+    self._rate = per_minute / 60.0
+    self._tokens = self.capacity
+    self._updated_at = now
+
+  def _refill(self, now: float) -> None:
+    elapsed = max(0.0, now - self._updated_at)
+    self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+    self._updated_at = now
+
+  def seconds_until_available(self, amount: float, now: float) -> float:
+    self._refill(now)
+    # A single request larger than the bucket is allowed once it is full,
+    # otherwise it would wait forever.
+    amount = min(amount, self.capacity)
+    if self._tokens >= amount:
+      return 0.0
+    return (amount - self._tokens) / self._rate
+
+  def consume(self, amount: float, now: float) -> None:
+    self._refill(now)
+    self._tokens -= min(amount, self.capacity)
+
+
+class _Waiter:
+  """A queued acquire call, woken from any thread through its event loop."""
+
+  def __init__(self, fairness_key: str, estimated_tokens: int):
+    self.fairness_key = fairness_key
+    self.estimated_tokens = estimated_tokens
+    self.loop = asyncio.get_running_loop()
+    self.event = asyncio.Event()
+
+  def wake(self) -> None:
+    try:
+      self.loop.call_soon_threadsafe(self.event.set)
+    except RuntimeError:
+      # The waiter's event loop has been closed; nothing left to wake.
+      pass
+
+
+class RateLimitLease:
+  """A granted slot of the rate limiter, held for the duration of a call.
+
+  Attributes:
+    queue_wait_seconds: Time spent queued before the call was admitted.
+    started_at: Clock reading when the call was admitted.
+  """
+
+  def __init__(self, queue_wait_seconds: float, started_at: float):
+    self.queue_wait_seconds = queue_wait_seconds
+    self.started_at = started_at
+    self._throttled = False
+
+  def record_throttled(self) -> None:
+    """Marks the call as rejected by the model for exceeding its quota."""
+    self._throttled = True
+
+  @property
+  def throttled(self) -> bool:
+    return self._throttled
+
+
+class ModelRateLimiter:
+  """Token-bucket and AIMD concurrency governor shared across invocations.
+
+  Use `get_rate_limiter` to obtain the shared instance for a key instead of
+  constructing this class directly.
+  """
+
+  def __init__(
+      self,
+      config: RateLimitConfig,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    self.config = config
+    self._clock = clock
+    self._lock = threading.Lock()
+    now = clock()
+    self._request_bucket = (
+        _TokenBucket(config.requests_per_minute, now)
+        if config.requests_per_minute
+        else None
+    )
+    self._token_bucket = (
+        _TokenBucket(config.tokens_per_minute, now)
+        if config.tokens_per_minute
+        else None
+    )
+    self._limit = float(
+        min(
+            config.max_concurrency,
+            max(
+                config.min_concurrency,
+                config.initial_concurrency or config.max_concurrency,
+            ),
+        )
+    )
+    self._in_flight = 0
+    self._last_decrease_at = -math.inf
+    # Waiters grouped per fairness key. Keys are served round-robin: after a
+    # key's head waiter is admitted the key moves to the back of the order.
+    self._queues: collections.OrderedDict[
+        str, collections.deque[_Waiter]
+    ] = collections.OrderedDict()
+
+  @property
+  def concurrency_limit(self) -> int:
+    """The current effective concurrency limit."""
+    return max(self.config.min_concurrency, int(self._limit))
+
+  @property
+  def in_flight(self) -> int:
+    """Number of admitted calls that have not finished yet."""
+    return self._in_flight
+
+  @property
+  def queue_depth(self) -> int:
+    """Number of calls waiting to be admitted."""
+    with self._lock:
+      return sum(len(queue) for queue in self._queues.values())
+
+  @contextlib.asynccontextmanager
+  async def acquire(
+      self, *, estimated_tokens: int = 0, fairness_key: str = ''
+  ) -> AsyncIterator[RateLimitLease]:
+    """Waits for admission and holds a concurrency slot until exit.
+
+    Leaving the context with a quota error, or after
+    `RateLimitLease.record_throttled`, shrinks the concurrency limit; leaving
+    it normally grows the limit.
+
+    Args:
+      estimated_tokens: Estimated input tokens of the call, charged against
+        `tokens_per_minute`.
+      fairness_key: Key waiters are queued fairly across, e.g. a session id.
+
+    Yields:
+      The granted lease.
+    """
+    queue_wait_seconds = await self._wait_for_admission(
+        estimated_tokens, fairness_key
+    )
+    lease = RateLimitLease(queue_wait_seconds, self._clock())
+    try:
+      yield lease
+    except BaseException as e:
+      if is_resource_exhausted_error(e):
+        lease.record_throttled()
+      self._release(lease, success=False)
+      raise
+    else:
+      self._release(lease, success=True)
+
+  async def _wait_for_admission(
+      self, estimated_tokens: int, fairness_key: str
+  ) -> float:
+    waiter = _Waiter(fairness_key, estimated_tokens)
+    enqueued_at = self._clock()
+    with self._lock:
+      self._queues.setdefault(fairness_key, collections.deque()).append(waiter)
+    try:
+      while True:
+        # Cleared before checking so a wake-up racing with the check is kept.
+        waiter.event.clear()
+        with self._lock:
+          delay = self._try_admit(waiter)
+        if delay == 0.0:
+          return self._clock() - enqueued_at
+        try:
+          await asyncio.wait_for(waiter.event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+          pass
+    except BaseException:
+      with self._lock:
+        self._remove(waiter)
+        head = self._head()
+      if head is not None:
+        head.wake()
+      raise
+
+  def _head(self) -> Optional[_Waiter]:
+    for queue in self._queues.values():
+      return queue[0]
+    return None
+
+  def _remove(self, waiter: _Waiter) -> None:
+    queue = self._queues.get(waiter.fairness_key)
+    if queue is None or waiter not in queue:
+      return
+    queue.remove(waiter)
+    if not queue:
+      del self._queues[waiter.fairness_key]
+
+  def _try_admit(self, waiter: _Waiter) -> Optional[float]:
+    """Admits `waiter` if it is its turn and capacity is available.
+
+    Must be called with the lock held.
+
+    Returns:
+      0.0 if admitted, the seconds to wait for the token buckets to refill if
+      rate limited, or None to wait until woken up.
+    """
+    if self._head() is not waiter:
+      return None
+    if self._in_flight >= self.concurrency_limit:
+      return None
+    now = self._clock()
+    delay = 0.0
+    if self._request_bucket:
+      delay = max(delay, self._request_bucket.seconds_until_available(1, now))
+    if self._token_bucket:
+      delay = max(
+          delay,
+          self._token_bucket.seconds_until_available(
+              waiter.estimated_tokens, now
+          ),
+      )
+    if delay > 0:
+      return delay
+    if self._request_bucket:
+      self._request_bucket.consume(1, now)
+    if self._token_bucket:
+      self._token_bucket.consume(waiter.estimated_tokens, now)
+    self._in_flight += 1
+    queue = self._queues.pop(waiter.fairness_key)
+    queue.popleft()
+    if queue:
+      # Re-inserting at the end gives the other keys their turn first.
+      self._queues[waiter.fairness_key] = queue
+    next_waiter = self._head()
+    if next_waiter is not None:
+      next_waiter.wake()
+    return 0.0
+
+  def _release(self, lease: RateLimitLease, success: bool) -> None:
+    with self._lock:
+      self._in_flight -= 1
+      if lease.throttled:
+        # Calls started before the last decrease were issued under the old
+        # limit; reacting to each of them would collapse the limit at once.
+        if lease.started_at >= self._last_decrease_at:
+          self._limit = max(
+              float(self.config.min_concurrency),
+              self._limit * self.config.multiplicative_decrease,
+          )
+          self._last_decrease_at = self._clock()
+          logger.info(
+              'Model quota exhausted, reducing concurrency limit to %d.',
+              self.concurrency_limit,
+          )
+      elif success:
+        self._limit = min(
+            float(self.config.max_concurrency),
+            self._limit + self.config.additive_increase / max(self._limit, 1),
+        )
+      head = self._head()
+    if head is not None:
+      head.wake()
+
+
+_rate_limiters: dict[str, ModelRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+# Keys already warned about, so that each mismatch is only logged once.
+_mismatched_config_keys: set[str] = set()
+
+
+def get_rate_limiter(key: str, config: RateLimitConfig) -> ModelRateLimiter:
+  """Returns the process-wide rate limiter for `key`, creating it if needed.
+
+  The configuration of the first caller for a key wins. A warning is logged
+  when a later caller passes a different configuration for the same key.
+  """
+  with _rate_limiters_lock:
+    rate_limiter = _rate_limiters.get(key)
+    if rate_limiter is None:
+      rate_limiter = ModelRateLimiter(config)
+      _rate_limiters[key] = rate_limiter
+    elif (
+        rate_limiter.config != config
+        and key not in _mismatched_config_keys
+    ):
+      _mismatched_config_keys.add(key)
+      logger.warning(
+          'The rate limiter for %r already exists with a different'
+          ' configuration, which is kept: %s. Ignoring: %s. Set a distinct'
+          ' `RateLimitConfig.key` to give this model its own budget.',
+          key,
+          rate_limiter.config,
+          config,
+      )
+    return rate_limiter
@@ -26,6 +26,7 @@ from ..agents.callback_context import CallbackContext
 from ..events.event import Event
 from ..models.llm_request import LlmRequest
 from ..models.llm_response import LlmResponse
+from ..utils.token_estimation import estimate_content_tokens
 from .base_plugin import BasePlugin
 
 logger = logging.getLogger("google_adk." + __name__)
@@ -70,6 +71,7 @@ class ContextFilterPlugin(BasePlugin):
       num_invocations_to_keep: Optional[int] = None,
       custom_filter: Optional[Callable[[List[Event]], List[Event]]] = None,
       name: str = "context_filter_plugin",
+      max_tokens: Optional[int] = None,
   ):
     """Initializes the context management plugin.
 
@@ -79,10 +81,14 @@ class ContextFilterPlugin(BasePlugin):
         by a model response.
       custom_filter: A function to filter the context.
       name: The name of the plugin instance.
+      max_tokens: The maximum estimated tokens of the contents to keep. The
+        most recent contents that fit are kept, and the latest content is
+        always kept. Token counts are estimated locally.
     """
     super().__init__(name)
     self._num_invocations_to_keep = num_invocations_to_keep
     self._custom_filter = custom_filter
+    self._max_tokens = max_tokens
 
   async def before_model_callback(
       self, *, callback_context: CallbackContext, llm_request: LlmRequest
@@ -118,6 +124,22 @@ class ContextFilterPlugin(BasePlugin):
           )
           contents = contents[split_index:]
 
+      if self._max_tokens is not None and contents:
+        total_tokens = 0
+        split_index = len(contents) - 1
+        for i in range(len(contents) - 1, -1, -1):
+          total_tokens += estimate_content_tokens(contents[i])
+          if total_tokens > self._max_tokens and i < len(contents) - 1:
+            break
+          split_index = i
+        if split_index > 0:
+          split_index = (
+              _adjust_split_index_to_avoid_orphaned_function_responses(
+                  contents, split_index
+              )
+          )
+          contents = contents[split_index:]
+
       if self._custom_filter:
         contents = self._custom_filter(contents)
 
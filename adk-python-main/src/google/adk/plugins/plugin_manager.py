@@ -25,6 +25,8 @@ from typing import TYPE_CHECKING
 
 from google.genai import types
 
+from ..telemetry import metrics as adk_metrics
+from ..telemetry.event_loop_monitor import track_activity
 from .base_plugin import BasePlugin
 
 if TYPE_CHECKING:
@@ -281,12 +283,22 @@ class PluginManager:
       RuntimeError: If a plugin encounters an unhandled exception during
         execution. The original exception is chained.
     """
+    invocation_context = kwargs.get('invocation_context')
+    if invocation_context is None:
+      context = kwargs.get('callback_context') or kwargs.get('tool_context')
+      invocation_context = getattr(context, '_invocation_context', None)
     for plugin in self.plugins:
       # Each plugin might not implement all callbacks. The base class provides
       # default `pass` implementations, so `getattr` will always succeed.
       callback_method = getattr(plugin, callback_name)
       try:
-        result = await callback_method(**kwargs)
+        with adk_metrics.measure(
+            adk_metrics.PLUGIN_CALLBACK_DURATION,
+            {'adk.plugin': plugin.name, 'adk.callback': callback_name},
+        ), track_activity(
+            invocation_context, 'plugin', f'{plugin.name}.{callback_name}'
+        ):
+          result = await callback_method(**kwargs)
         if result is not None:
           # Early exit: A plugin has returned a value. We stop
           # processing further plugins and return this value immediately.
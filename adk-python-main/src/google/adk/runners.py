@@ -59,6 +59,7 @@ from .plugins.plugin_manager import PluginManager
 from .sessions.base_session_service import BaseSessionService
 from .sessions.in_memory_session_service import InMemorySessionService
 from .sessions.session import Session
+from .telemetry import metrics as adk_metrics
 from .telemetry.tracing import tracer
 from .tools.base_toolset import BaseToolset
 from .utils._debug_output import print_event
@@ -372,17 +373,17 @@ class Runner:
     Raises:
       ValueError: If the session is not found and auto_create_session is False.
     """
-    session = await self.session_service.get_session(
-        app_name=self.app_name, user_id=user_id, session_id=session_id
-    )
-    if not session:
-      if self.auto_create_session:
+    with adk_metrics.measure(adk_metrics.SESSION_LOAD_DURATION):
+      session = await self.session_service.get_session(
+          app_name=self.app_name, user_id=user_id, session_id=session_id
+      )
+      if not session and self.auto_create_session:
         session = await self.session_service.create_session(
             app_name=self.app_name, user_id=user_id, session_id=session_id
         )
-      else:
-        message = self._format_session_not_found_message(session_id)
-        raise ValueError(message)
+    if not session:
+      message = self._format_session_not_found_message(session_id)
+      raise ValueError(message)
     return session
 
   def run(
@@ -459,6 +460,7 @@ class Runner:
       new_message: Optional[types.Content] = None,
       state_delta: Optional[dict[str, Any]] = None,
       run_config: Optional[RunConfig] = None,
+      session: Optional[Session] = None,
   ) -> AsyncGenerator[Event, None]:
     """Main entry method to run the agent in this runner.
 
@@ -476,15 +478,31 @@ class Runner:
       new_message: A new message to append to the session.
       state_delta: Optional state changes to apply to the session.
       run_config: The run config for the agent.
+      session: The session identified by `user_id` and `session_id`, if the
+        caller has already loaded it. The runner then uses it instead of
+        loading the session again.
 
     Yields:
       The events generated by the agent.
 
     Raises:
       ValueError: If the session is not found; If both invocation_id and
-        new_message are None.
+        new_message are None; If `session` is not the session identified by
+        `user_id` and `session_id`.
     """
     run_config = run_config or RunConfig()
+    if session is not None and (
+        session.app_name != self.app_name
+        or session.user_id != user_id
+        or session.id != session_id
+    ):
+      raise ValueError(
+          f'The preloaded session {session.id} of user {session.user_id} in'
+          f' app {session.app_name} does not match session {session_id} of'
+          f' user {user_id} in app {self.app_name}.'
+      )
+
+    preloaded_session = session
 
     if new_message and not new_message.role:
       new_message.role = 'user'
@@ -494,7 +512,7 @@ class Runner:
         invocation_id: Optional[str] = None,
     ) -> AsyncGenerator[Event, None]:
       with tracer.start_as_current_span('invocation'):
-        session = await self._get_or_create_session(
+        session = preloaded_session or await self._get_or_create_session(
             user_id=user_id, session_id=session_id
         )
         if not invocation_id and not new_message:
@@ -554,9 +572,10 @@ class Runner:
         # the end of an invocation.)
         if self.app and self.app.events_compaction_config:
           logger.debug('Running event compactor.')
-          await _run_compaction_for_sliding_window(
-              self.app, session, self.session_service
-          )
+          with adk_metrics.measure(adk_metrics.COMPACTION_DURATION):
+            await _run_compaction_for_sliding_window(
+                self.app, session, self.session_service
+            )
 
     async with Aclosing(_run_with_trace(new_message, invocation_id)) as agen:
       async for event in agen:
@@ -607,7 +626,7 @@ class Runner:
 
     logger.info('Rewinding session to invocation: %s', rewind_event)
 
-    await self.session_service.append_event(session=session, event=rewind_event)
+    await self._append_event(session=session, event=rewind_event)
 
   async def _compute_state_delta_for_rewind(
       self, session: Session, rewind_event_index: int
@@ -699,6 +718,11 @@ class Runner:
 
     return rewind_artifact_delta
 
+  async def _append_event(self, *, session: Session, event: Event) -> None:
+    """Appends an event to the session, recording how long it took."""
+    with adk_metrics.measure(adk_metrics.APPEND_EVENT_DURATION):
+      await self.session_service.append_event(session=session, event=event)
+
   def _should_append_event(self, event: Event, is_live_call: bool) -> bool:
     """Checks if an event should be appended to the session."""
     # Don't append audio response from model in live mode to session.
@@ -752,7 +776,7 @@ class Runner:
           early_exit_event, invocation_context.run_config
       )
       if self._should_append_event(early_exit_event, is_live_call):
-        await self.session_service.append_event(
+        await self._append_event(
             session=session,
             event=early_exit_event,
         )
@@ -806,13 +830,11 @@ class Runner:
                     'Appending transcription finished event: %s', event
                 )
                 if self._should_append_event(event, is_live_call):
-                  await self.session_service.append_event(
-                      session=session, event=event
-                  )
+                  await self._append_event(session=session, event=event)
 
                 for buffered_event in buffered_events:
                   logger.debug('Appending buffered event: %s', buffered_event)
-                  await self.session_service.append_event(
+                  await self._append_event(
                       session=session, event=buffered_event
                   )
                   yield buffered_event  # yield buffered events to caller
@@ -822,14 +844,10 @@ class Runner:
                 # example, event that stores blob reference, should be appended.
                 if self._should_append_event(event, is_live_call):
                   logger.debug('Appending non-buffered event: %s', event)
-                  await self.session_service.append_event(
-                      session=session, event=event
-                  )
+                  await self._append_event(session=session, event=event)
           else:
             if event.partial is not True:
-              await self.session_service.append_event(
-                  session=session, event=event
-              )
+              await self._append_event(session=session, event=event)
 
           # Step 3: Run the on_event callbacks to optionally modify the event.
           modified_event = await plugin_manager.run_on_event_callback(
@@ -918,7 +936,7 @@ class Runner:
     if function_call := invocation_context._find_matching_function_call(event):
       event.branch = function_call.branch
 
-    await self.session_service.append_event(session=session, event=event)
+    await self._append_event(session=session, event=event)
 
   async def run_live(
       self,
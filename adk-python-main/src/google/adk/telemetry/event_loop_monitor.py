@@ -0,0 +1,304 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A watchdog that reports the code blocking the event loop.
+
+A blocking tool, callback or plugin stalls every invocation served by the same
+event loop. `EventLoopMonitor` schedules a wakeup on the loop at a fixed
+interval and, from a separate thread, watches for wakeups that run late. While
+the loop is stalled, the thread samples the loop's stack and finds the tool,
+callback or plugin that is running through `track_activity`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import sys
+import threading
+import time
+import traceback
+from types import FrameType
+from typing import Any
+from typing import Callable
+from typing import ContextManager
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from ..utils.feature_decorator import experimental
+from . import metrics as adk_metrics
+
+if TYPE_CHECKING:
+  from ..agents.invocation_context import InvocationContext
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+# The number of innermost frames kept in the stack samples.
+_STACK_SAMPLE_LIMIT = 20
+
+# The activities running on monitored loops, by the id of the frame that
+# started them. Only tracked while a monitor is running.
+_activities: dict[int, list[_Activity]] = {}
+_activities_lock = threading.Lock()
+_running_monitors = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class _Activity:
+  kind: str
+  """`tool`, `callback` or `plugin`."""
+  name: str
+  invocation_id: Optional[str]
+  agent_name: Optional[str]
+  session_id: Optional[str]
+  frame: FrameType
+
+  def describe(self) -> str:
+    description = f'{self.kind} {self.name!r}'
+    if self.invocation_id:
+      description += (
+          f' (agent {self.agent_name!r}, session {self.session_id!r},'
+          f' invocation {self.invocation_id!r})'
+      )
+    return description
+
+
+class _ActivityTracker:
+
+  def __init__(self, activity: _Activity):
+    self._activity = activity
+
+  def __enter__(self) -> None:
+    with _activities_lock:
+      _activities.setdefault(id(self._activity.frame), []).append(
+          self._activity
+      )
+
+  def __exit__(self, *exc_info) -> None:
+    key = id(self._activity.frame)
+    with _activities_lock:
+      activities = _activities.get(key)
+      if activities:
+        activities.remove(self._activity)
+        if not activities:
+          del _activities[key]
+
+
+def track_activity(
+    invocation_context: Optional[InvocationContext],
+    kind: str,
+    name: str,
+) -> ContextManager[None]:
+  """Marks the block as running a tool, callback or plugin for the monitor.
+
+  Stalls of the event loop inside the block are attributed to the activity
+  and to the invocation it runs for. Tracking is a no-op unless an
+  `EventLoopMonitor` is running.
+
+  Example:
+    with track_activity(invocation_context, 'tool', tool.name):
+      result = await tool.run_async(args=args, tool_context=tool_context)
+
+  Args:
+    invocation_context: The invocation the activity runs for, if known.
+    kind: `tool`, `callback` or `plugin`.
+    name: The name of the tool, callback or plugin callback.
+  """
+  if not _running_monitors:
+    return contextlib.nullcontext()
+  invocation_id = agent_name = session_id = None
+  if invocation_context is not None:
+    invocation_id = invocation_context.invocation_id
+    agent_name = invocation_context.agent.name
+    session_id = invocation_context.session.id
+  return _ActivityTracker(
+      _Activity(
+          kind=kind,
+          name=name,
+          invocation_id=invocation_id,
+          agent_name=agent_name,
+          session_id=session_id,
+          # The frame of the function running the `with` statement.
+          frame=sys._getframe(1),
+      )
+  )
+
+
+def track_callback(
+    invocation_context: Optional[InvocationContext],
+    callback: Callable[..., Any],
+) -> ContextManager[None]:
+  """Marks the block as running an agent callback for the monitor."""
+  return track_activity(
+      invocation_context,
+      'callback',
+      getattr(callback, '__qualname__', type(callback).__qualname__),
+  )
+
+
+def _running_activity(frame: Optional[FrameType]) -> Optional[_Activity]:
+  """Returns the innermost activity on the stack ending at `frame`."""
+  with _activities_lock:
+    if not _activities:
+      return None
+    while frame is not None:
+      activities = _activities.get(id(frame))
+      if activities:
+        return activities[-1]
+      frame = frame.f_back
+  return None
+
+
+@dataclasses.dataclass
+class _StallSample:
+  wakeup: float
+  """The scheduled wakeup the sample was taken for."""
+  activity: Optional[_Activity]
+  stack: str
+
+
+@experimental
+class EventLoopMonitor:
+  """Reports the tools, callbacks and plugins that block the event loop.
+
+  The monitor wakes up on the loop every `interval_seconds`. When a wakeup
+  runs `threshold_seconds` or more after it was scheduled, it logs a warning
+  with the activity that was running and a sample of the loop's stack, and
+  records the stall in the `adk.event_loop.stall.duration` metric.
+
+  Example:
+    monitor = EventLoopMonitor(threshold_seconds=0.2)
+    monitor.start()  # From the event loop.
+    ...
+    await monitor.stop()
+  """
+
+  def __init__(
+      self,
+      *,
+      threshold_seconds: float = 0.1,
+      interval_seconds: Optional[float] = None,
+  ):
+    """Initializes the monitor.
+
+    Args:
+      threshold_seconds: The shortest stall that is reported.
+      interval_seconds: How often the loop is woken up and checked. Defaults
+        to half of `threshold_seconds`.
+    """
+    if threshold_seconds <= 0:
+      raise ValueError('threshold_seconds must be positive.')
+    self.threshold_seconds = threshold_seconds
+    self.interval_seconds = interval_seconds or threshold_seconds / 2
+    self.stall_count = 0
+    """The number of stalls reported."""
+    self._loop_thread_id: Optional[int] = None
+    self._heartbeat: Optional[asyncio.Task[None]] = None
+    self._watchdog: Optional[threading.Thread] = None
+    self._stopped = threading.Event()
+    self._lock = threading.Lock()
+    self._next_wakeup = 0.0
+    self._sample: Optional[_StallSample] = None
+
+  def start(self) -> None:
+    """Starts monitoring the running event loop."""
+    global _running_monitors
+    if self._heartbeat is not None:
+      return
+    loop = asyncio.get_running_loop()
+    self._loop_thread_id = threading.get_ident()
+    self._stopped.clear()
+    self._next_wakeup = time.monotonic() + self.interval_seconds
+    self._heartbeat = loop.create_task(self._beat())
+    self._watchdog = threading.Thread(
+        target=self._watch, name='adk_event_loop_monitor', daemon=True
+    )
+    self._watchdog.start()
+    with _activities_lock:
+      _running_monitors += 1
+
+  async def stop(self) -> None:
+    """Stops monitoring."""
+    global _running_monitors
+    if self._heartbeat is None:
+      return
+    self._stopped.set()
+    self._heartbeat.cancel()
+    try:
+      await self._heartbeat
+    except asyncio.CancelledError:
+      pass
+    self._heartbeat = None
+    await asyncio.to_thread(self._watchdog.join)
+    self._watchdog = None
+    with _activities_lock:
+      _running_monitors -= 1
+
+  async def _beat(self) -> None:
+    while True:
+      with self._lock:
+        wakeup = self._next_wakeup
+      await asyncio.sleep(max(0.0, wakeup - time.monotonic()))
+      now = time.monotonic()
+      with self._lock:
+        sample = self._sample
+        self._sample = None
+        self._next_wakeup = now + self.interval_seconds
+      stall = now - wakeup
+      if stall >= self.threshold_seconds:
+        self._report(stall, sample)
+
+  def _watch(self) -> None:
+    while not self._stopped.wait(self.interval_seconds / 2):
+      with self._lock:
+        wakeup = self._next_wakeup
+        if self._sample is not None and self._sample.wakeup == wakeup:
+          continue
+      if time.monotonic() - wakeup < self.threshold_seconds:
+        continue
+      # The loop is stalled: sample what it is running.
+      frame = sys._current_frames().get(self._loop_thread_id)
+      sample = _StallSample(
+          wakeup=wakeup,
+          activity=_running_activity(frame),
+          stack=''.join(
+              traceback.format_stack(frame, limit=_STACK_SAMPLE_LIMIT)
+          )
+          if frame is not None
+          else '',
+      )
+      del frame
+      with self._lock:
+        if self._next_wakeup == wakeup:
+          self._sample = sample
+
+  def _report(self, stall: float, sample: Optional[_StallSample]) -> None:
+    self.stall_count += 1
+    activity = sample.activity if sample else None
+    adk_metrics.record_duration(
+        adk_metrics.EVENT_LOOP_STALL_DURATION,
+        stall,
+        {
+            'adk.stall.kind': activity.kind if activity else 'unknown',
+            'adk.stall.name': activity.name if activity else 'unknown',
+        },
+    )
+    logger.warning(
+        'The event loop was blocked for %.3fs%s.%s',
+        stall,
+        f' by {activity.describe()}' if activity else '',
+        f' Stack sample:\n{sample.stack}' if sample and sample.stack else '',
+    )
@@ -0,0 +1,362 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latency metrics of the phases of an invocation.
+
+The metrics are recorded through the OpenTelemetry metrics API. Until a
+`MeterProvider` is set, e.g. by `maybe_set_otel_providers`, the API hands out
+no-op instruments and recording a metric costs next to nothing.
+
+All durations are histograms in seconds:
+
+- `adk.session.load.duration`: loading (or creating) the session of an
+  invocation.
+- `adk.session.append_event.duration`: appending an event to the session.
+- `adk.compaction.duration`: compacting the events of a session.
+- `adk.request_processor.duration`: each request processor of an LLM flow,
+  by `adk.processor`.
+- `adk.llm.time_to_first_token` and `adk.llm.call.duration`: the first and
+  the whole response of a model call, by `gen_ai.request.model`.
+- `adk.tool.queue.duration`: how long a tool call waited before it started,
+  by `gen_ai.tool.name` and `adk.queue` (`task` or `thread_pool`).
+- `adk.tool.execution.duration`: running a tool, by `gen_ai.tool.name`.
+- `adk.plugin.callback.duration`: each plugin callback, by `adk.plugin` and
+  `adk.callback`.
+- `adk.event_loop.stall.duration`: each time the event loop was blocked for
+  longer than the threshold of an `EventLoopMonitor`, by the `adk.stall.kind`
+  (`tool`, `callback`, `plugin` or `unknown`) and `adk.stall.name` of the
+  code that blocked it.
+- `adk.admission.queue.duration`: how long a request to the API server waited
+  for an invocation slot, by `adk.app`.
+
+Phases that fail are recorded with an `error.type` attribute.
+
+The admission control of the API server also records:
+
+- `adk.admission.queue.depth`: the number of requests waiting for an
+  invocation slot, by `adk.app`.
+- `adk.admission.rejections`: the number of requests rejected, by `adk.app`
+  and `adk.reason` (`queue_full` or `queue_timeout`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import contextmanager
+import math
+import time
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+from opentelemetry import metrics
+from opentelemetry.sdk.metrics.export import Gauge
+from opentelemetry.sdk.metrics.export import Histogram
+from opentelemetry.sdk.metrics.export import MetricsData
+from opentelemetry.sdk.metrics.export import Sum
+from opentelemetry.semconv.schemas import Schemas
+
+from .. import version
+from ..utils.context_utils import Aclosing
+
+_T = TypeVar('_T')
+
+SESSION_LOAD_DURATION = 'adk.session.load.duration'
+APPEND_EVENT_DURATION = 'adk.session.append_event.duration'
+COMPACTION_DURATION = 'adk.compaction.duration'
+REQUEST_PROCESSOR_DURATION = 'adk.request_processor.duration'
+LLM_TIME_TO_FIRST_TOKEN = 'adk.llm.time_to_first_token'
+LLM_CALL_DURATION = 'adk.llm.call.duration'
+TOOL_QUEUE_DURATION = 'adk.tool.queue.duration'
+TOOL_EXECUTION_DURATION = 'adk.tool.execution.duration'
+PLUGIN_CALLBACK_DURATION = 'adk.plugin.callback.duration'
+EVENT_LOOP_STALL_DURATION = 'adk.event_loop.stall.duration'
+ADMISSION_QUEUE_DURATION = 'adk.admission.queue.duration'
+ADMISSION_QUEUE_DEPTH = 'adk.admission.queue.depth'
+ADMISSION_REJECTIONS = 'adk.admission.rejections'
+
+# Bucket boundaries, in seconds, of in-process phases and of remote calls.
+_FAST_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# The boundaries recommended for `gen_ai.client.operation.duration`.
+_SLOW_BUCKETS = (
+    0.01,
+    0.02,
+    0.04,
+    0.08,
+    0.16,
+    0.32,
+    0.64,
+    1.28,
+    2.56,
+    5.12,
+    10.24,
+    20.48,
+    40.96,
+    81.92,
+)
+
+_HISTOGRAMS = {
+    SESSION_LOAD_DURATION: (
+        'Time to load or create the session of an invocation.',
+        _FAST_BUCKETS,
+    ),
+    APPEND_EVENT_DURATION: (
+        'Time to append an event to a session.',
+        _FAST_BUCKETS,
+    ),
+    COMPACTION_DURATION: (
+        'Time to compact the events of a session.',
+        _SLOW_BUCKETS,
+    ),
+    REQUEST_PROCESSOR_DURATION: (
+        'Time spent in a request processor of an LLM flow.',
+        _FAST_BUCKETS,
+    ),
+    LLM_TIME_TO_FIRST_TOKEN: (
+        'Time until the first response of a model call.',
+        _SLOW_BUCKETS,
+    ),
+    LLM_CALL_DURATION: (
+        'Time until the last response of a model call.',
+        _SLOW_BUCKETS,
+    ),
+    TOOL_QUEUE_DURATION: (
+        'Time a tool call waited before it started running.',
+        _FAST_BUCKETS,
+    ),
+    TOOL_EXECUTION_DURATION: (
+        'Time to run a tool.',
+        _SLOW_BUCKETS,
+    ),
+    PLUGIN_CALLBACK_DURATION: (
+        'Time spent in a plugin callback.',
+        _FAST_BUCKETS,
+    ),
+    EVENT_LOOP_STALL_DURATION: (
+        'Time the event loop was blocked for.',
+        _SLOW_BUCKETS,
+    ),
+    ADMISSION_QUEUE_DURATION: (
+        'Time a request waited for an invocation slot.',
+        _SLOW_BUCKETS,
+    ),
+}
+# Counters that only go up, and counters that go up and down.
+_COUNTERS = {
+    ADMISSION_REJECTIONS: 'Requests rejected by the admission control.',
+}
+_UP_DOWN_COUNTERS = {
+    ADMISSION_QUEUE_DEPTH: 'Requests waiting for an invocation slot.',
+}
+
+
+class _Instruments:
+  """The instruments of the metrics, created from a meter provider."""
+
+  def __init__(self, meter_provider: Optional[metrics.MeterProvider] = None):
+    meter = metrics.get_meter(
+        'gcp.vertex.agent',
+        version.__version__,
+        meter_provider=meter_provider,
+        schema_url=Schemas.V1_36_0.value,
+    )
+    self.histograms = {
+        name: meter.create_histogram(
+            name,
+            unit='s',
+            description=description,
+            explicit_bucket_boundaries_advisory=buckets,
+        )
+        for name, (description, buckets) in _HISTOGRAMS.items()
+    }
+    self.counters = {
+        name: meter.create_counter(name, unit='1', description=description)
+        for name, description in _COUNTERS.items()
+    }
+    self.counters.update(
+        (name, meter.create_up_down_counter(name, description=description))
+        for name, description in _UP_DOWN_COUNTERS.items()
+    )
+
+
+# Created from the global meter provider, which forwards to the provider that
+# is eventually set.
+_instruments = _Instruments()
+
+
+def record_duration(
+    name: str,
+    seconds: float,
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> None:
+  """Records a duration of one of the phases above."""
+  _instruments.histograms[name].record(seconds, attributes)
+
+
+def add_to_counter(
+    name: str,
+    amount: int,
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> None:
+  """Adds to one of the counters above."""
+  _instruments.counters[name].add(amount, attributes)
+
+
+@contextmanager
+def measure(
+    name: str, attributes: Optional[Mapping[str, Any]] = None
+) -> Iterator[None]:
+  """Records the duration of the wrapped block."""
+  start = time.perf_counter()
+  try:
+    yield
+  except Exception as e:
+    attributes = {**(attributes or {}), 'error.type': type(e).__qualname__}
+    raise
+  finally:
+    record_duration(name, time.perf_counter() - start, attributes)
+
+
+async def measure_stream(
+    stream: AsyncGenerator[_T, None],
+    name: str,
+    attributes: Optional[Mapping[str, Any]] = None,
+    *,
+    first_item_name: Optional[str] = None,
+) -> AsyncGenerator[_T, None]:
+  """Yields the items of `stream`, recording the time spent producing them.
+
+  The time the caller spends between two items is not counted, so wrapping a
+  stream whose items are processed as they arrive only measures the stream.
+
+  Args:
+    stream: The stream to measure.
+    name: The metric of the time to produce all the items.
+    attributes: The attributes of the metrics.
+    first_item_name: The metric of the time to produce the first item, if any.
+  """
+  elapsed = 0.0
+  first_item = True
+  start = time.perf_counter()
+  try:
+    async with Aclosing(stream) as agen:
+      async for item in agen:
+        elapsed += time.perf_counter() - start
+        if first_item and first_item_name:
+          record_duration(first_item_name, elapsed, attributes)
+        first_item = False
+        try:
+          yield item
+        finally:
+          start = time.perf_counter()
+  except Exception as e:
+    attributes = {**(attributes or {}), 'error.type': type(e).__qualname__}
+    raise
+  finally:
+    elapsed += time.perf_counter() - start
+    record_duration(name, elapsed, attributes)
+
+
+def _prometheus_name(name: str) -> str:
+  return ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+
+
+def _prometheus_value(value: float) -> str:
+  if math.isinf(value):
+    return '+Inf' if value > 0 else '-Inf'
+  return repr(float(value))
+
+
+def _prometheus_labels(
+    attributes: Mapping[str, Any], **extra_labels: str
+) -> str:
+  labels = {
+      _prometheus_name(key): str(value) for key, value in attributes.items()
+  }
+  labels.update(extra_labels)
+  if not labels:
+    return ''
+  escaped = (
+      '{}="{}"'.format(
+          key,
+          value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"'),
+      )
+      for key, value in sorted(labels.items())
+  )
+  return '{' + ','.join(escaped) + '}'
+
+
+def to_prometheus_text(metrics_data: Optional[MetricsData]) -> str:
+  """Renders collected metrics in the Prometheus text exposition format."""
+  lines = []
+  if metrics_data is None:
+    return ''
+  for resource_metrics in metrics_data.resource_metrics:
+    for scope_metrics in resource_metrics.scope_metrics:
+      for metric in scope_metrics.metrics:
+        name = _prometheus_name(metric.name)
+        data = metric.data
+        if isinstance(data, Histogram):
+          metric_type = 'histogram'
+        elif isinstance(data, Sum) and data.is_monotonic:
+          metric_type = 'counter'
+        elif isinstance(data, (Sum, Gauge)):
+          metric_type = 'gauge'
+        else:
+          continue
+        if metric.unit == 's':
+          name += '_seconds'
+        if metric_type == 'counter':
+          name += '_total'
+        if metric.description:
+          lines.append(f'# HELP {name} {metric.description}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        for point in data.data_points:
+          attributes = point.attributes or {}
+          if metric_type != 'histogram':
+            lines.append(
+                f'{name}{_prometheus_labels(attributes)}'
+                f' {_prometheus_value(point.value)}'
+            )
+            continue
+          cumulative = 0
+          bounds = list(point.explicit_bounds) + [math.inf]
+          for bound, count in zip(bounds, point.bucket_counts):
+            cumulative += count
+            labels = _prometheus_labels(
+                attributes, le=_prometheus_value(bound)
+            )
+            lines.append(f'{name}_bucket{labels} {cumulative}')
+          labels = _prometheus_labels(attributes)
+          lines.append(f'{name}_sum{labels} {_prometheus_value(point.sum)}')
+          lines.append(f'{name}_count{labels} {point.count}')
+  return '\n'.join(lines) + '\n' if lines else ''
@@ -23,14 +23,18 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterator
 from collections.abc import Mapping
 from contextlib import contextmanager
 import json
 import logging
 import os
+import threading
 from typing import Any
+from typing import Callable
 from typing import TYPE_CHECKING
+import weakref
 
 from google.genai import types
 from google.genai.models import Models
@@ -64,6 +68,20 @@ from ..utils.model_name_utils import is_gemini_model
 # This env, when set to false, allows to disable populating those attributes.
 ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS = 'ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS'
 
+# Caps the size of each payload attribute, in bytes. Larger payloads keep their
+# head and tail. 0 disables the cap.
+ADK_SPAN_PAYLOAD_MAX_BYTES = 'ADK_SPAN_PAYLOAD_MAX_BYTES'
+_DEFAULT_SPAN_PAYLOAD_MAX_BYTES = 1024 * 1024
+
+# The fraction of traces whose payloads are captured, from 0 to 1. Payloads of
+# failed model calls are always captured.
+ADK_SPAN_PAYLOAD_SAMPLE_RATE = 'ADK_SPAN_PAYLOAD_SAMPLE_RATE'
+
+# Which contents of LLM requests are captured: `full` (default) captures all of
+# them, `delta` only those added since the previous call of the session, with
+# their position in `contents_offset`.
+ADK_SPAN_PAYLOAD_CONTENTS = 'ADK_SPAN_PAYLOAD_CONTENTS'
+
 # Standard OTEL env variable to enable logging of prompt/response content.
 OTEL_INSTRUMENTATION_GENAI_CAPTURE_MESSAGE_CONTENT = (
     'OTEL_INSTRUMENTATION_GENAI_CAPTURE_MESSAGE_CONTENT'
@@ -174,10 +192,11 @@ def trace_tool_call(
   span.set_attribute('gcp.vertex.agent.llm_request', '{}')
   span.set_attribute('gcp.vertex.agent.llm_response', '{}')
 
-  if _should_add_request_response_to_spans():
+  capture_payloads = _should_capture_payloads(span)
+  if capture_payloads:
     span.set_attribute(
         'gcp.vertex.agent.tool_call_args',
-        _safe_json_serialize(args),
+        _cap_payload(_safe_json_serialize(args)),
     )
   else:
     span.set_attribute('gcp.vertex.agent.tool_call_args', '{}')
@@ -204,10 +223,10 @@ def trace_tool_call(
     tool_response = {'result': tool_response}
   if function_response_event is not None:
     span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
-  if _should_add_request_response_to_spans():
+  if capture_payloads:
     span.set_attribute(
         'gcp.vertex.agent.tool_response',
-        _safe_json_serialize(tool_response),
+        _cap_payload(_safe_json_serialize(tool_response)),
     )
   else:
     span.set_attribute('gcp.vertex.agent.tool_response', '{}')
@@ -237,17 +256,16 @@ def trace_merged_tool_calls(
   # TODO(b/441461932): See if these are still necessary
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
   span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
-  try:
-    function_response_event_json = function_response_event.model_dumps_json(
-        exclude_none=True
-    )
-  except Exception:  # pylint: disable=broad-exception-caught
-    function_response_event_json = '<not serializable>'
-
-  if _should_add_request_response_to_spans():
+  if _should_capture_payloads(span):
+    try:
+      function_response_event_json = function_response_event.model_dumps_json(
+          exclude_none=True
+      )
+    except Exception:  # pylint: disable=broad-exception-caught
+      function_response_event_json = '<not serializable>'
     span.set_attribute(
         'gcp.vertex.agent.tool_response',
-        function_response_event_json,
+        _cap_payload(function_response_event_json),
     )
   else:
     span.set_attribute('gcp.vertex.agent.tool_response', '{}')
@@ -290,11 +308,18 @@ def trace_call_llm(
       'gcp.vertex.agent.session_id', invocation_context.session.id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+  # Payloads of failed calls are captured even when their trace is not
+  # sampled, so that failures can be debugged.
+  capture_payloads = _should_capture_payloads(
+      span, force=llm_response.error_code is not None
+  )
   # Consider removing once GenAI SDK provides a way to record this info.
-  if _should_add_request_response_to_spans():
+  if capture_payloads:
     span.set_attribute(
         'gcp.vertex.agent.llm_request',
-        _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
+        _llm_request_payload(
+            span, invocation_context.session.id, llm_request
+        ),
     )
   else:
     span.set_attribute('gcp.vertex.agent.llm_request', '{}')
@@ -311,15 +336,14 @@ def trace_call_llm(
           llm_request.config.max_output_tokens,
       )
 
-  try:
-    llm_response_json = llm_response.model_dump_json(exclude_none=True)
-  except Exception:  # pylint: disable=broad-exception-caught
-    llm_response_json = '<not serializable>'
-
-  if _should_add_request_response_to_spans():
+  if capture_payloads:
+    try:
+      llm_response_json = llm_response.model_dump_json(exclude_none=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+      llm_response_json = '<not serializable>'
     span.set_attribute(
         'gcp.vertex.agent.llm_response',
-        llm_response_json,
+        _cap_payload(llm_response_json),
     )
   else:
     span.set_attribute('gcp.vertex.agent.llm_response', '{}')
@@ -367,21 +391,25 @@ def trace_send_data(
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
-  if _should_add_request_response_to_spans():
+  if _should_capture_payloads(span):
     span.set_attribute(
         'gcp.vertex.agent.data',
-        _safe_json_serialize([
-            types.Content(role=content.role, parts=content.parts).model_dump(
-                exclude_none=True, mode='json'
-            )
-            for content in data
-        ]),
+        _cap_payload(
+            _safe_json_serialize([
+                types.Content(
+                    role=content.role, parts=content.parts
+                ).model_dump(exclude_none=True, mode='json')
+                for content in data
+            ])
+        ),
     )
   else:
     span.set_attribute('gcp.vertex.agent.data', '{}')
 
 
-def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
+def _build_llm_request_for_trace(
+    llm_request: LlmRequest, contents_offset: int = 0
+) -> dict[str, Any]:
   """Builds a dictionary representation of the LLM request for tracing.
 
   This function prepares a dictionary representation of the LlmRequest
@@ -390,6 +418,8 @@ def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
 
   Args:
     llm_request: The LlmRequest object.
+    contents_offset: The number of leading contents to leave out. If not 0,
+      it is recorded as `contents_offset`.
 
   Returns:
     A dictionary representation of the LLM request.
@@ -400,19 +430,162 @@ def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
       'config': llm_request.config.model_dump(
           exclude_none=True, exclude='response_schema', mode='json'
       ),
-      'contents': [],
+      'contents': [
+          _content_for_trace(content)
+          for content in llm_request.contents[contents_offset:]
+      ],
   }
-  # We do not want to send bytes data to the trace.
-  for content in llm_request.contents:
-    parts = [part for part in content.parts if not part.inline_data]
-    result['contents'].append(
-        types.Content(role=content.role, parts=parts).model_dump(
-            exclude_none=True, mode='json'
-        )
-    )
+  if contents_offset:
+    result['contents_offset'] = contents_offset
   return result
 
 
+def _content_for_trace(content: types.Content) -> dict[str, Any]:
+  # We do not want to send bytes data to the trace.
+  parts = [part for part in content.parts or [] if not part.inline_data]
+  return types.Content(role=content.role, parts=parts).model_dump(
+      exclude_none=True, mode='json'
+  )
+
+
+# The payload of the LLM request of each `call_llm` span. Streamed responses
+# trace the same request once per chunk, and reuse it.
+_span_request_payloads: weakref.WeakKeyDictionary[Span, tuple[int, str]] = (
+    weakref.WeakKeyDictionary()
+)
+_span_request_payloads_lock = threading.Lock()
+
+# With `ADK_SPAN_PAYLOAD_CONTENTS=delta`, the number of contents of the last
+# captured request of each session, and the hash of its last content.
+_MAX_TRACED_SESSIONS = 4096
+_session_contents: OrderedDict[str, tuple[int, int]] = OrderedDict()
+_session_contents_lock = threading.Lock()
+
+
+def _content_hash(content: types.Content) -> int:
+  return hash(_safe_json_serialize(_content_for_trace(content)))
+
+
+def _delta_contents_offset(
+    session_id: str, contents: list[types.Content]
+) -> int:
+  """Returns the number of contents already captured for the session."""
+  with _session_contents_lock:
+    previous = _session_contents.get(session_id)
+  contents_offset = 0
+  if previous is not None:
+    contents_count, last_content_hash = previous
+    if (
+        0 < contents_count <= len(contents)
+        and _content_hash(contents[contents_count - 1]) == last_content_hash
+    ):
+      contents_offset = contents_count
+  with _session_contents_lock:
+    if contents:
+      _session_contents[session_id] = (
+          len(contents),
+          _content_hash(contents[-1]),
+      )
+      _session_contents.move_to_end(session_id)
+      while len(_session_contents) > _MAX_TRACED_SESSIONS:
+        _session_contents.popitem(last=False)
+    else:
+      _session_contents.pop(session_id, None)
+  return contents_offset
+
+
+def _llm_request_payload(
+    span: Span, session_id: str, llm_request: LlmRequest
+) -> str:
+  """Returns the captured payload of an LLM request.
+
+  Streamed responses trace the same request once per chunk; its payload is
+  serialized only once, and kept until the span started by
+  `start_call_llm_span` ends. With `ADK_SPAN_PAYLOAD_CONTENTS=delta`, only the
+  contents added since the previous call of the session are captured.
+  """
+  with _span_request_payloads_lock:
+    cached = _span_request_payloads.get(span)
+  if cached is not None and cached[0] == id(llm_request):
+    return cached[1]
+
+  contents_offset = 0
+  if os.getenv(ADK_SPAN_PAYLOAD_CONTENTS, 'full').lower() == 'delta':
+    contents_offset = _delta_contents_offset(session_id, llm_request.contents)
+  payload = _cap_payload(
+      _safe_json_serialize(
+          _build_llm_request_for_trace(llm_request, contents_offset)
+      )
+  )
+  with _span_request_payloads_lock:
+    _span_request_payloads[span] = (id(llm_request), payload)
+  return payload
+
+
+@contextmanager
+def start_call_llm_span() -> Iterator[Span]:
+  """Starts a `call_llm` span as the current span.
+
+  The payload of the LLM request traced on the span is kept until the span
+  ends.
+  """
+  with tracer.start_as_current_span('call_llm') as span:
+    try:
+      yield span
+    finally:
+      with _span_request_payloads_lock:
+        _span_request_payloads.pop(span, None)
+
+
+def _cap_payload(payload: str) -> str:
+  """Keeps the head and tail of payloads over `ADK_SPAN_PAYLOAD_MAX_BYTES`."""
+  max_bytes = _env_number(
+      ADK_SPAN_PAYLOAD_MAX_BYTES, _DEFAULT_SPAN_PAYLOAD_MAX_BYTES, int
+  )
+  # Checked on the length in characters first, which is at most the length
+  # in bytes, to skip encoding small payloads.
+  if max_bytes <= 0 or len(payload) <= max_bytes // 4:
+    return payload
+  data = payload.encode('utf-8')
+  if len(data) <= max_bytes:
+    return payload
+  half = max_bytes // 2
+  head = data[:half].decode('utf-8', errors='ignore')
+  tail = data[len(data) - half :].decode('utf-8', errors='ignore')
+  return f'{head}...<{len(data) - 2 * half} bytes truncated>...{tail}'
+
+
+_TRACE_ID_LOW_BITS_MASK = (1 << 64) - 1
+
+
+def _should_capture_payloads(span: Span, force: bool = False) -> bool:
+  """Returns whether to serialize payloads into the attributes of a span."""
+  if not _should_add_request_response_to_spans() or not span.is_recording():
+    return False
+  if force:
+    return True
+  sample_rate = _env_number(ADK_SPAN_PAYLOAD_SAMPLE_RATE, 1.0, float)
+  if sample_rate >= 1.0:
+    return True
+  # Decided by the trace ID, like `TraceIdRatioBased`, so that the spans of a
+  # trace are captured together.
+  trace_id = span.get_span_context().trace_id
+  return (trace_id & _TRACE_ID_LOW_BITS_MASK) < sample_rate * (
+      _TRACE_ID_LOW_BITS_MASK + 1
+  )
+
+
+def _env_number(name: str, default: Any, number_type: Callable[[str], Any]):
+  value = os.getenv(name)
+  if not value:
+    return default
+  try:
+    return number_type(value)
+  except ValueError:
+    logger.warning('Ignoring invalid %s=%r.', name, value)
+    return default
+
+
 # Defaults to true for now to preserve backward compatibility.
 # Once prompt and response logging is well established in ADK, we might start
 # a deprecation of request/response content in spans by switching the default
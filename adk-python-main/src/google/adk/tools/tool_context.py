@@ -96,10 +96,15 @@ class ToolContext(CallbackContext):
     )
 
   async def search_memory(self, query: str) -> SearchMemoryResponse:
-    """Searches the memory of the current user."""
+    """Searches the memory of the current user.
+
+    Results are cached for the rest of the invocation, so repeated searches
+    for the same query do not call the memory service again.
+    """
     if self._invocation_context.memory_service is None:
       raise ValueError('Memory service is not available.')
-    return await self._invocation_context.memory_service.search_memory(
+    return await self._invocation_context.memory_search_cache.search_memory(
+        self._invocation_context.memory_service,
         app_name=self._invocation_context.app_name,
         user_id=self._invocation_context.user_id,
         query=query,
@@ -14,8 +14,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
 import logging
 import re
+from typing import Optional
+
+from google.genai import types
 
 from ..agents.readonly_context import ReadonlyContext
 from ..sessions.state import State
@@ -66,36 +72,32 @@ async def inject_session_state(
   """
 
   invocation_context = readonly_context._invocation_context
+  literals, placeholders = _compile_template(template)
 
-  async def _async_sub(pattern, repl_async_fn, string) -> str:
-    result = []
-    last_end = 0
-    for match in re.finditer(pattern, string):
-      result.append(string[last_end : match.start()])
-      replacement = await repl_async_fn(match)
-      result.append(replacement)
-      last_end = match.end()
-    result.append(string[last_end:])
-    return ''.join(result)
-
-  async def _replace_match(match) -> str:
-    var_name = match.group().lstrip('{').rstrip('}').strip()
-    optional = False
-    if var_name.endswith('?'):
-      optional = True
-      var_name = var_name.removesuffix('?')
-    if var_name.startswith('artifact.'):
-      var_name = var_name.removeprefix('artifact.')
-      if invocation_context.artifact_service is None:
+  # The artifacts are loaded concurrently, each once per invocation.
+  artifacts: dict[str, Optional[types.Part]] = {}
+  artifact_service = invocation_context.artifact_service
+  filenames = list(
+      dict.fromkeys(p.name for p in placeholders if p.is_artifact)
+  )
+  if filenames and artifact_service is not None:
+    cache = invocation_context.artifact_load_cache
+    loaded = await asyncio.gather(*(
+        cache.load_artifact(
+            artifact_service, invocation_context.session, filename
+        )
+        for filename in filenames
+    ))
+    artifacts = dict(zip(filenames, loaded))
+
+  def _replace(placeholder: _Placeholder) -> str:
+    var_name = placeholder.name
+    if placeholder.is_artifact:
+      if artifact_service is None:
         raise ValueError('Artifact service is not initialized.')
-      artifact = await invocation_context.artifact_service.load_artifact(
-          app_name=invocation_context.session.app_name,
-          user_id=invocation_context.session.user_id,
-          session_id=invocation_context.session.id,
-          filename=var_name,
-      )
+      artifact = artifacts[var_name]
       if artifact is None:
-        if optional:
+        if placeholder.optional:
           logger.debug(
               'Artifact %s not found, replacing with empty string', var_name
           )
@@ -105,14 +107,14 @@ async def inject_session_state(
       return str(artifact)
     else:
       if not _is_valid_state_name(var_name):
-        return match.group()
+        return placeholder.text
       if var_name in invocation_context.session.state:
         value = invocation_context.session.state[var_name]
         if value is None:
           return ''
         return str(value)
       else:
-        if optional:
+        if placeholder.optional:
           logger.debug(
               'Context variable %s not found, replacing with empty string',
               var_name,
@@ -121,7 +123,59 @@ async def inject_session_state(
         else:
           raise KeyError(f'Context variable not found: `{var_name}`.')
 
-  return await _async_sub(r'{+[^{}]*}+', _replace_match, template)
+  result = [literals[0]]
+  for placeholder, literal in zip(placeholders, literals[1:]):
+    result.append(_replace(placeholder))
+    result.append(literal)
+  return ''.join(result)
+
+
+_PLACEHOLDER_PATTERN = re.compile(r'{+[^{}]*}+')
+
+
+@dataclasses.dataclass(frozen=True)
+class _Placeholder:
+  text: str
+  """The placeholder as written in the template, braces included."""
+  name: str
+  """The state variable or artifact filename."""
+  optional: bool
+  is_artifact: bool
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(
+    template: str,
+) -> tuple[tuple[str, ...], tuple[_Placeholder, ...]]:
+  """Splits a template into its literal text and its placeholders.
+
+  Templates are usually the fixed instructions of agents, so each is parsed
+  once rather than on every model call.
+
+  Returns:
+    The literal text around the placeholders, which has one more element than
+    the placeholders, and the placeholders.
+  """
+  literals = []
+  placeholders = []
+  last_end = 0
+  for match in _PLACEHOLDER_PATTERN.finditer(template):
+    literals.append(template[last_end : match.start()])
+    var_name = match.group().lstrip('{').rstrip('}').strip()
+    optional = var_name.endswith('?')
+    var_name = var_name.removesuffix('?')
+    is_artifact = var_name.startswith('artifact.')
+    placeholders.append(
+        _Placeholder(
+            text=match.group(),
+            name=var_name.removeprefix('artifact.'),
+            optional=optional,
+            is_artifact=is_artifact,
+        )
+    )
+    last_end = match.end()
+  literals.append(template[last_end:])
+  return tuple(literals), tuple(placeholders)
 
 
 def _is_valid_state_name(var_name):
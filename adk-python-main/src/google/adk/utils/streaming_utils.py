@@ -25,128 +25,122 @@ from ..features import is_feature_enabled
 from ..models.llm_response import LlmResponse
 
 
+def _parse_json_path(json_path: str) -> tuple[str, ...]:
+  """Splits a JSONPath like "$.location.latitude" into its keys."""
+  path = json_path[2:] if json_path.startswith('$.') else json_path
+  return tuple(path.split('.'))
+
+
+class _PartialArgsBuilder:
+  """Incrementally assembles streamed function call arguments.
+
+  Streaming string values arrive as many small chunks addressed by JSONPath.
+  Chunks are collected in per-path lists and joined once when the arguments
+  are built, instead of re-concatenating the whole string on every chunk.
+  """
+
+  def __init__(self):
+    # Keys of each JSONPath, in order of first appearance.
+    self._paths: dict[str, tuple[str, ...]] = {}
+    # Current value of each path. Streaming strings are kept as chunk lists.
+    self._values: dict[str, Any] = {}
+    self._string_paths: set[str] = set()
+
+  def __bool__(self) -> bool:
+    return bool(self._values)
+
+  def add(self, partial_arg: types.PartialArg) -> None:
+    """Adds a partial argument, ignoring ones without a path or value."""
+    json_path = partial_arg.json_path
+    if not json_path:
+      return
+    if json_path not in self._paths:
+      self._paths[json_path] = _parse_json_path(json_path)
+
+    if partial_arg.string_value is not None:
+      # For streaming strings, append chunks to the existing value.
+      if json_path in self._string_paths:
+        self._values[json_path].append(partial_arg.string_value)
+      else:
+        self._values[json_path] = [partial_arg.string_value]
+        self._string_paths.add(json_path)
+      return
+
+    if partial_arg.number_value is not None:
+      value = partial_arg.number_value
+    elif partial_arg.bool_value is not None:
+      value = partial_arg.bool_value
+    elif partial_arg.null_value is not None:
+      value = None
+    else:
+      return
+    self._values[json_path] = value
+    self._string_paths.discard(json_path)
+
+  def build(self) -> dict[str, Any]:
+    """Returns the arguments assembled so far as a nested dict."""
+    args: dict[str, Any] = {}
+    for json_path, keys in self._paths.items():
+      if json_path not in self._values:
+        continue
+      value = self._values[json_path]
+      if json_path in self._string_paths:
+        value = ''.join(value)
+      current = args
+      for key in keys[:-1]:
+        current = current.setdefault(key, {})
+      current[keys[-1]] = value
+    return args
+
+
 class StreamingResponseAggregator:
   """Aggregates partial streaming responses.
 
   It aggregates content from partial responses, and generates LlmResponses for
   individual (partial) model responses, as well as for aggregated content.
+
+  Text is collected as lists of chunks and joined once when a part is
+  flushed, so aggregating a long stream is linear in its length. Consumers
+  that only need the raw deltas can call `process_delta` instead of
+  `process_response` to skip building an `LlmResponse` per chunk.
   """
 
   def __init__(self):
-    self._text = ''
-    self._thought_text = ''
+    self._text_chunks: list[str] = []
+    self._thought_text_chunks: list[str] = []
     self._usage_metadata = None
     self._response = None
 
     # For progressive SSE streaming mode: accumulate parts in order
     self._parts_sequence: list[types.Part] = []
-    self._current_text_buffer: str = ''
+    self._current_text_chunks: list[str] = []
     self._current_text_is_thought: Optional[bool] = None
     self._finish_reason: Optional[types.FinishReason] = None
 
     # For streaming function call arguments
     self._current_fc_name: Optional[str] = None
-    self._current_fc_args: dict[str, Any] = {}
+    self._current_fc_args = _PartialArgsBuilder()
     self._current_fc_id: Optional[str] = None
     self._current_thought_signature: Optional[str] = None
 
+    # Set once `process_delta` is used; forces in-order aggregation.
+    self._deltas_only = False
+
   def _flush_text_buffer_to_sequence(self):
     """Flush current text buffer to parts sequence.
 
     This helper is used in progressive SSE mode to maintain part ordering.
     It only merges consecutive text parts of the same type (thought or regular).
     """
-    if self._current_text_buffer:
+    if self._current_text_chunks:
+      text = ''.join(self._current_text_chunks)
       if self._current_text_is_thought:
-        self._parts_sequence.append(
-            types.Part(text=self._current_text_buffer, thought=True)
-        )
+        self._parts_sequence.append(types.Part(text=text, thought=True))
       else:
-        self._parts_sequence.append(
-            types.Part.from_text(text=self._current_text_buffer)
-        )
-      self._current_text_buffer = ''
+        self._parts_sequence.append(types.Part.from_text(text=text))
+      self._current_text_chunks = []
       self._current_text_is_thought = None
 
-  def _get_value_from_partial_arg(
-      self, partial_arg: types.PartialArg, json_path: str
-  ):
-    """Extract value from a partial argument.
-
-    Args:
-      partial_arg: The partial argument object
-      json_path: JSONPath for this argument
-
-    Returns:
-      Tuple of (value, has_value) where has_value indicates if a value exists
-    """
-    value = None
-    has_value = False
-
-    if partial_arg.string_value is not None:
-      # For streaming strings, append chunks to existing value
-      string_chunk = partial_arg.string_value
-      has_value = True
-
-      # Get current value for this path (if any)
-      path_without_prefix = (
-          json_path[2:] if json_path.startswith('$.') else json_path
-      )
-      path_parts = path_without_prefix.split('.')
-
-      # Try to get existing value
-      existing_value = self._current_fc_args
-      for part in path_parts:
-        if isinstance(existing_value, dict) and part in existing_value:
-          existing_value = existing_value[part]
-        else:
-          existing_value = None
-          break
-
-      # Append to existing string or set new value
-      if isinstance(existing_value, str):
-        value = existing_value + string_chunk
-      else:
-        value = string_chunk
-
-    elif partial_arg.number_value is not None:
-      value = partial_arg.number_value
-      has_value = True
-    elif partial_arg.bool_value is not None:
-      value = partial_arg.bool_value
-      has_value = True
-    elif partial_arg.null_value is not None:
-      value = None
-      has_value = True
-
-    return value, has_value
-
-  def _set_value_by_json_path(self, json_path: str, value: Any):
-    """Set a value in _current_fc_args using JSONPath notation.
-
-    Args:
-      json_path: JSONPath string like "$.location" or "$.location.latitude"
-      value: The value to set
-    """
-    # Remove leading "$." from jsonPath
-    if json_path.startswith('$.'):
-      path = json_path[2:]
-    else:
-      path = json_path
-
-    # Split path into components
-    path_parts = path.split('.')
-
-    # Navigate to the correct location and set the value
-    current = self._current_fc_args
-    for part in path_parts[:-1]:
-      if part not in current:
-        current[part] = {}
-      current = current[part]
-
-    # Set the final value
-    current[path_parts[-1]] = value
-
   def _flush_function_call_to_sequence(self):
     """Flush current function call to parts sequence.
 
@@ -156,7 +150,7 @@ class StreamingResponseAggregator:
       # Create function call part with accumulated args
       fc_part = types.Part.from_function_call(
           name=self._current_fc_name,
-          args=self._current_fc_args.copy(),
+          args=self._current_fc_args.build(),
       )
 
       # Set the ID if provided (directly on the function_call object)
@@ -171,7 +165,7 @@ class StreamingResponseAggregator:
 
       # Reset FC state
       self._current_fc_name = None
-      self._current_fc_args = {}
+      self._current_fc_args = _PartialArgsBuilder()
       self._current_fc_id = None
       self._current_thought_signature = None
 
@@ -189,18 +183,7 @@ class StreamingResponseAggregator:
 
     # Process each partial argument
     for partial_arg in getattr(fc, 'partial_args', []):
-      json_path = partial_arg.json_path
-      if not json_path:
-        continue
-
-      # Extract value from partial arg
-      value, has_value = self._get_value_from_partial_arg(
-          partial_arg, json_path
-      )
-
-      # Set the value using JSONPath (only if a value was provided)
-      if has_value:
-        self._set_value_by_json_path(json_path, value)
+      self._current_fc_args.add(partial_arg)
 
     # Check if function call is complete
     fc_will_continue = getattr(fc, 'will_continue', False)
@@ -233,6 +216,65 @@ class StreamingResponseAggregator:
         self._flush_text_buffer_to_sequence()
         self._parts_sequence.append(part)
 
+  def _is_progressive(self) -> bool:
+    return is_feature_enabled(FeatureName.PROGRESSIVE_SSE_STREAMING)
+
+  def _accumulate_parts(self, parts: list[types.Part]) -> None:
+    """Accumulates parts in order for progressive aggregation.
+
+    Only consecutive text parts of the same type (thought or regular) merge.
+    """
+    for part in parts:
+      if part.text:
+        # Check if we need to flush the current buffer first
+        # (when text type changes from thought to regular or vice versa)
+        if (
+            self._current_text_chunks
+            and part.thought != self._current_text_is_thought
+        ):
+          self._flush_text_buffer_to_sequence()
+
+        # Accumulate text to buffer
+        if not self._current_text_chunks:
+          self._current_text_is_thought = part.thought
+        self._current_text_chunks.append(part.text)
+      elif part.function_call:
+        # Process function call (handles both streaming Args and
+        # non-streaming Args)
+        self._process_function_call_part(part)
+      else:
+        # Other non-text parts (bytes, etc.)
+        # Flush any buffered text first, then add the non-text part
+        self._flush_text_buffer_to_sequence()
+        self._parts_sequence.append(part)
+
+  def process_delta(
+      self, response: types.GenerateContentResponse
+  ) -> list[types.Part]:
+    """Aggregates a model response without building an LlmResponse.
+
+    This is a cheaper alternative to `process_response` for consumers that
+    only need the streamed deltas. Parts are always aggregated in order, as in
+    progressive SSE streaming mode, and `close` returns the final response.
+
+    Args:
+      response: The response to process.
+
+    Returns:
+      The parts of the response, i.e. the delta.
+    """
+    self._response = response
+    self._usage_metadata = response.usage_metadata
+    if not response.candidates:
+      return []
+    candidate = response.candidates[0]
+    if candidate.finish_reason:
+      self._finish_reason = candidate.finish_reason
+    parts = (candidate.content and candidate.content.parts) or []
+    self._accumulate_parts(parts)
+    self._deltas_only = True
+    return parts
+
   async def process_response(
       self, response: types.GenerateContentResponse
   ) -> AsyncGenerator[LlmResponse, None]:
@@ -245,7 +287,6 @@ class StreamingResponseAggregator:
       The generated LlmResponse(s), for the partial response, and the aggregated
       response if needed.
     """
-    # results = []
     self._response = response
     llm_response = LlmResponse.create(response)
     self._usage_metadata = llm_response.usage_metadata
@@ -255,33 +296,10 @@ class StreamingResponseAggregator:
     if llm_response.finish_reason:
       self._finish_reason = llm_response.finish_reason
 
-    if is_feature_enabled(FeatureName.PROGRESSIVE_SSE_STREAMING):
+    if self._is_progressive():
       # Accumulate parts while preserving their order
-      # Only merge consecutive text parts of the same type (thought or regular)
       if llm_response.content and llm_response.content.parts:
-        for part in llm_response.content.parts:
-          if part.text:
-            # Check if we need to flush the current buffer first
-            # (when text type changes from thought to regular or vice versa)
-            if (
-                self._current_text_buffer
-                and part.thought != self._current_text_is_thought
-            ):
-              self._flush_text_buffer_to_sequence()
-
-            # Accumulate text to buffer
-            if not self._current_text_buffer:
-              self._current_text_is_thought = part.thought
-            self._current_text_buffer += part.text
-          elif part.function_call:
-            # Process function call (handles both streaming Args and
-            # non-streaming Args)
-            self._process_function_call_part(part)
-          else:
-            # Other non-text parts (bytes, etc.)
-            # Flush any buffered text first, then add the non-text part
-            self._flush_text_buffer_to_sequence()
-            self._parts_sequence.append(part)
+        self._accumulate_parts(llm_response.content.parts)
 
       # Mark ALL intermediate chunks as partial
       llm_response.partial = True
@@ -296,29 +314,35 @@ class StreamingResponseAggregator:
     ):
       part0 = llm_response.content.parts[0]
       if part0.thought:
-        self._thought_text += part0.text
+        self._thought_text_chunks.append(part0.text)
       else:
-        self._text += part0.text
+        self._text_chunks.append(part0.text)
       llm_response.partial = True
-    elif (self._thought_text or self._text) and (
+    elif (self._thought_text_chunks or self._text_chunks) and (
         not llm_response.content
         or not llm_response.content.parts
         # don't yield the merged text event when receiving audio data
         or not llm_response.content.parts[0].inline_data
     ):
-      parts = []
-      if self._thought_text:
-        parts.append(types.Part(text=self._thought_text, thought=True))
-      if self._text:
-        parts.append(types.Part.from_text(text=self._text))
       yield LlmResponse(
-          content=types.ModelContent(parts=parts),
+          content=types.ModelContent(parts=self._take_text_parts()),
           usage_metadata=llm_response.usage_metadata,
       )
-      self._thought_text = ''
-      self._text = ''
     yield llm_response
 
+  def _take_text_parts(self) -> list[types.Part]:
+    """Joins and resets the text accumulated in non-progressive mode."""
+    parts = []
+    if self._thought_text_chunks:
+      parts.append(
+          types.Part(text=''.join(self._thought_text_chunks), thought=True)
+      )
+    if self._text_chunks:
+      parts.append(types.Part.from_text(text=''.join(self._text_chunks)))
+    self._thought_text_chunks = []
+    self._text_chunks = []
+    return parts
+
   def close(self) -> Optional[LlmResponse]:
     """Generate an aggregated response at the end, if needed.
 
@@ -328,7 +352,7 @@ class StreamingResponseAggregator:
       The aggregated LlmResponse.
     """
     # ========== Progressive SSE Streaming (new feature) ==========
-    if is_feature_enabled(FeatureName.PROGRESSIVE_SSE_STREAMING):
+    if self._deltas_only or self._is_progressive():
       # Always generate final aggregated response in progressive mode
       if self._response and self._response.candidates:
         # Flush any remaining buffers to complete the sequence
@@ -359,15 +383,11 @@ class StreamingResponseAggregator:
 
     # ========== Non-Progressive SSE Streaming (old behavior) ==========
     if (
-        (self._text or self._thought_text)
+        (self._text_chunks or self._thought_text_chunks)
         and self._response
         and self._response.candidates
     ):
-      parts = []
-      if self._thought_text:
-        parts.append(types.Part(text=self._thought_text, thought=True))
-      if self._text:
-        parts.append(types.Part.from_text(text=self._text))
+      parts = self._take_text_parts()
       candidate = self._response.candidates[0]
       return LlmResponse(
           content=types.ModelContent(parts=parts),
@@ -0,0 +1,251 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fast, offline token estimation for budgeting context before model calls.
+
+Estimates are approximate and never call the model. Per-`Content` counts are
+memoized, so re-estimating a growing conversation only tokenizes the new
+contents.
+
+Totals are not aggregated incrementally: `count_contents` and `count_request`
+add up the count of every content on each call, which is linear in the length
+of the history. This is intentional. The flows rebuild and deep-copy the
+request contents from the session events before each model call, so there is
+no append-only sequence of content objects that a running total could follow,
+and the per-call cost is dominated by building the request, not by adding up
+its counts.
+
+The tokenizer is pluggable: pass any object implementing `Tokenizer` to
+`TokenEstimator`, or replace the process-wide default with
+`set_default_estimator`.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+from typing import Iterable
+from typing import Optional
+from typing import Protocol
+from typing import runtime_checkable
+from typing import TYPE_CHECKING
+import weakref
+
+from google.genai import types
+
+if TYPE_CHECKING:
+  from ..models.llm_request import LlmRequest
+
+# Gemini bills images, and each second of video, at a fixed token cost.
+_MEDIA_PART_TOKENS = 258
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+  """Counts the tokens of a piece of text."""
+
+  def count_tokens(self, text: str) -> int:
+    ...
+
+
+class CharRatioTokenizer:
+  """Estimates tokens from the text length.
+
+  Four characters per token is a good approximation for English text with
+  Gemini and most BPE tokenizers.
+  """
+
+  def __init__(self, chars_per_token: float = 4.0):
+    if chars_per_token <= 0:
+      raise ValueError('chars_per_token must be positive.')
+    self._chars_per_token = chars_per_token
+
+  def count_tokens(self, text: str) -> int:
+    return int(len(text) / self._chars_per_token)
+
+
+def _json_length_text(value: Any) -> str:
+  try:
+    return json.dumps(value, ensure_ascii=False, default=str)
+  except (TypeError, ValueError):
+    return str(value)
+
+
+def _part_signature(part: types.Part) -> tuple[Any, ...]:
+  """Returns what identifies a part's counted values for the memo."""
+  function_call = part.function_call
+  function_response = part.function_response
+  return (
+      id(part),
+      len(part.text) if part.text else 0,
+      len(_json_length_text(function_call.args))
+      if function_call and function_call.args
+      else 0,
+      len(_json_length_text(function_response.response))
+      if function_response and function_response.response
+      else 0,
+      len(part.executable_code.code or '') if part.executable_code else 0,
+      len(part.code_execution_result.output or '')
+      if part.code_execution_result
+      else 0,
+  )
+
+
+class TokenEstimator:
+  """Estimates tokens of contents, tools and requests with memoization.
+
+  Counts are memoized per `types.Content` object for as long as it is alive.
+  A memoized count is reused only while the content's parts are unchanged:
+  same part objects, and same lengths of their text, function call arguments,
+  function response, code and code output. In-place edits that change one of
+  those lengths are re-estimated; an edit that keeps every length is not.
+  """
+
+  def __init__(self, tokenizer: Optional[Tokenizer] = None):
+    self.tokenizer = tokenizer or CharRatioTokenizer()
+    self._lock = threading.Lock()
+    # id(content) -> (weak reference, parts signature, token count)
+    self._memo: dict[int, tuple[weakref.ref, tuple[Any, ...], int]] = {}
+
+  def count_text(self, text: str) -> int:
+    """Estimates the tokens of a text."""
+    return self.tokenizer.count_tokens(text) if text else 0
+
+  def count_part(self, part: types.Part) -> int:
+    """Estimates the tokens of a single part."""
+    tokens = 0
+    if part.text:
+      tokens += self.count_text(part.text)
+    if part.function_call:
+      tokens += self.count_text(part.function_call.name or '')
+      if part.function_call.args:
+        tokens += self.count_text(_json_length_text(part.function_call.args))
+    if part.function_response:
+      tokens += self.count_text(part.function_response.name or '')
+      if part.function_response.response:
+        tokens += self.count_text(
+            _json_length_text(part.function_response.response)
+        )
+    if part.executable_code and part.executable_code.code:
+      tokens += self.count_text(part.executable_code.code)
+    if part.code_execution_result and part.code_execution_result.output:
+      tokens += self.count_text(part.code_execution_result.output)
+    if part.inline_data or part.file_data:
+      tokens += _MEDIA_PART_TOKENS
+    return tokens
+
+  def count_content(self, content: types.Content) -> int:
+    """Estimates the tokens of a content, memoized per content object."""
+    parts = content.parts or []
+    signature = tuple(_part_signature(part) for part in parts)
+    key = id(content)
+    with self._lock:
+      cached = self._memo.get(key)
+    if cached is not None and cached[0]() is content and cached[1] == signature:
+      return cached[2]
+
+    tokens = sum(self.count_part(part) for part in parts)
+    memo = self._memo
+
+    def _forget(_, key=key, memo=memo):
+      memo.pop(key, None)
+
+    with self._lock:
+      self._memo[key] = (weakref.ref(content, _forget), signature, tokens)
+    return tokens
+
+  def count_contents(self, contents: Iterable[types.Content]) -> int:
+    """Estimates the total tokens of several contents."""
+    return sum(self.count_content(content) for content in contents)
+
+  def count_tools(self, tools: Optional[Iterable[Any]]) -> int:
+    """Estimates the tokens of tool declarations."""
+    tokens = 0
+    for tool in tools or []:
+      if isinstance(tool, types.Tool):
+        tokens += self.count_text(
+            _json_length_text(tool.model_dump(exclude_none=True, mode='json'))
+        )
+    return tokens
+
+  def count_system_instruction(self, system_instruction: Any) -> int:
+    """Estimates the tokens of a system instruction of any supported type."""
+    if not system_instruction:
+      return 0
+    if isinstance(system_instruction, str):
+      return self.count_text(system_instruction)
+    if isinstance(system_instruction, types.Content):
+      return self.count_content(system_instruction)
+    if isinstance(system_instruction, types.Part):
+      return self.count_part(system_instruction)
+    if isinstance(system_instruction, list):
+      return sum(self.count_system_instruction(s) for s in system_instruction)
+    return self.count_text(str(system_instruction))
+
+  def count_request(
+      self, llm_request: LlmRequest, contents_count: Optional[int] = None
+  ) -> int:
+    """Estimates the input tokens of a request.
+
+    Args:
+      llm_request: The request: system instruction, tools and contents are
+        counted.
+      contents_count: If set, only the first `contents_count` contents are
+        counted, e.g. the prefix that would be cached.
+
+    Returns:
+      The estimated number of input tokens.
+    """
+    tokens = 0
+    if llm_request.config:
+      tokens += self.count_system_instruction(
+          llm_request.config.system_instruction
+      )
+      tokens += self.count_tools(llm_request.config.tools)
+    contents = llm_request.contents
+    if contents_count is not None:
+      contents = contents[:contents_count]
+    return tokens + self.count_contents(contents)
+
+
+_default_estimator = TokenEstimator()
+
+
+def get_default_estimator() -> TokenEstimator:
+  """Returns the process-wide estimator shared by the framework."""
+  return _default_estimator
+
+
+def set_default_estimator(estimator: TokenEstimator) -> None:
+  """Replaces the process-wide estimator, e.g. to plug in a real tokenizer."""
+  global _default_estimator
+  _default_estimator = estimator
+
+
+def estimate_content_tokens(content: types.Content) -> int:
+  """Estimates the tokens of a content with the default estimator."""
+  return get_default_estimator().count_content(content)
+
+
+def estimate_contents_tokens(contents: Iterable[types.Content]) -> int:
+  """Estimates the tokens of contents with the default estimator."""
+  return get_default_estimator().count_contents(contents)
+
+
+def estimate_request_tokens(
+    llm_request: LlmRequest, contents_count: Optional[int] = None
+) -> int:
+  """Estimates the input tokens of a request with the default estimator."""
+  return get_default_estimator().count_request(llm_request, contents_count)
@@ -0,0 +1,83 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process fake of the Discovery Engine StreamAssist API.
+
+Use it with `GeminiEnterprise(client_factory=FakeAssistantServiceAsyncClient)`
+to test or benchmark the model without network access.
+"""
+
+import asyncio
+import itertools
+from typing import Any, AsyncIterator, Optional
+
+from google.cloud import discoveryengine_v1 as discoveryengine
+
+
+class FakeAssistantServiceAsyncClient:
+    """Streams canned answers and assigns a Discovery Engine session per call.
+
+    Attributes:
+        chunks: Text chunks streamed for every request.
+        chunk_delay: Seconds to sleep before each chunk, simulating latency.
+        requests: All received StreamAssistRequest objects.
+        instances: Number of clients created through the factory.
+    """
+
+    instances = 0
+
+    def __init__(
+        self,
+        credentials: Any = None,
+        chunks: Optional[list[str]] = None,
+        chunk_delay: float = 0.0,
+    ):
+        FakeAssistantServiceAsyncClient.instances += 1
+        self.credentials = credentials
+        self.chunks = chunks if chunks is not None else ['Hello', ' world']
+        self.chunk_delay = chunk_delay
+        self.requests: list[discoveryengine.StreamAssistRequest] = []
+        self._session_ids = itertools.count()
+
+    async def stream_assist(
+        self, request: discoveryengine.StreamAssistRequest
+    ) -> AsyncIterator[discoveryengine.StreamAssistResponse]:
+        self.requests.append(request)
+        session = request.session or (
+            f'{request.name}/sessions/fake-{next(self._session_ids)}'
+        )
+        return self._stream(session)
+
+    async def _stream(
+        self, session: str
+    ) -> AsyncIterator[discoveryengine.StreamAssistResponse]:
+        for chunk in self.chunks:
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            yield discoveryengine.StreamAssistResponse(
+                answer=discoveryengine.AssistAnswer(
+                    replies=[
+                        discoveryengine.AssistAnswer.Reply(
+                            grounded_content=discoveryengine.AssistantGroundedContent(
+                                content=discoveryengine.AssistantContent(
+                                    text=chunk
+                                )
+                            )
+                        )
+                    ]
+                ),
+                session_info=discoveryengine.StreamAssistResponse.SessionInfo(
+                    session=session
+                ),
+            )
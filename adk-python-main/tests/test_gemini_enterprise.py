@@ -1,9 +1,13 @@
+import asyncio
+import types as pytypes
+
 import pytest
-from unittest.mock import MagicMock, patch
 from google.adk.models.gemini_enterprise_llm import GeminiEnterprise
 from google.adk.models.llm_request import LlmRequest
 from google.genai import types
 
+from .gemini_enterprise_fakes import FakeAssistantServiceAsyncClient
+
 @pytest.mark.asyncio
 async def test_gemini_enterprise_initialization():
     model = GeminiEnterprise(project_id="test-project", engine_id="test-engine")
@@ -21,30 +25,158 @@ async def test_gemini_enterprise_generate_content_no_project():
 
 @pytest.mark.asyncio
 async def test_gemini_enterprise_generate_content_success():
-    model = GeminiEnterprise(project_id="p", engine_id="e")
+    clients = []
+
+    def _factory(credentials):
+        client = FakeAssistantServiceAsyncClient(credentials, chunks=["Mocked", " answer"])
+        clients.append(client)
+        return client
+
+    model = GeminiEnterprise(project_id="p", engine_id="e", client_factory=_factory)
     request = LlmRequest(contents=[types.Content(parts=[types.Part(text="hello")])])
-    
-    # Mock the AssistantServiceClient
-    with patch("google.cloud.discoveryengine_v1.AssistantServiceClient") as MockClient:
-        mock_client = MockClient.return_value
-        mock_client.assistant_path.return_value = "projects/p/locations/l/collections/c/engines/e/assistants/a"
-        
-        # Mock the stream_assist response
-        mock_response = MagicMock()
-        mock_response.answer.replies = [
-            MagicMock(grounded_content=MagicMock(content=MagicMock(text="Mocked answer")))
-        ]
-        mock_response.session_info.session = "mock-session-id"
-
-        mock_client.stream_assist.return_value = [mock_response]
-        
-        responses = []
-        async for resp in model.generate_content_async(request, stream=True):
-            responses.append(resp)
-            
-        assert len(responses) == 2 # 1 partial, 1 final
-        assert responses[0].content.parts[0].text == "Mocked answer"
-        assert responses[0].partial is True
-        assert responses[1].content.parts[0].text == "Mocked answer"
-        assert responses[1].partial is False
-        assert model._session_id == "mock-session-id"
\ No newline at end of file
+
+    responses = []
+    async for resp in model.generate_content_async(request, stream=True):
+        responses.append(resp)
+
+    assert len(responses) == 3 # 2 partial, 1 final
+    assert responses[0].content.parts[0].text == "Mocked"
+    assert responses[0].partial is True
+    assert responses[1].content.parts[0].text == " answer"
+    assert responses[2].content.parts[0].text == "Mocked answer"
+    assert responses[2].partial is False
+    session = responses[2].interaction_id
+    assert session.endswith("/sessions/fake-0")
+    assert clients[0].requests[0].query.text == "hello"
+
+@pytest.mark.asyncio
+async def test_gemini_enterprise_reuses_client_and_resumes_session():
+    clients = []
+
+    def _factory(credentials):
+        client = FakeAssistantServiceAsyncClient(credentials)
+        clients.append(client)
+        return client
+
+    model = GeminiEnterprise(project_id="p", engine_id="e", client_factory=_factory)
+
+    async def _final(previous_interaction_id=None):
+        request = LlmRequest(
+            contents=[types.Content(parts=[types.Part(text="hi")])],
+            previous_interaction_id=previous_interaction_id,
+        )
+        return [r async for r in model.generate_content_async(request)][-1]
+
+    first = await _final()
+    second = await _final(first.interaction_id)
+    other_session = await _final()
+
+    assert len(clients) == 1
+    assert clients[0].requests[1].session == first.interaction_id
+    assert second.interaction_id == first.interaction_id
+    assert other_session.interaction_id != first.interaction_id
+
+@pytest.mark.asyncio
+async def test_gemini_enterprise_streams_concurrently():
+    model = GeminiEnterprise(
+        project_id="p",
+        engine_id="e",
+        client_factory=lambda credentials: FakeAssistantServiceAsyncClient(
+            credentials, chunks=["a", "b", "c"], chunk_delay=0.05
+        ),
+    )
+
+    async def _run():
+        request = LlmRequest(contents=[types.Content(parts=[types.Part(text="hi")])])
+        return [r async for r in model.generate_content_async(request, stream=True)]
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await asyncio.gather(*[_run() for _ in range(10)])
+    elapsed = loop.time() - start
+
+    assert all(r[-1].content.parts[0].text == "abc" for r in results)
+    # Ten sequential streams would take 1.5s if the loop were blocked.
+    assert elapsed < 0.75
+
+@pytest.mark.asyncio
+async def test_gemini_enterprise_parses_tool_call():
+    model = GeminiEnterprise(
+        project_id="p",
+        engine_id="e",
+        client_factory=lambda credentials: FakeAssistantServiceAsyncClient(
+            credentials,
+            chunks=['```json\n{"tool": "get_weather", ', '"parameters": {"city": "NY"}}\n```'],
+        ),
+    )
+    request = LlmRequest(contents=[types.Content(parts=[types.Part(text="weather?")])])
+
+    responses = [r async for r in model.generate_content_async(request)]
+
+    function_call = responses[-1].content.parts[0].function_call
+    assert function_call.name == "get_weather"
+    assert function_call.args == {"city": "NY"}
+
+@pytest.mark.asyncio
+async def test_gemini_enterprise_session_scoped_to_adk_session():
+    from google.adk.agents.llm_agent import Agent
+    from google.adk.runners import InMemoryRunner
+
+    client = FakeAssistantServiceAsyncClient()
+    model = GeminiEnterprise(
+        project_id="p", engine_id="e", client_factory=lambda credentials: client
+    )
+    runner = InMemoryRunner(agent=Agent(name="assistant", model=model))
+
+    async def _turn(session_id):
+        async for _ in runner.run_async(
+            user_id="u",
+            session_id=session_id,
+            new_message=types.UserContent("hi"),
+        ):
+            pass
+
+    for session_id in ("s1", "s2"):
+        await runner.session_service.create_session(
+            app_name=runner.app_name, user_id="u", session_id=session_id
+        )
+    await _turn("s1")
+    await _turn("s2")
+    await _turn("s1")
+
+    sessions = [request.session for request in client.requests]
+    assert sessions[0] == "" and sessions[1] == ""
+    assert sessions[2].endswith("/sessions/fake-0")
+
+@pytest.mark.asyncio
+async def test_gemini_enterprise_shares_clients_per_access_token():
+    clients = []
+
+    def _factory(credentials):
+        client = FakeAssistantServiceAsyncClient(credentials)
+        clients.append(client)
+        return client
+
+    model = GeminiEnterprise(project_id="p", engine_id="e", client_factory=_factory)
+
+    async def _call(credentials):
+        request = LlmRequest(
+            contents=[types.Content(parts=[types.Part(text="hi")])],
+            credentials=credentials,
+        )
+        return [r async for r in model.generate_content_async(request)]
+
+    # A new credentials object per request, as built by auth callbacks.
+    await _call(pytypes.SimpleNamespace(token="token-a"))
+    await _call(pytypes.SimpleNamespace(token="token-a"))
+    await _call(pytypes.SimpleNamespace(token="token-b"))
+    unfetched = pytypes.SimpleNamespace(token=None)
+    await _call(unfetched)
+    await _call(unfetched)
+
+    assert len(clients) == 3
+
+def test_gemini_enterprise_reset_session_is_deprecated_no_op():
+    model = GeminiEnterprise(project_id="p", engine_id="e")
+    with pytest.warns(DeprecationWarning, match="reset_session"):
+        model.reset_session()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -24,6 +25,7 @@ from a2a.types import TextPart
 from google.adk.a2a.converters.request_converter import AgentRunRequest
 from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
 from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutorConfig
+from google.adk.cli.utils.runner_cache import RunnerCache
 from google.adk.events.event import Event
 from google.adk.runners import RunConfig
 from google.adk.runners import Runner
@@ -383,6 +385,61 @@ class TestA2aAgentExecutor:
     # Verify that self._runner is now the resolved Runner instance
     assert executor._runner is self.mock_runner
 
+  @pytest.mark.asyncio
+  async def test_execute_with_runner_evicted_from_cache(self):
+    """Test that a runner used from a cache is not closed while it runs."""
+    cache = RunnerCache(idle_ttl_seconds=0.01)
+    runners = []
+
+    async def create_runner():
+      runner = Mock(spec=Runner)
+      runner.app_name = "test-app"
+      runner.session_service = self.mock_runner.session_service
+      runner._new_invocation_context = Mock()
+      runner.close = AsyncMock()
+
+      async def run_async(**kwargs):
+        await asyncio.sleep(0.02)
+        await cache.evict_expired()
+        # Not evicted while the request runs.
+        assert not runner.close.called
+        yield Mock(spec=Event)
+
+      runner.run_async = run_async
+      runners.append(runner)
+      return runner
+
+    executor = A2aAgentExecutor(
+        runner=lambda: cache.use("test-app", create_runner),
+        config=self.mock_config,
+    )
+    self.mock_request_converter.return_value = AgentRunRequest(
+        user_id="test-user",
+        session_id="test-session",
+        new_message=Mock(spec=Content),
+        run_config=Mock(spec=RunConfig),
+    )
+    mock_session = Mock()
+    mock_session.id = "test-session"
+    self.mock_runner.session_service.get_session = AsyncMock(
+        return_value=mock_session
+    )
+    self.mock_event_converter.return_value = []
+
+    await executor.execute(self.mock_context, self.mock_event_queue)
+    # The idle runner expires once the request is done.
+    await asyncio.sleep(0.02)
+    await cache.evict_expired()
+    runners[0].close.assert_awaited_once()
+
+    # A later request runs on a new runner.
+    await executor.execute(self.mock_context, self.mock_event_queue)
+
+    assert len(runners) == 2
+    runners[1].close.assert_not_awaited()
+    for call in self.mock_event_queue.enqueue_event.call_args_list:
+      assert call[0][0].status.state != TaskState.failed
+
   @pytest.mark.asyncio
   async def test_execute_with_sync_callable_runner(self):
     """Test execution with sync callable runner."""
@@ -627,3 +627,36 @@ class TestGeminiContextCacheManager:
     assert result.cache_name is None
     assert result.fingerprint == "test_fp"
     self.manager.genai_client.aio.caches.create.assert_not_called()
+
+  async def test_cache_creation_from_estimate_without_token_count(self):
+    """Test that the first cacheable request sizes the cache by estimate."""
+    mock_cached_content = AsyncMock()
+    mock_cached_content.name = (
+        "projects/test/locations/us-central1/cachedContents/estimated"
+    )
+    self.manager.genai_client.aio.caches.create = AsyncMock(
+        return_value=mock_cached_content
+    )
+
+    def _request(min_tokens, cache_metadata=None):
+      # Three contents of 4000 characters: 3000 tokens at 4 chars per token.
+      llm_request = self.create_llm_request(cache_metadata=cache_metadata)
+      for content in llm_request.contents:
+        content.parts[0].text = "x" * 4000
+      llm_request.cache_config = ContextCacheConfig(
+          cache_intervals=10, ttl_seconds=1800, min_tokens=min_tokens
+      )
+      return llm_request
+
+    for min_tokens, creates_cache in [(4000, False), (3000, True)]:
+      fingerprint_only = await self.manager.handle_context_caching(
+          _request(min_tokens)
+      )
+      assert fingerprint_only.cache_name is None
+      llm_request = _request(min_tokens, cache_metadata=fingerprint_only)
+      assert llm_request.cacheable_contents_token_count is None
+
+      result = await self.manager.handle_context_caching(llm_request)
+
+      assert (result.cache_name is not None) == creates_cache
+    self.manager.genai_client.aio.caches.create.assert_called_once()
@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from google.adk.agents.live_request_queue import LiveQueueOverflowPolicy
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
 from google.genai import types
@@ -54,3 +55,58 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+def _audio(data: bytes) -> types.Blob:
+  return types.Blob(mime_type="audio/pcm;rate=16000", data=data)
+
+
+async def _drain(queue: LiveRequestQueue, count: int) -> list[LiveRequest]:
+  return [await queue.get() for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_oldest_blobs():
+  queue = LiveRequestQueue(max_size=2)
+
+  queue.send_realtime(_audio(b"1"))
+  queue.send_realtime(_audio(b"2"))
+  queue.send_realtime(_audio(b"3"))
+  queue.close()  # Never dropped, even beyond the bound.
+
+  requests = await _drain(queue, 3)
+  assert [r.blob.data for r in requests[:2]] == [b"2", b"3"]
+  assert requests[2].close
+  assert queue.dropped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_drops_newest_blobs():
+  queue = LiveRequestQueue(
+      max_size=1, overflow_policy=LiveQueueOverflowPolicy.DROP_NEWEST
+  )
+
+  queue.send_realtime(_audio(b"1"))
+  queue.send_realtime(_audio(b"2"))
+
+  assert [r.blob.data for r in await _drain(queue, 1)] == [b"1"]
+  assert queue.dropped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_coalesces_blobs():
+  queue = LiveRequestQueue(
+      max_size=2, overflow_policy=LiveQueueOverflowPolicy.COALESCE
+  )
+  frame_1 = types.Blob(mime_type="image/jpeg", data=b"frame_1")
+  frame_2 = types.Blob(mime_type="image/jpeg", data=b"frame_2")
+
+  queue.send_realtime(_audio(b"1"))
+  queue.send_realtime(frame_1)
+  queue.send_realtime(_audio(b"2"))
+  queue.send_realtime(frame_2)
+
+  requests = await _drain(queue, 2)
+  # Audio is appended, while the latest video frame replaces the queued one.
+  assert [r.blob.data for r in requests] == [b"12", b"frame_2"]
+  assert queue.dropped_count == 0
@@ -106,6 +106,40 @@ class TestCompaction(unittest.IsolatedAsyncioTestCase):
     self.mock_compactor.maybe_summarize_events.assert_not_called()
     self.mock_session_service.append_event.assert_not_called()
 
+  async def test_run_compaction_for_sliding_window_token_threshold(self):
+    app = App(
+        name='test',
+        root_agent=Mock(spec=BaseAgent),
+        events_compaction_config=EventsCompactionConfig(
+            summarizer=self.mock_compactor,
+            compaction_interval=3,
+            overlap_size=1,
+            token_threshold=10,
+        ),
+    )
+    # Two invocations are below compaction_interval=3, but their estimated
+    # tokens exceed token_threshold=10.
+    events = [
+        self._create_event(1.0, 'inv1', 'e' * 40),
+        self._create_event(2.0, 'inv2', 'e' * 40),
+    ]
+    session = Session(app_name='test', user_id='u1', id='s1', events=events)
+    mock_compacted_event = self._create_compacted_event(1.0, 2.0, 'Summary')
+    self.mock_compactor.maybe_summarize_events.return_value = (
+        mock_compacted_event
+    )
+
+    await _run_compaction_for_sliding_window(
+        app, session, self.mock_session_service
+    )
+
+    self.mock_compactor.maybe_summarize_events.assert_called_once_with(
+        events=events
+    )
+    self.mock_session_service.append_event.assert_called_once_with(
+        session=session, event=mock_compacted_event
+    )
+
   async def test_run_compaction_for_sliding_window_first_compaction(self):
     app = App(
         name='test',
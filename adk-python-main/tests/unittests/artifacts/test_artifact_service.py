@@ -18,8 +18,12 @@
 
 from datetime import datetime
 import enum
+import errno
+import hashlib
 import json
+import os
 from pathlib import Path
+import shutil
 from typing import Any
 from typing import Optional
 from typing import Union
@@ -87,9 +91,31 @@ class MockBlob:
     if content_type:
       self.content_type = content_type
 
-  def download_as_bytes(self) -> bytes:
+  def upload_from_file(
+      self,
+      file_obj: Any,
+      rewind: bool = False,
+      content_type: Optional[str] = None,
+  ) -> None:
+    """Mocks uploading data to the blob from a file object."""
+    if rewind:
+      file_obj.seek(0)
+    self.upload_from_string(file_obj.read(), content_type=content_type)
+
+  @property
+  def size(self) -> Optional[int]:
+    """Mocks the size of the blob's content."""
+    return None if self.content is None else len(self.content)
+
+  def download_as_bytes(
+      self, start: Optional[int] = None, end: Optional[int] = None
+  ) -> bytes:
     """Mocks downloading the blob's content as bytes.
 
+    Args:
+        start: The first byte to download, if not the first of the blob.
+        end: The last byte to download, inclusive, if not the last of the blob.
+
     Returns:
         bytes: The content of the blob as bytes.
 
@@ -98,7 +124,7 @@ class MockBlob:
     """
     if self.content is None:
       return b""
-    return self.content
+    return self.content[start or 0 : None if end is None else end + 1]
 
   def delete(self) -> None:
     """Mocks deleting a blob."""
@@ -597,6 +623,102 @@ async def test_get_artifact_version_out_of_index(
   )
 
 
+async def _chunks(*chunks: bytes):
+  for chunk in chunks:
+    yield chunk
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
+)
+async def test_save_artifact_stream_and_read_ranges(
+    service_type, artifact_service_factory
+):
+  """Tests streamed saves and byte-range reads."""
+  artifact_service = artifact_service_factory(service_type)
+  version = await artifact_service.save_artifact_stream(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="recording.wav",
+      chunks=_chunks(b"0123", b"4567", b"89"),
+      mime_type="audio/wav",
+      custom_metadata={"source": "mic"},
+  )
+  assert version == 0
+
+  loaded = await artifact_service.load_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="recording.wav",
+  )
+  assert loaded.inline_data.data == b"0123456789"
+  assert loaded.inline_data.mime_type == "audio/wav"
+
+  reader = await artifact_service.open_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="recording.wav",
+  )
+  async with reader:
+    assert reader.size == 10
+    assert reader.mime_type == "audio/wav"
+    assert await reader.read(3, 4) == b"3456"
+    assert await reader.read(8) == b"89"
+    assert await reader.read(20) == b""
+    assert [
+        chunk async for chunk in reader.iter_chunks(1, 8, chunk_size=3)
+    ] == [b"123", b"456", b"78"]
+    with pytest.raises(ValueError):
+      await reader.read(-1)
+
+  assert (
+      await artifact_service.open_artifact(
+          app_name="app0",
+          user_id="user0",
+          session_id="123",
+          filename="missing.wav",
+      )
+      is None
+  )
+
+
+@pytest.mark.asyncio
+async def test_file_open_text_and_empty_artifacts(artifact_service_factory):
+  """FileArtifactService reads text as UTF-8 and handles empty payloads."""
+  artifact_service = artifact_service_factory(ArtifactServiceType.FILE)
+  for filename, artifact in [
+      ("notes.txt", types.Part(text="héllo")),
+      ("empty.bin", types.Part.from_bytes(data=b"", mime_type="x/y")),
+  ]:
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename=filename,
+        artifact=artifact,
+    )
+
+  async with await artifact_service.open_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="notes.txt"
+  ) as reader:
+    assert reader.mime_type is None
+    assert (await reader.read()).decode("utf-8") == "héllo"
+  async with await artifact_service.open_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="empty.bin"
+  ) as reader:
+    assert reader.size == 0
+    assert [chunk async for chunk in reader.iter_chunks()] == []
+
+
 @pytest.mark.asyncio
 async def test_file_metadata_camelcase(tmp_path, artifact_service_factory):
   """Ensures FileArtifactService writes camelCase metadata without newlines."""
@@ -640,6 +762,7 @@ async def test_file_metadata_camelcase(tmp_path, artifact_service_factory):
       "canonicalUri": expected_canonical_uri,
       "version": 0,
       "customMetadata": {},
+      "contentHash": hashlib.sha256(b"binary-content").hexdigest(),
   }
   parsed_canonical = urlparse(metadata["canonicalUri"])
   canonical_path = Path(unquote(parsed_canonical.path))
@@ -717,6 +840,319 @@ async def test_file_list_artifact_versions(tmp_path, artifact_service_factory):
   assert latest.custom_metadata == version_meta.custom_metadata
 
 
+@pytest.mark.asyncio
+async def test_file_deduplicates_identical_payloads(tmp_path):
+  """Identical payloads share one blob, which is removed with its last use."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  artifact = types.Part.from_bytes(data=b"same-bytes", mime_type="image/png")
+  for session_id in ["sess1", "sess2"]:
+    for _ in range(2):
+      await artifact_service.save_artifact(
+          app_name="myapp",
+          user_id="user123",
+          session_id=session_id,
+          filename="image.png",
+          artifact=artifact,
+      )
+  await artifact_service.save_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="notes.txt",
+      artifact=types.Part(text="same-bytes"),
+  )
+
+  digest = hashlib.sha256(b"same-bytes").hexdigest()
+  blob_path = tmp_path / "artifacts" / "blobs" / "sha256" / digest[:2] / digest
+  blobs = [
+      path
+      for path in (tmp_path / "artifacts" / "blobs").rglob("*")
+      if path.is_file()
+  ]
+  assert blobs == [blob_path]
+  assert blob_path.stat().st_nlink == 6
+
+  version = await artifact_service.get_artifact_version(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess2",
+      filename="image.png",
+  )
+  payload_path = Path(unquote(urlparse(version.canonical_uri).path))
+  assert payload_path.samefile(blob_path)
+  loaded = await artifact_service.load_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="notes.txt",
+  )
+  assert loaded.text == "same-bytes"
+
+  for session_id, filename in [
+      ("sess1", "image.png"),
+      ("sess2", "image.png"),
+  ]:
+    await artifact_service.delete_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id=session_id,
+        filename=filename,
+    )
+  assert blob_path.exists()
+  await artifact_service.delete_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="notes.txt",
+  )
+  assert not blob_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_file_save_copies_payload_without_hard_links(tmp_path):
+  """Payloads are still saved on filesystems without hard links."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  with patch(
+      "os.link", side_effect=PermissionError(errno.EPERM, "not supported")
+  ):
+    await artifact_service.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename="notes.txt",
+        artifact=types.Part(text="hello"),
+    )
+
+  loaded = await artifact_service.load_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="notes.txt",
+  )
+  assert loaded.text == "hello"
+
+
+@pytest.mark.asyncio
+async def test_file_save_propagates_other_link_errors(tmp_path):
+  """Only missing hard link support falls back to moving the shared blob."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  with patch("os.link", side_effect=FileExistsError(errno.EEXIST, "exists")):
+    with pytest.raises(FileExistsError):
+      await artifact_service.save_artifact(
+          app_name="myapp",
+          user_id="user123",
+          session_id="sess1",
+          filename="notes.txt",
+          artifact=types.Part(text="hello"),
+      )
+
+  digest = hashlib.sha256(b"hello").hexdigest()
+  blob_path = tmp_path / "artifacts" / "blobs" / "sha256" / digest[:2] / digest
+  assert blob_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_file_saved_files_use_default_permissions(tmp_path):
+  """Files get the mode `open()` would give them under the current umask."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+
+  async def _chunks():
+    yield b"streamed"
+
+  umask = os.umask(0o027)
+  try:
+    await artifact_service.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename="notes.txt",
+        artifact=types.Part(text="hello"),
+    )
+    await artifact_service.save_artifact_stream(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename="stream.bin",
+        chunks=_chunks(),
+        mime_type="application/octet-stream",
+    )
+  finally:
+    os.umask(umask)
+
+  files = [
+      path for path in (tmp_path / "artifacts").rglob("*") if path.is_file()
+  ]
+  # 2 payloads, 2 metadata files, 2 blobs and the session scope's manifest.
+  assert len(files) == 7
+  assert {path.stat().st_mode & 0o777 for path in files} == {0o640}
+
+
+@pytest.mark.asyncio
+async def test_file_lookups_read_the_manifest_not_the_tree(tmp_path):
+  """Listing and loading do not walk the artifact directories."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  for filename, text in [
+      ("a.txt", "a0"),
+      ("a.txt", "a1"),
+      ("user:b.txt", "b0"),
+  ]:
+    await artifact_service.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename=filename,
+        artifact=types.Part(text=text),
+    )
+
+  with (
+      patch(
+          "google.adk.artifacts.file_artifact_service._iter_artifact_dirs",
+          side_effect=AssertionError("walked the tree"),
+      ),
+      patch(
+          "google.adk.artifacts.file_artifact_service._list_versions_on_disk",
+          side_effect=AssertionError("listed versions on disk"),
+      ),
+  ):
+    assert await artifact_service.list_artifact_keys(
+        app_name="myapp", user_id="user123", session_id="sess1"
+    ) == ["a.txt", "user:b.txt"]
+    assert await artifact_service.list_versions(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename="a.txt",
+    ) == [0, 1]
+    loaded = await artifact_service.load_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename="a.txt",
+    )
+    version = await artifact_service.get_artifact_version(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename="a.txt",
+        version=0,
+    )
+  assert loaded.text == "a1"
+  assert version.version == 0
+
+  manifest = json.loads(
+      (
+          tmp_path
+          / "artifacts"
+          / "users"
+          / "user123"
+          / "sessions"
+          / "sess1"
+          / "artifacts.manifest.json"
+      ).read_text()
+  )
+  assert list(manifest["artifacts"]["a.txt"]) == ["0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_file_manifest_is_built_for_existing_trees(tmp_path):
+  """Trees written before manifests existed are indexed on first use."""
+  root_dir = tmp_path / "artifacts"
+  await FileArtifactService(root_dir=root_dir).save_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="a.txt",
+      artifact=types.Part(text="a0"),
+  )
+  for manifest_path in root_dir.rglob("*.manifest.json"):
+    manifest_path.unlink()
+
+  artifact_service = FileArtifactService(root_dir=root_dir)
+  assert await artifact_service.list_artifact_keys(
+      app_name="myapp", user_id="user123", session_id="sess1"
+  ) == ["a.txt"]
+  await artifact_service.save_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="a.txt",
+      artifact=types.Part(text="a1"),
+  )
+  assert await artifact_service.list_versions(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="a.txt",
+  ) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_file_rebuild_index_picks_up_external_changes(tmp_path):
+  """`rebuild_index` re-reads the tree after it was modified directly."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  for filename in ["a.txt", "user:b.txt"]:
+    await artifact_service.save_artifact(
+        app_name="myapp",
+        user_id="user123",
+        session_id="sess1",
+        filename=filename,
+        artifact=types.Part(text="content"),
+    )
+  session_root = (
+      tmp_path / "artifacts" / "users" / "user123" / "sessions" / "sess1"
+  )
+  shutil.rmtree(session_root / "artifacts" / "a.txt")
+
+  assert await artifact_service.list_artifact_keys(
+      app_name="myapp", user_id="user123", session_id="sess1"
+  ) == ["a.txt", "user:b.txt"]
+  assert await artifact_service.rebuild_index() == 2
+  assert await artifact_service.list_artifact_keys(
+      app_name="myapp", user_id="user123", session_id="sess1"
+  ) == ["user:b.txt"]
+
+
+@pytest.mark.asyncio
+async def test_file_save_skips_versions_missing_from_the_manifest(tmp_path):
+  """A version directory the manifest does not know of is not overwritten."""
+  artifact_service = FileArtifactService(root_dir=tmp_path / "artifacts")
+  await artifact_service.save_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="a.txt",
+      artifact=types.Part(text="a0"),
+  )
+  versions_dir = (
+      tmp_path
+      / "artifacts"
+      / "users"
+      / "user123"
+      / "sessions"
+      / "sess1"
+      / "artifacts"
+      / "a.txt"
+      / "versions"
+  )
+  (versions_dir / "1").mkdir()
+
+  version = await artifact_service.save_artifact(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="a.txt",
+      artifact=types.Part(text="a2"),
+  )
+
+  assert version == 2
+  assert await artifact_service.list_versions(
+      app_name="myapp",
+      user_id="user123",
+      session_id="sess1",
+      filename="a.txt",
+  ) == [0, 2]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("filename", "session_id"),
@@ -0,0 +1,215 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from unittest import mock
+
+from google.adk.artifacts.caching_artifact_service import CachingArtifactService
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.genai import types
+from pydantic import Field
+import pytest
+
+APP_NAME = 'test-app'
+USER_ID = 'test-user'
+SESSION_ID = 'test-session'
+
+
+class _CountingArtifactService(InMemoryArtifactService):
+  loads: list[tuple[str, Optional[int]]] = Field(default_factory=list)
+
+  async def load_artifact(self, *, filename, version=None, **kwargs):
+    self.loads.append((filename, version))
+    return await super().load_artifact(
+        filename=filename, version=version, **kwargs
+    )
+
+
+async def _save(service, filename, data: bytes) -> int:
+  return await service.save_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename=filename,
+      artifact=types.Part.from_bytes(data=data, mime_type='text/plain'),
+  )
+
+
+async def _load(service, filename, version=None):
+  artifact = await service.load_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename=filename,
+      version=version,
+  )
+  return artifact.inline_data.data if artifact else None
+
+
+@pytest.mark.asyncio
+async def test_versions_are_cached_and_latest_expires():
+  artifact_service = _CountingArtifactService()
+  caching_service = CachingArtifactService(
+      artifact_service, latest_ttl_seconds=10
+  )
+  await _save(caching_service, 'a.txt', b'v0')
+
+  with mock.patch('time.monotonic', return_value=100.0):
+    assert await _load(caching_service, 'a.txt', 0) == b'v0'
+    assert await _load(caching_service, 'a.txt', 0) == b'v0'
+    assert await _load(caching_service, 'a.txt') == b'v0'
+    assert await _load(caching_service, 'a.txt') == b'v0'
+  # Saved by another process, so only seen once the latest version expires.
+  await _save(artifact_service, 'a.txt', b'v1')
+  with mock.patch('time.monotonic', return_value=105.0):
+    assert await _load(caching_service, 'a.txt') == b'v0'
+  with mock.patch('time.monotonic', return_value=111.0):
+    assert await _load(caching_service, 'a.txt') == b'v1'
+    assert await _load(caching_service, 'a.txt', 0) == b'v0'
+
+  assert artifact_service.loads == [
+      ('a.txt', 0),
+      ('a.txt', None),
+      ('a.txt', None),
+  ]
+  assert (caching_service.hits, caching_service.misses) == (4, 3)
+
+
+@pytest.mark.asyncio
+async def test_writes_through_the_service_invalidate():
+  artifact_service = _CountingArtifactService()
+  caching_service = CachingArtifactService(artifact_service)
+  await _save(caching_service, 'a.txt', b'v0')
+  assert await _load(caching_service, 'a.txt') == b'v0'
+
+  await _save(caching_service, 'a.txt', b'v1')
+  assert await _load(caching_service, 'a.txt') == b'v1'
+
+  await caching_service.delete_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename='a.txt',
+  )
+  assert await _load(caching_service, 'a.txt') is None
+  assert await _load(caching_service, 'a.txt', 0) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_artifacts_are_copies():
+  caching_service = CachingArtifactService(InMemoryArtifactService())
+  await caching_service.save_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename='a.txt',
+      artifact=types.Part(text='hello'),
+  )
+
+  loaded = await caching_service.load_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename='a.txt',
+      version=0,
+  )
+  loaded.text = 'changed'
+  reloaded = await caching_service.load_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename='a.txt',
+      version=0,
+  )
+
+  assert reloaded.text == 'hello'
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_is_bounded_by_bytes():
+  artifact_service = _CountingArtifactService()
+  caching_service = CachingArtifactService(artifact_service, max_bytes=8)
+  for filename, size in [('a', 4), ('b', 4), ('c', 4), ('big', 20)]:
+    await _save(caching_service, filename, b'x' * size)
+
+  for filename in ['a', 'b', 'a', 'c', 'a', 'b', 'big', 'big']:
+    await _load(caching_service, filename, 0)
+
+  assert artifact_service.loads == [
+      ('a', 0),
+      ('b', 0),
+      ('c', 0),
+      ('b', 0),
+      ('big', 0),
+      ('big', 0),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_outlives_the_service(tmp_path):
+  artifact_service = _CountingArtifactService()
+  await _save(artifact_service, 'a.txt', b'v0')
+  caching_service = CachingArtifactService(
+      artifact_service, disk_cache_dir=tmp_path
+  )
+  assert await _load(caching_service, 'a.txt', 0) == b'v0'
+
+  caching_service = CachingArtifactService(
+      artifact_service, disk_cache_dir=tmp_path
+  )
+  assert await _load(caching_service, 'a.txt', 0) == b'v0'
+  assert artifact_service.loads == [('a.txt', 0)]
+
+  await caching_service.delete_artifact(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      session_id=SESSION_ID,
+      filename='a.txt',
+  )
+  assert not list(tmp_path.rglob('*.json'))
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_is_bounded_by_bytes(tmp_path):
+  artifact_service = _CountingArtifactService()
+  for filename in ['a', 'b', 'c']:
+    await _save(artifact_service, filename, b'x' * 100)
+  caching_service = CachingArtifactService(
+      artifact_service, max_bytes=1, disk_cache_dir=tmp_path
+  )
+  entry_size = None
+  for filename in ['a', 'b']:
+    await _load(caching_service, filename, 0)
+    entry_size = entry_size or sum(
+        path.stat().st_size for path in tmp_path.rglob('*.json')
+    )
+
+  caching_service = CachingArtifactService(
+      artifact_service,
+      max_bytes=1,
+      disk_cache_dir=tmp_path,
+      max_disk_bytes=2 * entry_size,
+  )
+  await _load(caching_service, 'a', 0)
+  await _load(caching_service, 'c', 0)
+  await _load(caching_service, 'a', 0)
+  await _load(caching_service, 'b', 0)
+
+  assert artifact_service.loads == [
+      ('a', 0),
+      ('b', 0),
+      ('c', 0),
+      ('b', 0),
+  ]
+  assert len(list(tmp_path.rglob('*.json'))) == 2
@@ -32,8 +32,12 @@ from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.run_config import RunConfig
 from google.adk.apps.app import App
 from google.adk.artifacts.base_artifact_service import ArtifactVersion
+from google.adk.artifacts.base_artifact_service import BytesArtifactReader
 from google.adk.cli import fast_api as fast_api_module
+from google.adk.cli.adk_web_server import AdkWebServer
 from google.adk.cli.fast_api import get_fast_api_app
+from google.adk.cli.utils.admission import AdmissionController
+from google.adk.cli.utils.admission import AdmissionRejectedError
 from google.adk.errors.input_validation_error import InputValidationError
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_case import Invocation
@@ -131,6 +135,7 @@ async def dummy_run_async(
     state_delta=None,
     run_config: Optional[RunConfig] = None,
     invocation_id: Optional[str] = None,
+    session: Optional[Session] = None,
 ):
   run_config = run_config or RunConfig()
   yield _event_1()
@@ -322,6 +327,21 @@ def mock_artifact_service():
         return []
       return [entry["version"] for entry in artifacts[key]]
 
+    async def open_artifact(
+        self, *, app_name, user_id, filename, session_id=None, version=None
+    ):
+      """Open an artifact payload for ranged reads."""
+      artifact = await self.load_artifact(
+          app_name, user_id, session_id, filename, version
+      )
+      if artifact is None:
+        return None
+      if artifact.inline_data is not None:
+        return BytesArtifactReader(
+            artifact.inline_data.data, artifact.inline_data.mime_type
+        )
+      return BytesArtifactReader(artifact.text.encode("utf-8"), None)
+
     async def delete_artifact(self, app_name, user_id, session_id, filename):
       """Delete an artifact."""
       key = _artifact_key(app_name, user_id, session_id, filename)
@@ -407,6 +427,7 @@ def mock_eval_set_results_manager():
 
 @pytest.fixture
 def test_app(
+    request,
     mock_session_service,
     mock_artifact_service,
     mock_memory_service,
@@ -414,7 +435,11 @@ def test_app(
     mock_eval_sets_manager,
     mock_eval_set_results_manager,
 ):
-  """Create a TestClient for the FastAPI app without starting a server."""
+  """Create a TestClient for the FastAPI app without starting a server.
+
+  Tests can pass extra arguments of `get_fast_api_app` by parametrizing the
+  fixture indirectly.
+  """
 
   # Patch multiple services and signal handlers
   with (
@@ -467,6 +492,7 @@ def test_app(
         a2a=False,  # Disable A2A for most tests
         host="127.0.0.1",
         port=8000,
+        **getattr(request, "param", {}),
     )
 
     # Create a TestClient that doesn't start a real server
@@ -720,6 +746,28 @@ def test_list_apps(test_app):
   logger.info(f"Listed apps: {data}")
 
 
+def test_metrics_endpoint(test_app):
+  """Test that the metrics are served in the Prometheus text format."""
+  response = test_app.get("/metrics")
+
+  assert response.status_code == 200
+  assert response.headers["content-type"].startswith("text/plain")
+  for line in response.text.splitlines():
+    assert line.startswith("# ") or line.startswith("adk_")
+
+
+@pytest.mark.parametrize(
+    "test_app",
+    [{"workers": 2, "trace_spill_path": ":memory:"}],
+    indirect=True,
+)
+def test_metrics_endpoint_is_not_served_by_workers(test_app):
+  """Test that the workers of a multi-process server do not serve metrics."""
+  response = test_app.get("/metrics")
+
+  assert response.status_code == 501
+
+
 def test_list_apps_detailed(test_app):
   """Test listing available applications with detailed metadata."""
   response = test_app.get("/list-apps?detailed=true")
@@ -802,6 +850,121 @@ def test_get_session(test_app, create_test_session):
   logger.info(f"Retrieved session: {data['id']}")
 
 
+@pytest.fixture
+async def create_test_session_with_events(
+    create_test_session, mock_session_service
+):
+  """Add a text event and an audio event to the test session."""
+  info = create_test_session
+  session = await mock_session_service.get_session(
+      app_name=info["app_name"],
+      user_id=info["user_id"],
+      session_id=info["session_id"],
+  )
+  for event_id, part in (
+      ("text_event", types.Part(text="hello " * 400)),
+      (
+          "audio_event",
+          types.Part.from_bytes(data=b"audio", mime_type="audio/pcm"),
+      ),
+  ):
+    await mock_session_service.append_event(
+        session,
+        Event(
+            id=event_id,
+            author="dummy agent",
+            content=types.Content(role="model", parts=[part]),
+        ),
+    )
+  return info
+
+
+def test_get_session_with_projection_paging_and_compression(
+    test_app, create_test_session_with_events
+):
+  """Test getting a subset of the events of a session, compressed."""
+  info = create_test_session_with_events
+  url = f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/{info['session_id']}"
+
+  response = test_app.get(
+      url,
+      params={"fields": "id,author", "event_limit": 1},
+      headers={"Accept-Encoding": "gzip"},
+  )
+  assert response.status_code == 200
+  assert response.headers["X-Total-Events"] == "2"
+  assert response.json()["events"] == [
+      {"id": "text_event", "author": "dummy agent"}
+  ]
+
+  response = test_app.get(url, headers={"Accept-Encoding": "gzip"})
+  assert response.headers["Content-Encoding"] == "gzip"
+  assert len(response.json()["events"]) == 2
+
+  response = test_app.get(
+      url,
+      params={"event_offset": 1, "exclude_blobs": True, "fields": "content"},
+  )
+  part = response.json()["events"][0]["content"]["parts"][0]
+  assert "inlineData" not in part
+  assert part["fileData"]["mimeType"] == "audio/pcm"
+  blob_response = test_app.get(part["fileData"]["fileUri"])
+  assert blob_response.content == b"audio"
+  assert blob_response.headers["Content-Type"] == "audio/pcm"
+
+  assert test_app.get(url, params={"fields": "unknown"}).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_session_escapes_blob_urls(test_app, mock_session_service):
+  """Test that the ids in the blob URLs of a session are escaped."""
+  session = await mock_session_service.create_session(
+      app_name="test_app", user_id="test user", session_id="s 1?x#y"
+  )
+  for event_id in ("e 1#x", "e/2"):
+    await mock_session_service.append_event(
+        session,
+        Event(
+            id=event_id,
+            author="dummy agent",
+            content=types.Content(
+                role="model",
+                parts=[
+                    types.Part.from_bytes(data=b"audio", mime_type="audio/pcm")
+                ],
+            ),
+        ),
+    )
+
+  response = test_app.get(
+      "/apps/test_app/users/test%20user/sessions/s%201%3Fx%23y",
+      params={"exclude_blobs": True},
+  )
+
+  uris = [
+      event["content"]["parts"][0]["fileData"]["fileUri"]
+      for event in response.json()["events"]
+  ]
+  prefix = "/apps/test_app/users/test%20user/sessions/s%201%3Fx%23y/events"
+  assert uris == [
+      f"{prefix}/e%201%23x/parts/0/blob",
+      f"{prefix}/e%2F2/parts/0/blob",
+  ]
+  assert test_app.get(uris[0]).content == b"audio"
+
+
+def test_get_session_documents_the_projected_session(test_app):
+  """Test that the OpenAPI schema does not promise a full session."""
+  operation = test_app.get("/openapi.json").json()["paths"][
+      "/apps/{app_name}/users/{user_id}/sessions/{session_id}"
+  ]["get"]
+  schema = operation["responses"]["200"]["content"]["application/json"][
+      "schema"
+  ]
+
+  assert schema["properties"]["events"]["items"] == {"type": "object"}
+
+
 def test_list_sessions(test_app, create_test_session):
   """Test listing all sessions for a user."""
   info = create_test_session
@@ -904,6 +1067,95 @@ def test_patch_session_not_found(test_app, test_session_info):
   logger.info("Patch session not found test passed")
 
 
+@pytest.mark.parametrize(
+    "test_app", [{"max_concurrent_invocations": 1}], indirect=True
+)
+def test_agent_run_with_admission_control(test_app, create_test_session):
+  """Test that runs are admitted, and rejected with a Retry-After header."""
+  info = create_test_session
+  payload = {
+      "app_name": info["app_name"],
+      "user_id": info["user_id"],
+      "session_id": info["session_id"],
+      "new_message": {"role": "user", "parts": [{"text": "Hello agent"}]},
+  }
+
+  # The slot of each run is released once it is done.
+  assert test_app.post("/run", json=payload).status_code == 200
+  assert test_app.post("/run", json=payload).status_code == 200
+
+  with patch.object(
+      AdmissionController,
+      "acquire",
+      autospec=True,
+      side_effect=AdmissionRejectedError(
+          "Too many invocations.", status_code=429, retry_after=3
+      ),
+  ):
+    response = test_app.post("/run", json=payload)
+    sse_response = test_app.post("/run_sse", json=payload)
+
+  assert response.status_code == 429
+  assert response.headers["Retry-After"] == "3"
+  assert sse_response.status_code == 429
+
+
+@pytest.mark.parametrize(
+    "test_app", [{"prewarm_apps": ["test_app"]}], indirect=True
+)
+def test_agent_run_with_prewarmed_runner(
+    test_app, create_test_session, monkeypatch
+):
+  """Test that prewarmed runners are created at startup, and only then."""
+  info = create_test_session
+  created_runners = []
+  create_runner = AdkWebServer._create_runner
+
+  def create_runner_spy(self, agentic_app):
+    created_runners.append(agentic_app.name)
+    return create_runner(self, agentic_app)
+
+  monkeypatch.setattr(AdkWebServer, "_create_runner", create_runner_spy)
+  payload = {
+      "app_name": info["app_name"],
+      "user_id": info["user_id"],
+      "session_id": info["session_id"],
+      "new_message": {"role": "user", "parts": [{"text": "Hello agent"}]},
+  }
+
+  with test_app:  # Runs the lifespan of the app.
+    assert created_runners == ["test_app"]
+    assert test_app.post("/run", json=payload).status_code == 200
+
+  assert created_runners == ["test_app"]
+
+
+def test_agent_run_live_with_binary_audio(
+    test_app, create_test_session, monkeypatch
+):
+  """Test that /run_live exchanges audio as binary websocket frames."""
+  info = create_test_session
+
+  async def run_live_echo(self, *, session, live_request_queue, run_config):
+    request = await live_request_queue.get()
+    yield Event(
+        author="dummy agent",
+        content=types.Content(
+            role="model", parts=[types.Part(inline_data=request.blob)]
+        ),
+    )
+
+  monkeypatch.setattr(Runner, "run_live", run_live_echo)
+  url = (
+      f"/run_live?app_name={info['app_name']}&user_id={info['user_id']}"
+      f"&session_id={info['session_id']}&binary_audio=true"
+  )
+
+  with test_app.websocket_connect(url) as websocket:
+    websocket.send_bytes(b"audio")
+    assert websocket.receive_bytes() == b"audio"
+
+
 def test_agent_run(test_app, create_test_session):
   """Test running an agent with a message."""
   info = create_test_session
@@ -968,6 +1220,7 @@ def test_agent_run_sse_splits_artifact_delta(
 ):
   """Test /run_sse splits artifact deltas to avoid double-rendering in web."""
   info = create_test_session
+  preloaded_sessions = []
 
   async def run_async_with_artifact_delta(
       self,
@@ -978,8 +1231,10 @@ def test_agent_run_sse_splits_artifact_delta(
       new_message: Optional[types.Content] = None,
       state_delta: Optional[dict[str, Any]] = None,
       run_config: Optional[RunConfig] = None,
+      session: Optional[Session] = None,
   ):
     del user_id, session_id, invocation_id, new_message, state_delta, run_config
+    preloaded_sessions.append(session)
     yield Event(
         author="dummy agent",
         invocation_id="invocation_id",
@@ -1018,6 +1273,9 @@ def test_agent_run_sse_splits_artifact_delta(
   assert "content" not in sse_events[1]
   assert sse_events[1]["actions"]["artifactDelta"] == {"artifact.txt": 0}
 
+  # The runner reuses the session loaded by the endpoint.
+  assert [s.id for s in preloaded_sessions] == [info["session_id"]]
+
 
 def test_list_artifact_names(test_app, create_test_session):
   """Test listing artifact names for a session."""
@@ -1113,6 +1371,51 @@ def test_save_artifact_returns_500_on_unexpected_error(
   assert response.json()["detail"] == "unexpected failure"
 
 
+def test_download_artifact_streams_payload_and_ranges(
+    test_app, create_test_session, mock_artifact_service
+):
+  """Test downloading raw artifact bytes, whole and by byte range."""
+  info = create_test_session
+  url = (
+      f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/"
+      f"{info['session_id']}/artifacts"
+  )
+  payload = {
+      "filename": "clip.wav",
+      "artifact": types.Part.from_bytes(
+          data=b"0123456789", mime_type="audio/wav"
+      ).model_dump(mode="json", by_alias=True, exclude_none=True),
+  }
+  assert test_app.post(url, json=payload).status_code == 200
+
+  response = test_app.get(f"{url}/clip.wav/content")
+  assert response.status_code == 200
+  assert response.content == b"0123456789"
+  assert response.headers["content-type"] == "audio/wav"
+  assert response.headers["accept-ranges"] == "bytes"
+
+  response = test_app.get(
+      f"{url}/clip.wav/content", headers={"Range": "bytes=2-5"}
+  )
+  assert response.status_code == 206
+  assert response.content == b"2345"
+  assert response.headers["content-range"] == "bytes 2-5/10"
+
+  response = test_app.get(
+      f"{url}/clip.wav/content", headers={"Range": "bytes=-3"}
+  )
+  assert response.content == b"789"
+
+  response = test_app.get(
+      f"{url}/clip.wav/content", headers={"Range": "bytes=10-"}
+  )
+  assert response.status_code == 416
+  assert response.headers["content-range"] == "bytes */10"
+
+  response = test_app.get(f"{url}/missing.wav/content")
+  assert response.status_code == 404
+
+
 def test_get_eval_set_result_not_found(test_app):
   """Test getting an eval set result that doesn't exist."""
   url = "/apps/test_app_name/eval_results/test_eval_result_id_not_found"
@@ -0,0 +1,110 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from google.adk.cli.utils.admission import AdmissionController
+from google.adk.cli.utils.admission import AdmissionRejectedError
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_admits_waiting_requests_round_robin_across_users():
+  controller = AdmissionController(
+      max_concurrent_invocations=1, max_queue_size=10
+  )
+  running = await controller.acquire('app', 'alice')
+  admitted = []
+
+  async def run(user_id: str, name: str):
+    slot = await controller.acquire('app', user_id)
+    admitted.append(name)
+    slot.release()
+
+  tasks = [
+      asyncio.create_task(run('alice', 'alice-1')),
+      asyncio.create_task(run('alice', 'alice-2')),
+      asyncio.create_task(run('alice', 'alice-3')),
+      asyncio.create_task(run('bob', 'bob-1')),
+  ]
+  await asyncio.sleep(0)
+  assert controller.queued == 4
+
+  running.release()
+  running.release()  # Releasing twice frees a single slot.
+  await asyncio.gather(*tasks)
+
+  assert admitted == ['alice-1', 'bob-1', 'alice-2', 'alice-3']
+  assert controller.running == 0
+  assert controller.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_limits_each_app_separately():
+  controller = AdmissionController(
+      max_concurrent_invocations_per_app=1, max_queue_size=1
+  )
+  await controller.acquire('app_1', 'user')
+
+  # Another app is admitted right away.
+  slot = await controller.acquire('app_2', 'user')
+  assert controller.running == 2
+  slot.release()
+  assert controller.running == 1
+
+
+@pytest.mark.asyncio
+async def test_rejects_requests_when_the_queue_is_full():
+  controller = AdmissionController(max_concurrent_invocations=1)
+  await controller.acquire('app', 'user')
+
+  with pytest.raises(AdmissionRejectedError) as e:
+    await controller.acquire('app', 'user')
+
+  assert e.value.status_code == 429
+  assert e.value.retry_after >= 1
+
+
+@pytest.mark.asyncio
+async def test_rejects_requests_that_wait_too_long():
+  controller = AdmissionController(
+      max_concurrent_invocations=1,
+      max_queue_size=1,
+      max_queue_wait_seconds=0.01,
+  )
+  await controller.acquire('app', 'user')
+
+  with pytest.raises(AdmissionRejectedError) as e:
+    await controller.acquire('app', 'user')
+
+  assert e.value.status_code == 503
+  assert controller.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_leave_the_queue():
+  controller = AdmissionController(
+      max_concurrent_invocations=1, max_queue_size=1
+  )
+  running = await controller.acquire('app', 'user')
+  waiting = asyncio.create_task(controller.acquire('app', 'user'))
+  await asyncio.sleep(0)
+
+  waiting.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await waiting
+
+  assert controller.queued == 0
+  running.release()
+  assert controller.running == 0
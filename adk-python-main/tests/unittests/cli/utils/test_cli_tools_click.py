@@ -558,6 +558,29 @@ def test_cli_api_server_invokes_uvicorn(
   assert _patch_uvicorn.calls, "uvicorn.Server.run must be called"
 
 
+def test_cli_api_server_with_workers_runs_workers(
+    tmp_path: Path, _patch_uvicorn: _Recorder, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """`adk api_server --workers` should serve the app from worker processes."""
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  mock_run_workers = _Recorder()
+  monkeypatch.setattr(cli_tools_click, "run_workers", mock_run_workers)
+
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      ["api_server", str(agents_dir), "--workers", "2", "--port", "9000"],
+  )
+
+  assert result.exit_code == 0
+  assert not _patch_uvicorn.calls
+  called_kwargs = mock_run_workers.calls[0][1]
+  assert called_kwargs["workers"] == 2
+  assert called_kwargs["port"] == 9000
+  assert called_kwargs["app_kwargs"]["agents_dir"] == str(agents_dir)
+
+
 def test_cli_web_passes_service_uris(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _patch_uvicorn: _Recorder
 ) -> None:
@@ -719,6 +742,24 @@ def test_cli_create_eval_set(tmp_path: Path):
   assert eval_set_data["eval_cases"] == []
 
 
+def test_cli_artifacts_rebuild_index(tmp_path: Path):
+  scope_root = tmp_path / "users" / "user" / "artifacts"
+  version_dir = scope_root / "notes.txt" / "versions" / "0"
+  version_dir.mkdir(parents=True)
+  (version_dir / "notes.txt").write_text("hello")
+
+  result = CliRunner().invoke(
+      cli_tools_click.main,
+      ["artifacts", "rebuild_index", str(tmp_path)],
+  )
+
+  assert result.exit_code == 0, result.output
+  assert "Rebuilt 1 artifact manifests." in result.output
+  manifest_path = scope_root.with_name("artifacts.manifest.json")
+  with open(manifest_path, "r") as f:
+    assert list(json.load(f)["artifacts"]) == ["notes.txt"]
+
+
 def test_cli_add_eval_case_with_session(tmp_path: Path):
   app_name = "test_app_add_2"
   eval_set_id = "test_eval_set_add_2"
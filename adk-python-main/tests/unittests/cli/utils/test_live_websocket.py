@@ -0,0 +1,97 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+
+from google.adk.cli.utils.live_websocket import LiveEventSender
+from google.adk.events.event import Event
+from google.genai import types
+import pytest
+
+
+class _FakeWebSocket:
+
+  def __init__(self):
+    self.frames = []
+
+  async def send_text(self, text: str) -> None:
+    self.frames.append(json.loads(text))
+
+  async def send_bytes(self, data: bytes) -> None:
+    self.frames.append(data)
+
+
+def _text_event(text: str) -> Event:
+  return Event(
+      author='agent',
+      content=types.Content(role='model', parts=[types.Part(text=text)]),
+  )
+
+
+def _audio_event(data: bytes, **kwargs) -> Event:
+  return Event(
+      author='agent',
+      content=types.Content(
+          role='model',
+          parts=[
+              types.Part(
+                  inline_data=types.Blob(
+                      mime_type='audio/pcm;rate=24000', data=data
+                  )
+              )
+          ],
+      ),
+      **kwargs,
+  )
+
+
+@pytest.mark.asyncio
+async def test_sends_audio_as_binary_frames():
+  websocket = _FakeWebSocket()
+  sender = LiveEventSender(websocket, binary_audio=True)
+
+  await sender.send(_audio_event(b'audio_1'))
+  await sender.send(_audio_event(b'audio_2', interrupted=True))
+  await sender.send(_text_event('hi'))
+
+  assert websocket.frames[0] == b'audio_1'
+  # The rest of an event is still sent when it carries more than audio.
+  assert websocket.frames[1]['interrupted']
+  assert websocket.frames[1]['content']['parts'] == []
+  assert websocket.frames[2] == b'audio_2'
+  assert websocket.frames[3]['content']['parts'][0]['text'] == 'hi'
+
+
+@pytest.mark.asyncio
+async def test_batches_small_events():
+  websocket = _FakeWebSocket()
+  sender = LiveEventSender(websocket, batch_window_seconds=0.01)
+
+  await sender.send(_text_event('1'))
+  await sender.send(_text_event('2'))
+  assert not websocket.frames
+
+  await asyncio.sleep(0.05)
+  await sender.send(_text_event('3'))
+  await sender.send(_text_event('x' * 2000))  # Large events are not batched.
+  await sender.flush()
+  sender.close()
+
+  assert [
+      [event['content']['parts'][0]['text'] for event in frame]
+      if isinstance(frame, list)
+      else frame['content']['parts'][0]['text'][:1]
+      for frame in websocket.frames
+  ] == [['1', '2'], ['3'], 'x']
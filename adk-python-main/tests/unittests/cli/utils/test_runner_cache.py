@@ -0,0 +1,86 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from google.adk.cli.utils.runner_cache import RunnerCache
+from google.adk.runners import Runner
+import pytest
+
+
+def _runner_factory(created: list[str], app_name: str):
+  async def create_runner() -> Runner:
+    await asyncio.sleep(0)
+    created.append(app_name)
+    runner = MagicMock(spec=Runner)
+    runner.close = AsyncMock()
+    return runner
+
+  return create_runner
+
+
+@pytest.mark.asyncio
+async def test_creates_the_runner_of_concurrent_requests_once():
+  cache = RunnerCache()
+  created = []
+
+  runners = await asyncio.gather(*(
+      cache.get_or_create('app', _runner_factory(created, 'app'))
+      for _ in range(5)
+  ))
+
+  assert created == ['app']
+  assert all(runner is runners[0] for runner in runners)
+  assert 'app' in cache
+
+
+@pytest.mark.asyncio
+async def test_closes_the_least_recently_used_idle_runners():
+  cache = RunnerCache(max_size=2)
+  created = []
+  app_1 = await cache.get_or_create('app_1', _runner_factory(created, 'app_1'))
+  app_2 = await cache.get_or_create('app_2', _runner_factory(created, 'app_2'))
+
+  async with cache.use('app_1', _runner_factory(created, 'app_1')):
+    # app_1 runs an invocation, so app_2 is evicted although used last.
+    await cache.get_or_create('app_3', _runner_factory(created, 'app_3'))
+    assert list(cache) == ['app_1', 'app_3']
+    app_2.close.assert_awaited_once()
+
+    await cache.get_or_create('app_4', _runner_factory(created, 'app_4'))
+    assert list(cache) == ['app_1', 'app_4']
+
+  app_1.close.assert_not_awaited()
+  assert created == ['app_1', 'app_2', 'app_3', 'app_4']
+
+
+@pytest.mark.asyncio
+async def test_closes_idle_runners():
+  cache = RunnerCache(idle_ttl_seconds=0.01)
+  created = []
+  runner = await cache.get_or_create('app', _runner_factory(created, 'app'))
+
+  async with cache.use('app', _runner_factory(created, 'app')):
+    await asyncio.sleep(0.02)
+    await cache.evict_expired()
+    # Not evicted while in use.
+    assert 'app' in cache
+
+  await asyncio.sleep(0.02)
+  await cache.evict_expired()
+
+  assert 'app' not in cache
+  runner.close.assert_awaited_once()
@@ -0,0 +1,51 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import sys
+import types
+from unittest.mock import MagicMock
+
+from google.adk.cli.utils.session_view import compress
+from google.adk.cli.utils.session_view import parse_event_fields
+import pytest
+
+_BODY = b'{"events":[]}' * 200
+
+
+def test_parse_event_fields_accepts_names_and_aliases():
+  assert parse_event_fields('id, invocationId,long_running_tool_ids,') == {
+      'id',
+      'invocation_id',
+      'long_running_tool_ids',
+  }
+  with pytest.raises(ValueError, match='unknown'):
+    parse_event_fields('id,unknown')
+
+
+def test_compresses_with_gzip():
+  body, encoding = compress(_BODY, 'deflate, gzip;q=0.5')
+
+  assert encoding == 'gzip'
+  assert gzip.decompress(body) == _BODY
+  assert compress(_BODY, 'gzip;q=0') == (_BODY, None)
+  assert compress(b'{}', 'gzip') == (b'{}', None)
+
+
+def test_prefers_brotli_when_installed(monkeypatch):
+  brotli = types.ModuleType('brotli')
+  brotli.compress = MagicMock(return_value=b'compressed')
+  monkeypatch.setitem(sys.modules, 'brotli', brotli)
+
+  assert compress(_BODY, 'gzip, br') == (b'compressed', 'br')
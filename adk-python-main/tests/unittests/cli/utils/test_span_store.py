@@ -0,0 +1,140 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest import mock
+
+from google.adk.cli.utils.span_store import SpanStore
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
+import pytest
+
+_next_span_id = 0
+
+
+def _span(name: str, trace_id: int, **attributes) -> ReadableSpan:
+  global _next_span_id
+  _next_span_id += 1
+  return ReadableSpan(
+      name=name,
+      context=SpanContext(
+          trace_id=trace_id, span_id=_next_span_id, is_remote=False
+      ),
+      attributes=attributes,
+      start_time=1,
+      end_time=2,
+  )
+
+
+def _call_llm(trace_id: int, session_id: str, event_id: str) -> ReadableSpan:
+  return _span(
+      "call_llm",
+      trace_id,
+      **{
+          "gcp.vertex.agent.session_id": session_id,
+          "gcp.vertex.agent.event_id": event_id,
+      },
+  )
+
+
+def test_looks_up_spans_by_session_and_event():
+  store = SpanStore()
+  store.add([
+      _span("execute_tool search", 1, **{"gcp.vertex.agent.event_id": "e1"}),
+      _call_llm(1, "s1", "e0"),
+      _call_llm(2, "s2", "e2"),
+  ])
+  store.add([_span("invocation", 1), _span("invocation", 2)])
+
+  spans = store.get_session_spans("s1")
+
+  assert [(s["name"], s["trace_id"]) for s in spans] == [
+      ("execute_tool search", 1),
+      ("call_llm", 1),
+      ("invocation", 1),
+  ]
+  assert store.get_session_spans("unknown") == []
+  event_trace = store.get_event_trace("e1")
+  assert event_trace["gcp.vertex.agent.event_id"] == "e1"
+  assert event_trace["trace_id"] == 1
+  assert store.get_event_trace("unknown") is None
+
+
+def test_evicts_oldest_spans_beyond_limits():
+  store = SpanStore(max_spans=2)
+  store.add([_call_llm(1, "s1", "e1")])
+  store.add([_call_llm(2, "s2", "e2"), _call_llm(3, "s3", "e3")])
+
+  assert len(store) == 2
+  assert store.get_session_spans("s1") == []
+  assert store.get_event_trace("e1") is None
+  assert len(store.get_session_spans("s3")) == 1
+
+  store = SpanStore(max_bytes=1000)
+  store.add([
+      _span("call_llm", 1, **{"gcp.vertex.agent.llm_request": "x" * 600}),
+      _span("call_llm", 2, **{"gcp.vertex.agent.llm_request": "x" * 600}),
+  ])
+  assert len(store) == 1
+
+
+def test_expires_spans_after_ttl():
+  store = SpanStore(ttl_seconds=10)
+  with mock.patch("time.time", return_value=100.0):
+    store.add([_call_llm(1, "s1", "e1")])
+  with mock.patch("time.time", return_value=105.0):
+    store.add([_call_llm(2, "s1", "e2")])
+
+  with mock.patch("time.time", return_value=111.0):
+    assert [s["trace_id"] for s in store.get_session_spans("s1")] == [2]
+    assert store.get_event_trace("e1") is None
+
+
+def test_spills_evicted_spans_to_sqlite(tmp_path: Path):
+  spill_path = str(tmp_path / "spans.db")
+  store = SpanStore(max_spans=1, spill_path=spill_path)
+  store.add([_call_llm(1, "s1", "e1")])
+  store.add([_span("invocation", 1), _call_llm(2, "s1", "e2")])
+
+  assert len(store) == 1
+  assert [s["name"] for s in store.get_session_spans("s1")] == [
+      "call_llm",
+      "invocation",
+      "call_llm",
+  ]
+  assert store.get_event_trace("e1")["trace_id"] == 1
+  store.close()
+
+  # A new store on the same file keeps the spilled spans and their order.
+  store = SpanStore(max_spans=1, spill_path=spill_path)
+  store.add([_call_llm(3, "s1", "e3")])
+  assert [s["trace_id"] for s in store.get_session_spans("s1")] == [1, 1, 2, 3]
+  store.close()
+
+
+def test_shares_spans_between_stores_of_the_same_spill_path(tmp_path: Path):
+  spill_path = str(tmp_path / "spans.db")
+  store_1 = SpanStore(spill_path=spill_path, shared=True)
+  store_2 = SpanStore(spill_path=spill_path, shared=True)
+  store_1.add([_call_llm(1, "s1", "e1")])
+  store_2.add([_span("invocation", 1), _call_llm(2, "s1", "e2")])
+
+  for store in (store_1, store_2):
+    assert [s["trace_id"] for s in store.get_session_spans("s1")] == [1, 1, 2]
+    assert store.get_event_trace("e2")["trace_id"] == 2
+  store_1.close()
+  store_2.close()
+
+  with pytest.raises(ValueError, match="spill path"):
+    SpanStore(shared=True)
@@ -0,0 +1,111 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+from pathlib import Path
+from unittest import mock
+
+import click
+from google.adk.cli.utils import workers
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _local_runtime(monkeypatch: pytest.MonkeyPatch) -> None:
+  for name in (
+      "ADK_DISABLE_LOCAL_STORAGE",
+      "ADK_FORCE_LOCAL_STORAGE",
+      "K_SERVICE",
+      "KUBERNETES_SERVICE_HOST",
+  ):
+    monkeypatch.delenv(name, raising=False)
+
+
+def test_refuses_in_memory_session_and_artifact_services(tmp_path: Path):
+  with pytest.raises(click.UsageError, match="session service"):
+    workers.check_services_for_workers(
+        agents_dir=str(tmp_path), use_local_storage=False
+    )
+  with pytest.raises(click.UsageError, match="artifact service"):
+    workers.check_services_for_workers(
+        agents_dir=str(tmp_path),
+        session_service_uri=f"sqlite:///{tmp_path / 'sessions.db'}",
+        use_local_storage=False,
+    )
+  with pytest.raises(click.UsageError, match="session service"):
+    workers.check_services_for_workers(
+        agents_dir=str(tmp_path),
+        session_service_uri="sqlite:///:memory:",
+    )
+
+
+def test_closes_the_checked_services(tmp_path: Path):
+  session_service = mock.Mock()
+  session_service.close = mock.AsyncMock()
+
+  with mock.patch.object(
+      workers,
+      "create_session_service_from_options",
+      return_value=session_service,
+  ):
+    workers.check_services_for_workers(agents_dir=str(tmp_path))
+
+  session_service.close.assert_awaited_once()
+
+
+def test_warns_about_in_memory_memory_service(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+):
+  with caplog.at_level(logging.WARNING):
+    workers.check_services_for_workers(agents_dir=str(tmp_path))
+
+  assert "memory service is in memory" in caplog.text
+
+
+def test_runs_workers_with_a_shared_trace_store(tmp_path: Path):
+  worker_kwargs = {}
+
+  def fake_run(app: str, **kwargs):
+    assert kwargs["factory"] and kwargs["workers"] == 2
+    module_name, factory_name = app.split(":")
+    assert module_name == workers.__name__
+    with mock.patch(
+        "google.adk.cli.fast_api.get_fast_api_app",
+        side_effect=lambda **kwargs: worker_kwargs.update(kwargs),
+    ):
+      getattr(workers, factory_name)()
+    assert os.path.exists(worker_kwargs["trace_spill_path"])
+
+  with mock.patch.object(workers.uvicorn, "run", side_effect=fake_run):
+    workers.run_workers(
+        workers=2,
+        host="127.0.0.1",
+        port=8000,
+        app_kwargs={
+            "agents_dir": str(tmp_path),
+            "web": False,
+            "max_concurrent_invocations": 5,
+            "max_queued_invocations": 0,
+        },
+    )
+
+  assert worker_kwargs["workers"] == 2
+  # The server-wide limits are split between the workers.
+  assert worker_kwargs["max_concurrent_invocations"] == 3
+  assert worker_kwargs["max_queued_invocations"] == 0
+  assert worker_kwargs["agents_dir"] == str(tmp_path)
+  # The temporary trace store is removed once the server stops.
+  assert not os.path.exists(worker_kwargs["trace_spill_path"])
+  assert workers._APP_KWARGS_ENV not in os.environ
@@ -369,6 +369,7 @@ class TestGenerateInferencesForSingleUserInvocation:
         user_id="test_user",
         session_id="test_session",
         new_message=user_content,
+        run_config=None,
     )
 
 
@@ -433,7 +434,7 @@ class TestGenerateInferencesFromRootAgent:
     # Each call to _generate_inferences_for_single_user_invocation will
     # yield one user and one agent event.
     async def mock_generate_inferences_side_effect(
-        runner, user_id, session_id, user_content
+        runner, user_id, session_id, user_content, run_config=None
     ):
       yield _build_event("user", user_content.parts, "inv1")
       yield _build_event("agent", [types.Part(text="agent_response")], "inv1")
@@ -19,6 +19,7 @@ import sys
 from typing import Optional
 
 from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.run_config import BatchConfig
 from google.adk.errors.not_found_error import NotFoundError
 from google.adk.evaluation.base_eval_service import EvaluateConfig
 from google.adk.evaluation.base_eval_service import EvaluateRequest
@@ -247,15 +248,51 @@ async def test_perform_inference_with_case_ids(
       eval_set_id="test_eval_set",
       eval_case=eval_set.eval_cases[0],
       root_agent=dummy_agent,
+      run_config=None,
   )
   eval_service._perform_inference_single_eval_item.assert_any_call(
       app_name="test_app",
       eval_set_id="test_eval_set",
       eval_case=eval_set.eval_cases[2],
       root_agent=dummy_agent,
+      run_config=None,
   )
 
 
+@pytest.mark.asyncio
+async def test_perform_inference_passes_batch_config(
+    eval_service,
+    mock_eval_sets_manager,
+    mocker,
+):
+  eval_set = EvalSet(
+      eval_set_id="test_eval_set",
+      eval_cases=[
+          EvalCase(eval_id="case1", conversation=[], session_input=None),
+      ],
+  )
+  mock_eval_sets_manager.get_eval_set.return_value = eval_set
+  eval_service._perform_inference_single_eval_item = mocker.AsyncMock(
+      return_value=mocker.MagicMock()
+  )
+  batch_config = BatchConfig(max_batch_size=16, max_wait_seconds=0.5)
+
+  inference_request = InferenceRequest(
+      app_name="test_app",
+      eval_set_id="test_eval_set",
+      inference_config=InferenceConfig(
+          parallelism=16, batch_config=batch_config
+      ),
+  )
+  async for _ in eval_service.perform_inference(inference_request):
+    pass
+
+  run_config = eval_service._perform_inference_single_eval_item.call_args[
+      1
+  ]["run_config"]
+  assert run_config.batch_config == batch_config
+
+
 @pytest.mark.asyncio
 async def test_perform_inference_eval_set_not_found(
     eval_service,
@@ -0,0 +1,189 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for coalescing model calls into batch submissions."""
+
+import asyncio
+import gc
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.agents.run_config import BatchConfig
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.run_config import StreamingMode
+from google.adk.flows.llm_flows import batch_scheduler
+from google.adk.flows.llm_flows.batch_scheduler import BatchScheduler
+from google.adk.flows.llm_flows.batch_scheduler import get_batch_scheduler
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types
+import pytest
+
+from ... import testing_utils
+
+
+def _request(text: str) -> LlmRequest:
+  return LlmRequest(contents=[types.UserContent(text)])
+
+
+def test_supports_batch():
+  assert testing_utils.MockBatchModel().supports_batch
+  assert not testing_utils.MockModel.create(responses=['hi']).supports_batch
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full():
+  model = testing_utils.MockBatchModel()
+  scheduler = BatchScheduler(
+      model, BatchConfig(max_batch_size=3, max_wait_seconds=60)
+  )
+
+  responses = await asyncio.gather(
+      *[scheduler.submit(_request(f'q{i}')) for i in range(6)]
+  )
+
+  assert [r.content.parts[0].text for r in responses] == [
+      f'echo: q{i}' for i in range(6)
+  ]
+  assert model.batch_sizes == [3, 3]
+  assert scheduler.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_max_wait():
+  model = testing_utils.MockBatchModel()
+  scheduler = BatchScheduler(
+      model, BatchConfig(max_batch_size=10, max_wait_seconds=0.01)
+  )
+
+  responses = await asyncio.gather(
+      scheduler.submit(_request('a')), scheduler.submit(_request('b'))
+  )
+
+  assert len(responses) == 2
+  assert model.batch_sizes == [2]
+
+
+@pytest.mark.asyncio
+async def test_batch_error_is_raised_to_every_caller():
+  model = testing_utils.MockBatchModel(error=RuntimeError('backend down'))
+  scheduler = BatchScheduler(
+      model, BatchConfig(max_batch_size=2, max_wait_seconds=60)
+  )
+
+  results = await asyncio.gather(
+      scheduler.submit(_request('a')),
+      scheduler.submit(_request('b')),
+      return_exceptions=True,
+  )
+
+  assert [str(r) for r in results] == ['backend down', 'backend down']
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_leaves_pending_batch():
+  model = testing_utils.MockBatchModel()
+  scheduler = BatchScheduler(
+      model, BatchConfig(max_batch_size=10, max_wait_seconds=0.01)
+  )
+
+  cancelled = asyncio.create_task(scheduler.submit(_request('a')))
+  kept = asyncio.create_task(scheduler.submit(_request('b')))
+  await asyncio.sleep(0)
+  cancelled.cancel()
+
+  response = await kept
+  assert response.content.parts[0].text == 'echo: b'
+  assert model.batch_sizes == [1]
+
+
+@pytest.mark.asyncio
+async def test_get_batch_scheduler_is_shared_per_model_and_config():
+  model = testing_utils.MockBatchModel()
+  config = BatchConfig(max_batch_size=4)
+
+  assert get_batch_scheduler(model, config) is get_batch_scheduler(
+      model, BatchConfig(max_batch_size=4)
+  )
+  assert get_batch_scheduler(model, config) is not get_batch_scheduler(
+      testing_utils.MockBatchModel(), config
+  )
+
+
+@pytest.mark.asyncio
+async def test_get_batch_scheduler_does_not_keep_models_alive():
+  model = testing_utils.MockBatchModel()
+  config = BatchConfig(max_batch_size=4)
+  scheduler = get_batch_scheduler(model, config)
+  schedulers = batch_scheduler._schedulers[asyncio.get_running_loop()]
+  key = (id(model), config)
+  assert schedulers[key] is scheduler
+
+  del model
+  gc.collect()
+
+  assert key not in schedulers
+
+
+@pytest.mark.asyncio
+async def test_flow_coalesces_calls_from_concurrent_invocations():
+  model = testing_utils.MockBatchModel(latency=0.05)
+  runner = testing_utils.InMemoryRunner(Agent(name='agent', model=model))
+  run_config = RunConfig(
+      batch_config=BatchConfig(max_batch_size=8, max_wait_seconds=1)
+  )
+
+  async def _run(index: int) -> str:
+    session = await runner.runner.session_service.create_session(
+        app_name='test_app', user_id='test_user'
+    )
+    events = [
+        event
+        async for event in runner.runner.run_async(
+            user_id='test_user',
+            session_id=session.id,
+            new_message=types.UserContent(f'q{index}'),
+            run_config=run_config,
+        )
+    ]
+    return events[-1].content.parts[0].text
+
+  texts = await asyncio.gather(*[_run(i) for i in range(8)])
+
+  assert texts == [f'echo: q{i}' for i in range(8)]
+  assert model.batch_sizes == [8]
+  assert model.single_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_flow_does_not_batch_streaming_calls():
+  model = testing_utils.MockBatchModel()
+  runner = testing_utils.InMemoryRunner(Agent(name='agent', model=model))
+
+  events = await runner.run_async(
+      types.UserContent('hi'),
+  )
+  assert events[-1].content.parts[0].text == 'echo: hi'
+
+  session = runner.session
+  async for _ in runner.runner.run_async(
+      user_id=session.user_id,
+      session_id=session.id,
+      new_message=types.UserContent('again'),
+      run_config=RunConfig(
+          batch_config=BatchConfig(), streaming_mode=StreamingMode.SSE
+      ),
+  ):
+    pass
+
+  assert model.batch_sizes == []
+  assert model.single_calls == 2
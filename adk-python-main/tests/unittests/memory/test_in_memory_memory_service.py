@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from google.adk.events.event import Event
+from google.adk.memory import _utils
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.sessions.session import Session
 from google.genai import types
@@ -109,13 +110,11 @@ async def test_add_session_to_memory():
   await memory_service.add_session_to_memory(MOCK_SESSION_1)
 
   user_key = f'{MOCK_APP_NAME}/{MOCK_USER_ID}'
-  assert user_key in memory_service._session_events
-  session_memory = memory_service._session_events[user_key]
-  assert MOCK_SESSION_1.id in session_memory
+  assert user_key in memory_service._indexes
+  session_docs = memory_service._indexes[user_key].session_docs
+  assert MOCK_SESSION_1.id in session_docs
   # Check that the event with no content was filtered out
-  assert len(session_memory[MOCK_SESSION_1.id]) == 2
-  assert session_memory[MOCK_SESSION_1.id][0].id == 'event-1a'
-  assert session_memory[MOCK_SESSION_1.id][1].id == 'event-1c'
+  assert list(session_docs[MOCK_SESSION_1.id]) == ['event-1a', 'event-1c']
 
 
 @pytest.mark.asyncio
@@ -125,10 +124,10 @@ async def test_add_session_with_no_events_to_memory():
   await memory_service.add_session_to_memory(MOCK_SESSION_WITH_NO_EVENTS)
 
   user_key = f'{MOCK_APP_NAME}/{MOCK_USER_ID}'
-  assert user_key in memory_service._session_events
-  session_memory = memory_service._session_events[user_key]
-  assert MOCK_SESSION_WITH_NO_EVENTS.id in session_memory
-  assert not session_memory[MOCK_SESSION_WITH_NO_EVENTS.id]
+  assert user_key in memory_service._indexes
+  session_docs = memory_service._indexes[user_key].session_docs
+  assert MOCK_SESSION_WITH_NO_EVENTS.id in session_docs
+  assert not session_docs[MOCK_SESSION_WITH_NO_EVENTS.id]
 
 
 @pytest.mark.asyncio
@@ -217,3 +216,209 @@ async def test_search_memory_is_scoped_by_user():
   assert (
       result_other_user.memories[0].content.parts[0].text == 'This is a secret.'
   )
+
+
+def _session_with_texts(session_id: str, texts: list[str]) -> Session:
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id=session_id,
+      last_update_time=1000,
+      events=[
+          Event(
+              id=f'{session_id}-{i}',
+              invocation_id=f'inv-{i}',
+              author='user',
+              timestamp=1000 + i,
+              content=types.Content(parts=[types.Part(text=text)]),
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+@pytest.mark.asyncio
+async def test_search_memory_ranks_by_relevance():
+  """Tests that events matching more and rarer query words rank first."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(
+      _session_with_texts(
+          'session-a',
+          [
+              'We talked about the weather today.',
+              'My favorite color is blue, like the ocean.',
+              'The ocean is blue and the weather is nice.',
+          ],
+      )
+  )
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='blue ocean weather'
+  )
+
+  texts = [memory.content.parts[0].text for memory in result.memories]
+  assert texts == [
+      'The ocean is blue and the weather is nice.',
+      'My favorite color is blue, like the ocean.',
+      'We talked about the weather today.',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_search_memory_top_k():
+  """Tests that searches return at most top_k memories."""
+  memory_service = InMemoryMemoryService(top_k=3)
+  await memory_service.add_session_to_memory(
+      _session_with_texts('session-a', [f'note number {i}' for i in range(20)])
+  )
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='note'
+  )
+  assert len(result.memories) == 3
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='note', top_k=5
+  )
+  assert len(result.memories) == 5
+
+  unbounded_service = InMemoryMemoryService(top_k=None)
+  await unbounded_service.add_session_to_memory(
+      _session_with_texts('session-a', [f'note number {i}' for i in range(20)])
+  )
+  result = await unbounded_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='note'
+  )
+  assert len(result.memories) == 20
+
+
+@pytest.mark.asyncio
+async def test_search_memory_unicode_words():
+  """Tests that non-ASCII words and unspaced scripts are searchable."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(
+      _session_with_texts(
+          'session-a', ['Ich wohne in der Straße.', '東京タワーに行きました。']
+      )
+  )
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='STRASSE'
+  )
+  assert [m.content.parts[0].text for m in result.memories] == [
+      'Ich wohne in der Straße.'
+  ]
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='東京'
+  )
+  assert [m.content.parts[0].text for m in result.memories] == [
+      '東京タワーに行きました。'
+  ]
+
+
+@pytest.mark.asyncio
+async def test_readding_session_replaces_its_events():
+  """Tests that re-adding a session reindexes its current events only."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(
+      _session_with_texts('session-a', ['old apples', 'kept bananas'])
+  )
+  session = _session_with_texts('session-a', ['old apples', 'kept bananas'])
+  session.events = session.events[1:] + [
+      _session_with_texts('session-b', ['new cherries']).events[0]
+  ]
+  await memory_service.add_session_to_memory(session)
+
+  async def _texts(query):
+    result = await memory_service.search_memory(
+        app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=query
+    )
+    return [memory.content.parts[0].text for memory in result.memories]
+
+  assert await _texts('apples') == []
+  assert await _texts('bananas') == ['kept bananas']
+  assert await _texts('cherries') == ['new cherries']
+  index = memory_service._indexes[f'{MOCK_APP_NAME}/{MOCK_USER_ID}']
+  assert len(index.docs) == 2
+  assert 'apples' not in index.postings
+
+
+@pytest.mark.asyncio
+async def test_readding_session_only_tokenizes_new_events():
+  """Tests that re-adding a grown session indexes only its new events."""
+  memory_service = InMemoryMemoryService()
+  session = _session_with_texts('session-a', ['apples', 'bananas'])
+  await memory_service.add_session_to_memory(session)
+  session.events.append(
+      _session_with_texts('session-a', ['', '', 'cherries']).events[2]
+  )
+
+  index = memory_service._indexes[f'{MOCK_APP_NAME}/{MOCK_USER_ID}']
+  add_doc = index._add_doc
+  added = []
+
+  def _recording_add_doc(event):
+    added.append(event.id)
+    return add_doc(event)
+
+  index._add_doc = _recording_add_doc
+  await memory_service.add_session_to_memory(session)
+  await memory_service.add_session_to_memory(session)
+
+  assert added == ['session-a-2']
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='cherries apples'
+  )
+  assert len(result.memories) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_events_to_memory_is_idempotent():
+  """Tests that adding overlapping events stores each event once."""
+  memory_service = InMemoryMemoryService()
+  events = _session_with_texts('session-a', ['one', 'two', 'three']).events
+
+  await memory_service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id='session-a',
+      events=events[:2],
+  )
+  await memory_service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id='session-a',
+      events=events,
+  )
+  await memory_service.add_session_to_memory(
+      _session_with_texts('session-a', ['one', 'two', 'three'])
+  )
+
+  user_key = f'{MOCK_APP_NAME}/{MOCK_USER_ID}'
+  index = memory_service._indexes[user_key]
+  assert list(index.session_docs['session-a']) == [
+      'session-a-0',
+      'session-a-1',
+      'session-a-2',
+  ]
+  assert len(index.docs) == 3
+
+
+def test_ingestion_tracker_claims_are_exclusive_and_released_on_error():
+  """Tests that in-flight events are skipped, and retried after a failure."""
+  tracker = _utils.IngestionTracker()
+  events = _session_with_texts('session-a', ['one', 'two']).events
+  scope = (MOCK_APP_NAME, MOCK_USER_ID, 'session-a')
+
+  with pytest.raises(RuntimeError):
+    with tracker.claim(*scope, events[:1]) as first:
+      with tracker.claim(*scope, events) as second:
+        assert [event.id for event in second] == ['session-a-1']
+      raise RuntimeError('ingestion failed')
+  assert [event.id for event in first] == ['session-a-0']
+
+  with tracker.claim(*scope, events) as retried:
+    assert [event.id for event in retried] == ['session-a-0']
+  with tracker.claim(*scope, events) as nothing_new:
+    assert not nothing_new
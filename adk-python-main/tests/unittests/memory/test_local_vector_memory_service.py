@@ -0,0 +1,260 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from unittest import mock
+
+from google.adk.events.event import Event
+from google.adk.memory import local_vector_memory_service
+from google.adk.memory.local_vector_memory_service import cosine_top_k
+from google.adk.memory.local_vector_memory_service import LocalVectorMemoryService
+from google.adk.sessions.session import Session
+from google.genai import types
+import numpy as np
+import pytest
+
+APP_NAME = 'test-app'
+USER_ID = 'test-user'
+
+_TOPICS = ['cats', 'python', 'weather', 'music']
+
+
+class _KeywordEmbedder:
+  """Embeds texts as one-hot vectors over a fixed topic vocabulary."""
+
+  def __init__(self):
+    self.batches: list[list[str]] = []
+
+  async def __call__(self, texts: list[str]) -> list[list[float]]:
+    self.batches.append(texts)
+    return [
+        [1.0 if topic in text.lower() else 0.0 for topic in _TOPICS]
+        + [0.1]
+        for text in texts
+    ]
+
+
+def _session(session_id: str, texts: list[str], user_id=USER_ID) -> Session:
+  return Session(
+      app_name=APP_NAME,
+      user_id=user_id,
+      id=session_id,
+      last_update_time=1000,
+      events=[
+          Event(
+              id=f'{session_id}-{i}',
+              invocation_id=f'inv-{i}',
+              author='user',
+              timestamp=1000 + i,
+              content=types.Content(parts=[types.Part(text=text)]),
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+async def _search(memory_service, query, user_id=USER_ID) -> list[str]:
+  response = await memory_service.search_memory(
+      app_name=APP_NAME, user_id=user_id, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+def test_cosine_top_k():
+  matrix = np.eye(4, dtype=np.float32)
+  queries = np.array([[0.0, 0.6, 0.8, 0.0], [1.0, 0.0, 0.0, 0.0]])
+
+  indices, scores = cosine_top_k(matrix, queries, 2)
+
+  assert indices.tolist() == [[2, 1], [0, 1]]
+  assert scores[0].tolist() == pytest.approx([0.8, 0.6])
+
+
+@pytest.mark.asyncio
+async def test_search_returns_most_similar_memories():
+  memory_service = LocalVectorMemoryService(_KeywordEmbedder(), top_k=2)
+  await memory_service.add_session_to_memory(
+      _session(
+          's1',
+          [
+              'I have two cats.',
+              'I write Python every day.',
+              'The weather is nice.',
+              'Cats and Python are my favorite things.',
+          ],
+      )
+  )
+
+  assert await _search(memory_service, 'python') == [
+      'I write Python every day.',
+      'Cats and Python are my favorite things.',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_search_is_scoped_by_user_and_respects_min_similarity():
+  memory_service = LocalVectorMemoryService(
+      _KeywordEmbedder(), min_similarity=0.5
+  )
+  await memory_service.add_session_to_memory(_session('s1', ['I like cats.']))
+  await memory_service.add_session_to_memory(
+      _session('s2', ['I like music.'], user_id='other-user')
+  )
+
+  assert await _search(memory_service, 'music') == []
+  assert await _search(memory_service, 'music', user_id='other-user') == [
+      'I like music.'
+  ]
+  assert await _search(memory_service, 'unknown user', 'nobody') == []
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_batched_and_sessions_readded_incrementally():
+  embedder = _KeywordEmbedder()
+  memory_service = LocalVectorMemoryService(embedder, embedding_batch_size=2)
+  session = _session('s1', ['cats', 'python', 'weather'])
+
+  await memory_service.add_session_to_memory(session)
+  session.events.append(_session('s1', ['', '', '', 'music']).events[3])
+  await memory_service.add_session_to_memory(session)
+
+  assert embedder.batches == [['cats', 'python'], ['weather'], ['music']]
+
+
+@pytest.mark.asyncio
+async def test_sync_embedding_function_is_supported():
+  memory_service = LocalVectorMemoryService(
+      lambda texts: [[1.0, float(len(text))] for text in texts]
+  )
+  await memory_service.add_session_to_memory(_session('s1', ['a', 'bbbb']))
+
+  assert (await _search(memory_service, 'ccccc'))[0] == 'bbbb'
+
+
+@pytest.mark.asyncio
+async def test_memories_persist_across_instances(tmp_path):
+  embedder = _KeywordEmbedder()
+  memory_service = LocalVectorMemoryService(embedder, persist_dir=tmp_path)
+  await memory_service.add_session_to_memory(
+      _session('s1', ['I have cats.', 'The weather is cold.'])
+  )
+
+  reloaded = LocalVectorMemoryService(embedder, persist_dir=tmp_path)
+  assert await _search(reloaded, 'weather') == [
+      'The weather is cold.',
+      'I have cats.',
+  ]
+
+  # Re-adding a stored session does not embed its events again.
+  embedder.batches.clear()
+  await reloaded.add_session_to_memory(
+      _session('s1', ['I have cats.', 'The weather is cold.'])
+  )
+  assert not embedder.batches
+
+
+@pytest.mark.asyncio
+async def test_partially_written_entry_is_dropped_on_load(tmp_path):
+  embedder = _KeywordEmbedder()
+  memory_service = LocalVectorMemoryService(embedder, persist_dir=tmp_path)
+  await memory_service.add_session_to_memory(_session('s1', ['cats']))
+  entries_path = os.path.join(tmp_path, APP_NAME, USER_ID, 'entries.jsonl')
+  with open(entries_path, 'a', encoding='utf-8') as f:
+    f.write('{"session_id": "s2"')
+
+  reloaded = LocalVectorMemoryService(embedder, persist_dir=tmp_path)
+  await reloaded.add_session_to_memory(_session('s2', ['music']))
+
+  assert await _search(reloaded, 'music') == ['music', 'cats']
+
+
+@pytest.mark.asyncio
+async def test_ivf_index_finds_nearest_neighbors():
+  rng = np.random.default_rng(1)
+  clusters = rng.normal(size=(8, 16))
+  vectors = {}
+  texts = []
+  for i in range(800):
+    text = f'memory {i}'
+    vectors[text] = clusters[i % 8] + 0.05 * rng.normal(size=16)
+    texts.append(text)
+
+  def _embed(batch):
+    return [vectors.get(text, clusters[3]) for text in batch]
+
+  memory_service = LocalVectorMemoryService(
+      _embed, top_k=5, ivf_partitions=8, ivf_probes=2
+  )
+  await memory_service.add_session_to_memory(_session('s1', texts))
+
+  store = memory_service._stores[(APP_NAME, USER_ID)]
+  assert store.ivf is not None
+  results = await _search(memory_service, 'query')
+  assert len(results) == 5
+  assert all(int(text.split()[1]) % 8 == 3 for text in results)
+
+
+@pytest.mark.asyncio
+async def test_ivf_training_runs_off_the_event_loop():
+  rng = np.random.default_rng(2)
+  vectors = {f'memory {i}': rng.normal(size=8) for i in range(400)}
+  train = local_vector_memory_service._IvfIndex.train
+  training_threads = []
+  late_rows = []
+  memory_service = None
+
+  def _train(rows, num_partitions):
+    training_threads.append(threading.current_thread())
+    # Rows stored while training are assigned when the index is swapped in.
+    store = memory_service._stores[(APP_NAME, USER_ID)]
+    with memory_service._lock:
+      store.append(
+          np.ones((1, 8), dtype=np.float32), ['{"late": true}\n']
+      )
+    late_rows.append(store.count - 1)
+    return train(rows, num_partitions)
+
+  memory_service = LocalVectorMemoryService(
+      lambda batch: [vectors[text] for text in batch], ivf_partitions=4
+  )
+  with mock.patch.object(
+      local_vector_memory_service._IvfIndex, 'train', side_effect=_train
+  ):
+    await memory_service.add_session_to_memory(
+        _session('s1', list(vectors))
+    )
+
+  assert training_threads
+  assert threading.main_thread() not in training_threads
+  store = memory_service._stores[(APP_NAME, USER_ID)]
+  assert store.ivf.trained_rows == 400
+  assert any(
+      late_rows[0] in partition for partition in store.ivf._partitions
+  )
+  assert not store.ivf_training
+
+
+@pytest.mark.asyncio
+async def test_embedding_dimension_mismatch_raises():
+  dims = iter([2, 3])
+
+  def _embed(texts):
+    dim = next(dims)
+    return [[1.0] * dim for _ in texts]
+
+  memory_service = LocalVectorMemoryService(_embed)
+  await memory_service.add_session_to_memory(_session('s1', ['a']))
+  with pytest.raises(ValueError, match='dimension'):
+    await memory_service.add_session_to_memory(_session('s2', ['b']))
@@ -0,0 +1,154 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import mock
+
+from google.adk.events.event import Event
+from google.adk.memory.base_memory_service import SearchMemoryResponse
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.memory.memory_entry import MemoryEntry
+from google.adk.memory.memory_search_cache import CachingMemoryService
+from google.adk.memory.memory_search_cache import MemorySearchCache
+from google.adk.sessions.session import Session
+from google.genai import types
+import pytest
+
+APP_NAME = 'test-app'
+USER_ID = 'test-user'
+
+
+class _CountingMemoryService(InMemoryMemoryService):
+
+  def __init__(self, delay: float = 0.0):
+    super().__init__()
+    self.queries: list[str] = []
+    self._delay = delay
+
+  async def search_memory(self, *, app_name, user_id, query):
+    self.queries.append(query)
+    await asyncio.sleep(self._delay)
+    return SearchMemoryResponse(
+        memories=[
+            MemoryEntry(
+                author='user',
+                content=types.Content(parts=[types.Part(text=f'{query}!')]),
+            )
+        ]
+    )
+
+
+def _session(texts: list[str]) -> Session:
+  return Session(
+      app_name=APP_NAME,
+      user_id=USER_ID,
+      id='s1',
+      last_update_time=0,
+      events=[
+          Event(
+              id=f'e{i}',
+              invocation_id='inv',
+              author='user',
+              timestamp=i,
+              content=types.Content(parts=[types.Part(text=text)]),
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+@pytest.mark.asyncio
+async def test_invocation_cache_shares_concurrent_and_repeated_searches():
+  memory_service = _CountingMemoryService(delay=0.01)
+  cache = MemorySearchCache()
+
+  async def _search(query, user_id=USER_ID):
+    return await cache.search_memory(
+        memory_service, app_name=APP_NAME, user_id=user_id, query=query
+    )
+
+  responses = await asyncio.gather(_search('cats'), _search('cats'))
+  await _search('cats')
+  await _search('cats', user_id='other-user')
+
+  assert memory_service.queries == ['cats', 'cats']
+  assert (cache.hits, cache.misses) == (2, 2)
+  assert responses[0].memories == responses[1].memories
+  responses[0].memories[0].content.parts[0].text = 'changed'
+  responses[0].memories.clear()
+  cached = (await _search('cats')).memories
+  assert [m.content.parts[0].text for m in cached] == ['cats!']
+
+  cache.invalidate(APP_NAME, USER_ID)
+  await _search('cats')
+  assert len(memory_service.queries) == 3
+
+
+@pytest.mark.asyncio
+async def test_invocation_cache_does_not_cache_failures():
+  memory_service = mock.AsyncMock()
+  memory_service.search_memory.side_effect = [
+      RuntimeError('unavailable'),
+      SearchMemoryResponse(),
+  ]
+  cache = MemorySearchCache()
+
+  with pytest.raises(RuntimeError):
+    await cache.search_memory(
+        memory_service, app_name=APP_NAME, user_id=USER_ID, query='q'
+    )
+  await cache.search_memory(
+      memory_service, app_name=APP_NAME, user_id=USER_ID, query='q'
+  )
+
+  assert memory_service.search_memory.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_caching_memory_service_expires_and_invalidates_on_add():
+  memory_service = _CountingMemoryService()
+  caching_service = CachingMemoryService(memory_service, ttl_seconds=10)
+
+  with mock.patch('time.monotonic', return_value=100.0):
+    await caching_service.search_memory(
+        app_name=APP_NAME, user_id=USER_ID, query='cats'
+    )
+    await caching_service.search_memory(
+        app_name=APP_NAME, user_id=USER_ID, query='cats'
+    )
+  assert memory_service.queries == ['cats']
+  assert (caching_service.hits, caching_service.misses) == (1, 1)
+
+  with mock.patch('time.monotonic', return_value=111.0):
+    await caching_service.search_memory(
+        app_name=APP_NAME, user_id=USER_ID, query='cats'
+    )
+    await caching_service.add_session_to_memory(_session(['new memory']))
+    await caching_service.search_memory(
+        app_name=APP_NAME, user_id=USER_ID, query='cats'
+    )
+  assert memory_service.queries == ['cats', 'cats', 'cats']
+
+
+@pytest.mark.asyncio
+async def test_caching_memory_service_evicts_least_recently_used():
+  memory_service = _CountingMemoryService()
+  caching_service = CachingMemoryService(memory_service, max_entries=2)
+
+  for query in ['a', 'b', 'a', 'c', 'a', 'b']:
+    await caching_service.search_memory(
+        app_name=APP_NAME, user_id=USER_ID, query=query
+    )
+
+  assert memory_service.queries == ['a', 'b', 'c', 'b']
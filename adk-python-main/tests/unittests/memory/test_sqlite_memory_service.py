@@ -0,0 +1,169 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+
+from google.adk.events.event import Event
+from google.adk.memory.sqlite_memory_service import SqliteMemoryService
+from google.adk.sessions.session import Session
+from google.adk.sessions.sqlite_session_service import SqliteSessionService
+from google.genai import types
+import pytest
+
+APP_NAME = 'test-app'
+USER_ID = 'test-user'
+
+
+def _session(
+    session_id: str, texts: list[str], user_id: str = USER_ID
+) -> Session:
+  return Session(
+      app_name=APP_NAME,
+      user_id=user_id,
+      id=session_id,
+      last_update_time=1000,
+      events=[
+          Event(
+              id=f'{session_id}-{i}',
+              invocation_id=f'inv-{i}',
+              author='user',
+              timestamp=1000 + i,
+              content=types.Content(parts=[types.Part(text=text)]),
+          )
+          for i, text in enumerate(texts)
+      ],
+  )
+
+
+async def _texts(memory_service, query, user_id=USER_ID) -> list[str]:
+  response = await memory_service.search_memory(
+      app_name=APP_NAME, user_id=user_id, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+  return str(tmp_path / 'adk.db')
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_with_bm25_and_returns_snippets(db_path):
+  memory_service = SqliteMemoryService(db_path)
+  await memory_service.add_session_to_memory(
+      _session(
+          's1',
+          [
+              'We talked about the weather today.',
+              'My favorite color is blue, like the ocean.',
+              'The ocean is blue and the weather is nice.',
+          ],
+      )
+  )
+
+  response = await memory_service.search_memory(
+      app_name=APP_NAME, user_id=USER_ID, query='Blue ocean weather?'
+  )
+
+  assert [m.content.parts[0].text for m in response.memories] == [
+      'The ocean is blue and the weather is nice.',
+      'My favorite color is blue, like the ocean.',
+      'We talked about the weather today.',
+  ]
+  first = response.memories[0]
+  assert first.id == 's1-2'
+  assert first.author == 'user'
+  assert 'ocean is blue' in first.custom_metadata['snippet']
+  scores = [m.custom_metadata['score'] for m in response.memories]
+  assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_search_top_k_and_case_and_diacritics_folding(db_path):
+  memory_service = SqliteMemoryService(db_path, top_k=2)
+  await memory_service.add_session_to_memory(
+      _session('s1', ['Café au lait', 'café crème', 'CAFE noir', 'tea'])
+  )
+
+  assert len(await _texts(memory_service, 'cafe')) == 2
+  assert await _texts(memory_service, 'TEA') == ['tea']
+  assert await _texts(memory_service, '?!') == []
+
+
+@pytest.mark.asyncio
+async def test_search_is_scoped_by_user(db_path):
+  memory_service = SqliteMemoryService(db_path)
+  await memory_service.add_session_to_memory(_session('s1', ['public note']))
+  await memory_service.add_session_to_memory(
+      _session('s2', ['This is a secret.'], user_id='other-user')
+  )
+
+  assert await _texts(memory_service, 'secret') == []
+  assert await _texts(memory_service, 'secret', user_id='other-user') == [
+      'This is a secret.'
+  ]
+
+
+@pytest.mark.asyncio
+async def test_readding_session_is_idempotent(db_path):
+  memory_service = SqliteMemoryService(db_path)
+  session = _session('s1', ['apples', 'bananas'])
+  await memory_service.add_session_to_memory(session)
+  session.events.append(_session('s1', ['', '', 'more apples']).events[2])
+  await memory_service.add_session_to_memory(session)
+
+  assert await _texts(memory_service, 'apples') == ['apples', 'more apples']
+  with sqlite3.connect(db_path) as conn:
+    (count,) = conn.execute('SELECT COUNT(*) FROM memory_entries').fetchone()
+  assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_events_without_text_and_query_syntax_are_ignored(db_path):
+  memory_service = SqliteMemoryService(db_path)
+  session = _session('s1', ['NOT a "quoted" AND OR term'])
+  session.events.append(Event(id='empty', invocation_id='inv', author='user'))
+  await memory_service.add_session_to_memory(session)
+
+  assert await _texts(memory_service, 'NOT "quoted" *') == [
+      'NOT a "quoted" AND OR term'
+  ]
+
+
+@pytest.mark.asyncio
+async def test_shares_database_file_with_session_service(db_path):
+  session_service = SqliteSessionService(db_path)
+  memory_service = SqliteMemoryService(f'sqlite:///{db_path}')
+  session = await session_service.create_session(
+      app_name=APP_NAME, user_id=USER_ID, session_id='s1'
+  )
+  await session_service.append_event(
+      session,
+      Event(
+          invocation_id='inv',
+          author='user',
+          content=types.Content(parts=[types.Part(text='remember the milk')]),
+      ),
+  )
+
+  await memory_service.add_session_to_memory(
+      await session_service.get_session(
+          app_name=APP_NAME, user_id=USER_ID, session_id='s1'
+      )
+  )
+
+  assert await _texts(memory_service, 'milk') == ['remember the milk']
+  assert await session_service.get_session(
+      app_name=APP_NAME, user_id=USER_ID, session_id='s1'
+  )
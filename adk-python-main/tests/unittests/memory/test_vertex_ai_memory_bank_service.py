@@ -139,6 +139,30 @@ async def test_add_empty_session_to_memory(mock_vertexai_client):
   mock_vertexai_client.agent_engines.memories.generate.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_readding_session_sends_only_new_events(mock_vertexai_client):
+  memory_service = mock_vertex_ai_memory_bank_service()
+  session = MOCK_SESSION.model_copy(deep=True)
+  await memory_service.add_session_to_memory(session)
+  session.events.append(
+      Event(
+          id='777',
+          invocation_id='789',
+          author='user',
+          timestamp=34567,
+          content=types.Content(parts=[types.Part(text='new_content')]),
+      )
+  )
+  await memory_service.add_session_to_memory(session)
+  await memory_service.add_session_to_memory(session)
+
+  generate = mock_vertexai_client.agent_engines.memories.generate
+  assert generate.call_count == 2
+  assert generate.call_args.kwargs['direct_contents_source'] == {
+      'events': [{'content': {'parts': [{'text': 'new_content'}]}}]
+  }
+
+
 @pytest.mark.asyncio
 async def test_search_memory(mock_vertexai_client):
   retrieved_memory = mock.MagicMock()
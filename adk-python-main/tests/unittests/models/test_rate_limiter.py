@@ -0,0 +1,338 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the client-side model rate limiter."""
+
+import asyncio
+from unittest import mock
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.flows.llm_flows import base_llm_flow
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.models.rate_limiter import get_rate_limiter
+from google.adk.models.rate_limiter import is_resource_exhausted_error
+from google.adk.models.rate_limiter import ModelRateLimiter
+from google.adk.models.rate_limiter import RateLimitConfig
+from google.genai import types
+from google.genai.errors import ClientError
+import pytest
+
+from .. import testing_utils
+
+
+class _FakeClock:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+def _quota_error() -> ClientError:
+  return ClientError(
+      code=429,
+      response_json={
+          'error': {'message': 'quota', 'status': 'RESOURCE_EXHAUSTED'}
+      },
+  )
+
+
+def test_is_resource_exhausted_error():
+  assert is_resource_exhausted_error(_quota_error())
+  assert is_resource_exhausted_error(RuntimeError('RESOURCE_EXHAUSTED'))
+  assert not is_resource_exhausted_error(ValueError('boom'))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_blocks_until_release():
+  limiter = ModelRateLimiter(RateLimitConfig(max_concurrency=1))
+  order = []
+
+  async def _call(name: str):
+    async with limiter.acquire(fairness_key=name):
+      order.append(f'start-{name}')
+      await asyncio.sleep(0.01)
+      order.append(f'end-{name}')
+
+  await asyncio.gather(_call('a'), _call('b'))
+
+  assert order == ['start-a', 'end-a', 'start-b', 'end-b']
+  assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_aimd_decreases_on_quota_error_and_increases_on_success():
+  limiter = ModelRateLimiter(
+      RateLimitConfig(max_concurrency=8, additive_increase=1.0)
+  )
+
+  with pytest.raises(ClientError):
+    async with limiter.acquire():
+      raise _quota_error()
+  assert limiter.concurrency_limit == 4
+
+  # Non-quota errors leave the limit unchanged.
+  with pytest.raises(ValueError):
+    async with limiter.acquire():
+      raise ValueError('boom')
+  assert limiter.concurrency_limit == 4
+
+  # Roughly one full window of successes grows the limit by one.
+  for _ in range(5):
+    async with limiter.acquire():
+      pass
+  assert limiter.concurrency_limit == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_quota_errors_decrease_once():
+  limiter = ModelRateLimiter(RateLimitConfig(max_concurrency=8))
+  started = asyncio.Event()
+  in_flight = 0
+
+  async def _call():
+    nonlocal in_flight
+    async with limiter.acquire() as lease:
+      in_flight += 1
+      if in_flight == 3:
+        started.set()
+      await started.wait()
+      lease.record_throttled()
+
+  await asyncio.gather(_call(), _call(), _call())
+
+  assert limiter.concurrency_limit == 4
+
+
+@pytest.mark.asyncio
+async def test_fair_queuing_across_fairness_keys():
+  limiter = ModelRateLimiter(RateLimitConfig(max_concurrency=1))
+  order = []
+  blocker = asyncio.Event()
+
+  async def _hold():
+    async with limiter.acquire(fairness_key='holder'):
+      await blocker.wait()
+
+  async def _call(key: str, index: int):
+    async with limiter.acquire(fairness_key=key):
+      order.append(f'{key}{index}')
+
+  holder = asyncio.create_task(_hold())
+  await asyncio.sleep(0)
+  tasks = [asyncio.create_task(_call('a', i)) for i in range(3)]
+  tasks.append(asyncio.create_task(_call('b', 0)))
+  await asyncio.sleep(0)
+  assert limiter.queue_depth == 4
+
+  blocker.set()
+  await asyncio.gather(holder, *tasks)
+
+  assert order == ['a0', 'b0', 'a1', 'a2']
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_delays_requests(monkeypatch):
+  clock = _FakeClock()
+  limiter = ModelRateLimiter(
+      RateLimitConfig(requests_per_minute=60), clock=clock
+  )
+  for _ in range(60):
+    async with limiter.acquire():
+      pass
+
+  waits = []
+
+  async def _fake_wait_for(awaitable, timeout):
+    awaitable.close()
+    waits.append(timeout)
+    clock.now += timeout
+    raise asyncio.TimeoutError()
+
+  monkeypatch.setattr(asyncio, 'wait_for', _fake_wait_for)
+  async with limiter.acquire() as lease:
+    assert lease.queue_wait_seconds == pytest.approx(1.0)
+  assert waits == [pytest.approx(1.0)]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed():
+  limiter = ModelRateLimiter(RateLimitConfig(max_concurrency=1))
+  blocker = asyncio.Event()
+
+  async def _hold():
+    async with limiter.acquire():
+      await blocker.wait()
+
+  async def _call():
+    async with limiter.acquire():
+      pass
+
+  holder = asyncio.create_task(_hold())
+  await asyncio.sleep(0)
+  waiter = asyncio.create_task(_call())
+  await asyncio.sleep(0)
+  assert limiter.queue_depth == 1
+
+  waiter.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await waiter
+  assert limiter.queue_depth == 0
+
+  blocker.set()
+  await holder
+  assert limiter.in_flight == 0
+
+
+def test_get_rate_limiter_shares_instances_per_key():
+  config = RateLimitConfig(key='test-shared-key')
+  assert get_rate_limiter('test-shared-key', config) is get_rate_limiter(
+      'test-shared-key', config
+  )
+
+
+def test_get_rate_limiter_warns_once_on_config_mismatch(caplog):
+  first = get_rate_limiter(
+      'test-mismatch-key', RateLimitConfig(max_concurrency=4)
+  )
+
+  with caplog.at_level('WARNING'):
+    for _ in range(2):
+      assert (
+          get_rate_limiter(
+              'test-mismatch-key', RateLimitConfig(max_concurrency=8)
+          )
+          is first
+      )
+
+  warnings = [r for r in caplog.records if 'test-mismatch-key' in r.message]
+  assert len(warnings) == 1
+  assert first.config.max_concurrency == 4
+
+
+def test_model_rate_limiter_uses_key_or_model_name():
+  model = testing_utils.MockModel.create(responses=['hi'])
+  assert model.rate_limiter is None
+
+  model.rate_limit_config = RateLimitConfig(key='test-model-key')
+  assert model.rate_limiter is get_rate_limiter(
+      'test-model-key', model.rate_limit_config
+  )
+
+
+@pytest.mark.asyncio
+async def test_flow_reduces_limit_on_quota_error_response():
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          LlmResponse(error_code='RESOURCE_EXHAUSTED', error_message='quota'),
+      ]
+  )
+  mock_model.rate_limit_config = RateLimitConfig(
+      key='test-flow-key', max_concurrency=4
+  )
+  agent = Agent(name='test_agent', model=mock_model)
+  runner = testing_utils.InMemoryRunner(agent)
+
+  runner.run('test')
+
+  limiter = mock_model.rate_limiter
+  assert limiter.concurrency_limit == 2
+  assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_flow_releases_slot_before_running_tools():
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          types.Part.from_function_call(name='slow_tool', args={}),
+          'done',
+      ]
+  )
+  mock_model.rate_limit_config = RateLimitConfig(
+      key='test-slow-consumer-key', max_concurrency=1
+  )
+  limiter = mock_model.rate_limiter
+  in_flight_during_tool = []
+
+  async def slow_tool() -> str:
+    in_flight_during_tool.append(limiter.in_flight)
+    # Another session's model call is admitted while this tool runs.
+    async with limiter.acquire(fairness_key='other-session'):
+      await asyncio.sleep(0.01)
+    return 'ok'
+
+  agent = Agent(name='test_agent', model=mock_model, tools=[slow_tool])
+  runner = testing_utils.InMemoryRunner(agent)
+
+  events = await asyncio.wait_for(runner.run_async('test'), timeout=5)
+
+  assert in_flight_during_tool == [0]
+  assert events[-1].content.parts[0].text == 'done'
+  assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_flow_reads_model_stream_at_the_pace_of_the_consumer():
+  limiter = ModelRateLimiter(RateLimitConfig(key='test-stream-key'))
+  produced = []
+
+  async def _stream():
+    for i in range(10):
+      produced.append(i)
+      yield LlmResponse(partial=True)
+
+  responses = base_llm_flow._generate_with_rate_limit(
+      limiter,
+      _stream(),
+      LlmRequest(),
+      mock.Mock(session=mock.Mock(id='session')),
+      mock.Mock(),
+  )
+  read_ahead = []
+  async for _ in responses:
+    await asyncio.sleep(0)
+    read_ahead.append(len(produced))
+  consumed = range(1, len(read_ahead) + 1)
+
+  assert len(read_ahead) == 10
+  assert max(p - c for p, c in zip(read_ahead, consumed)) <= 2
+  assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_flow_stops_the_model_stream_when_the_consumer_stops():
+  limiter = ModelRateLimiter(RateLimitConfig(key='test-stream-stop-key'))
+  produced = []
+
+  async def _stream():
+    for i in range(100):
+      produced.append(i)
+      yield LlmResponse(partial=True)
+
+  responses = base_llm_flow._generate_with_rate_limit(
+      limiter,
+      _stream(),
+      LlmRequest(),
+      mock.Mock(session=mock.Mock(id='session')),
+      mock.Mock(),
+  )
+  await responses.__anext__()
+  await asyncio.sleep(0)
+
+  await asyncio.wait_for(responses.aclose(), timeout=5)
+
+  assert len(produced) <= 3
+  assert limiter.in_flight == 0
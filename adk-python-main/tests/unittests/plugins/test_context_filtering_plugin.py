@@ -291,3 +291,39 @@ async def test_filter_with_nested_function_calls():
           response_ids.add(part.function_response.id)
 
   assert response_ids.issubset(call_ids)
+
+
+@pytest.mark.asyncio
+async def test_filter_by_max_tokens():
+  """Tests that only the most recent contents within the budget are kept."""
+  plugin = ContextFilterPlugin(max_tokens=10)
+  contents = [
+      _create_content("user", "a" * 40),
+      _create_content("model", "b" * 20),
+      _create_content("user", "c" * 20),
+  ]
+  llm_request = LlmRequest(contents=contents)
+
+  await plugin.before_model_callback(
+      callback_context=Mock(spec=CallbackContext), llm_request=llm_request
+  )
+
+  assert [c.parts[0].text[0] for c in llm_request.contents] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_filter_by_max_tokens_keeps_latest_content():
+  """Tests that the latest content is kept even if it exceeds the budget."""
+  plugin = ContextFilterPlugin(max_tokens=1)
+  contents = [
+      _create_content("user", "user_prompt_1"),
+      _create_content("model", "model_response_1"),
+  ]
+  llm_request = LlmRequest(contents=contents)
+
+  await plugin.before_model_callback(
+      callback_context=Mock(spec=CallbackContext), llm_request=llm_request
+  )
+
+  assert len(llm_request.contents) == 1
+  assert llm_request.contents[0].parts[0].text == "model_response_1"
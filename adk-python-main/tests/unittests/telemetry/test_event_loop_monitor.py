@@ -0,0 +1,118 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import logging
+import time
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.telemetry import event_loop_monitor
+from google.adk.telemetry import metrics as adk_metrics
+from google.adk.telemetry.event_loop_monitor import EventLoopMonitor
+from google.adk.telemetry.event_loop_monitor import track_activity
+from google.genai import types
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+import pytest
+
+from .. import testing_utils
+
+
+@pytest.fixture
+def metric_reader(monkeypatch) -> InMemoryMetricReader:
+  reader = InMemoryMetricReader()
+  monkeypatch.setattr(
+      adk_metrics,
+      '_instruments',
+      adk_metrics._Instruments(MeterProvider(metric_readers=[reader])),
+  )
+  return reader
+
+
+def _stall_attributes(reader: InMemoryMetricReader) -> list[dict]:
+  metrics_data = reader.get_metrics_data()
+  return [
+      dict(point.attributes)
+      for resource_metrics in metrics_data.resource_metrics
+      for scope_metrics in resource_metrics.scope_metrics
+      for metric in scope_metrics.metrics
+      if metric.name == adk_metrics.EVENT_LOOP_STALL_DURATION
+      for point in metric.data.data_points
+  ]
+
+
+def _block_the_loop():
+  time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_reports_stalls_with_the_running_activity(metric_reader, caplog):
+  monitor = EventLoopMonitor(threshold_seconds=0.1)
+  monitor.start()
+  try:
+    with caplog.at_level(logging.WARNING):
+      with track_activity(None, 'plugin', 'slow_plugin.before_run_callback'):
+        _block_the_loop()
+      # Lets the monitor's wakeup run.
+      await asyncio.sleep(0.1)
+  finally:
+    await monitor.stop()
+
+  assert monitor.stall_count >= 1
+  assert {
+      'adk.stall.kind': 'plugin',
+      'adk.stall.name': 'slow_plugin.before_run_callback',
+  } in _stall_attributes(metric_reader)
+  messages = [
+      r.getMessage() for r in caplog.records if 'by plugin' in r.getMessage()
+  ]
+  assert "by plugin 'slow_plugin.before_run_callback'" in messages[0]
+  assert '_block_the_loop' in messages[0]
+  assert not event_loop_monitor._activities
+
+
+def test_tracking_is_a_no_op_without_a_monitor():
+  assert isinstance(
+      track_activity(None, 'tool', 'tool'), contextlib.nullcontext
+  )
+
+
+@pytest.mark.asyncio
+async def test_attributes_stalls_to_blocking_tools(metric_reader, caplog):
+  def slow_tool() -> str:
+    time.sleep(0.3)
+    return 'done'
+
+  model = testing_utils.MockModel.create(
+      responses=[types.Part.from_function_call(name='slow_tool', args={}), 'ok']
+  )
+  agent = Agent(name='root_agent', model=model, tools=[slow_tool])
+  runner = testing_utils.InMemoryRunner(agent)
+  monitor = EventLoopMonitor(threshold_seconds=0.1)
+  monitor.start()
+  try:
+    with caplog.at_level(logging.WARNING):
+      await runner.run_async('hi')
+      await asyncio.sleep(0.1)
+  finally:
+    await monitor.stop()
+
+  assert {'adk.stall.kind': 'tool', 'adk.stall.name': 'slow_tool'} in (
+      _stall_attributes(metric_reader)
+  )
+  assert any(
+      "by tool 'slow_tool' (agent 'root_agent'" in r.getMessage()
+      for r in caplog.records
+  )
@@ -0,0 +1,156 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.telemetry import metrics as adk_metrics
+from google.genai import types
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+import pytest
+
+from .. import testing_utils
+
+
+@pytest.fixture
+def metric_reader(monkeypatch) -> InMemoryMetricReader:
+  reader = InMemoryMetricReader()
+  monkeypatch.setattr(
+      adk_metrics,
+      '_instruments',
+      adk_metrics._Instruments(MeterProvider(metric_readers=[reader])),
+  )
+  return reader
+
+
+def _points(reader: InMemoryMetricReader) -> dict[str, list]:
+  points = {}
+  metrics_data = reader.get_metrics_data()
+  if metrics_data is None:
+    return points
+  for resource_metrics in metrics_data.resource_metrics:
+    for scope_metrics in resource_metrics.scope_metrics:
+      for metric in scope_metrics.metrics:
+        points[metric.name] = list(metric.data.data_points)
+  return points
+
+
+def test_measure_records_errors(metric_reader):
+  with adk_metrics.measure(adk_metrics.COMPACTION_DURATION):
+    pass
+  with pytest.raises(ValueError):
+    with adk_metrics.measure(adk_metrics.COMPACTION_DURATION, {'a': 'b'}):
+      raise ValueError()
+
+  points = _points(metric_reader)[adk_metrics.COMPACTION_DURATION]
+  assert sorted(dict(p.attributes).get('error.type', '') for p in points) == [
+      '',
+      'ValueError',
+  ]
+  assert all(p.count == 1 for p in points)
+
+
+@pytest.mark.asyncio
+async def test_measure_stream_excludes_time_between_items(metric_reader):
+  async def stream():
+    yield 1
+    yield 2
+
+  times = [0.0, 1.0, 1.5, 10.0, 12.0, 14.0]
+  with mock.patch('time.perf_counter', side_effect=times):
+    async for _ in adk_metrics.measure_stream(
+        stream(),
+        adk_metrics.LLM_CALL_DURATION,
+        first_item_name=adk_metrics.LLM_TIME_TO_FIRST_TOKEN,
+    ):
+      pass
+
+  points = _points(metric_reader)
+  # The caller holds the items from 1.0 to 1.5 and from 10.0 to 12.0.
+  assert points[adk_metrics.LLM_TIME_TO_FIRST_TOKEN][0].sum == 1.0
+  assert points[adk_metrics.LLM_CALL_DURATION][0].sum == 1.0 + 8.5 + 2.0
+
+
+def test_runner_records_invocation_phases(metric_reader):
+  def get_weather(city: str) -> str:
+    return f'Sunny in {city}'
+
+  class _NoopPlugin(BasePlugin):
+    pass
+
+  model = testing_utils.MockModel.create(
+      responses=[
+          types.Part.from_function_call(
+              name='get_weather', args={'city': 'Paris'}
+          ),
+          'done',
+      ]
+  )
+  agent = Agent(name='root_agent', model=model, tools=[get_weather])
+  runner = testing_utils.InMemoryRunner(agent, plugins=[_NoopPlugin('noop')])
+
+  runner.run('hi')
+
+  points = _points(metric_reader)
+  assert points[adk_metrics.SESSION_LOAD_DURATION][0].count == 1
+  # The user message, the function call and response, and the final answer.
+  assert points[adk_metrics.APPEND_EVENT_DURATION][0].count == 4
+  assert points[adk_metrics.LLM_CALL_DURATION][0].count == 2
+  assert points[adk_metrics.LLM_TIME_TO_FIRST_TOKEN][0].count == 2
+  assert dict(points[adk_metrics.LLM_CALL_DURATION][0].attributes) == {
+      'gen_ai.request.model': 'mock'
+  }
+  processors = {
+      p.attributes['adk.processor']
+      for p in points[adk_metrics.REQUEST_PROCESSOR_DURATION]
+  }
+  assert {'_BasicLlmRequestProcessor', 'tools'} <= processors
+  (tool_point,) = points[adk_metrics.TOOL_EXECUTION_DURATION]
+  assert dict(tool_point.attributes) == {'gen_ai.tool.name': 'get_weather'}
+  (queue_point,) = points[adk_metrics.TOOL_QUEUE_DURATION]
+  assert queue_point.attributes['adk.queue'] == 'task'
+  callbacks = {
+      (p.attributes['adk.plugin'], p.attributes['adk.callback'])
+      for p in points[adk_metrics.PLUGIN_CALLBACK_DURATION]
+  }
+  assert ('noop', 'before_run_callback') in callbacks
+  assert ('noop', 'before_tool_callback') in callbacks
+
+
+def test_to_prometheus_text(metric_reader):
+  adk_metrics.record_duration(
+      adk_metrics.TOOL_EXECUTION_DURATION, 0.05, {'gen_ai.tool.name': 'a"b'}
+  )
+
+  text = adk_metrics.to_prometheus_text(metric_reader.get_metrics_data())
+
+  lines = text.splitlines()
+  assert '# TYPE adk_tool_execution_duration_seconds histogram' in lines
+  assert (
+      'adk_tool_execution_duration_seconds_bucket'
+      '{gen_ai_tool_name="a\\"b",le="0.04"} 0'
+      in lines
+  )
+  assert (
+      'adk_tool_execution_duration_seconds_bucket'
+      '{gen_ai_tool_name="a\\"b",le="+Inf"} 1'
+      in lines
+  )
+  assert (
+      'adk_tool_execution_duration_seconds_count{gen_ai_tool_name="a\\"b"} 1'
+      in lines
+  )
+  assert adk_metrics.to_prometheus_text(None) == ''
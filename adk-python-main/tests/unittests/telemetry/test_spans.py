@@ -23,7 +23,11 @@ from google.adk.agents.llm_agent import LlmAgent
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.telemetry import tracing
 from google.adk.telemetry.tracing import ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS
+from google.adk.telemetry.tracing import ADK_SPAN_PAYLOAD_CONTENTS
+from google.adk.telemetry.tracing import ADK_SPAN_PAYLOAD_MAX_BYTES
+from google.adk.telemetry.tracing import ADK_SPAN_PAYLOAD_SAMPLE_RATE
 from google.adk.telemetry.tracing import trace_agent_invocation
 from google.adk.telemetry.tracing import trace_call_llm
 from google.adk.telemetry.tracing import trace_generate_content_result
@@ -501,6 +505,184 @@ async def test_call_llm_disabling_request_response_content(
   )
 
 
+def _attribute(span, name):
+  values = [
+      call_obj.args[1]
+      for call_obj in span.set_attribute.call_args_list
+      if call_obj.args[0] == name
+  ]
+  return values[-1] if values else None
+
+
+@pytest.mark.asyncio
+async def test_call_llm_does_not_serialize_when_capture_is_disabled(
+    monkeypatch, mock_span_fixture
+):
+  monkeypatch.setenv(ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS, 'false')
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_response = LlmResponse(turn_complete=True)
+
+  with mock.patch.object(
+      LlmResponse, 'model_dump_json', side_effect=AssertionError
+  ):
+    trace_call_llm(
+        invocation_context,
+        'test_event_id',
+        LlmRequest(model='gemini-pro'),
+        llm_response,
+        mock_span_fixture,
+    )
+  mock_span_fixture.is_recording.return_value = False
+  monkeypatch.delenv(ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS)
+  with mock.patch.object(
+      LlmResponse, 'model_dump_json', side_effect=AssertionError
+  ):
+    trace_call_llm(
+        invocation_context,
+        'test_event_id',
+        LlmRequest(model='gemini-pro'),
+        llm_response,
+        mock_span_fixture,
+    )
+
+
+@pytest.mark.asyncio
+async def test_call_llm_truncates_large_payloads(monkeypatch, mock_span_fixture):
+  monkeypatch.setenv(ADK_SPAN_PAYLOAD_MAX_BYTES, '1000')
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(
+      model='gemini-pro',
+      contents=[
+          types.Content(role='user', parts=[types.Part(text='a' * 5000)]),
+          types.Content(role='user', parts=[types.Part(text='the end')]),
+      ],
+  )
+
+  trace_call_llm(
+      invocation_context,
+      'test_event_id',
+      llm_request,
+      LlmResponse(turn_complete=True),
+      mock_span_fixture,
+  )
+
+  payload = _attribute(mock_span_fixture, 'gcp.vertex.agent.llm_request')
+  assert len(payload) < 1100
+  assert payload.startswith('{"model": "gemini-pro"')
+  assert 'bytes truncated>...' in payload
+  assert payload.endswith('"text": "the end"}], "role": "user"}]}')
+
+
+@pytest.mark.asyncio
+async def test_call_llm_captures_content_deltas(monkeypatch):
+  monkeypatch.setenv(ADK_SPAN_PAYLOAD_CONTENTS, 'delta')
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  contents = [
+      types.Content(role='user', parts=[types.Part(text='first')]),
+      types.Content(role='model', parts=[types.Part(text='second')]),
+  ]
+
+  def _trace(contents):
+    span = mock.MagicMock()
+    trace_call_llm(
+        invocation_context,
+        'test_event_id',
+        LlmRequest(model='gemini-pro', contents=contents),
+        LlmResponse(turn_complete=True),
+        span,
+    )
+    return json.loads(_attribute(span, 'gcp.vertex.agent.llm_request'))
+
+  assert len(_trace(contents[:1])['contents']) == 1
+  delta = _trace(contents)
+  assert delta['contents_offset'] == 1
+  assert delta['contents'][0]['parts'][0]['text'] == 'second'
+  # A changed history is captured in full.
+  rewritten = _trace(contents[1:])
+  assert 'contents_offset' not in rewritten
+  assert len(rewritten['contents']) == 1
+
+
+@pytest.mark.asyncio
+async def test_call_llm_serializes_streamed_requests_once(mock_span_fixture):
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(model='gemini-pro')
+
+  with mock.patch(
+      'google.adk.telemetry.tracing._build_llm_request_for_trace',
+      wraps=tracing._build_llm_request_for_trace,
+  ) as build:
+    for _ in range(3):
+      trace_call_llm(
+          invocation_context,
+          'test_event_id',
+          llm_request,
+          LlmResponse(partial=True),
+          mock_span_fixture,
+      )
+
+  assert build.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_call_llm_keeps_request_payloads_until_the_span_ends():
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(
+      model='gemini-pro',
+      contents=[types.Content(role='user', parts=[types.Part(text='hi')])],
+  )
+
+  with tracing.start_call_llm_span() as span:
+    with mock.patch.object(span, 'is_recording', return_value=True):
+      trace_call_llm(
+          invocation_context,
+          'test_event_id',
+          llm_request,
+          LlmResponse(partial=True),
+          span,
+      )
+    assert span in tracing._span_request_payloads
+
+  assert span not in tracing._span_request_payloads
+  # Sessions are only tracked for `ADK_SPAN_PAYLOAD_CONTENTS=delta`.
+  assert invocation_context.session.id not in tracing._session_contents
+
+
+@pytest.mark.asyncio
+async def test_call_llm_samples_payloads_by_trace(monkeypatch):
+  monkeypatch.setenv(ADK_SPAN_PAYLOAD_SAMPLE_RATE, '0.5')
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+
+  def _trace(trace_id, llm_response):
+    span = mock.MagicMock()
+    span.get_span_context.return_value.trace_id = trace_id
+    trace_call_llm(
+        invocation_context,
+        'test_event_id',
+        LlmRequest(model='gemini-pro'),
+        llm_response,
+        span,
+    )
+    return _attribute(span, 'gcp.vertex.agent.llm_response')
+
+  assert _trace(1, LlmResponse(turn_complete=True)) != '{}'
+  assert _trace((1 << 64) - 1, LlmResponse(turn_complete=True)) == '{}'
+  # Failed calls are captured regardless of sampling.
+  assert _trace((1 << 64) - 1, LlmResponse(error_code='500')) != '{}'
+
+
 def test_trace_tool_call_disabling_request_response_content(
     monkeypatch,
     mock_span_fixture,
@@ -291,6 +291,56 @@ async def test_session_auto_creation():
   assert event.content.parts[0].text == "Test LLM response"
 
 
+@pytest.mark.asyncio
+async def test_run_async_uses_preloaded_session():
+  session_service = InMemorySessionService()
+  runner = Runner(
+      app_name=TEST_APP_ID,
+      agent=MockLlmAgent("test_agent"),
+      session_service=session_service,
+  )
+  session = await session_service.create_session(
+      app_name=TEST_APP_ID, user_id=TEST_USER_ID, session_id=TEST_SESSION_ID
+  )
+  session_service.get_session = AsyncMock()
+
+  events = [
+      event
+      async for event in runner.run_async(
+          user_id=TEST_USER_ID,
+          session_id=TEST_SESSION_ID,
+          new_message=types.Content(role="user", parts=[types.Part(text="hi")]),
+          session=session,
+      )
+  ]
+
+  session_service.get_session.assert_not_called()
+  assert events[0].content.parts[0].text == "Test LLM response"
+  # The events are appended to the preloaded session.
+  assert [event.author for event in session.events] == ["user", "test_agent"]
+
+
+@pytest.mark.asyncio
+async def test_run_async_rejects_mismatched_preloaded_session():
+  runner = Runner(
+      app_name=TEST_APP_ID,
+      agent=MockLlmAgent("test_agent"),
+      session_service=InMemorySessionService(),
+  )
+  session = Session(
+      id="other_session", app_name=TEST_APP_ID, user_id=TEST_USER_ID
+  )
+
+  with pytest.raises(ValueError, match="does not match"):
+    async for _ in runner.run_async(
+        user_id=TEST_USER_ID,
+        session_id=TEST_SESSION_ID,
+        new_message=types.Content(role="user", parts=[types.Part(text="hi")]),
+        session=session,
+    ):
+      pass
+
+
 @pytest.mark.asyncio
 async def test_rewind_auto_create_session_on_missing_session():
   """When auto_create_session=True, rewind should create session if missing.
@@ -389,6 +389,48 @@ class MockModel(BaseLlm):
     yield MockLlmConnection(self.responses)
 
 
+class MockBatchModel(BaseLlm):
+  """In-process fake batch backend that echoes the last user text.
+
+  Every submission, single or batched, costs `latency` seconds, so batching
+  many concurrent calls shows up as higher throughput.
+  """
+
+  model: str = 'mock-batch'
+
+  latency: float = 0.0
+  error: Union[Exception, None] = None
+  batch_sizes: list[int] = []
+  single_calls: int = 0
+
+  @staticmethod
+  def _echo(llm_request: LlmRequest) -> LlmResponse:
+    text = ''
+    for content in reversed(llm_request.contents):
+      if content.role == 'user' and content.parts and content.parts[0].text:
+        text = content.parts[0].text
+        break
+    return LlmResponse(content=ModelContent([Part(text=f'echo: {text}')]))
+
+  @override
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    self.single_calls += 1
+    await asyncio.sleep(self.latency)
+    yield self._echo(llm_request)
+
+  @override
+  async def generate_content_batch(
+      self, llm_requests: list[LlmRequest]
+  ) -> list[LlmResponse]:
+    self.batch_sizes.append(len(llm_requests))
+    await asyncio.sleep(self.latency)
+    if self.error is not None:
+      raise self.error
+    return [self._echo(llm_request) for llm_request in llm_requests]
+
+
 class MockLlmConnection(BaseLlmConnection):
 
   def __init__(self, llm_responses: list[LlmResponse]):
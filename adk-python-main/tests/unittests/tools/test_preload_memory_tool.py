@@ -0,0 +1,75 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.memory.base_memory_service import SearchMemoryResponse
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.memory.memory_entry import MemoryEntry
+from google.adk.tools.load_memory_tool import load_memory_tool
+from google.adk.tools.preload_memory_tool import preload_memory_tool
+from google.genai import types
+import pytest
+
+from .. import testing_utils
+
+
+class _CountingMemoryService(InMemoryMemoryService):
+
+  def __init__(self):
+    super().__init__()
+    self.queries: list[str] = []
+
+  async def search_memory(self, *, app_name, user_id, query):
+    self.queries.append(query)
+    return SearchMemoryResponse(
+        memories=[
+            MemoryEntry(
+                author='user',
+                content=types.Content(parts=[types.Part(text=f'{query}!')]),
+            )
+        ]
+    )
+
+
+def _increase(x: int) -> int:
+  return x + 1
+
+
+@pytest.mark.asyncio
+async def test_preload_and_load_memory_search_once_per_invocation():
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          types.Part.from_function_call(name='_increase', args={'x': 1}),
+          types.Part.from_function_call(
+              name='load_memory', args={'query': 'remember cats'}
+          ),
+          'done',
+          'done again',
+      ]
+  )
+  agent = Agent(
+      name='root_agent',
+      model=mock_model,
+      tools=[preload_memory_tool, load_memory_tool, _increase],
+  )
+  runner = testing_utils.InMemoryRunner(agent)
+  memory_service = _CountingMemoryService()
+  runner.runner.memory_service = memory_service
+
+  await runner.run_async('remember cats')
+  assert memory_service.queries == ['remember cats']
+  assert 'remember cats!' in mock_model.requests[2].config.system_instruction
+
+  await runner.run_async('remember cats')
+  assert memory_service.queries == ['remember cats', 'remember cats']
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 from google.adk.agents.llm_agent import Agent
 from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
 from google.adk.sessions.session import Session
 from google.adk.utils import instructions_utils
 import pytest
@@ -267,3 +271,62 @@ async def test_inject_session_state_with_optional_missing_state_returns_empty():
       instruction_template, invocation_context
   )
   assert populated_instruction == "Optional value: "
+
+
+class _SlowArtifactService(MockArtifactService):
+
+  def __init__(self, artifacts: dict):
+    super().__init__(artifacts)
+    self.loads: list[str] = []
+    self.max_concurrent_loads = 0
+    self._concurrent_loads = 0
+
+  async def load_artifact(self, app_name, user_id, session_id, filename):
+    self.loads.append(filename)
+    self._concurrent_loads += 1
+    self.max_concurrent_loads = max(
+        self.max_concurrent_loads, self._concurrent_loads
+    )
+    await asyncio.sleep(0.01)
+    self._concurrent_loads -= 1
+    return await super().load_artifact(app_name, user_id, session_id, filename)
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_loads_artifacts_concurrently_once():
+  instruction_template = "{artifact.a} {artifact.b} {artifact.a} {artifact.c?}"
+  artifact_service = _SlowArtifactService({"a": "A", "b": "B"})
+  readonly_context = await _create_test_readonly_context(
+      artifact_service=artifact_service
+  )
+
+  for _ in range(2):
+    populated_instruction = await instructions_utils.inject_session_state(
+        instruction_template, readonly_context
+    )
+    assert populated_instruction == "A B A "
+
+  assert artifact_service.loads == ["a", "b", "c"]
+  assert artifact_service.max_concurrent_loads == 3
+
+
+@pytest.mark.asyncio
+async def test_inject_session_state_reloads_artifacts_in_artifact_delta():
+  artifact_service = _SlowArtifactService({"a": "A1", "b": "B1"})
+  readonly_context = await _create_test_readonly_context(
+      artifact_service=artifact_service
+  )
+  await instructions_utils.inject_session_state(
+      "{artifact.a} {artifact.b}", readonly_context
+  )
+
+  artifact_service.artifacts.update({"a": "A2", "b": "B2"})
+  readonly_context._invocation_context.session.events.append(
+      Event(author="agent", actions=EventActions(artifact_delta={"a": 1}))
+  )
+  populated_instruction = await instructions_utils.inject_session_state(
+      "{artifact.a} {artifact.b}", readonly_context
+  )
+
+  assert populated_instruction == "A2 B1"
+  assert artifact_service.loads == ["a", "b", "a"]
@@ -200,3 +200,65 @@ class TestStreamingResponseAggregator:
 
     closed_response = aggregator.close()
     assert closed_response is None
+
+  def test_process_delta_aggregates_in_order(self):
+    aggregator = streaming_utils.StreamingResponseAggregator()
+    chunks = [
+        types.Part(text="Let me ", thought=True),
+        types.Part(text="think.", thought=True),
+        types.Part(text="The answer"),
+        types.Part(text=" is 42."),
+    ]
+    deltas = []
+    for i, part in enumerate(chunks):
+      deltas.extend(
+          aggregator.process_delta(
+              types.GenerateContentResponse(
+                  candidates=[
+                      types.Candidate(
+                          content=types.Content(role="model", parts=[part]),
+                          finish_reason=types.FinishReason.STOP
+                          if i == len(chunks) - 1
+                          else None,
+                      )
+                  ]
+              )
+          )
+      )
+
+    assert [d.text for d in deltas] == [c.text for c in chunks]
+    closed = aggregator.close()
+    assert [(p.text, bool(p.thought)) for p in closed.content.parts] == [
+        ("Let me think.", True),
+        ("The answer is 42.", False),
+    ]
+    assert closed.finish_reason == types.FinishReason.STOP
+    assert not closed.partial
+
+
+class TestPartialArgsBuilder:
+
+  def test_build_joins_string_chunks_and_nests_paths(self):
+    builder = streaming_utils._PartialArgsBuilder()
+    for partial_arg in [
+        types.PartialArg(json_path="$.location.city", string_value="New "),
+        types.PartialArg(json_path="$.days", number_value=3),
+        types.PartialArg(json_path="$.location.city", string_value="York"),
+        types.PartialArg(json_path="$.metric", bool_value=True),
+        types.PartialArg(json_path="", string_value="ignored"),
+    ]:
+      builder.add(partial_arg)
+
+    assert builder.build() == {
+        "location": {"city": "New York"},
+        "days": 3,
+        "metric": True,
+    }
+
+  def test_scalar_replaces_streamed_string(self):
+    builder = streaming_utils._PartialArgsBuilder()
+    builder.add(types.PartialArg(json_path="$.value", string_value="abc"))
+    builder.add(types.PartialArg(json_path="$.value", number_value=1))
+    builder.add(types.PartialArg(json_path="$.value", string_value="x"))
+
+    assert builder.build() == {"value": "x"}
@@ -0,0 +1,153 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for token_estimation."""
+
+from google.adk.models.llm_request import LlmRequest
+from google.adk.utils import token_estimation
+from google.adk.utils.token_estimation import CharRatioTokenizer
+from google.adk.utils.token_estimation import TokenEstimator
+from google.genai import types
+import pytest
+
+
+class _CountingTokenizer:
+
+  def __init__(self):
+    self.calls = 0
+
+  def count_tokens(self, text: str) -> int:
+    self.calls += 1
+    return len(text.split())
+
+
+def test_char_ratio_tokenizer():
+  assert CharRatioTokenizer().count_tokens('a' * 40) == 10
+  assert CharRatioTokenizer(chars_per_token=2).count_tokens('a' * 40) == 20
+  with pytest.raises(ValueError):
+    CharRatioTokenizer(chars_per_token=0)
+
+
+def test_count_content_covers_part_types():
+  estimator = TokenEstimator(CharRatioTokenizer())
+  content = types.Content(
+      role='model',
+      parts=[
+          types.Part(text='a' * 40),
+          types.Part(
+              function_call=types.FunctionCall(
+                  name='tool', args={'query': 'x' * 40}
+              )
+          ),
+          types.Part(
+              inline_data=types.Blob(mime_type='image/png', data=b'123')
+          ),
+      ],
+  )
+
+  tokens = estimator.count_content(content)
+
+  assert tokens > 10 + 10 + 258
+
+
+def test_count_content_is_memoized_and_detects_edits():
+  tokenizer = _CountingTokenizer()
+  estimator = TokenEstimator(tokenizer)
+  content = types.UserContent('one two three')
+
+  assert estimator.count_content(content) == 3
+  assert estimator.count_content(content) == 3
+  assert tokenizer.calls == 1
+
+  content.parts[0].text = 'one two three four five'
+  assert estimator.count_content(content) == 5
+  assert tokenizer.calls == 2
+
+
+def test_count_content_detects_edits_of_function_parts():
+  tokenizer = _CountingTokenizer()
+  estimator = TokenEstimator(tokenizer)
+  content = types.Content(
+      role='model',
+      parts=[
+          types.Part(
+              function_call=types.FunctionCall(name='tool', args={'q': 'a'})
+          ),
+          types.Part(
+              function_response=types.FunctionResponse(
+                  name='tool', response={'result': 'one'}
+              )
+          ),
+      ],
+  )
+  tokens = estimator.count_content(content)
+  assert estimator.count_content(content) == tokens
+  calls = tokenizer.calls
+
+  content.parts[0].function_call.args['q'] = 'a b c'
+  assert estimator.count_content(content) == tokens + 2
+  assert tokenizer.calls > calls
+
+  content.parts[1].function_response.response['result'] = 'one two'
+  assert estimator.count_content(content) == tokens + 3
+
+
+def test_memo_entries_are_released_with_contents():
+  estimator = TokenEstimator()
+  content = types.UserContent('hello')
+  estimator.count_content(content)
+  assert len(estimator._memo) == 1
+
+  del content
+
+  assert not estimator._memo
+
+
+def test_count_request_includes_system_instruction_and_tools():
+  estimator = TokenEstimator(CharRatioTokenizer())
+  llm_request = LlmRequest(
+      contents=[types.UserContent('a' * 40), types.UserContent('b' * 40)],
+      config=types.GenerateContentConfig(
+          system_instruction='s' * 40,
+          tools=[
+              types.Tool(
+                  function_declarations=[
+                      types.FunctionDeclaration(name='tool', description='d')
+                  ]
+              )
+          ],
+      ),
+  )
+
+  total = estimator.count_request(llm_request)
+  prefix = estimator.count_request(llm_request, contents_count=1)
+
+  assert total - prefix == 10
+  assert prefix > 20
+
+
+def test_set_default_estimator():
+  original = token_estimation.get_default_estimator()
+  try:
+    token_estimation.set_default_estimator(
+        TokenEstimator(_CountingTokenizer())
+    )
+    assert (
+        token_estimation.estimate_content_tokens(
+            types.UserContent('one two')
+        )
+        == 2
+    )
+  finally:
+    token_estimation.set_default_estimator(original)